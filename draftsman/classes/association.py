@@ -29,6 +29,11 @@ class Association(weakref.ref):
     def __deepcopy__(self, memo):
         return self
 
+    def __reduce__(self):
+        # Pickled along with the entity it refers to, so that it refers to the
+        # unpickled copy of that entity
+        return (Association, (self(),))
+
     # def __deepcopy__(self, memo):
     #     # type: (dict) -> Association
     #     entity = memo.get(id(self()), copy.deepcopy(self(), memo))
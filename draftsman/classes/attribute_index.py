@@ -0,0 +1,221 @@
+# attribute_index.py
+# -*- encoding: utf-8 -*-
+
+from draftsman.utils import flatten_entities
+
+from typing import Callable, TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no coverage
+    from draftsman.classes.entity import Entity
+    from draftsman.classes.entitylike import EntityLike
+
+
+class AttributeIndex(object):
+    """
+    Secondary index of all the leaf entities inside an
+    :py:class:`.EntityCollection`, organized by the values of their ``name``,
+    ``type``, ``direction`` and ``recipe`` attributes. Also keeps track of
+    which entities are able to have a ``control_behavior``.
+
+    Entities are grouped into "buckets", each of which is a ``dict`` mapping
+    ``id(entity)`` to ``entity``. Entities that do not have a particular
+    attribute are absent from all of that attribute's buckets. This allows
+    queries like :py:meth:`.EntityCollection.find_entities_filtered` to only
+    look at the entities that might match, instead of every entity in the
+    collection.
+
+    The index is kept up to date by the ``on_entity_insert``,
+    ``on_entity_set`` and ``on_entity_remove`` callbacks of the collection
+    that owns it. ``name`` and ``type`` cannot change while an entity is
+    inside of a collection. ``direction`` is changed by
+    :py:meth:`.Transformable.rotate` and :py:meth:`.Transformable.flip`, and
+    ``recipe`` by :py:class:`.RecipeMixin`; both report the change through
+    :py:func:`update_attribute`.
+    """
+
+    attributes = ("name", "type", "direction", "recipe")
+
+    def __init__(self):
+        # type: () -> None
+        self.buckets = {attribute: {} for attribute in self.attributes}
+        self.control_behavior = {}
+        self.entities = {}
+        # Position of each entity in the flattened entity list; calculated
+        # lazily and invalidated whenever entities are added or removed
+        self._order = None
+
+    def add(self, entity):
+        # type: (Entity) -> None
+        """
+        Adds a single leaf entity to the index.
+
+        :param entity: The ``Entity`` to add.
+        """
+        key = id(entity)
+        self.entities[key] = entity
+        for attribute in self.attributes:
+            if hasattr(entity, attribute):
+                value = getattr(entity, attribute)
+                self.buckets[attribute].setdefault(value, {})[key] = entity
+        if hasattr(entity, "control_behavior"):
+            self.control_behavior[key] = entity
+        self._order = None
+
+    def remove(self, entity):
+        # type: (Entity) -> None
+        """
+        Removes a single leaf entity from the index. Does nothing if the entity
+        is not in the index.
+
+        :param entity: The ``Entity`` to remove.
+        """
+        key = id(entity)
+        if self.entities.pop(key, None) is None:
+            return
+        for attribute in self.attributes:
+            if hasattr(entity, attribute):
+                self._discard(attribute, getattr(entity, attribute), key)
+        self.control_behavior.pop(key, None)
+        self._order = None
+
+    def recursive_add(self, entitylike):
+        # type: (EntityLike) -> None
+        """
+        Adds an ``EntityLike`` to the index. If ``entitylike`` is a
+        :py:class:`.Group`, all of its leaf entities are added instead.
+
+        :param entitylike: The ``EntityLike`` to add.
+        """
+        for entity in flatten_entities([entitylike]):
+            self.add(entity)
+
+    def recursive_remove(self, entitylike):
+        # type: (EntityLike) -> None
+        """
+        Removes an ``EntityLike`` from the index. If ``entitylike`` is a
+        :py:class:`.Group`, all of its leaf entities are removed instead.
+
+        :param entitylike: The ``EntityLike`` to remove.
+        """
+        for entity in flatten_entities([entitylike]):
+            self.remove(entity)
+
+    def update(self, entity, attribute, old_value):
+        # type: (Entity, str, object) -> None
+        """
+        Moves ``entity`` to the correct bucket after the value of one of its
+        indexed attributes changed. Does nothing if the entity is not in the
+        index.
+
+        :param entity: The ``Entity`` whose attribute changed.
+        :param attribute: The name of the attribute that changed.
+        :param old_value: The value of the attribute before it changed.
+        """
+        key = id(entity)
+        if key not in self.entities:
+            return
+        self._discard(attribute, old_value, key)
+        value = getattr(entity, attribute)
+        self.buckets[attribute].setdefault(value, {})[key] = entity
+
+    def clear(self):
+        # type: () -> None
+        """
+        Removes all entities from the index.
+        """
+        for buckets in self.buckets.values():
+            buckets.clear()
+        self.control_behavior.clear()
+        self.entities.clear()
+        self._order = None
+
+    def get(self, attribute, values):
+        # type: (str, set) -> list[dict]
+        """
+        Gets the buckets of ``attribute`` that correspond to each of
+        ``values``. Values that no entity has are omitted.
+
+        :param attribute: The name of the indexed attribute.
+        :param values: An iterable of attribute values to look for.
+
+        :returns: A ``list`` of ``dict`` buckets, each mapping ``id(entity)``
+            to ``entity``.
+        """
+        buckets = self.buckets[attribute]
+        return [buckets[value] for value in values if value in buckets]
+
+    def sort(self, entities, root, key=None):
+        # type: (list, list[EntityLike], Callable[[object], Entity]) -> list
+        """
+        Sorts a list of indexed entities into the same order that
+        :py:func:`.flatten_entities` would return them in.
+
+        :param entities: The list of entities to sort, in place.
+        :param root: The top-level ``EntityList`` of the owning collection.
+        :param key: An optional function that gets the indexed entity from each
+            item in ``entities``, if they are not entities themselves.
+
+        :returns: ``entities``, sorted.
+        """
+        if self._order is None:
+            self._order = {
+                id(entity): i for i, entity in enumerate(flatten_entities(root))
+            }
+        order = self._order
+        if key is None:
+            entities.sort(key=lambda entity: order[id(entity)])
+        else:
+            entities.sort(key=lambda item: order[id(key(item))])
+        return entities
+
+    def __reduce__(self):
+        # The buckets are keyed by ``id()``, which pickling does not preserve,
+        # so an empty index is unpickled and the owning collection re-adds its
+        # entities to it
+        return (AttributeIndex, ())
+
+    def _discard(self, attribute, value, key):
+        # type: (str, object, int) -> None
+        buckets = self.buckets[attribute]
+        bucket = buckets.get(value)
+        if bucket is not None:
+            bucket.pop(key, None)
+            if not bucket:
+                del buckets[value]
+
+
+def ancestor_indexes(collection, attribute="entity_index"):
+    # type: (object, str) -> list
+    """
+    Gets the index named ``attribute`` of ``collection``, as well as the
+    indexes of the same name of every collection that ``collection`` is nested
+    inside of. Used to keep the indexes of the outer collections in sync when
+    the contents of a nested :py:class:`.Group` change.
+
+    :param collection: The innermost ``EntityCollection``, or ``None``.
+    :param attribute: The name of the index attribute, such as
+        ``"entity_index"`` or ``"circuit_index"``.
+
+    :returns: A ``list`` of index objects, innermost first.
+    """
+    indexes = []
+    while collection is not None:
+        index = getattr(collection, attribute, None)
+        if index is not None:
+            indexes.append(index)
+        collection = getattr(collection, "parent", None)
+    return indexes
+
+
+def update_attribute(entity, attribute, old_value):
+    # type: (Entity, str, object) -> None
+    """
+    Updates the indexes of all collections that contain ``entity`` after one
+    of its indexed attributes changed from ``old_value`` to its current value.
+
+    :param entity: The ``Entity`` whose attribute changed.
+    :param attribute: The name of the attribute that changed.
+    :param old_value: The value of the attribute before it changed.
+    """
+    for index in ancestor_indexes(entity.parent):
+        index.update(entity, attribute, old_value)
@@ -3,11 +3,15 @@
 
 from __future__ import unicode_literals
 
+from draftsman.classes.profile import Profile, ProfileMeta
+from draftsman.constants import ValidationLevel
+from draftsman import data
 from draftsman.error import IncorrectBlueprintTypeError, DataFormatError
 from draftsman import signatures
 from draftsman import utils
+from draftsman import validation
 
-from abc import ABCMeta, abstractmethod
+from abc import abstractmethod
 
 # import deal # TODO
 import json
@@ -16,7 +20,7 @@ import six
 from typing import Any, Sequence, Union
 
 
-@six.add_metaclass(ABCMeta)
+@six.add_metaclass(ProfileMeta)
 class Blueprintable(object):
     """
     An abstract base class representing "blueprint-like" objects, such as
@@ -28,12 +32,20 @@ class Blueprintable(object):
     """
 
     @utils.reissue_warnings
-    def __init__(self, root_item, item, init_data=None):
-        # type: (str, str, Union[str, dict]) -> None
+    def __init__(
+        self, root_item, item, init_data=None, validation_level=None, profile=None
+    ):
+        # type: (str, str, Union[str, dict], Union[ValidationLevel, str], Union[Profile, str]) -> None
         """
         Initializes the private ``_root`` data dictionary, as well as setting
-        the ``item`` name.
+        the ``item`` name. ``init_data`` is loaded with ``validation_level``
+        and ``profile`` in effect.
         """
+        self._profile = None
+        self.profile = profile
+        self._validation_level = None
+        self.validation_level = validation_level
+
         # The "root" dict, contains everything inside of this blueprintable
         # Output format is equivalent to:
         # { self._root_item: self._root }
@@ -42,18 +54,18 @@ class Blueprintable(object):
         self._root_item = six.text_type(root_item)
         self._root["item"] = six.text_type(item)
 
-        if init_data is None:
-            self.setup()
-        elif isinstance(init_data, six.string_types):
-            self.load_from_string(init_data)
-        elif isinstance(init_data, dict):
-            self.setup(**init_data[self._root_item])
-        else:
-            raise TypeError(
-                "'{}' must be a factorio blueprint string, a dictionary, or None".format(
-                    self._root_item
+        with validation.level(self.validation_level), data.profile(self.profile):
+            if init_data is None:
+                self.setup()
+            elif isinstance(init_data, six.string_types):
+                self.load_from_string(init_data)
+            elif isinstance(init_data, dict):
+                self.setup(**init_data[self._root_item])
+            else:
+                raise TypeError(
+                    "'{}' must be a factorio blueprint string, a dictionary, or "
+                    "None".format(self._root_item)
                 )
-            )
 
     @utils.reissue_warnings
     def load_from_string(self, string):
@@ -251,6 +263,9 @@ class Blueprintable(object):
         if value is None:
             self._root.pop("icons", None)
             return
+        if self.validation_level is ValidationLevel.NONE:
+            self._root["icons"] = value
+            return
         try:
             self._root["icons"] = signatures.ICONS.validate(value)
         except SchemaError as e:
@@ -314,6 +329,70 @@ class Blueprintable(object):
         else:
             raise TypeError("'version' must be an int, sequence of ints or None")
 
+    # =========================================================================
+
+    @property
+    def validation_level(self):
+        # type: () -> ValidationLevel
+        """
+        How thoroughly the data set on this blueprintable, and on every entity
+        inside of it, is checked. See :py:class:`.ValidationLevel` for what
+        each level does. Not exported.
+
+        :getter: Gets the level set on this object, or the current level
+            from :py:func:`draftsman.validation.get_level` if not set.
+        :setter: Sets the level of this object, either as a
+            :py:class:`.ValidationLevel` or its name, such as ``"none"``.
+            Follows the current level if set to ``None``.
+        :type: :py:class:`.ValidationLevel`
+
+        :exception ValueError: If set to anything other than a validation
+            level or ``None``.
+        """
+        if self._validation_level is None:
+            return validation.get_level()
+        return self._validation_level
+
+    @validation_level.setter
+    def validation_level(self, value):
+        # type: (Union[ValidationLevel, str]) -> None
+        if value is None:
+            self._validation_level = None
+        else:
+            self._validation_level = validation.to_level(value)
+
+    # =========================================================================
+
+    @property
+    def profile(self):
+        # type: () -> Profile
+        """
+        The data :py:class:`.Profile` of this blueprintable, which is used
+        whenever it, or any entity or tile inside of it, is loaded, added or
+        modified, regardless of the current profile. Not exported.
+
+        :getter: Gets the profile set on this object, or the current profile
+            from :py:func:`draftsman.data.get_profile` if not set.
+        :setter: Sets the profile of this object, either as a
+            :py:class:`.Profile` or the folder to load one from. Follows the
+            current profile if set to ``None``.
+        :type: :py:class:`.Profile`
+
+        :exception ValueError: If set to anything other than a profile, a
+            folder, or ``None``.
+        """
+        if self._profile is None:
+            return data.get_profile()
+        return self._profile
+
+    @profile.setter
+    def profile(self, value):
+        # type: (Union[Profile, str]) -> None
+        if value is None:
+            self._profile = None
+        else:
+            self._profile = data.to_profile(value)
+
     # =========================================================================
     # Utility functions
     # =========================================================================
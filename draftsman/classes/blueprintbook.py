@@ -22,7 +22,7 @@
                 ... # Up to 4 icons total
             ],
             "description": str, # A user given description for this blueprint book
-            "version": int, # The encoded version of Factorio this planner was created 
+            "version": int, # The encoded version of Factorio this planner was created
                             # with/designed for (64 bits)
             "active_index": int, # The currently selected blueprint in "blueprints"
             "blueprints": [ # A list of all Blueprintable objects this book contains
@@ -53,14 +53,20 @@ from draftsman._factorio_version import __factorio_version_info__
 from draftsman.classes.blueprint import Blueprint
 from draftsman.classes.blueprintable import Blueprintable
 from draftsman.classes.deconstruction_planner import DeconstructionPlanner
+from draftsman.classes.profile import Profile
 from draftsman.classes.upgrade_planner import UpgradePlanner
+from draftsman.constants import ValidationLevel
+from draftsman import data
 from draftsman.error import DataFormatError
 from draftsman import signatures
 from draftsman import utils
+from draftsman import validation
 from draftsman.warning import DraftsmanWarning, IndexWarning
 
 from builtins import int
 import copy
+import gc
+import multiprocessing
 from schema import SchemaError
 import six
 from typing import Union
@@ -79,30 +85,58 @@ class BlueprintableList(MutableSequence):
     can exist inside other BlueprintBook instances.
     """
 
-    def __init__(self, initlist=None):
-        # type: (list[Blueprint]) -> None
+    def __init__(self, initlist=None, processes=1):
+        # type: (list[Blueprint], int) -> None
+        """
+        :param initlist: A list of blueprintables, or of ``dict`` objects to
+            construct blueprintables from.
+        :param processes: The number of processes to construct the
+            blueprintables from ``dict`` objects with. ``1`` constructs them
+            one after another in this process, and ``None`` uses one process
+            per CPU. See :py:class:`BlueprintBook` for when this is faster.
+        """
         self.data = []
-        if initlist is not None:
+        if initlist is None:
+            return
+
+        if processes is None:
+            processes = multiprocessing.cpu_count()
+        jobs = [
+            (elem, validation.get_level(), data.get_profile())
+            for elem in initlist
+            if isinstance(elem, dict)
+        ]
+        processes = min(processes, len(jobs))
+
+        if processes <= 1:
             for elem in initlist:
                 if isinstance(elem, dict):
-                    # TODO: this would be way cleaner, but circuilar imports
-                    # self.append(get_blueprintable_from_JSON(elem))
-                    # fmt: off
-                    if "blueprint" in elem:
-                        self.append(Blueprint(elem))
-                    elif "deconstruction_planner" in elem:
-                        self.append(DeconstructionPlanner(elem))
-                    elif "upgrade_planner" in elem:
-                        self.append(UpgradePlanner(elem))
-                    elif "blueprint_book" in elem:
-                        self.append(BlueprintBook(elem))
-                    else:
-                        raise TypeError(
-                            "Dictionary input cannot be resolve to a blueprintable"
-                        )
-                    # fmt: on
+                    self.append(_new_blueprintable(elem))
                 else:
                     self.append(elem)
+            return
+
+        # Unpickling the results creates a lot of objects at once, which would
+        # otherwise run the garbage collector over and over for no gain
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        pool = multiprocessing.Pool(processes)
+        try:
+            results = iter(pool.map(_load_blueprintable, jobs))
+        finally:
+            pool.close()
+            pool.join()
+            if gc_enabled:
+                gc.enable()
+
+        for elem in initlist:
+            if isinstance(elem, dict):
+                blueprintable, caught = next(results)
+                for message, category in caught:
+                    warnings.warn(message, category, stacklevel=2)
+                self.append(blueprintable)
+            else:
+                self.append(elem)
 
     def insert(self, idx, value):
         # type: (int, Blueprintable) -> None
@@ -138,6 +172,45 @@ class BlueprintableList(MutableSequence):
             )
 
 
+def _new_blueprintable(elem):
+    # type: (dict) -> Blueprintable
+    """
+    Constructs the blueprintable described by the ``dict`` ``elem``, based on
+    its root key.
+    """
+    # TODO: this would be way cleaner, but circuilar imports
+    # return get_blueprintable_from_JSON(elem)
+    if "blueprint" in elem:
+        return Blueprint(elem)
+    elif "deconstruction_planner" in elem:
+        return DeconstructionPlanner(elem)
+    elif "upgrade_planner" in elem:
+        return UpgradePlanner(elem)
+    elif "blueprint_book" in elem:
+        return BlueprintBook(elem)
+    else:
+        raise TypeError("Dictionary input cannot be resolve to a blueprintable")
+
+
+def _load_blueprintable(job):
+    # type: (tuple) -> tuple[Blueprintable, list]
+    """
+    Constructs a blueprintable in a worker process of
+    :py:class:`BlueprintableList`, with the validation level and profile of
+    the process that's waiting for it. Warnings can't be issued across
+    processes, so they're returned instead, to be issued there in order.
+
+    :returns: The blueprintable, and the message and category of each warning
+        issued while constructing it.
+    """
+    elem, validation_level, profile = job
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        with validation.level(validation_level), data.profile(profile):
+            blueprintable = _new_blueprintable(elem)
+    return blueprintable, [(warning.message, warning.category) for warning in caught]
+
+
 class BlueprintBook(Blueprintable):
     """
     Factorio Blueprint Book class. Contains a list of :py:class:`.Blueprintable`
@@ -145,17 +218,46 @@ class BlueprintBook(Blueprintable):
     """
 
     @utils.reissue_warnings
-    def __init__(self, blueprint_book=None):
-        # type: (str, Union[str, dict]) -> None
+    def __init__(
+        self, blueprint_book=None, validation_level=None, profile=None, processes=1
+    ):
+        # type: (Union[str, dict], Union[ValidationLevel, str], Union[Profile, str], int) -> None
         """
         Creates a ``BlueprintBook`` class. Will load the data from
         ``blueprint_book`` if provided, otherwise initializes with defaults.
 
         :param blueprint_book: Either a Factorio-format blueprint string or a
             ``dict`` object with the desired keys in the correct format.
+        :param validation_level: The :py:attr:`validation_level` of the
+            BlueprintBook, which is also used when loading ``blueprint_book``
+            and the blueprintables inside of it. Defaults to the current level.
+        :param profile: The :py:attr:`profile` of the BlueprintBook, which is
+            also used when loading ``blueprint_book`` and the blueprintables
+            inside of it. Defaults to the current profile.
+        :param processes: The number of processes to construct the
+            blueprintables inside of ``blueprint_book`` with, in parallel.
+            ``1`` (the default) constructs them one after another in this
+            process, and ``None`` uses one process per CPU. Each blueprintable
+            is pickled to be sent back to this process, and unpickling it here
+            takes about a sixth of the time it took to construct, so loading
+            is at most about 6 times faster no matter how many processes are
+            used. Starting the pool takes around 10 ms where processes are
+            forked (Linux), so it pays off for any book with more than a
+            couple of blueprints; where processes are spawned instead
+            (Windows, macOS), each one has to import Draftsman first, so only
+            books that take at least a few seconds to load get faster. See
+            ``test/performance/blueprint_book.py`` to measure these costs.
+
+        :exception ValueError: If ``validation_level`` is not a valid level,
+            or if ``profile`` is not a valid profile.
         """
+        self._processes = processes
         super(BlueprintBook, self).__init__(
-            root_item="blueprint_book", item="blueprint-book", init_data=blueprint_book
+            root_item="blueprint_book",
+            item="blueprint-book",
+            init_data=blueprint_book,
+            validation_level=validation_level,
+            profile=profile,
         )
 
     @utils.reissue_warnings
@@ -177,17 +279,20 @@ class BlueprintBook(Blueprintable):
             self.version = utils.encode_version(*__factorio_version_info__)
 
         if "blueprints" in kwargs:
-            self._root["blueprints"] = BlueprintableList(kwargs.pop("blueprints"))
+            self._root["blueprints"] = BlueprintableList(
+                kwargs.pop("blueprints"), self._processes
+            )
         else:
             self._root["blueprints"] = BlueprintableList()
 
         # Issue warnings for any keyword not recognized by BlueprintBook
-        for unused_arg in kwargs:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in kwargs:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
 
     # =========================================================================
     # BlueprintBook properties
@@ -233,6 +338,9 @@ class BlueprintBook(Blueprintable):
         if value is None:
             self._root.pop("label_color", None)
             return
+        if self.validation_level is ValidationLevel.NONE:
+            self._root["label_color"] = value
+            return
         try:
             self._root["label_color"] = signatures.COLOR.validate(value)
         except SchemaError as e:
@@ -268,7 +376,11 @@ class BlueprintBook(Blueprintable):
                 raise IndexError(
                     "'active_index' ({}) not in range [0, 65536)".format(value)
                 )
-            elif self.blueprints is not None and value >= len(self.blueprints):
+            elif (
+                self.blueprints is not None
+                and value >= len(self.blueprints)
+                and self.validation_level is ValidationLevel.STRICT
+            ):
                 warnings.warn(
                     "'active_index' ({}) not in range [0, {})".format(
                         value, len(self.blueprints)
@@ -0,0 +1,319 @@
+# circuit_index.py
+# -*- encoding: utf-8 -*-
+
+from draftsman.classes.association import Association
+from draftsman.utils import flatten_entities
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no coverage
+    from draftsman.classes.entity import Entity
+    from draftsman.classes.entitylike import EntityLike
+
+
+class CircuitNetworkIndex(object):
+    """
+    Union-find structure that groups the circuit connection points of the
+    entities inside an :py:class:`.EntityCollection` into circuit networks.
+
+    Each connection point is a "node" identified by an entity, a side (``1``
+    or ``2``) and a wire color (``"red"`` or ``"green"``). Two nodes are in the
+    same network if they are connected by wires of that color, either directly
+    or through any number of other entities. Each network is identified by an
+    integer network id, and keeps a list of its member nodes so that querying
+    a network costs time proportional to its size.
+
+    Connections added with :py:meth:`.EntityCollection.add_circuit_connection`
+    are merged into the index incrementally. Networks cannot be split in a
+    union-find, so when connections or entities are removed, only the networks
+    they were part of are taken apart and their remaining members are
+    connected again from their ``connections``; this costs time proportional
+    to the size of those networks. Adding entities that already have
+    connections marks the index as ``stale`` instead; a stale index is rebuilt
+    from the ``connections`` of every entity the next time it is queried. If
+    you modify the ``connections`` of an entity by hand, call
+    :py:meth:`invalidate` on the index of each collection it belongs to.
+
+    Network ids are only guaranteed to be consistent between queries as long as
+    no connections are added or removed.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        self.parents = {}
+        self.members = {}
+        self.ordinals = {}
+        self.entities = {}
+        self.next_ordinal = 0
+        self.stale = False
+
+    # =========================================================================
+
+    def add(self, entitylike):
+        # type: (EntityLike) -> None
+        """
+        Called when ``entitylike`` is added to the owning collection. Entities
+        without circuit connections form their own networks and do not need to
+        be tracked; otherwise the index is marked as stale.
+
+        :param entitylike: The ``EntityLike`` that was added.
+        """
+        if not self.stale and has_circuit_connections(entitylike):
+            self.invalidate()
+
+    def remove(self, entitylike):
+        # type: (EntityLike) -> None
+        """
+        Called when ``entitylike`` is removed from the owning collection. If any
+        of the removed entities were part of a network, that network is split
+        into the networks of its remaining members.
+
+        :param entitylike: The ``EntityLike`` that was removed.
+        """
+        if self.stale:
+            return
+        removed = {id(entity) for entity in flatten_entities([entitylike])}
+        self._split(removed, removed)
+
+    def disconnect(self, color, entity_1, entity_2, side1=1, side2=1):
+        # type: (str, Entity, Entity, int, int) -> None
+        """
+        Called when the connection between two connection points was removed.
+        Splits their network if they are no longer connected through any other
+        path.
+
+        :param color: The color of the removed wire.
+        :param entity_1: The first entity.
+        :param entity_2: The second entity.
+        :param side1: The side of the first entity.
+        :param side2: The side of the second entity.
+        """
+        if self.stale:
+            return
+        self._split({id(entity_1), id(entity_2)})
+
+    def disconnect_all(self, entities):
+        # type: (list[EntityLike]) -> None
+        """
+        Called when every circuit connection of ``entities`` (and their
+        children) was removed. Splits the networks they were part of.
+
+        :param entities: A ``list`` of ``EntityLike`` instances.
+        """
+        if self.stale:
+            return
+        self._split({id(entity) for entity in flatten_entities(entities)})
+
+    def invalidate(self):
+        # type: () -> None
+        """
+        Marks the index as stale, so that it is rebuilt the next time it is
+        queried. Also drops all references to the indexed entities, so that
+        removed entities are not kept alive by the index.
+        """
+        self.clear()
+        self.stale = True
+
+    def clear(self):
+        # type: () -> None
+        """
+        Removes all nodes from the index.
+        """
+        self.parents.clear()
+        self.members.clear()
+        self.ordinals.clear()
+        self.entities.clear()
+        self.next_ordinal = 0
+        self.stale = False
+
+    def rebuild(self, entities):
+        # type: (list[EntityLike]) -> None
+        """
+        Clears the index and reconstructs it from the ``connections`` of every
+        entity in ``entities``. Connections to entities that are not in
+        ``entities`` are ignored.
+
+        :param entities: The ``EntityList`` of the owning collection.
+        """
+        self.clear()
+        leaves = flatten_entities(entities)
+        contained = {id(entity) for entity in leaves}
+        for entity in leaves:
+            connections = getattr(entity, "connections", None)
+            if not connections:
+                continue
+            for side in ("1", "2"):
+                if side not in connections:
+                    continue
+                for color in ("red", "green"):
+                    for point in connections[side].get(color, ()):
+                        target = point["entity_id"]
+                        if not isinstance(target, Association):
+                            continue
+                        target = target()
+                        if target is None or id(target) not in contained:
+                            continue
+                        self.union(
+                            color,
+                            entity,
+                            target,
+                            int(side),
+                            point.get("circuit_id", 1),
+                        )
+
+    # =========================================================================
+
+    def union(self, color, entity_1, entity_2, side1=1, side2=1):
+        # type: (str, Entity, Entity, int, int) -> None
+        """
+        Merges the networks of two connection points.
+
+        :param color: The color of the wire connecting the two points.
+        :param entity_1: The first entity.
+        :param entity_2: The second entity.
+        :param side1: The side of the first entity.
+        :param side2: The side of the second entity.
+        """
+        root_1 = self._find(self._node(entity_1, side1, color))
+        root_2 = self._find(self._node(entity_2, side2, color))
+        if root_1 == root_2:
+            return
+
+        # Merge the smaller network into the larger one
+        if len(self.members[root_1]) < len(self.members[root_2]):
+            root_1, root_2 = root_2, root_1
+        self.parents[root_2] = root_1
+        self.members[root_1].extend(self.members.pop(root_2))
+
+    def get_network_id(self, entity, color, side=1):
+        # type: (Entity, str, int) -> int
+        """
+        Gets the id of the network that a connection point belongs to.
+
+        :param entity: The entity to query.
+        :param color: The color of the wire network.
+        :param side: The side of the entity.
+
+        :returns: An ``int`` shared by every connection point in the network.
+        """
+        node = (id(entity), side, color)
+        if node not in self.parents:
+            # Untracked points are their own network; their ids are negative,
+            # so that they can't collide with the ids of tracked networks
+            return -1 - (id(entity) * 4 + (side - 1) * 2 + (color == "green"))
+        return self.ordinals[self._find(node)]
+
+    def get_network(self, entity, color, side=1):
+        # type: (Entity, str, int) -> list[tuple[Entity, int]]
+        """
+        Gets all of the connection points in the same network as a connection
+        point, including itself.
+
+        :param entity: The entity to query.
+        :param color: The color of the wire network.
+        :param side: The side of the entity.
+
+        :returns: A ``list`` of ``(entity, side)`` tuples.
+        """
+        node = (id(entity), side, color)
+        if node not in self.parents:
+            return [(entity, side)]
+        root = self._find(node)
+        return [(self.entities[node[0]], node[1]) for node in self.members[root]]
+
+    def __getstate__(self):
+        # type: () -> dict
+        # Nodes are keyed by ``id()``, which pickling does not preserve, so the
+        # unpickled index is stale and rebuilt the next time it's queried
+        return {
+            "parents": {},
+            "members": {},
+            "ordinals": {},
+            "entities": {},
+            "next_ordinal": 0,
+            "stale": True,
+        }
+
+    # =========================================================================
+
+    def _node(self, entity, side, color):
+        # type: (Entity, int, str) -> tuple[int, int, str]
+        node = (id(entity), side, color)
+        if node not in self.parents:
+            self.parents[node] = node
+            self.members[node] = [node]
+            self.ordinals[node] = self.next_ordinal
+            self.next_ordinal += 1
+            self.entities[id(entity)] = entity
+        return node
+
+    def _split(self, entity_ids, dropped=()):
+        # type: (set[int], set[int]) -> None
+        # Takes apart every network with a point of any entity in
+        # ``entity_ids``, and connects the remaining points again from their
+        # ``connections``; the points of entities in ``dropped`` are left out
+        roots = set()
+        for entity_id in entity_ids:
+            for side in (1, 2):
+                for color in ("red", "green"):
+                    node = (entity_id, side, color)
+                    if node in self.parents:
+                        roots.add(self._find(node))
+        if not roots:
+            return
+
+        nodes = [node for root in roots for node in self.members.pop(root)]
+        for node in nodes:
+            del self.parents[node]
+            del self.ordinals[node]
+        remaining = {node for node in nodes if node[0] not in dropped}
+
+        for entity_id, side, color in remaining:
+            entity = self.entities[entity_id]
+            connections = getattr(entity, "connections", None) or {}
+            for point in connections.get(str(side), {}).get(color, ()):
+                target = point["entity_id"]
+                if not isinstance(target, Association):
+                    continue
+                target = target()
+                if target is None:
+                    continue
+                target_side = point.get("circuit_id", 1)
+                if (id(target), target_side, color) in remaining:
+                    self.union(color, entity, target, side, target_side)
+
+        # Forget the entities that are no longer part of any network
+        for entity_id in {node[0] for node in nodes}:
+            if not any(
+                (entity_id, side, color) in self.parents
+                for side in (1, 2)
+                for color in ("red", "green")
+            ):
+                del self.entities[entity_id]
+
+    def _find(self, node):
+        # type: (tuple[int, int, str]) -> tuple[int, int, str]
+        root = node
+        while self.parents[root] != root:
+            root = self.parents[root]
+        # Path compression
+        while self.parents[node] != root:
+            self.parents[node], node = root, self.parents[node]
+        return root
+
+
+def has_circuit_connections(entitylike):
+    # type: (EntityLike) -> bool
+    """
+    Checks whether or not ``entitylike`` (or any of its children, if it is a
+    :py:class:`.Group`) has any circuit wire connections.
+
+    :param entitylike: The ``EntityLike`` to check.
+
+    :returns: ``True`` if any circuit connections exist, ``False`` otherwise.
+    """
+    for entity in flatten_entities([entitylike]):
+        connections = getattr(entity, "connections", None)
+        if connections and ("1" in connections or "2" in connections):
+            return True
+    return False
@@ -2,12 +2,17 @@
 # -*- encoding: utf-8 -*-
 
 from draftsman.classes.association import Association
+from draftsman.classes.attribute_index import AttributeIndex, ancestor_indexes
+from draftsman.classes.circuit_index import CircuitNetworkIndex
 from draftsman.classes.entitylike import EntityLike
 from draftsman.classes.entitylist import EntityList
+from draftsman.classes.power_coverage import PowerCoverage
+from draftsman.classes.profile import ProfileMeta
 from draftsman.classes.tilelist import TileList
 from draftsman.classes.spatial_data_structure import SpatialDataStructure
 from draftsman.classes.tile import Tile
 from draftsman.classes.vector import Vector, PrimitiveVector
+from draftsman.constants import ValidationLevel
 from draftsman.error import (
     DraftsmanError,
     EntityNotPowerConnectableError,
@@ -24,12 +29,13 @@ from draftsman.warning import (
 from draftsman.utils import AABB, PrimitiveAABB, flatten_entities, distance
 
 import abc
+import math
 import six
-from typing import Union
+from typing import Callable, Union
 import warnings
 
 
-@six.add_metaclass(abc.ABCMeta)
+@six.add_metaclass(ProfileMeta)
 class EntityCollection(object):
     """
     Abstract class used to describe an object that can contain a list of
@@ -57,6 +63,28 @@ class EntityCollection(object):
         """
         pass
 
+    @property
+    def entity_index(self):
+        # type: () -> AttributeIndex
+        """
+        Object that holds references to the entities organized by the values of
+        their attributes, used to speed up :py:meth:`find_entities_filtered`.
+        An instance of :py:class:`.AttributeIndex`, or ``None`` if this
+        collection does not maintain one.
+        """
+        return getattr(self, "_entity_index", None)
+
+    @property
+    def circuit_index(self):
+        # type: () -> CircuitNetworkIndex
+        """
+        Object that groups the circuit connection points of the entities into
+        circuit networks, used by :py:meth:`get_circuit_network`. An instance
+        of :py:class:`.CircuitNetworkIndex`, or ``None`` if this collection
+        does not maintain one.
+        """
+        return getattr(self, "_circuit_index", None)
+
     @property
     def rotatable(self):
         # type: () -> bool
@@ -184,6 +212,42 @@ class EntityCollection(object):
 
         return self.entity_map.get_in_area(aabb)
 
+    def find_entity_at_positions(self, positions):
+        # type: (list[Union[Vector, PrimitiveVector]]) -> list[EntityLike]
+        """
+        Batched version of :py:meth:`find_entity_at_position`. Finds any entity
+        at each position in ``positions``, sharing the spatial lookup work
+        between positions that lie close to one another. Useful when querying
+        many positions at once, such as the pickup and drop positions of every
+        inserter in a blueprint.
+
+        :param positions: A sequence of positions to search, each either a
+            PrimitiveVector or a :py:class:`.Vector`.
+
+        :returns: A ``list`` the same length as ``positions``, where each entry
+            is the first-placed ``EntityLike`` at the corresponding position,
+            or ``None`` if none were found.
+        """
+        results = self.entity_map.get_on_points(positions, limit=1)
+        return [result[0] if result else None for result in results]
+
+    def find_entities_many(self, areas):
+        # type: (list[Union[AABB, PrimitiveAABB]]) -> list[list[EntityLike]]
+        """
+        Batched version of :py:meth:`find_entities`. Returns a ``list`` of all
+        entities within each area in ``areas``, sharing the spatial lookup work
+        between areas that overlap the same regions.
+
+        :param areas: A sequence of areas to search, each either an
+            :py:class:`.AABB` or a ``Sequence`` of 4 floats.
+
+        :returns: A ``list`` the same length as ``areas``, where each entry is a
+            regular ``list`` of ``EntityLikes`` whose ``collision_box`` overlaps
+            the corresponding area.
+        """
+        areas = [AABB.from_other(area) for area in areas]
+        return self.entity_map.get_in_areas(areas)
+
     def find_entities_filtered(self, **kwargs):
         # type: (**dict) -> list[EntityLike]
         """
@@ -226,6 +290,14 @@ class EntityCollection(object):
               - ``Direction`` or ``set{Direction}``
               - | The direction(s) of the entities that you want to search for.
                 | Excludes entities that have no direction.
+            * - ``recipe``
+              - ``str`` or ``set{str}``
+              - | The recipe(s) of the entities that you want to search for.
+                | Excludes entities that have no recipe.
+            * - ``has_control_behavior``
+              - ``bool``
+              - | Whether or not the entities you want to search for have a
+                  non-empty ``control_behavior``.
             * - ``limit``
               - ``int``
               - | Limit the maximum size of the returned list to this amount.
@@ -238,9 +310,82 @@ class EntityCollection(object):
         ``position`` and ``radius`` take precidence over ``aabb`` if all are
         specified. If no region keywords are specified, the entire Collection is
         searched.
+
+        If the Collection maintains an :py:attr:`entity_index`, the ``name``,
+        ``type``, ``direction``, ``recipe`` and ``has_control_behavior``
+        criteria are resolved through it, so searching the entire Collection
+        only visits the entities that could possibly match. Results are
+        returned in the same order regardless.
         """
 
-        search_region = []
+        if isinstance(kwargs.get("name", None), str):
+            names = {kwargs.pop("name", None)}
+        else:
+            names = kwargs.pop("name", None)
+        if isinstance(kwargs.get("type", None), str):
+            types = {kwargs.pop("type", None)}
+        else:
+            types = kwargs.pop("type", None)
+        if isinstance(kwargs.get("direction", None), int):
+            directions = {kwargs.pop("direction", None)}
+        else:
+            directions = kwargs.pop("direction", None)
+        if isinstance(kwargs.get("recipe", None), str):
+            recipes = {kwargs.pop("recipe", None)}
+        else:
+            recipes = kwargs.pop("recipe", None)
+        has_control_behavior = kwargs.pop("has_control_behavior", None)
+
+        # Gather the buckets of every indexed criteria that was specified
+        index = self.entity_index
+        criteria = []
+        if index is not None:
+            for attribute, values in (
+                ("name", names),
+                ("type", types),
+                ("direction", directions),
+                ("recipe", recipes),
+            ):
+                if values is not None:
+                    criteria.append(index.get(attribute, values))
+            if has_control_behavior:
+                criteria.append([index.control_behavior])
+
+        def in_index(entity):
+            key = id(entity)
+            for buckets in criteria:
+                for bucket in buckets:
+                    if key in bucket:
+                        break
+                else:
+                    return False
+            return True
+
+        def test(entity):
+            if index is None:
+                if names is not None and entity.name not in names:
+                    return False
+                if types is not None and entity.type not in types:
+                    return False
+                if (
+                    directions is not None
+                    and getattr(entity, "direction", None) not in directions
+                ):
+                    return False
+                if (
+                    recipes is not None
+                    and getattr(entity, "recipe", None) not in recipes
+                ):
+                    return False
+            elif not in_index(entity):
+                return False
+            if has_control_behavior is not None and has_control_behavior != bool(
+                getattr(entity, "control_behavior", None)
+            ):
+                return False
+            return True
+
+        search_region = None
         if "position" in kwargs:
             if "radius" in kwargs:
                 # Intersect entities with circle
@@ -254,42 +399,68 @@ class EntityCollection(object):
             # Intersect entities with area
             area = AABB.from_other(kwargs["area"])
             search_region = self.entity_map.get_in_area(area)
+        elif criteria and not kwargs.get("invert", None):
+            # Only look at the entities in the smallest set of buckets, instead
+            # of every entity in the Collection
+            smallest = min(criteria, key=lambda b: sum(len(x) for x in b))
+            candidates = {}
+            for bucket in smallest:
+                candidates.update(bucket)
+            results = [entity for entity in candidates.values() if test(entity)]
+            index.sort(results, self.entities)
+            return results[: kwargs.pop("limit", len(results))]
         else:
             # Search all entities, but make sure it's a 1D list
             search_region = flatten_entities(self.entities)
 
-        if isinstance(kwargs.get("name", None), str):
-            names = {kwargs.pop("name", None)}
-        else:
-            names = kwargs.pop("name", None)
-        if isinstance(kwargs.get("type", None), str):
-            types = {kwargs.pop("type", None)}
-        else:
-            types = kwargs.pop("type", None)
-        if isinstance(kwargs.get("direction", None), int):
-            directions = {kwargs.pop("direction", None)}
-        else:
-            directions = kwargs.pop("direction", None)
-
         # Keep track of how many
         limit = kwargs.pop("limit", len(search_region))
 
+        if kwargs.get("invert", None):
+            return list(filter(lambda entity: not test(entity), search_region))[:limit]
+        else:
+            return list(filter(lambda entity: test(entity), search_region))[:limit]
+
+    def find_nearest_entities(self, position, k=1, name=None, type=None, filter=None):
+        # type: (Union[Vector, PrimitiveVector], int, Union[str, set[str]], Union[str, set[str]], Callable[[EntityLike], bool]) -> list[EntityLike]
+        """
+        Returns the ``k`` entities closest to ``position``, measured from each
+        entity's ``global_position``. Searches outward from ``position`` and
+        stops as soon as no closer entities can exist, so there is no need to
+        guess a search radius:
+
+        .. code-block:: python
+
+            # Find the closest electric pole to an assembling machine
+            machine = blueprint.entities["assembler"]
+            pole = blueprint.find_nearest_entities(
+                machine.global_position, type="electric-pole"
+            )
+
+        :param position: The position to search from, either a PrimitiveVector
+            or a :py:class:`.Vector`.
+        :param k: The maximum number of entities to return.
+        :param name: The name(s) of the entities that you want to search for.
+        :param type: The type(s) of the entities that you want to search for.
+        :param filter: An optional function that takes an ``EntityLike`` and
+            returns ``True`` if it should be considered.
+
+        :returns: A ``list`` of at most ``k`` ``EntityLikes``, sorted from
+            closest to furthest.
+        """
+        names = {name} if isinstance(name, six.string_types) else name
+        types = {type} if isinstance(type, six.string_types) else type
+
         def test(entity):
             if names is not None and entity.name not in names:
                 return False
             if types is not None and entity.type not in types:
                 return False
-            if (
-                directions is not None
-                and getattr(entity, "direction", None) not in directions
-            ):
+            if filter is not None and not filter(entity):
                 return False
             return True
 
-        if kwargs.get("invert", None):
-            return list(filter(lambda entity: not test(entity), search_region))[:limit]
-        else:
-            return list(filter(lambda entity: test(entity), search_region))[:limit]
+        return self.entity_map.get_nearest(position, k, filter=test)
 
     # =========================================================================
     # Connections
@@ -385,35 +556,38 @@ class EntityCollection(object):
                 "2 dual-power-connectable entities cannot connect directly"
             )
 
-        # Issue a warning if the entities being connected are too far apart
-        min_dist = min(entity_1.maximum_wire_distance, entity_2.maximum_wire_distance)
-        real_dist = distance(
-            entity_1.global_position.data, entity_2.global_position.data
-        )
-        if real_dist > min_dist:
-            warnings.warn(
-                "Distance between entity '{}' and entity '{}' ({}) is greater"
-                " than max connection distance ({})".format(
-                    entity_1.name, entity_2.name, real_dist, min_dist
-                ),
-                ConnectionDistanceWarning,
-                stacklevel=2,
-            )
-
-        # Issue a warning if the either of the connected entities have 5 or more
-        # power connections
-        if len(entity_1.neighbours) >= 5:
-            warnings.warn(
-                "'entity_1' ({}) has more than 5 connections".format(entity_1.name),
-                TooManyConnectionsWarning,
-                stacklevel=2,
+        if self.validation_level is ValidationLevel.STRICT:
+            # Issue a warning if the entities being connected are too far apart
+            min_dist = min(
+                entity_1.maximum_wire_distance, entity_2.maximum_wire_distance
             )
-        if len(entity_2.neighbours) >= 5:
-            warnings.warn(
-                "'entity_2' ({}) has more than 5 connections".format(entity_2.name),
-                TooManyConnectionsWarning,
-                stacklevel=2,
+            real_dist = distance(
+                entity_1.global_position.data, entity_2.global_position.data
             )
+            if real_dist > min_dist:
+                warnings.warn(
+                    "Distance between entity '{}' and entity '{}' ({}) is greater"
+                    " than max connection distance ({})".format(
+                        entity_1.name, entity_2.name, real_dist, min_dist
+                    ),
+                    ConnectionDistanceWarning,
+                    stacklevel=2,
+                )
+
+            # Issue a warning if the either of the connected entities have 5 or more
+            # power connections
+            if len(entity_1.neighbours) >= 5:
+                warnings.warn(
+                    "'entity_1' ({}) has more than 5 connections".format(entity_1.name),
+                    TooManyConnectionsWarning,
+                    stacklevel=2,
+                )
+            if len(entity_2.neighbours) >= 5:
+                warnings.warn(
+                    "'entity_2' ({}) has more than 5 connections".format(entity_2.name),
+                    TooManyConnectionsWarning,
+                    stacklevel=2,
+                )
 
         # Only worried about entity_1
         if entity_1.dual_power_connectable:  # power switch
@@ -562,55 +736,103 @@ class EntityCollection(object):
         """
         # Get all power poles in the Collection (1D list)
         electric_poles = self.find_entities_filtered(type="electric-pole")
-        for cur_pole in electric_poles:
+        if len(electric_poles) == 0:
+            return
+
+        # Precompute the positions and wire reaches of every pole
+        positions = []
+        for pole in electric_poles:
+            global_position = pole.global_position
+            positions.append((global_position.x, global_position.y))
+        reaches = [pole.maximum_wire_distance for pole in electric_poles]
+
+        # Bin each pole into a grid whose cells are as wide as the furthest
+        # reach, so that every potential neighbour of a pole lies in the 3x3
+        # block of cells surrounding it
+        cell_size = max(reaches) or 1
+        grid = {}
+        cells = []
+        for i, position in enumerate(positions):
+            cell = (
+                int(math.floor(position[0] / cell_size)),
+                int(math.floor(position[1] / cell_size)),
+            )
+            cells.append(cell)
+            try:
+                grid[cell].append(i)
+            except KeyError:
+                grid[cell] = [i]
+
+        for i, cur_pole in enumerate(electric_poles):
+            # If this pole is already full, none of the candidates will connect
+            if len(cur_pole.neighbours) >= 5:
+                continue
+
+            cur_x, cur_y = cur_position = positions[i]
+            cur_reach = reaches[i]
+
+            # Gather all the nearby poles, in their original order
+            nearby = []
+            cell_x, cell_y = cells[i]
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    nearby.extend(grid.get((cell_x + dx, cell_y + dy), ()))
+            nearby.sort()
+
             # Get all the power poles candidates
-            def power_connectable(other):
-                # type: (EntityLike) -> bool
+            potential_neighbours = []
+            for j in nearby:
                 # Don't include ourself in the entities we're connecting to
-                if other is cur_pole:
-                    return False
+                if j == i:
+                    continue
+                other_x, other_y = positions[j]
                 # If only_axis is true, only include ones that have the same x
                 # or y
-                if (
-                    cur_pole.global_position.x != other.global_position.x
-                    and cur_pole.global_position.y != other.global_position.y
-                    and only_axis
-                ):
-                    return False
+                on_axis = cur_x == other_x or cur_y == other_y
+                if only_axis and not on_axis:
+                    continue
                 # Only return poles that are less than the max power pole
                 # distance
-                dist = distance(
-                    cur_pole.global_position.data, other.global_position.data
-                )
-                min_dist = min(
-                    cur_pole.maximum_wire_distance, other.maximum_wire_distance
-                )
-                return dist <= min_dist
+                dist = distance(cur_position, positions[j])
+                if dist <= min(cur_reach, reaches[j]):
+                    potential_neighbours.append((dist, not on_axis, j))
 
-            potential_neighbours = list(filter(power_connectable, electric_poles))
             # Sort the power poles by distance
-            potential_neighbours.sort(
-                key=lambda x: distance(
-                    x.global_position.data, cur_pole.global_position.data
-                )
-            )
+            potential_neighbours.sort(key=lambda x: x[0])
 
             # Sort the power poles by whether or not they are on the axis first
             if prefer_axis:
-                potential_neighbours.sort(
-                    key=lambda x: not (
-                        x.global_position.x == cur_pole.global_position.x
-                        or x.global_position.y == cur_pole.global_position.y
-                    )
-                )
+                potential_neighbours.sort(key=lambda x: x[1])
 
             # Iterate over every potential neighbour
             while len(potential_neighbours) > 0:
-                neighbour = potential_neighbours.pop()
+                neighbour = electric_poles[potential_neighbours.pop()[2]]
                 # Make sure this connection would not exceed each entities max
                 # connections
                 if len(cur_pole.neighbours) < 5 and len(neighbour.neighbours) < 5:
-                    self.add_power_connection(cur_pole, neighbour)
+                    # Both poles are known to be valid and in range, so we can
+                    # skip the checks in `add_power_connection()`
+                    if Association(neighbour) not in cur_pole.neighbours:
+                        cur_pole.neighbours.append(Association(neighbour))
+                    if Association(cur_pole) not in neighbour.neighbours:
+                        neighbour.neighbours.append(Association(cur_pole))
+
+    def get_power_coverage(self):
+        # type: () -> PowerCoverage
+        """
+        Analyzes the electric networks of every entity in the Collection,
+        including entities inside of Groups.
+
+        .. code-block:: python
+
+            coverage = blueprint.get_power_coverage()
+            for entity in coverage.get_uncovered_entities():
+                print(entity.name, "at", entity.global_position, "is unpowered")
+            print(len(coverage.networks), "separate copper networks")
+
+        :returns: A :py:class:`.PowerCoverage` snapshot of the Collection.
+        """
+        return PowerCoverage(flatten_entities(self.entities))
 
     # =========================================================================
 
@@ -682,77 +904,144 @@ class EntityCollection(object):
         if not entity_2.circuit_connectable:
             raise EntityNotCircuitConnectableError(entity_2.name)
 
-        if side1 == 2 and not entity_1.dual_circuit_connectable:
-            warnings.warn(
-                "'side1' was specified as 2, but entity '{}' is not"
-                " dual circuit connectable".format(type(entity_1).__name__),
-                ConnectionSideWarning,
-                stacklevel=2,
+        if self.validation_level is ValidationLevel.STRICT:
+            if side1 == 2 and not entity_1.dual_circuit_connectable:
+                warnings.warn(
+                    "'side1' was specified as 2, but entity '{}' is not"
+                    " dual circuit connectable".format(type(entity_1).__name__),
+                    ConnectionSideWarning,
+                    stacklevel=2,
+                )
+            if side2 == 2 and not entity_2.dual_circuit_connectable:
+                warnings.warn(
+                    "'side2' was specified as 2, but entity '{}' is not"
+                    " dual circuit connectable".format(type(entity_2).__name__),
+                    ConnectionSideWarning,
+                    stacklevel=2,
+                )
+
+            # Issue a warning if the entities being connected are too far apart
+            min_dist = min(
+                entity_1.circuit_wire_max_distance, entity_2.circuit_wire_max_distance
             )
-        if side2 == 2 and not entity_2.dual_circuit_connectable:
-            warnings.warn(
-                "'side2' was specified as 2, but entity '{}' is not"
-                " dual circuit connectable".format(type(entity_2).__name__),
-                ConnectionSideWarning,
-                stacklevel=2,
+            real_dist = distance(
+                entity_1.global_position.data, entity_2.global_position.data
             )
+            if real_dist > min_dist:
+                warnings.warn(
+                    "Distance between entity '{}' and entity '{}' ({}) is greater"
+                    " than max connection distance ({})".format(
+                        entity_1.name, entity_2.name, real_dist, min_dist
+                    ),
+                    ConnectionDistanceWarning,
+                    stacklevel=2,
+                )
 
-        # Issue a warning if the entities being connected are too far apart
-        min_dist = min(
-            entity_1.circuit_wire_max_distance, entity_2.circuit_wire_max_distance
-        )
-        real_dist = distance(
-            entity_1.global_position.data, entity_2.global_position.data
-        )
-        if real_dist > min_dist:
-            warnings.warn(
-                "Distance between entity '{}' and entity '{}' ({}) is greater"
-                " than max connection distance ({})".format(
-                    entity_1.name, entity_2.name, real_dist, min_dist
-                ),
-                ConnectionDistanceWarning,
-                stacklevel=2,
-            )
+        self._write_circuit_connection(color, entity_1, entity_2, side1, side2)
 
-        # Add entity_2 to entity_1.connections
+        # Merge the two networks in this collection and any containing ones
+        for index in ancestor_indexes(self, "circuit_index"):
+            if not index.stale:
+                index.union(color, entity_1, entity_2, side1, side2)
 
-        if six.text_type(side1) not in entity_1.connections:
-            entity_1.connections[six.text_type(side1)] = dict()
-        current_side = entity_1.connections[six.text_type(side1)]
+    def connect_chain(self, color, entities, side=1):
+        # type: (str, list[Union[EntityLike, int, str]], int) -> None
+        """
+        Connects a sequence of entities with circuit wires, each entity to the
+        one after it. Each entity can be either a reference to the entity to
+        connect, the index of the entity in the ``entities`` list, or it's
+        string ID. ``side`` is used for both ends of every wire.
 
-        if color not in current_side:
-            current_side[color] = list()
-        current_color = current_side[color]
+        .. code-block:: python
 
-        # If dual circuit connectable specify the target side
-        if entity_2.dual_circuit_connectable:
-            entry = {"entity_id": Association(entity_2), "circuit_id": side2}
-        else:
-            # However, for most entities you dont need a target side
-            entry = {"entity_id": Association(entity_2)}
+            # Equivalent to 3 calls to add_circuit_connection
+            blueprint.connect_chain("red", ["a", "b", "c", "d"])
 
-        if entry not in current_color:
-            current_color.append(entry)
+        Equivalent to calling :py:meth:`add_circuit_connection` on each
+        consecutive pair, except that the arguments are validated once for
+        the whole batch and the connections are written directly. If any part
+        of the batch is invalid, an exception is raised before any connections
+        are made. Warnings are also issued once per batch instead of once per
+        connection.
 
-        # Add entity_1 to entity_2.connections
+        :param color: Color of the wire to make the connections with. Must be
+            either ``"red"`` or ``"green"``.
+        :param entities: A sequence of IDs, indices, or references to the
+            entities to connect, in order.
+        :param side: Which side of each dual-circuit-connectable entity to
+            connect to, where ``1`` is "input" and ``2`` is "output". Defaults
+            to ``1``.
+
+        :exception KeyError, IndexError: If any entity is an invalid ID or
+            index to the parent Collection.
+        :exception InvalidAssociationError: If any entity is not inside the
+            parent Collection.
+        :exception InvalidWireTypeError: If ``color`` is neither ``"red"`` nor
+            ``"green"``.
+        :exception InvalidConnectionSideError: If ``side`` is neither ``1`` nor
+            ``2``.
+        :exception EntityNotCircuitConnectableError: If any entity does not
+            have the capability to be circuit wire connected.
+        """
+        entities = [self._resolve_connection_entity(entity) for entity in entities]
+        self._connect_circuit_pairs(
+            color,
+            [
+                (entities[i], entities[i + 1], side, side)
+                for i in range(len(entities) - 1)
+            ],
+        )
 
-        if six.text_type(side2) not in entity_2.connections:
-            entity_2.connections[six.text_type(side2)] = dict()
-        current_side = entity_2.connections[six.text_type(side2)]
+    def connect_pairs(self, color, pairs):
+        # type: (str, list[tuple]) -> None
+        """
+        Adds many circuit wire connections in one batch. Each pair is either a
+        tuple ``(entity_1, entity_2)`` or ``(entity_1, entity_2, side1, side2)``,
+        where the entities and sides have the same meaning as the arguments of
+        :py:meth:`add_circuit_connection`. Sides default to ``1`` if omitted.
 
-        if color not in current_side:
-            current_side[color] = list()
-        current_color = current_side[color]
+        .. code-block:: python
 
-        # If dual circuit connectable specify the target side
-        if entity_1.dual_circuit_connectable:
-            entry = {"entity_id": Association(entity_1), "circuit_id": side1}
-        else:
-            # However, for most entities you dont need a target side
-            entry = {"entity_id": Association(entity_1)}
+            blueprint.connect_pairs("green", [("a", "b"), ("b", "c", 2, 1)])
 
-        if entry not in current_color:
-            current_color.append(entry)
+        Equivalent to calling :py:meth:`add_circuit_connection` on each pair,
+        except that the arguments are validated once for the whole batch and
+        the connections are written directly. If any part of the batch is
+        invalid, an exception is raised before any connections are made.
+        Warnings are also issued once per batch instead of once per
+        connection.
+
+        :param color: Color of the wire to make the connections with. Must be
+            either ``"red"`` or ``"green"``.
+        :param pairs: A sequence of tuples, each describing one connection.
+
+        :exception KeyError, IndexError: If any entity is an invalid ID or
+            index to the parent Collection.
+        :exception InvalidAssociationError: If any entity is not inside the
+            parent Collection.
+        :exception InvalidWireTypeError: If ``color`` is neither ``"red"`` nor
+            ``"green"``.
+        :exception InvalidConnectionSideError: If any side is neither ``1`` nor
+            ``2``.
+        :exception EntityNotCircuitConnectableError: If any entity does not
+            have the capability to be circuit wire connected.
+        """
+        connections = []
+        for pair in pairs:
+            if len(pair) == 2:
+                entity_1, entity_2 = pair
+                side1, side2 = 1, 1
+            else:
+                entity_1, entity_2, side1, side2 = pair
+            connections.append(
+                (
+                    self._resolve_connection_entity(entity_1),
+                    self._resolve_connection_entity(entity_2),
+                    side1,
+                    side2,
+                )
+            )
+        self._connect_circuit_pairs(color, connections)
 
     def remove_circuit_connection(self, color, entity_1, entity_2, side1=1, side2=1):
         # type: (str, Union[EntityLike, int, str], Union[EntityLike, int, str], int, int) -> None
@@ -844,6 +1133,10 @@ class EntityCollection(object):
         except (KeyError, ValueError):
             pass
 
+        # Removing a connection might split the network it was part of
+        for index in ancestor_indexes(self, "circuit_index"):
+            index.disconnect(color, entity_1, entity_2, side1, side2)
+
     def remove_circuit_connections(self):
         # type: () -> None
         """
@@ -863,6 +1156,251 @@ class EntityCollection(object):
                     if "2" in entity.connections:
                         del entity.connections["2"]
 
+        for index in ancestor_indexes(self, "circuit_index"):
+            index.disconnect_all(self.entities)
+
+    def get_circuit_network(self, entity, color, side=1):
+        # type: (Union[EntityLike, int, str], str, int) -> list[tuple[EntityLike, int]]
+        """
+        Gets every connection point that shares a circuit network with a side
+        of an entity, including that side itself. The entity can be either a
+        reference to the entity, the index of the entity in the ``entities``
+        list, or it's string ID.
+
+        .. code-block:: python
+
+            blueprint.add_circuit_connection("red", "a", "b")
+            blueprint.add_circuit_connection("red", "b", "c")
+            network = blueprint.get_circuit_network("a", "red")
+            assert [e.id for e, side in network] == ["a", "b", "c"]
+
+        Networks are tracked by :py:attr:`circuit_index`, so the cost of this
+        query is proportional to the size of the network instead of the size of
+        the Collection.
+
+        :param entity: ID, index, or reference to the entity to query.
+        :param color: Color of the wire network. Must be either ``"red"`` or
+            ``"green"``.
+        :param side: Which side of the entity to query, where ``1`` is "input"
+            and ``2`` is "output". Defaults to ``1``.
+
+        :returns: A ``list`` of ``(entity, side)`` tuples, in the same order as
+            the entities appear in the Collection.
+
+        :exception KeyError, IndexError: If ``entity`` is an invalid ID or index
+            to the parent Collection.
+        :exception InvalidAssociationError: If ``entity`` is not inside the
+            parent Collection.
+        :exception InvalidWireTypeError: If ``color`` is neither ``"red"`` nor
+            ``"green"``.
+        :exception InvalidConnectionSideError: If ``side`` is neither ``1`` nor
+            ``2``.
+        :exception EntityNotCircuitConnectableError: If ``entity`` does not
+            have the capability to be circuit wire connected.
+        """
+        entity = self._resolve_circuit_query(entity, color, side)
+        network = self._get_circuit_index().get_network(entity, color, side)
+        if self.entity_index is not None:
+            network.sort(key=lambda point: point[1])
+            self.entity_index.sort(network, self.entities, key=lambda point: point[0])
+        return network
+
+    def get_circuit_network_id(self, entity, color, side=1):
+        # type: (Union[EntityLike, int, str], str, int) -> int
+        """
+        Gets an integer identifying the circuit network that a side of an entity
+        belongs to. Two connection points are on the same network if and only if
+        their network ids are equal. Ids remain consistent between queries as
+        long as no wire connections are added or removed.
+
+        :param entity: ID, index, or reference to the entity to query.
+        :param color: Color of the wire network. Must be either ``"red"`` or
+            ``"green"``.
+        :param side: Which side of the entity to query, where ``1`` is "input"
+            and ``2`` is "output". Defaults to ``1``.
+
+        :returns: The ``int`` id of the network.
+
+        :exception KeyError, IndexError: If ``entity`` is an invalid ID or index
+            to the parent Collection.
+        :exception InvalidAssociationError: If ``entity`` is not inside the
+            parent Collection.
+        :exception InvalidWireTypeError: If ``color`` is neither ``"red"`` nor
+            ``"green"``.
+        :exception InvalidConnectionSideError: If ``side`` is neither ``1`` nor
+            ``2``.
+        :exception EntityNotCircuitConnectableError: If ``entity`` does not
+            have the capability to be circuit wire connected.
+        """
+        entity = self._resolve_circuit_query(entity, color, side)
+        return self._get_circuit_index().get_network_id(entity, color, side)
+
+    def _resolve_circuit_query(self, entity, color, side):
+        # type: (Union[EntityLike, int, str], str, int) -> EntityLike
+        """
+        Resolves and validates the arguments of a circuit network query.
+        """
+        entity = self._resolve_connection_entity(entity)
+
+        if color not in {"red", "green"}:
+            raise InvalidWireTypeError(color)
+        if side not in {1, 2}:
+            raise InvalidConnectionSideError("'{}'".format(side))
+
+        if not entity.circuit_connectable:
+            raise EntityNotCircuitConnectableError(entity.name)
+
+        return entity
+
+    def _resolve_connection_entity(self, entity):
+        # type: (Union[EntityLike, int, str]) -> EntityLike
+        """
+        Resolves an ID, index, or reference to an entity in this collection,
+        making sure that it is actually contained within it. Uses
+        :py:attr:`entity_index` to check membership when available.
+        """
+        if not isinstance(entity, EntityLike):
+            entity = self.entities[entity]
+
+        index = self.entity_index
+        if index is not None and id(entity) in index.entities:
+            return entity
+        if entity not in self.entities:
+            raise InvalidAssociationError(
+                "entity ({}) not contained within this collection".format(entity)
+            )
+
+        return entity
+
+    def _connect_circuit_pairs(self, color, connections):
+        # type: (str, list[tuple[EntityLike, EntityLike, int, int]]) -> None
+        """
+        Validates and adds a batch of circuit connections between already
+        resolved entities. Nothing is modified unless every connection in the
+        batch is valid.
+        """
+        if color not in {"red", "green"}:
+            raise InvalidWireTypeError(color)
+
+        strict = self.validation_level is ValidationLevel.STRICT
+        checked = set()
+        wrong_sides = []
+        too_far = []
+        for entity_1, entity_2, side1, side2 in connections:
+            for entity, side in ((entity_1, side1), (entity_2, side2)):
+                if side not in {1, 2}:
+                    raise InvalidConnectionSideError("'{}'".format(side))
+                if id(entity) not in checked:
+                    if not entity.circuit_connectable:
+                        raise EntityNotCircuitConnectableError(entity.name)
+                    checked.add(id(entity))
+                if strict and side == 2 and not entity.dual_circuit_connectable:
+                    wrong_sides.append(entity)
+
+            if not strict:
+                continue
+            min_dist = min(
+                entity_1.circuit_wire_max_distance, entity_2.circuit_wire_max_distance
+            )
+            real_dist = distance(
+                entity_1.global_position.data, entity_2.global_position.data
+            )
+            if real_dist > min_dist:
+                too_far.append((entity_1, entity_2, real_dist, min_dist))
+
+        # Issue at most one warning of each kind for the entire batch
+        if wrong_sides:
+            warnings.warn(
+                "{} connection side(s) were specified as 2, but entity '{}' (and"
+                " possibly others) is not dual circuit connectable".format(
+                    len(wrong_sides), type(wrong_sides[0]).__name__
+                ),
+                ConnectionSideWarning,
+                stacklevel=3,
+            )
+        if too_far:
+            entity_1, entity_2, real_dist, min_dist = too_far[0]
+            warnings.warn(
+                "{} connection(s) are greater than their max connection distance;"
+                " distance between entity '{}' and entity '{}' ({}) is greater"
+                " than max connection distance ({})".format(
+                    len(too_far), entity_1.name, entity_2.name, real_dist, min_dist
+                ),
+                ConnectionDistanceWarning,
+                stacklevel=3,
+            )
+
+        indexes = [
+            index
+            for index in ancestor_indexes(self, "circuit_index")
+            if not index.stale
+        ]
+        for entity_1, entity_2, side1, side2 in connections:
+            self._write_circuit_connection(color, entity_1, entity_2, side1, side2)
+            for index in indexes:
+                index.union(color, entity_1, entity_2, side1, side2)
+
+    def _write_circuit_connection(self, color, entity_1, entity_2, side1, side2):
+        # type: (str, EntityLike, EntityLike, int, int) -> None
+        """
+        Adds the entries for a circuit connection to the ``connections`` of both
+        entities, without any validation.
+        """
+        # Add entity_2 to entity_1.connections
+
+        if six.text_type(side1) not in entity_1.connections:
+            entity_1.connections[six.text_type(side1)] = dict()
+        current_side = entity_1.connections[six.text_type(side1)]
+
+        if color not in current_side:
+            current_side[color] = list()
+        current_color = current_side[color]
+
+        # If dual circuit connectable specify the target side
+        if entity_2.dual_circuit_connectable:
+            entry = {"entity_id": Association(entity_2), "circuit_id": side2}
+        else:
+            # However, for most entities you dont need a target side
+            entry = {"entity_id": Association(entity_2)}
+
+        if entry not in current_color:
+            current_color.append(entry)
+
+        # Add entity_1 to entity_2.connections
+
+        if six.text_type(side2) not in entity_2.connections:
+            entity_2.connections[six.text_type(side2)] = dict()
+        current_side = entity_2.connections[six.text_type(side2)]
+
+        if color not in current_side:
+            current_side[color] = list()
+        current_color = current_side[color]
+
+        # If dual circuit connectable specify the target side
+        if entity_1.dual_circuit_connectable:
+            entry = {"entity_id": Association(entity_1), "circuit_id": side1}
+        else:
+            # However, for most entities you dont need a target side
+            entry = {"entity_id": Association(entity_1)}
+
+        if entry not in current_color:
+            current_color.append(entry)
+
+    def _get_circuit_index(self):
+        # type: () -> CircuitNetworkIndex
+        """
+        Gets the up-to-date circuit index of this collection, rebuilding it if
+        it is stale. Collections that do not maintain an index get a temporary
+        one.
+        """
+        index = self.circuit_index
+        if index is None:
+            index = CircuitNetworkIndex()
+            index.rebuild(self.entities)
+        elif index.stale:
+            index.rebuild(self.entities)
+        return index
+
 
 # =============================================================================
 
@@ -888,7 +1426,7 @@ class TileCollection(object):
         # type: () -> SpatialDataStructure
         """
         Object that holds the spatial information for the Tiles of this object,
-        usually a :py:class:`~draftsman.classes.spatialhashmap.SpatialHashMap`.
+        usually a :py:class:`~draftsman.classes.tile_hashmap.TileHashMap`.
         """
         pass
 
@@ -3,8 +3,11 @@
 from draftsman.classes.vector import Vector
 
 from draftsman.constants import Direction
+from draftsman import data
 from draftsman import utils
 
+from typing import Callable
+
 
 class CollisionSet:
     """
@@ -92,3 +95,48 @@ class CollisionSet:
     def __repr__(self):  # pragma: no coverage
         # type: () -> str
         return "<CollisionSet>{}".format(self.shapes)
+
+
+def get_collision_set_rotations(name, directions, generate):
+    # type: (str, list[int], Callable[[], dict[int, CollisionSet]]) -> dict[int, CollisionSet]
+    """
+    Gets the rotated collision sets of the entity prototype ``name`` for each
+    direction in ``directions``. Rotated collision sets are deterministic per
+    prototype name and direction, so they are only generated (via ``generate``)
+    the first time they are requested and then stored in a cache of the current
+    :py:class:`.Profile`.
+    Subsequent calls with the same name return the same ``CollisionSet``
+    instances, along with their cached points and projections.
+
+    .. NOTE::
+
+        Because the returned collision sets are shared between all entities of
+        the same name, they should never be modified in place.
+
+    :param name: The name of the entity prototype.
+    :param directions: The directions to get the collision sets for.
+    :param generate: A function that takes no arguments and returns a ``dict``
+        mapping each direction to it's rotated ``CollisionSet``. Only called if
+        the rotations for ``name`` are not yet cached.
+
+    :returns: A new ``dict`` mapping each direction to it's ``CollisionSet``.
+    """
+    # Rotated collision sets keyed by ``(name, direction)``
+    cache = data.get_profile().cache("collision_set_rotations")
+    try:
+        return {direction: cache[(name, direction)] for direction in directions}
+    except KeyError:
+        rotations = generate()
+        for direction, collision_set in rotations.items():
+            cache[(name, direction)] = collision_set
+        return {direction: rotations[direction] for direction in directions}
+
+
+def clear_collision_set_cache():
+    # type: () -> None
+    """
+    Clears the cache of rotated collision sets of the current
+    :py:class:`.Profile`. Should be called if the collision boxes of entity
+    prototypes change, such as after the Factorio data is updated.
+    """
+    data.get_profile().cache("collision_set_rotations").clear()
@@ -0,0 +1,652 @@
+# compiled_schema.py
+# -*- encoding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+from schema import Schema, SchemaError, And, Or, Use, Optional
+import six
+
+try:
+    from builtins import int as _int
+except ImportError:  # pragma: no coverage
+    _int = int
+
+
+class CompiledSchema(object):
+    """
+    Drop-in replacement for a ``schema.Schema`` object, which validates data
+    with plain Python functions generated from the schema instead of
+    interpreting the schema tree on every call.
+
+    ``Schema.validate()`` constructs a new ``Schema`` object for every node it
+    visits and dispatches on the type of each node every time, which adds up
+    quickly for nested formats like control behavior that are validated on
+    every property assignment and every entity imported from a blueprint
+    string. When a ``CompiledSchema`` is created, each node of the schema is
+    instead translated into a few lines of Python source, which are compiled
+    once into a set of functions that check and normalize the data directly:
+    :py:class:`schema.And` becomes a sequence of statements, :py:class:`schema.Or`
+    a chain of ``try`` blocks (or a single ``in`` check against a set of
+    literals), dicts a lookup table of per-key validator functions, and so on.
+
+    The compiled functions mostly only decide whether data is valid; they do
+    not construct error messages. If they reject the data, it is validated
+    again with the original schema, which raises the same ``SchemaError`` with
+    the same message that it always would. The exception is when a function
+    passed to :py:class:`schema.Use` (or a validator called through ``Schema``)
+    raises: the ``SchemaError`` is then built from the original exception as
+    the data is rejected and raised directly, so that the function is not
+    called a second time along with any side effects it has. Either way, the
+    outcome of :py:meth:`validate` is always the same as the outcome of
+    ``self.schema.validate()``; only the time it takes is different.
+
+    Supports ``Schema``, ``And``, ``Or``, ``Use``, dicts with literal (and
+    ``Optional`` literal) keys, lists, types, plain callables and literal
+    values. Any other validator object is called through ``Schema`` as
+    usual.
+
+    The generated source is only compiled into functions the first time the
+    schema is used, so that importing the many signatures in
+    :py:mod:`draftsman.signatures` is cheap. Unsupported schemas are still
+    rejected immediately.
+    """
+
+    def __init__(self, schema):
+        # type: (Schema) -> None
+        """
+        Translates ``schema`` into Python source, which is compiled the first
+        time it's used.
+
+        :param schema: The ``Schema`` object to compile.
+
+        :exception TypeError: If ``schema`` contains something that can't be
+            compiled, like dicts with non-literal keys.
+        """
+        self.schema = schema
+        self._compiler = _Compiler()
+        self._names = self._compiler.translate(schema)
+        self.source = self._compiler.source
+        self._function = None
+
+    def _compile(self):
+        # type: () -> None
+        # The generated entry point behaves exactly like ``validate()`` below,
+        # but saves a level of function calls on every validation
+        self._function, self.validate = self._compiler.build(*self._names)
+        self._compiler = None
+
+    @property
+    def function(self):
+        # type: () -> Callable
+        """
+        The compiled function that validates data against the schema, which
+        raises an internal exception instead of ``SchemaError``. Read only.
+        """
+        if self._function is None:
+            self._compile()
+        return self._function
+
+    def validate(self, data):
+        # type: (Any) -> Any
+        """
+        Validates and normalizes ``data``. Equivalent to
+        ``self.schema.validate(data)``.
+
+        :param data: The data to validate.
+
+        :returns: The normalized data.
+
+        :exception SchemaError: If ``data`` does not match the schema.
+        """
+        try:
+            return self.function(data)
+        except _Failure as failure:
+            raise SchemaError(failure.autos, failure.errors)
+        except _Reject:
+            return self.schema.validate(data)
+
+    def __repr__(self):  # pragma: no coverage
+        # type: () -> str
+        return "CompiledSchema({!r})".format(self.schema)
+
+
+class _Reject(Exception):
+    """
+    Raised by compiled validator functions when the data does not match.
+    """
+
+    pass
+
+
+class _Failure(_Reject):
+    """
+    Raised by compiled validator functions when a ``Use`` function or another
+    validator raises, carrying the parts of the ``SchemaError`` message that
+    ``schema`` would have built for it so far.
+    """
+
+    def __init__(self, autos, errors):
+        # type: (list, list) -> None
+        self.autos = autos
+        self.errors = errors
+
+    def within(self, auto, error):
+        # type: (Optional[str], Optional[str]) -> _Failure
+        """
+        Adds the message of an enclosing node, in front of the current ones.
+        """
+        self.autos.insert(0, auto)
+        self.errors.insert(0, error)
+        return self
+
+
+def _callable_str(function):
+    # type: (Callable) -> str
+    # The same name ``schema`` uses for functions in its messages
+    return getattr(function, "__name__", None) or str(function)
+
+
+def _use_failure(node, data, exception):
+    # type: (Use, Any, Exception) -> _Failure
+    """
+    Creates the failure for when the function of ``node`` raises
+    ``exception``, like ``Use.validate()`` does.
+    """
+    error = node._error.format(data) if node._error else None
+    if isinstance(exception, SchemaError):
+        return _Failure([None] + exception.autos, [error] + exception.errors)
+    message = "%s(%r) raised %r" % (_callable_str(node._callable), data, exception)
+    return _Failure([message], [error])
+
+
+def _validator_failure(node, data, exception):
+    # type: (Any, Any, Exception) -> _Failure
+    """
+    Creates the failure for when ``node.validate()`` raises ``exception``,
+    like ``Schema.validate()`` does.
+    """
+    if isinstance(exception, SchemaError):
+        return _Failure([None] + exception.autos, [None] + exception.errors)
+    message = "%r.validate(%r) raised %r" % (node, data, exception)
+    return _Failure([message], [None])
+
+
+def _or_failure(node, data, rejects, pure):
+    # type: (Or, Any, tuple[_Reject], tuple[bool]) -> _Reject
+    """
+    Creates the failure for when every option of ``node`` rejects ``data``,
+    like ``Or.validate()`` does. Options without a message of their own are
+    validated again to get one, unless they would call a ``Use`` function
+    again; if they would, the whole value is validated again instead.
+    """
+    if not any(isinstance(reject, _Failure) for reject in rejects):
+        return _Reject()
+    error = node._error.format(data) if node._error else None
+    autos = ["%r did not validate %r" % (node, data)]
+    errors = [error]
+    for option, reject, option_pure in zip(node._args, rejects, pure):
+        if isinstance(reject, _Failure):
+            autos += reject.autos
+            errors += [error] + reject.errors
+            continue
+        if not option_pure:
+            return _Reject()
+        try:
+            Schema(option, error=node._error).validate(data)
+        except SchemaError as exception:
+            autos += exception.autos
+            errors += exception.errors
+        else:  # pragma: no coverage
+            return _Reject()
+    return _Failure(autos, errors)
+
+
+def _pure(node):
+    # type: (Any) -> bool
+    """
+    Whether or not validating against ``node`` never calls a ``Use`` function
+    or other validator, so that it can be repeated without side effects.
+    """
+    node_type = type(node)
+    if node_type is Schema:
+        return not getattr(node, "_ignore_extra_keys", False) and _pure(node._schema)
+    elif node_type in (And, Or):
+        return not getattr(node, "_ignore_extra_keys", False) and all(
+            _pure(arg) for arg in node._args
+        )
+    elif node_type in (list, tuple, set, frozenset):
+        return all(_pure(arg) for arg in node)
+    elif isinstance(node, dict):
+        return all(_pure(value) for value in node.values())
+    elif isinstance(node, type):
+        return True
+    return not hasattr(node, "validate")
+
+
+def _validate_dict(data, handlers, required):
+    # type: (dict, dict, tuple) -> dict
+    """
+    Validates a dict against a dict schema with literal keys. ``handlers`` maps
+    each key to the compiled validator of its value, and ``required`` lists the
+    keys that must be present. Like ``Schema``, values that are not dicts are
+    validated (and inserted into the result) before values that are.
+    """
+    if not isinstance(data, dict):
+        raise _Reject
+    new = type(data)()
+    nested = None
+    for key, value in data.items():
+        if isinstance(value, dict):
+            if nested is None:
+                nested = []
+            nested.append((key, value))
+            continue
+        try:
+            handler = handlers[key]
+        except (KeyError, TypeError):
+            raise _Reject
+        try:
+            new[key] = handler(value)
+        except _Failure as failure:
+            raise failure.within("Key '%s' error:" % key, None)
+    if nested is not None:
+        for key, value in nested:
+            try:
+                handler = handlers[key]
+            except (KeyError, TypeError):
+                raise _Reject
+            try:
+                new[key] = handler(value)
+            except _Failure as failure:
+                raise failure.within("Key '%s' error:" % key, None)
+    for key in required:
+        if key not in new:
+            raise _Reject
+    return new
+
+
+# Dict schemas with at most this many keys are validated with inline code
+_inline_keys = 4
+
+# Types of literals that can be matched with a set lookup instead of ``==``
+_hashable_literals = (six.text_type, six.binary_type, type(None)) + six.integer_types
+
+
+class _Compiler(object):
+    """
+    Translates a schema into the source of a set of Python functions, one for
+    every ``Schema``, dict and list node in the tree.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        self.namespace = {
+            "_Reject": _Reject,
+            "_Failure": _Failure,
+            "_use_failure": _use_failure,
+            "_validator_failure": _validator_failure,
+            "_or_failure": _or_failure,
+            "_validate_dict": _validate_dict,
+        }
+        self.functions = {}
+        self.blocks = []
+        self.tables = []
+        self.counter = 0
+
+    @property
+    def source(self):
+        # type: () -> str
+        return "\n\n".join(self.blocks + self.tables)
+
+    def compile(self, node):
+        # type: (Any) -> tuple[Callable, Callable]
+        """
+        Compiles ``node``, and returns the function that validates it along
+        with an entry point that falls back to ``node.validate()`` if the data
+        is rejected.
+        """
+        return self.build(*self.translate(node))
+
+    def translate(self, node):
+        # type: (Any) -> tuple[str, str]
+        """
+        Generates the source of the functions that validate ``node``, and
+        returns the names of the function that validates it and of the entry
+        point.
+        """
+        name = self.function(node)
+
+        root = node
+        if (
+            type(root) is Schema
+            and not getattr(root, "_ignore_extra_keys", False)
+            and not root._error
+        ):
+            root = root._schema
+        entry = self.name("validate")
+        lines = ["def {}(data):".format(entry), "    value = data", "    try:"]
+        lines += self.statements(root, "value", 2)
+        lines += [
+            "    except _Failure as failure:",
+            "        raise {}(failure.autos, failure.errors)".format(
+                self.constant(SchemaError)
+            ),
+            "    except _Reject:",
+            "        return {}.validate(data)".format(self.constant(node)),
+            "    return value",
+        ]
+        self.blocks.append("\n".join(lines))
+        return name, entry
+
+    def build(self, name, entry):
+        # type: (str, str) -> tuple[Callable, Callable]
+        """
+        Compiles the generated source, and returns the functions called
+        ``name`` and ``entry``.
+        """
+        six.exec_(compile(self.source, "<compiled schema>", "exec"), self.namespace)
+        return self.namespace[name], self.namespace[entry]
+
+    def name(self, prefix):
+        # type: (str) -> str
+        self.counter += 1
+        return "{}{}".format(prefix, self.counter)
+
+    def constant(self, value):
+        # type: (Any) -> str
+        name = self.name("c")
+        self.namespace[name] = value
+        return name
+
+    def function(self, node):
+        # type: (Any) -> str
+        """
+        Creates a function that validates and returns its only argument
+        ``data``, and returns its name. Functions for the same node are only
+        created once, so schemas shared by many others (like ``SIGNAL_ID``)
+        are only compiled once.
+        """
+        key = id(node)
+        if key in self.functions:
+            return self.functions[key][0]
+        if (
+            type(node) is Schema
+            and not getattr(node, "_ignore_extra_keys", False)
+            and not node._error
+        ):
+            # A plain ``Schema`` wrapper validates the same as its contents
+            name = self.function(node._schema)
+            self.functions[key] = (name, node)
+            return name
+        name = self.name("f")
+        # Keep a reference to the node so that its id cannot be reused
+        self.functions[key] = (name, node)
+
+        if isinstance(node, dict):
+            body = self.dict(name, node)
+        else:
+            body = ["def {}(data):".format(name)]
+            body += self.statements(node, "data", 1)
+            body.append("    return data")
+        self.blocks.append("\n".join(body))
+        return name
+
+    def statements(self, node, var, depth):
+        # type: (Any, str, int) -> list[str]
+        """
+        Creates the lines that validate the variable ``var`` against ``node``,
+        replacing ``var`` with the normalized value.
+        """
+        indent = "    " * depth
+        node_type = type(node)
+
+        if node_type is Schema:
+            if getattr(node, "_ignore_extra_keys", False):
+                return self.delegate(node, var, depth)
+            lines = [
+                "{}{} = {}({})".format(indent, var, self.function(node._schema), var)
+            ]
+            return self.within(node._error, lines, var, depth)
+
+        elif node_type is And:
+            if getattr(node, "_ignore_extra_keys", False):
+                return self.delegate(node, var, depth)
+            lines = []
+            for arg in node._args:
+                lines += self.statements(arg, var, depth)
+            return self.within(node._error, lines, var, depth)
+
+        elif node_type is Or:
+            if getattr(node, "_ignore_extra_keys", False) or getattr(
+                node, "only_one", False
+            ):
+                return self.delegate(node, var, depth)
+            if all(
+                type(arg) in _hashable_literals and type(arg) is not bool
+                for arg in node._args
+            ):
+                return [
+                    "{}try:".format(indent),
+                    "{}    if {} not in {}:".format(
+                        indent, var, self.constant(frozenset(node._args))
+                    ),
+                    "{}        raise _Reject".format(indent),
+                    "{}except TypeError:".format(indent),
+                    "{}    raise _Reject".format(indent),
+                ]
+            # Each option is tried inside the ``except`` block of the one
+            # before it, so that the rejections of all of them are available
+            # for the error message if none match
+            result = self.name("t")
+            rejects = []
+            lines = []
+            for i, arg in enumerate(node._args):
+                inner = "    " * (depth + i)
+                rejects.append(self.name("r"))
+                lines.append("{}try:".format(inner))
+                lines.append("{}    {} = {}".format(inner, result, var))
+                lines += self.statements(arg, result, depth + i + 1)
+                lines.append("{}except _Reject as {}:".format(inner, rejects[-1]))
+            lines.append(
+                "{}    raise _or_failure({}, {}, ({},), {})".format(
+                    "    " * (depth + len(node._args) - 1),
+                    self.constant(node),
+                    var,
+                    ", ".join(rejects),
+                    self.constant(tuple(_pure(arg) for arg in node._args)),
+                )
+            )
+            lines.append("{}{} = {}".format(indent, var, result))
+            return lines
+
+        elif node_type is Use:
+            return [
+                "{}try:".format(indent),
+                "{}    {} = {}({})".format(
+                    indent, var, self.constant(node._callable), var
+                ),
+                "{}except Exception as exception:".format(indent),
+                "{}    raise _use_failure({}, {}, exception)".format(
+                    indent, self.constant(node), var
+                ),
+            ]
+
+        elif node_type in (list, tuple, set, frozenset):
+            element = self.function(Or(*node))
+            if node_type is list:
+                fast = "[{}(v) for v in {}]".format(element, var)
+            else:
+                fast = "{}({}(v) for v in {})".format(node_type.__name__, element, var)
+            return [
+                "{}if type({}) is {}:".format(indent, var, node_type.__name__),
+                "{}    {} = {}".format(indent, var, fast),
+                "{}elif isinstance({}, {}):".format(
+                    indent, var, self.constant(node_type)
+                ),
+                "{}    {} = type({})({}(v) for v in {})".format(
+                    indent, var, var, element, var
+                ),
+                "{}else:".format(indent),
+                "{}    raise _Reject".format(indent),
+            ]
+
+        elif isinstance(node, dict):
+            return ["{}{} = {}({})".format(indent, var, self.function(node), var)]
+
+        elif isinstance(node, type):
+            if node is bool:
+                return [
+                    "{}if {} is not True and {} is not False:".format(indent, var, var),
+                    "{}    raise _Reject".format(indent),
+                ]
+            condition = "not isinstance({}, {})".format(var, self.constant(node))
+            if node is int or node is _int:
+                # ``Schema(int)`` does not accept bools
+                condition += " or isinstance({}, bool)".format(var)
+            return [
+                "{}if {}:".format(indent, condition),
+                "{}    raise _Reject".format(indent),
+            ]
+
+        elif hasattr(node, "validate"):
+            return self.delegate(node, var, depth)
+
+        elif callable(node):
+            return [
+                "{}try:".format(indent),
+                "{}    valid = {}({})".format(indent, self.constant(node), var),
+                "{}except Exception:".format(indent),
+                "{}    raise _Reject".format(indent),
+                "{}if not valid:".format(indent),
+                "{}    raise _Reject".format(indent),
+            ]
+
+        else:
+            return [
+                "{}if not ({} == {}):".format(indent, self.constant(node), var),
+                "{}    raise _Reject".format(indent),
+            ]
+
+    def delegate(self, node, var, depth):
+        # type: (Any, str, int) -> list[str]
+        """
+        Creates the lines that validate ``var`` by calling ``node.validate()``,
+        for validators that cannot be compiled.
+        """
+        indent = "    " * depth
+        constant = self.constant(node)
+        return [
+            "{}try:".format(indent),
+            "{}    {} = {}.validate({})".format(indent, var, constant, var),
+            "{}except Exception as exception:".format(indent),
+            "{}    raise _validator_failure({}, {}, exception)".format(
+                indent, constant, var
+            ),
+        ]
+
+    def within(self, error, lines, var, depth):
+        # type: (Optional[str], list[str], str, int) -> list[str]
+        """
+        Wraps ``lines`` so that the error message of their node, if it has
+        one, is added to any failure raised from them.
+        """
+        if not error:
+            return lines
+        indent = "    " * depth
+        return (
+            ["{}try:".format(indent)]
+            + ["    " + line for line in lines]
+            + [
+                "{}except _Failure as failure:".format(indent),
+                "{}    raise failure.within(None, {}.format({}))".format(
+                    indent, self.constant(error), var
+                ),
+            ]
+        )
+
+    def dict(self, name, node):
+        # type: (str, dict) -> list[str]
+        entries = []
+        required = []
+        for key, value in node.items():
+            if type(key) is Optional:
+                if hasattr(key, "default"):
+                    raise TypeError(
+                        "Optional keys with defaults cannot be compiled ({!r})".format(
+                            key
+                        )
+                    )
+                key = key._schema
+            else:
+                required.append(key)
+            if type(key) not in _hashable_literals:
+                raise TypeError(
+                    "Only literal dict keys can be compiled ({!r})".format(key)
+                )
+            entries.append((self.constant(key), value))
+
+        # The table of handlers refers to the functions by name, so it is
+        # defined after all of them
+        table = self.name("h")
+        self.tables.append(
+            "{} = {{{}}}".format(
+                table,
+                ", ".join(
+                    "{}: {}".format(key, self.function(value)) for key, value in entries
+                ),
+            )
+        )
+        required = self.constant(tuple(required))
+        if len(entries) > _inline_keys:
+            return [
+                "def {}(data):".format(name),
+                "    return _validate_dict(data, {}, {})".format(table, required),
+            ]
+
+        # Small dicts (like SignalIDs) are common enough to be worth checking
+        # inline, which is the same as ``_validate_dict()`` with each handler
+        # written out in an if-chain
+        chain = []
+        for i, (key, value) in enumerate(entries):
+            chain.append("{} key == {}:".format("if" if i == 0 else "elif", key))
+            chain += ["    " + line for line in self.statements(value, "value", 0)]
+        if chain:
+            chain += ["else:", "    raise _Reject"]
+        else:
+            chain = ["raise _Reject"]
+        chain = (
+            ["try:"]
+            + ["    " + line for line in chain]
+            + [
+                "except _Failure as failure:",
+                "    raise failure.within(\"Key '%s' error:\" % key, None)",
+                "new[key] = value",
+            ]
+        )
+
+        lines = [
+            "def {}(data):".format(name),
+            "    if type(data) is not dict:",
+            "        return _validate_dict(data, {}, {})".format(table, required),
+            "    new = {}",
+            "    nested = None",
+            "    for key, value in data.items():",
+            "        if isinstance(value, dict):",
+            "            if nested is None:",
+            "                nested = []",
+            "            nested.append((key, value))",
+            "            continue",
+        ]
+        lines += ["        " + line for line in chain]
+        lines += [
+            "    if nested is not None:",
+            "        for key, value in nested:",
+        ]
+        lines += ["            " + line for line in chain]
+        lines += [
+            "    for key in {}:".format(required),
+            "        if key not in new:",
+            "            raise _Reject",
+            "    return new",
+        ]
+        return lines
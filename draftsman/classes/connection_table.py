@@ -0,0 +1,253 @@
+# connection_table.py
+# -*- encoding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+from draftsman.classes.association import Association
+from draftsman.error import InvalidAssociationError
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no coverage
+    from draftsman.classes.entity import Entity
+
+
+class ConnectionTable(object):
+    """
+    Flat table of every wire connection made by a list of entities, where each
+    entity is referred to by an integer "handle" equal to its position in the
+    list instead of by :py:class:`.Association`.
+
+    Each connection point is stored as a single edge tuple
+    ``(source, side, color, target, extra)``:
+
+    * Circuit connections have a ``side`` of ``"1"`` or ``"2"``, a ``color`` of
+      ``"red"`` or ``"green"``, and an ``extra`` of the ``circuit_id`` of the
+      target, or ``None`` if the target is not dual-circuit-connectable.
+    * Copper wire connections (power switches) have a ``side`` of ``"Cu0"`` or
+      ``"Cu1"``, a ``color`` of ``None``, and an ``extra`` of the ``wire_id``.
+    * Power pole connections (``neighbours``) have a ``side`` and ``color`` of
+      ``None``.
+
+    Edges are grouped by source, so the edges of any one entity are a
+    contiguous slice of :py:attr:`edges`. The ``connections`` and
+    ``neighbours`` of each entity can be derived from the table with
+    :py:meth:`connections` and :py:meth:`neighbours`, and the table can be
+    written back onto a different list of entities (such as a copy of the
+    original list) with :py:meth:`apply`. Both cost time proportional to the
+    number of edges, instead of searching for every connected entity in the
+    list.
+
+    The table is a snapshot; it does not update when the connections of the
+    entities change, and it is not a store of connections in its own right.
+    It is only built where a whole list of entities is translated at once:
+    :py:meth:`.Blueprint.to_dict()`, :py:meth:`.Blueprint.clone()`,
+    :py:meth:`.Group.clone()` and :py:meth:`.Blueprint.validate()`. Importing a
+    blueprint and ``copy.deepcopy()`` do not use it.
+    """
+
+    def __init__(self, entities):
+        # type: (list[Entity]) -> None
+        """
+        Creates a table of the connections of ``entities``.
+
+        :param entities: A flat list of entities, such as the one returned by
+            :py:func:`.flatten_entities`.
+
+        :exception InvalidAssociationError: If any entity is connected to an
+            entity that no longer exists, or to one that is not in
+            ``entities``.
+        """
+        self.entities = list(entities)
+        self.handles = {id(entity): i for i, entity in enumerate(self.entities)}
+        self.edges = []
+        # Index into ``edges`` where the edges of each source start; the edges
+        # of handle ``i`` are ``edges[starts[i]:starts[i + 1]]``
+        self.starts = [0]
+
+        for source, entity in enumerate(self.entities):
+            connections = getattr(entity, "connections", None)
+            if connections:
+                for side in connections:
+                    if side in {"1", "2"}:
+                        for color in connections[side]:
+                            for point in connections[side][color]:
+                                self.edges.append(
+                                    (
+                                        source,
+                                        side,
+                                        color,
+                                        self._target(entity, point["entity_id"]),
+                                        point.get("circuit_id", None),
+                                    )
+                                )
+                    elif side in {"Cu0", "Cu1"}:  # pragma: no branch
+                        for point in connections[side]:
+                            self.edges.append(
+                                (
+                                    source,
+                                    side,
+                                    None,
+                                    self._target(entity, point["entity_id"]),
+                                    point["wire_id"],
+                                )
+                            )
+            for neighbour in getattr(entity, "neighbours", None) or ():
+                self.edges.append(
+                    (source, None, None, self._target(entity, neighbour), None)
+                )
+            self.starts.append(len(self.edges))
+
+    def __len__(self):
+        # type: () -> int
+        return len(self.edges)
+
+    # =========================================================================
+
+    def handle(self, entity):
+        # type: (Entity) -> int
+        """
+        Gets the handle of an entity in the table.
+
+        :param entity: The entity to look up.
+
+        :returns: The ``int`` position of ``entity`` in :py:attr:`entities`.
+
+        :exception InvalidAssociationError: If ``entity`` is not in the table.
+        """
+        try:
+            return self.handles[id(entity)]
+        except KeyError:
+            raise InvalidAssociationError(
+                "'{}' is not contained within this table".format(entity)
+            )
+
+    def get_edges(self, handle):
+        # type: (int) -> list[tuple]
+        """
+        Gets all of the edges that originate from a particular entity.
+
+        :param handle: The handle of the source entity.
+
+        :returns: A ``list`` of edge tuples.
+        """
+        return self.edges[self.starts[handle] : self.starts[handle + 1]]
+
+    def connections(self, handle, offset=1):
+        # type: (int, int) -> dict
+        """
+        Derives the ``connections`` dict of an entity from the table, where
+        each connected entity is referred to by its handle plus ``offset``. With
+        the default ``offset`` of ``1``, this is the format of an exported
+        blueprint, where ``entity_id`` is the ``entity_number`` of the target.
+
+        :param handle: The handle of the entity.
+        :param offset: The amount to add to each target handle.
+
+        :returns: A ``dict`` in the same format as ``Entity.connections``, which
+            is empty if the entity has no wire connections.
+        """
+        connections = {}
+        for _, side, color, target, extra in self.get_edges(handle):
+            if side is None:
+                continue
+            point = {"entity_id": target + offset}
+            if color is None:
+                point["wire_id"] = extra
+                connections.setdefault(side, []).append(point)
+            else:
+                if extra is not None:
+                    point["circuit_id"] = extra
+                connections.setdefault(side, {}).setdefault(color, []).append(point)
+        return connections
+
+    def neighbours(self, handle, offset=1):
+        # type: (int, int) -> list[int]
+        """
+        Derives the ``neighbours`` list of an entity from the table, where each
+        connected entity is referred to by its handle plus ``offset``.
+
+        :param handle: The handle of the entity.
+        :param offset: The amount to add to each target handle.
+
+        :returns: A ``list`` of ``int``, which is empty if the entity has no
+            power pole connections.
+        """
+        return [
+            target + offset
+            for _, side, _, target, _ in self.get_edges(handle)
+            if side is None
+        ]
+
+    def apply(self, entities):
+        # type: (list[Entity]) -> None
+        """
+        Replaces the connections of ``entities`` with the ones in this table,
+        where the entity at each position in ``entities`` takes the place of the
+        entity with that handle. Used to reconnect a copy of the original list
+        of entities to itself, instead of to the original entities.
+
+        Only entities that have edges in the table are modified.
+
+        :param entities: A list of entities the same length as
+            :py:attr:`entities`, in the same order.
+        """
+        for handle, entity in enumerate(entities):
+            edges = self.get_edges(handle)
+            if not edges:
+                continue
+            # Clear the sides that the table describes before rewriting them
+            if hasattr(entity, "connections"):
+                for side in ("1", "2", "Cu0", "Cu1"):
+                    entity.connections.pop(side, None)
+            if hasattr(entity, "neighbours"):
+                del entity.neighbours[:]
+
+            for _, side, color, target, extra in edges:
+                association = Association(entities[target])
+                if side is None:
+                    entity.neighbours.append(association)
+                elif color is None:
+                    entity.connections.setdefault(side, []).append(
+                        {"entity_id": association, "wire_id": extra}
+                    )
+                else:
+                    point = {"entity_id": association}
+                    if extra is not None:
+                        point["circuit_id"] = extra
+                    entity.connections.setdefault(side, {}).setdefault(
+                        color, []
+                    ).append(point)
+
+    def __getstate__(self):
+        # type: () -> dict
+        # Handles are keyed by ``id()``, which pickling does not preserve
+        state = self.__dict__.copy()
+        del state["handles"]
+        return state
+
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        self.__dict__.update(state)
+        self.handles = {id(entity): i for i, entity in enumerate(self.entities)}
+
+    # =========================================================================
+
+    def _target(self, entity, association):
+        # type: (Entity, Association) -> int
+        target = association()
+        if target is None:
+            raise InvalidAssociationError(
+                "'{}' at {} is connected to an entity that no longer exists".format(
+                    entity.name, entity.position
+                )
+            )
+        try:
+            return self.handles[id(target)]
+        except KeyError:
+            raise InvalidAssociationError(
+                "'{}' at {} is connected to '{}' at {}, which is not contained "
+                "within this table".format(
+                    entity.name, entity.position, target.name, target.position
+                )
+            )
@@ -0,0 +1,78 @@
+# context_local.py
+# -*- encoding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+import threading
+from typing import Any
+
+try:  # pragma: no coverage
+    from contextvars import ContextVar
+except ImportError:  # pragma: no coverage
+    ContextVar = None
+
+
+class ContextLocal(object):
+    """
+    A value that is set separately in each context: each thread, and (where
+    :py:mod:`contextvars` is available) each ``asyncio`` task. Used for
+    settings that a ``with`` block changes temporarily, so that concurrent code
+    in other threads or tasks keeps its own value. Falls back to a
+    ``threading.local`` on Python versions without ``contextvars``.
+
+    The value is ``None`` in every context until it's set.
+
+    .. code-block:: python
+
+        current = ContextLocal("current")
+        token = current.set(value)
+        try:
+            current.get()  # value, only in this context
+        finally:
+            current.reset(token)
+    """
+
+    def __init__(self, name):
+        # type: (str) -> None
+        """
+        :param name: The name of the underlying ``ContextVar``, for debugging.
+        """
+        if ContextVar is not None:
+            var = ContextVar(name, default=None)
+            self.get = var.get
+            self.set = var.set
+            self.reset = var.reset
+        else:  # pragma: no coverage
+            self._local = threading.local()
+
+    def get(self):  # pragma: no coverage
+        # type: () -> Any
+        """
+        Gets the value in the current context.
+
+        :returns: The value, or ``None`` if it isn't set.
+        """
+        return getattr(self._local, "value", None)
+
+    def set(self, value):  # pragma: no coverage
+        # type: (Any) -> Any
+        """
+        Sets the value in the current context.
+
+        :param value: The value to set.
+
+        :returns: A token to pass to :py:meth:`reset`.
+        """
+        previous = self.get()
+        self._local.value = value
+        return previous
+
+    def reset(self, token):  # pragma: no coverage
+        # type: (Any) -> None
+        """
+        Restores the value from before the call to :py:meth:`set` that returned
+        ``token``.
+
+        :param token: The token returned by :py:meth:`set`.
+        """
+        self._local.value = token
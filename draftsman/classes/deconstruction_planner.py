@@ -8,7 +8,7 @@
         "deconstruction_planner": {
             "item": "deconstruction-planner", # The associated item with this structure
             "label": str, # A user given name for this deconstruction planner
-            "version": int, # The encoded version of Factorio this planner was created 
+            "version": int, # The encoded version of Factorio this planner was created
                             # with/designed for (64 bits)
             "settings": {
                 "entity_filter_mode": int, # 0 = Whitelist, 1 = Blacklist
@@ -19,7 +19,7 @@
                     },
                     ... # Up to 30 filters total
                 ]
-                "trees_and_rocks_only": bool, # Self explanatory, disables everything 
+                "trees_and_rocks_only": bool, # Self explanatory, disables everything
                                               # else
                 "tile_filter_mode": int, # 0 = Whitelist, 1 = Blacklist
                 "tile_filters": [ # A list of tiles to deconstruct
@@ -29,9 +29,9 @@
                     },
                     ... # Up to 30 filters total
                 ]
-                "tile_selection_mode": int, # 0 = Normal, 1 = Always, 2 = Never, 
+                "tile_selection_mode": int, # 0 = Normal, 1 = Always, 2 = Never,
                                             # 3 = Only
-                "description": str, # A user given description for this deconstruction 
+                "description": str, # A user given description for this deconstruction
                                     # planner
                 "icons": [ # A set of signals to act as visual identification
                     {
@@ -49,7 +49,7 @@ from __future__ import unicode_literals
 
 from draftsman import __factorio_version_info__
 from draftsman.classes.blueprintable import Blueprintable
-from draftsman.constants import FilterMode, TileSelectionMode
+from draftsman.constants import FilterMode, TileSelectionMode, ValidationLevel
 from draftsman.data import items
 from draftsman.error import DataFormatError, InvalidItemError
 from draftsman import signatures
@@ -71,15 +71,22 @@ class DeconstructionPlanner(Blueprintable):
     """
 
     @utils.reissue_warnings
-    def __init__(self, deconstruction_planner=None):
-        # type: (Union[str, dict]) -> None
+    def __init__(self, deconstruction_planner=None, validation_level=None):
+        # type: (Union[str, dict], Union[ValidationLevel, str]) -> None
         """
         TODO
+
+        :param validation_level: The :py:attr:`validation_level` of the
+            DeconstructionPlanner, which is also used when loading
+            ``deconstruction_planner``. Defaults to the current level.
+
+        :exception ValueError: If ``validation_level`` is not a valid level.
         """
         super(DeconstructionPlanner, self).__init__(
             root_item="deconstruction_planner",
             item="deconstruction-planner",
             init_data=deconstruction_planner,
+            validation_level=validation_level,
         )
 
     @utils.reissue_warnings
@@ -112,12 +119,13 @@ class DeconstructionPlanner(Blueprintable):
             self.icons = settings.pop("icons", None)
 
         # Issue warnings for any keyword not recognized by UpgradePlanner
-        for unused_arg in kwargs:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in kwargs:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
 
     # =========================================================================
     # Properties
@@ -12,16 +12,19 @@ from draftsman.classes.association import Association
 from draftsman.classes.collisionset import CollisionSet
 from draftsman.classes.entitylike import EntityLike
 from draftsman.classes.vector import Vector
-from draftsman.data import entities
+from draftsman import data
 from draftsman.error import InvalidEntityError, DraftsmanError
 from draftsman import utils
 
 import copy
 import json
-from typing import Union, Callable
+from typing import Union, Callable, TYPE_CHECKING
 from schema import Schema
 import six
 
+if TYPE_CHECKING:  # pragma: no coverage
+    from draftsman.classes.validation_report import ValidationReport
+
 
 class Entity(EntityLike):
     """
@@ -129,9 +132,10 @@ class Entity(EntityLike):
                 )
             )
         self._name = six.text_type(name)
+        prototype = data.get_profile().entities.raw[self.name]
 
         # Entity type
-        self._type = entities.raw[self.name]["type"]
+        self._type = prototype["type"]
 
         # ID (used in Blueprints and Groups)
         self.id = None
@@ -148,7 +152,7 @@ class Entity(EntityLike):
         # Collision set (Internal)
         # Check to see if we have overwritten this value with the better ones
         if not hasattr(self, "_overwritten_collision_set"):
-            collision_box = entities.raw[self.name]["collision_box"]
+            collision_box = prototype["collision_box"]
             self._collision_set = CollisionSet(
                 [
                     utils.AABB(
@@ -161,8 +165,8 @@ class Entity(EntityLike):
             )
 
         # Collision mask (Internal)
-        if "collision_mask" in entities.raw[self.name]:
-            self._collision_mask = set(entities.raw[self.name]["collision_mask"])
+        if "collision_mask" in prototype:
+            self._collision_mask = set(prototype["collision_mask"])
         else:  # Base default
             self._collision_mask = {
                 "item-layer",
@@ -177,13 +181,13 @@ class Entity(EntityLike):
             self._collision_set.get_bounding_box()
         )
         # But sometimes it can be overrided in special cases (rails)
-        if "tile_width" in entities.raw[self.name]:
-            self._tile_width = entities.raw[self.name]["tile_width"]
-        if "tile_height" in entities.raw[self.name]:
-            self._tile_height = entities.raw[self.name]["tile_height"]
+        if "tile_width" in prototype:
+            self._tile_width = prototype["tile_width"]
+        if "tile_height" in prototype:
+            self._tile_height = prototype["tile_height"]
 
         # Hidden? (Internal)
-        self._hidden = "hidden" in entities.raw[self.name]["flags"]
+        self._hidden = "hidden" in prototype["flags"]
 
         # Position
         if "position" in kwargs:
@@ -517,7 +521,7 @@ class Entity(EntityLike):
 
             Work in progress. May be incorrect, especially for modded entities.
         """
-        return entities.flippable[self.name]
+        return self.profile.entities.flippable[self.name]
 
     # =========================================================================
 
@@ -600,6 +604,20 @@ class Entity(EntityLike):
 
         return out
 
+    def _validate(self, report):
+        # type: (ValidationReport) -> None
+        """
+        Checks the data of the Entity as if it had all been set with strict
+        validation, adding each problem found to ``report`` instead of raising
+        or issuing it. Nothing is modified. Used by
+        :py:meth:`.Blueprint.validate()`; mixins and prototypes with checks of
+        their own extend this and call the ``super()`` version, so that every
+        check of the Entity runs.
+
+        :param report: The :py:class:`.ValidationReport` to add issues to.
+        """
+        pass
+
     def mergable_with(self, other):
         # type: (Entity) -> bool
         return (
@@ -3,9 +3,12 @@
 
 from draftsman.classes.association import Association
 from draftsman.classes.entitylike import EntityLike
+from draftsman.constants import ValidationLevel
+from draftsman import data
 from draftsman.entity import new_entity
 from draftsman.error import DuplicateIDError, InvalidAssociationError
 from draftsman import utils
+from draftsman import validation
 from draftsman.warning import HiddenEntityWarning
 
 try:  # pragma: no coverage
@@ -193,14 +196,22 @@ class EntityList(MutableSequence):
         # Convert to new Entity if constructed via string keyword
         new = False
         if isinstance(name, six.string_types):
-            entitylike = new_entity(name, **kwargs)
+            # Construct the entity with the validation level and profile of the
+            # collection it's being added to
+            with validation.level(self._parent.validation_level), data.profile(
+                self._parent.profile
+            ):
+                entitylike = new_entity(name, **kwargs)
             new = True
         else:
             entitylike = name
 
         if copy and not new:
             # Create a DEEPCopy of the entity if desired
-            entitylike = deepcopy(entitylike)
+            with validation.level(self._parent.validation_level), data.profile(
+                self._parent.profile
+            ):
+                entitylike = deepcopy(entitylike)
 
         # If we attempt to merge an entitylike that isn't a copy, bad things
         # will probably happen
@@ -441,6 +452,34 @@ class EntityList(MutableSequence):
 
         return new
 
+    def _clone(self, parent, memo):
+        # type: (EntityCollection, dict) -> EntityList
+        """
+        Creates a copy of the EntityList and every EntityLike inside of it with
+        :py:meth:`.EntityLike.clone`, with ``parent`` as the new parent. Unlike
+        :py:meth:`__deepcopy__`, the copied entities are placed directly into
+        the new list without calling any of ``parent``'s callbacks, and
+        Associations are not remapped; the caller is responsible for both.
+
+        :param parent: The ``EntityCollection`` that will own the copy.
+        :param memo: A ``dict`` which is populated with the copy of each
+            ``EntityLike`` (and any nested entities), keyed by the ``id()`` of
+            the original.
+
+        :returns: The new ``EntityList``.
+        """
+        new = EntityList(parent)
+        for entitylike in self.data:
+            entitylike_copy = entitylike._clone(memo)
+            entitylike_copy._parent = parent
+            new.data.append(entitylike_copy)
+
+        new.key_map = {key: memo[id(value)] for key, value in self.key_map.items()}
+        new.key_to_idx = dict(self.key_to_idx)
+        new.idx_to_key = dict(self.idx_to_key)
+
+        return new
+
     def check_entitylike(self, entitylike):
         # type: (EntityLike) -> None
         """
@@ -464,7 +503,10 @@ class EntityList(MutableSequence):
             raise DuplicateIDError(entitylike.id)
 
         # Warn if the placed entity is hidden
-        if getattr(entitylike, "hidden", False):
+        if (
+            getattr(entitylike, "hidden", False)
+            and self._parent.validation_level is ValidationLevel.STRICT
+        ):
             warnings.warn(
                 "Attempting to add hidden entity '{}'".format(type(entitylike)),
                 HiddenEntityWarning,
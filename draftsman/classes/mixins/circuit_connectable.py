@@ -3,13 +3,19 @@
 
 from __future__ import unicode_literals
 
+from draftsman.constants import ValidationLevel
 from draftsman import signatures
-from draftsman.data import entities
+from draftsman import data
 from draftsman.error import DataFormatError
 
 from schema import SchemaError
 import six
 
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no coverage
+    from draftsman.classes.validation_report import ValidationReport
+
 
 class CircuitConnectableMixin(object):
     """
@@ -26,20 +32,21 @@ class CircuitConnectableMixin(object):
 
     def __init__(self, name, similar_entities, **kwargs):
         # type: (str, list[str], **dict) -> None
+        profile = data.get_profile()
         super(CircuitConnectableMixin, self).__init__(name, similar_entities, **kwargs)
 
         self._circuit_connectable = True
 
-        if "circuit_wire_max_distance" in entities.raw[self.name]:
-            self._circuit_wire_max_distance = entities.raw[self.name][
+        if "circuit_wire_max_distance" in profile.entities.raw[self.name]:
+            self._circuit_wire_max_distance = profile.entities.raw[self.name][
                 "circuit_wire_max_distance"
             ]
-        elif "maximum_wire_distance" in entities.raw[self.name]:
-            self._circuit_wire_max_distance = entities.raw[self.name][
+        elif "maximum_wire_distance" in profile.entities.raw[self.name]:
+            self._circuit_wire_max_distance = profile.entities.raw[self.name][
                 "maximum_wire_distance"
             ]
-        elif "wire_max_distance" in entities.raw[self.name]:
-            self._circuit_wire_max_distance = entities.raw[self.name][
+        elif "wire_max_distance" in profile.entities.raw[self.name]:
+            self._circuit_wire_max_distance = profile.entities.raw[self.name][
                 "wire_max_distance"
             ]
 
@@ -81,7 +88,21 @@ class CircuitConnectableMixin(object):
     @connections.setter
     def connections(self, value):
         # type: (dict) -> None
+        if self.validation_level is ValidationLevel.NONE:
+            self._connections = {} if value is None else value
+            return
         try:
             self._connections = signatures.CONNECTIONS.validate(value)
         except SchemaError as e:
             six.raise_from(DataFormatError(e), None)
+
+    # =========================================================================
+
+    def _validate(self, report):
+        # type: (ValidationReport) -> None
+        super(CircuitConnectableMixin, self)._validate(report)
+
+        if self.connections:
+            report.check_format(
+                "connections", self.connections, signatures.CONNECTIONS, (self,)
+            )
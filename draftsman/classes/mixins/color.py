@@ -3,6 +3,7 @@
 
 from __future__ import unicode_literals
 
+from draftsman.constants import ValidationLevel
 from draftsman.error import DataFormatError
 from draftsman import signatures
 
@@ -14,6 +15,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no coverage
     from draftsman.classes.entity import Entity
+    from draftsman.classes.validation_report import ValidationReport
 
 
 class ColorMixin(object):
@@ -68,11 +70,21 @@ class ColorMixin(object):
     @color.setter
     def color(self, value):
         # type: (Union[list, dict]) -> None
+        if self.validation_level is ValidationLevel.NONE:
+            self._color = value
+            return
         try:
             self._color = signatures.COLOR.validate(value)
         except SchemaError as e:
             six.raise_from(DataFormatError(e), None)
 
+    def _validate(self, report):
+        # type: (ValidationReport) -> None
+        super(ColorMixin, self)._validate(report)
+
+        if self.color is not None:
+            report.check_format("color", self.color, signatures.COLOR, (self,))
+
     def merge(self, other):
         # type: (Entity) -> None
         super(ColorMixin, self).merge(other)
@@ -3,14 +3,21 @@
 
 from __future__ import unicode_literals
 
+from draftsman.constants import ValidationLevel
 from draftsman.error import DataFormatError
 from draftsman import signatures
 
 from abc import ABCMeta, abstractmethod
 from typing import Union
-from schema import SchemaError
+from schema import Schema, SchemaError
 import six
 
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no coverage
+    from draftsman.classes.validation_report import ValidationReport
+
+
 # six.add_metaclass(ABCMeta) # Doesn't work for some reason
 class ControlBehaviorMixin(six.with_metaclass(ABCMeta, object)):
     """
@@ -46,6 +53,10 @@ class ControlBehaviorMixin(six.with_metaclass(ABCMeta, object)):
         }
     }
 
+    # The signature that the ``control_behavior`` setter of each Entity
+    # validates against, so that it can also be checked after the fact
+    _control_behavior_signature = None  # type: Schema
+
     def __init__(self, name, similar_entities, **kwargs):
         # type: (str, list[str], **dict) -> None
         super(ControlBehaviorMixin, self).__init__(name, similar_entities, **kwargs)
@@ -103,12 +114,17 @@ class ControlBehaviorMixin(six.with_metaclass(ABCMeta, object)):
         condition = self.control_behavior[condition_name]
 
         # Check the inputs
-        try:
-            a = signatures.SIGNAL_ID_OR_NONE.validate(a)
-            cmp = signatures.COMPARATOR.validate(cmp)
-            b = signatures.SIGNAL_ID_OR_CONSTANT.validate(b)
-        except SchemaError as e:
-            six.raise_from(DataFormatError(e), None)
+        if self.validation_level is not ValidationLevel.NONE:
+            try:
+                a = signatures.SIGNAL_ID_OR_NONE.validate(a)
+                cmp = signatures.COMPARATOR.validate(cmp)
+                b = signatures.SIGNAL_ID_OR_CONSTANT.validate(b)
+            except SchemaError as e:
+                six.raise_from(DataFormatError(e), None)
+        else:
+            a = signatures.normalize_signal_name(a)
+            cmp = signatures.normalize_comparator(cmp)
+            b = signatures.normalize_signal_name(b)
 
         # A
         if a is None:
@@ -126,3 +142,17 @@ class ControlBehaviorMixin(six.with_metaclass(ABCMeta, object)):
         else:  # int
             condition["constant"] = b
             condition.pop("second_signal", None)
+
+    # =========================================================================
+
+    def _validate(self, report):
+        # type: (ValidationReport) -> None
+        super(ControlBehaviorMixin, self)._validate(report)
+
+        if self.control_behavior:
+            report.check_format(
+                "control_behavior",
+                self.control_behavior,
+                self._control_behavior_signature,
+                (self,),
+            )
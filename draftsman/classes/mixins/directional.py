@@ -4,7 +4,8 @@
 from __future__ import unicode_literals
 
 # from draftsman.classes.vector import Vector
-from draftsman.constants import Direction
+from draftsman.classes.collisionset import get_collision_set_rotations
+from draftsman.constants import Direction, ValidationLevel
 from draftsman.error import DraftsmanError
 from draftsman import utils
 from draftsman.warning import DirectionWarning
@@ -16,6 +17,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no coverage
     from draftsman.classes.entity import Entity
+    from draftsman.classes.validation_report import ValidationReport
 
 
 class DirectionalMixin(object):
@@ -50,7 +52,6 @@ class DirectionalMixin(object):
         # Technically this check is not necessary, but we include it for
         # completeness
         if not hasattr(self, "_overwritten_collision_set"):  # pragma: no branch
-            self._collision_set_rotation = {}
             # if hasattr(self, "_disable_collision_set_rotation"):
             #     # Set every collision orientation to the single collision_set
             #     for i in {0, 2, 4, 6}:
@@ -58,8 +59,12 @@ class DirectionalMixin(object):
             # else:
             # Automatically generate a set of rotated collision sets for every
             # orientation
-            for i in {0, 2, 4, 6}:
-                self._collision_set_rotation[i] = self._collision_set.rotate(i)
+            base_collision_set = self._collision_set
+            self._collision_set_rotation = get_collision_set_rotations(
+                self.name,
+                (0, 2, 4, 6),
+                lambda: {i: base_collision_set.rotate(i) for i in (0, 2, 4, 6)},
+            )
 
         self.direction = 0
         if "direction" in kwargs:
@@ -118,11 +123,12 @@ class DirectionalMixin(object):
             self._direction = Direction(value)
 
         if self._direction not in {0, 2, 4, 6}:
-            warnings.warn(
-                "'{}' only has 4-way rotation".format(type(self).__name__),
-                DirectionWarning,
-                stacklevel=2,
-            )
+            if self.validation_level is ValidationLevel.STRICT:
+                warnings.warn(
+                    "'{}' only has 4-way rotation".format(type(self).__name__),
+                    DirectionWarning,
+                    stacklevel=2,
+                )
             return
 
         # if self._direction == Direction.EAST or self._direction == Direction.WEST:
@@ -155,3 +161,14 @@ class DirectionalMixin(object):
         # type: (Entity) -> bool
         base_mergable = super(DirectionalMixin, self).mergable_with(other)
         return base_mergable and self.direction == other.direction
+
+    def _validate(self, report):
+        # type: (ValidationReport) -> None
+        super(DirectionalMixin, self)._validate(report)
+
+        if self.direction not in {0, 2, 4, 6}:
+            report.add(
+                DirectionWarning,
+                "'{}' only has 4-way rotation".format(type(self).__name__),
+                (self,),
+            )
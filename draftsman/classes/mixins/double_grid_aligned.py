@@ -4,12 +4,18 @@
 from __future__ import unicode_literals
 
 from draftsman.classes.vector import Vector
+from draftsman.constants import ValidationLevel
 from draftsman.warning import RailAlignmentWarning
 
 import math
 from typing import Union
 import warnings
 
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no coverage
+    from draftsman.classes.validation_report import ValidationReport
+
 
 class DoubleGridAlignedMixin(object):
     """
@@ -66,7 +72,9 @@ class DoubleGridAlignedMixin(object):
         super(DoubleGridAlignedMixin, type(self)).position.fset(self, value)
 
         # if the grid alignment is off, warn the user
-        if self._tile_position.x % 2 == 1 or self._tile_position.y % 2 == 1:
+        if self.validation_level is ValidationLevel.STRICT and (
+            self._tile_position.x % 2 == 1 or self._tile_position.y % 2 == 1
+        ):
             cast_position = Vector(
                 math.floor(self._tile_position.x / 2) * 2,
                 math.floor(self._tile_position.y / 2) * 2,
@@ -120,7 +128,9 @@ class DoubleGridAlignedMixin(object):
         super(DoubleGridAlignedMixin, type(self)).tile_position.fset(self, value)
 
         # if the grid alignment is off, warn the user
-        if self._tile_position.x % 2 == 1 or self._tile_position.y % 2 == 1:
+        if self.validation_level is ValidationLevel.STRICT and (
+            self._tile_position.x % 2 == 1 or self._tile_position.y % 2 == 1
+        ):
             cast_position = Vector(
                 math.floor(self._tile_position.x / 2) * 2,
                 math.floor(self._tile_position.y / 2) * 2,
@@ -133,3 +143,23 @@ class DoubleGridAlignedMixin(object):
                 RailAlignmentWarning,
                 stacklevel=2,
             )
+
+    # =========================================================================
+
+    def _validate(self, report):
+        # type: (ValidationReport) -> None
+        super(DoubleGridAlignedMixin, self)._validate(report)
+
+        if self._tile_position.x % 2 == 1 or self._tile_position.y % 2 == 1:
+            cast_position = Vector(
+                math.floor(self._tile_position.x / 2) * 2,
+                math.floor(self._tile_position.y / 2) * 2,
+            )
+            report.add(
+                RailAlignmentWarning,
+                "Double-grid aligned entity is not placed along chunk grid; "
+                "entity's position will be cast from {} to {} when imported".format(
+                    self._tile_position, cast_position
+                ),
+                (self,),
+            )
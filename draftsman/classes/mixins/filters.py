@@ -3,13 +3,19 @@
 
 from __future__ import unicode_literals
 
-from draftsman.data import items, entities
+from draftsman.constants import ValidationLevel
+from draftsman import data
 from draftsman.error import InvalidItemError, DataFormatError
 from draftsman import signatures
 
 from schema import SchemaError
 import six
 
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no coverage
+    from draftsman.classes.validation_report import ValidationReport
+
 
 class FiltersMixin(object):
     """
@@ -26,9 +32,10 @@ class FiltersMixin(object):
 
     def __init__(self, name, similar_entities, **kwargs):
         # type: (str, list[str], **dict) -> None
+        profile = data.get_profile()
         super(FiltersMixin, self).__init__(name, similar_entities, **kwargs)
 
-        self._filter_count = entities.raw[self.name].get("filter_count", 0)
+        self._filter_count = profile.entities.raw[self.name].get("filter_count", 0)
 
         self.filters = None
 
@@ -66,6 +73,7 @@ class FiltersMixin(object):
             to ``filter_count``.
         :exception InvalidItemError: If ``item`` is not a valid item name.
         """
+        profile = data.get_profile()
         if self.filters is None:
             self.filters = []
 
@@ -79,7 +87,10 @@ class FiltersMixin(object):
         if item is not None:
             # Make sure item string is unicode
             item = six.text_type(item)
-            if item not in items.raw:
+            if (
+                self.validation_level is ValidationLevel.STRICT
+                and item not in profile.items.raw
+            ):
                 raise InvalidItemError("'{}'".format(item))
 
         for i in range(len(self.filters)):
@@ -119,10 +130,16 @@ class FiltersMixin(object):
         :exception InvalidItemError: If the item name of one of the entries is
             not valid.
         """
+        profile = data.get_profile()
         if filters is None:
             self.filters = None
             return
 
+        level = self.validation_level
+        if level is ValidationLevel.NONE:
+            self.filters = filters
+            return
+
         # Normalize to standard internal format
         try:
             filters = signatures.FILTERS.validate(filters)
@@ -136,12 +153,36 @@ class FiltersMixin(object):
                     "Index {} exceeds the maximum number of filter slots for this "
                     "entity ({})".format(item["index"], self.filter_count)
                 )
-            if item["name"] not in items.raw:
+            if (
+                level is ValidationLevel.STRICT
+                and item["name"] not in profile.items.raw
+            ):
                 raise InvalidItemError("'{}'".format(item))
 
         for item in filters:
             self.set_item_filter(item["index"] - 1, item["name"])
 
+    def _validate(self, report):
+        # type: (ValidationReport) -> None
+        profile = data.get_profile()
+        super(FiltersMixin, self)._validate(report)
+
+        if not self.filters:
+            return
+        filters = report.check_format(
+            "filters", self.filters, signatures.FILTERS, (self,)
+        )
+        for item in filters or ():
+            if item["index"] > self.filter_count:
+                report.add(
+                    IndexError,
+                    "Index {} exceeds the maximum number of filter slots for this "
+                    "entity ({})".format(item["index"], self.filter_count),
+                    (self,),
+                )
+            if item["name"] not in profile.items.raw:
+                report.add(InvalidItemError, "'{}'".format(item["name"]), (self,))
+
     def merge(self, other):
         super(FiltersMixin, self).merge(other)
 
@@ -3,7 +3,9 @@
 
 from __future__ import unicode_literals
 
-from draftsman.data import entities, items
+from draftsman.constants import ValidationLevel
+from draftsman import data
+from draftsman.data import items
 from draftsman.error import DraftsmanError
 from draftsman.warning import IndexWarning, ItemCapacityWarning
 
@@ -14,6 +16,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no coverage
     from draftsman.classes.entity import Entity
+    from draftsman.classes.validation_report import ValidationReport
 
 
 class InventoryMixin(object):
@@ -34,9 +37,10 @@ class InventoryMixin(object):
     def __init__(self, name, similar_entities, **kwargs):
         # type: (str, list[str], **dict) -> None
         # TODO: fix this hack
+        profile = data.get_profile()
         try:
-            self._inventory_size = entities.raw[name]["inventory_size"]
-            self._inventory_bar_enabled = entities.raw[name].get(
+            self._inventory_size = profile.entities.raw[name]["inventory_size"]
+            self._inventory_bar_enabled = profile.entities.raw[name].get(
                 "enable_inventory_bar", True
             )
         except:
@@ -129,7 +133,10 @@ class InventoryMixin(object):
             if not 0 <= value < 65536:
                 # Error if out of range
                 raise IndexError("Bar index ({}) not in range [0, 65536)".format(value))
-            elif value >= self.inventory_size:
+            elif (
+                value >= self.inventory_size
+                and self.validation_level is ValidationLevel.STRICT
+            ):
                 # Warn if greater than what makes sense
                 warnings.warn(
                     "Bar index ({}) not in range [0, {})".format(
@@ -149,22 +156,51 @@ class InventoryMixin(object):
         """
         Issues warnings if the set item exceeds the inventory size of the entity.
         """
-        if item in items.raw:
-            stack_size = items.raw[item]["stack_size"]
+        profile = data.get_profile()
+        if item in profile.items.raw:
+            stack_size = profile.items.raw[item]["stack_size"]
             num_slots_add = int(math.ceil(count / float(stack_size)))
             num_slots_old = int(math.ceil(self.items.get(item, 0) / float(stack_size)))
 
             self._inventory_slots_occupied -= num_slots_old
             self._inventory_slots_occupied += num_slots_add
 
-        if self.inventory_slots_occupied > self.inventory_size:
-            warnings.warn(
-                "Current item requests exceeds the inventory size of this entity",
+        if self.validation_level is ValidationLevel.STRICT:
+            if self.inventory_slots_occupied > self.inventory_size:
+                warnings.warn(
+                    "Current item requests exceeds the inventory size of this entity",
+                    ItemCapacityWarning,
+                    stacklevel=2,
+                )
+
+        super(InventoryMixin, self).set_item_request(item, count)
+
+    def _validate(self, report):
+        # type: (ValidationReport) -> None
+        profile = data.get_profile()
+        super(InventoryMixin, self)._validate(report)
+
+        # Counted from the requests themselves, in case `items` was replaced
+        slots_occupied = 0
+        for item, count in self.items.items():
+            if item in profile.items.raw and isinstance(count, int):
+                stack_size = profile.items.raw[item]["stack_size"]
+                slots_occupied += int(math.ceil(count / float(stack_size)))
+        if slots_occupied > self.inventory_size:
+            report.add(
                 ItemCapacityWarning,
-                stacklevel=2,
+                "Current item requests exceeds the inventory size of this entity",
+                (self,),
             )
 
-        super(InventoryMixin, self).set_item_request(item, count)
+        if self.bar is not None and self.bar >= self.inventory_size:
+            report.add(
+                IndexWarning,
+                "Bar index ({}) not in range [0, {})".format(
+                    self.bar, self.inventory_size
+                ),
+                (self,),
+            )
 
     def merge(self, other):
         # type: (Entity) -> None
@@ -3,8 +3,9 @@
 
 from __future__ import unicode_literals
 
+from draftsman.constants import ValidationLevel
 from draftsman import signatures
-from draftsman.data import entities
+from draftsman import data
 from draftsman.data import items
 from draftsman.error import (
     InvalidItemError,
@@ -20,6 +21,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no coverage
     from draftsman.classes.entity import Entity
+    from draftsman.classes.validation_report import ValidationReport
 
 
 class InventoryFilterMixin(object):
@@ -37,9 +39,10 @@ class InventoryFilterMixin(object):
 
     def __init__(self, name, similar_entities, **kwargs):
         # type: (str, list[str], **dict) -> None
+        profile = data.get_profile()
         super(InventoryFilterMixin, self).__init__(name, similar_entities, **kwargs)
 
-        self._inventory_size = entities.raw[self.name]["inventory_size"]
+        self._inventory_size = profile.entities.raw[self.name]["inventory_size"]
 
         self.inventory = {}
         if "inventory" in kwargs:
@@ -93,6 +96,9 @@ class InventoryFilterMixin(object):
     @inventory.setter
     def inventory(self, value):
         # type: (dict) -> None
+        if self.validation_level is ValidationLevel.NONE:
+            self._inventory = {} if value is None else value
+            return
         try:
             self._inventory = signatures.INVENTORY_FILTER.validate(value)
         except SchemaError as e:
@@ -134,7 +140,10 @@ class InventoryFilterMixin(object):
 
         if not 0 <= value < 65536:
             raise IndexError("Bar index ({}) not in range [0, 65536)".format(value))
-        elif value >= self.inventory_size:
+        elif (
+            value >= self.inventory_size
+            and self.validation_level is ValidationLevel.STRICT
+        ):
             warnings.warn(
                 "Bar index ({}) not in range [0, {})".format(
                     value, self.inventory_size
@@ -162,6 +171,7 @@ class InventoryFilterMixin(object):
         :exception IndexError: If ``index`` lies outside the range
             ``[0, inventory_size)``.
         """
+        profile = data.get_profile()
         try:
             index = signatures.INTEGER.validate(index)
             item = signatures.STRING_OR_NONE.validate(item)
@@ -174,7 +184,10 @@ class InventoryFilterMixin(object):
         if item is not None:
             # Make sure item string is unicode
             item = six.text_type(item)
-            if item not in items.raw:
+            if (
+                self.validation_level is ValidationLevel.STRICT
+                and item not in profile.items.raw
+            ):
                 raise InvalidItemError(item)
 
         if not 0 <= index < self.inventory_size:
@@ -223,25 +236,71 @@ class InventoryFilterMixin(object):
         :exception IndexError: If the index of one of the entries lies outside
             the range ``[0, inventory_size)``.
         """
+        profile = data.get_profile()
         if filters is None:
             self.inventory.pop("filters", None)
             return
 
+        level = self.validation_level
+        if level is ValidationLevel.NONE:
+            self.inventory["filters"] = filters
+            return
+
         try:
             filters = signatures.FILTERS.validate(filters)
         except SchemaError as e:
             six.raise_from(DataFormatError(e), None)
 
         # Make sure the items are item signals
-        for item in filters:
-            if item["name"] not in items.raw:
-                raise InvalidItemError(item)
+        if level is ValidationLevel.STRICT:
+            for item in filters:
+                if item["name"] not in profile.items.raw:
+                    raise InvalidItemError(item)
 
         for i in range(len(filters)):
             self.set_inventory_filter(filters[i]["index"] - 1, filters[i]["name"])
 
     # =========================================================================
 
+    def _validate(self, report):
+        # type: (ValidationReport) -> None
+        profile = data.get_profile()
+        super(InventoryFilterMixin, self)._validate(report)
+
+        if not self.inventory:
+            return
+        inventory = report.check_format(
+            "inventory", self.inventory, signatures.INVENTORY_FILTER, (self,)
+        )
+        if inventory is None:
+            return
+
+        for item in inventory.get("filters", ()):
+            if item["name"] not in profile.items.raw:
+                report.add(InvalidItemError, item["name"], (self,))
+            if not 0 <= item["index"] - 1 < self.inventory_size:
+                report.add(
+                    IndexError,
+                    "Filter index ({}) not in range [0, {})".format(
+                        item["index"] - 1, self.inventory_size
+                    ),
+                    (self,),
+                )
+
+        bar = inventory.get("bar", None)
+        if bar is not None and not 0 <= bar < 65536:
+            report.add(
+                IndexError,
+                "Bar index ({}) not in range [0, 65536)".format(bar),
+                (self,),
+            )
+        elif bar is not None and bar >= self.inventory_size:
+            report.add(
+                IndexWarning,
+                "Bar index ({}) not in range [0, {})".format(bar, self.inventory_size),
+                (self,),
+            )
+
     def merge(self, other):
         # type: (Entity) -> None
         super(InventoryFilterMixin, self).merge(other)
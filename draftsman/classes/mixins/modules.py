@@ -1,10 +1,17 @@
 # modules.py
 
-from draftsman.data import entities, modules
+from draftsman.constants import ValidationLevel
+from draftsman import data
+from draftsman.data import modules
 from draftsman.warning import ModuleCapacityWarning
 
 import warnings
 
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no coverage
+    from draftsman.classes.validation_report import ValidationReport
+
 
 class ModulesMixin(object):  # (RequestItemsMixin)
     """
@@ -20,10 +27,11 @@ class ModulesMixin(object):  # (RequestItemsMixin)
         # type: (str, list[str], **dict) -> None
 
         # Get the total number of module slots
+        profile = data.get_profile()
         try:
-            self._total_module_slots = entities.raw[name]["module_specification"][
-                "module_slots"
-            ]
+            self._total_module_slots = profile.entities.raw[name][
+                "module_specification"
+            ]["module_slots"]
         except KeyError:
             self._total_module_slots = 0
 
@@ -61,21 +69,43 @@ class ModulesMixin(object):  # (RequestItemsMixin)
 
     def set_item_request(self, item, count):
         # type: (str, int) -> None
+        profile = data.get_profile()
         new_count = count if count is not None else 0
 
-        if item in modules.raw and new_count >= 0:
+        if item in profile.modules.raw and new_count >= 0:
             self._module_slots_occupied -= self.items.get(item, 0)
             self._module_slots_occupied += new_count
 
-        # Make sure we dont have too many modules in the Entity
-        if self.module_slots_occupied > self.total_module_slots:
-            warnings.warn(
+        if self.validation_level is ValidationLevel.STRICT:
+            # Make sure we dont have too many modules in the Entity
+            if self.module_slots_occupied > self.total_module_slots:
+                warnings.warn(
+                    "Current number of module slots used ({}) greater than max "
+                    "module capacity ({})".format(
+                        self.module_slots_occupied, self.total_module_slots
+                    ),
+                    ModuleCapacityWarning,
+                    stacklevel=2,
+                )
+
+        super(ModulesMixin, self).set_item_request(item, count)
+
+    def _validate(self, report):
+        # type: (ValidationReport) -> None
+        profile = data.get_profile()
+        super(ModulesMixin, self)._validate(report)
+
+        # Counted from the requests themselves, in case `items` was replaced
+        module_slots_occupied = 0
+        for item, count in self.items.items():
+            if item in profile.modules.raw and isinstance(count, int) and count >= 0:
+                module_slots_occupied += count
+        if module_slots_occupied > self.total_module_slots:
+            report.add(
+                ModuleCapacityWarning,
                 "Current number of module slots used ({}) greater than max "
                 "module capacity ({})".format(
-                    self.module_slots_occupied, self.total_module_slots
+                    module_slots_occupied, self.total_module_slots
                 ),
-                ModuleCapacityWarning,
-                stacklevel=2,
+                (self,),
             )
-
-        super(ModulesMixin, self).set_item_request(item, count)
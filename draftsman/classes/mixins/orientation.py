@@ -3,6 +3,7 @@
 
 from __future__ import unicode_literals
 
+from draftsman.constants import ValidationLevel
 from draftsman.warning import ValueWarning
 from draftsman.utils import Rectangle
 
@@ -12,6 +13,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no coverage
     from draftsman.classes.entity import Entity
+    from draftsman.classes.validation_report import ValidationReport
 
 
 class OrientationMixin(object):
@@ -75,7 +77,10 @@ class OrientationMixin(object):
             self._orientation = value
             self._collision_set.shapes[0].angle = 0
         elif isinstance(value, float):
-            if value is not None and not 0.0 <= value < 1.0:
+            if (
+                not 0.0 <= value < 1.0
+                and self.validation_level is ValidationLevel.STRICT
+            ):
                 warnings.warn(
                     "Orientation not in range [0.0, 1.0); will be cast to {} on import".format(
                         value % 1.0
@@ -88,6 +93,19 @@ class OrientationMixin(object):
         else:
             raise TypeError("'orientation' must be a float or None")
 
+    def _validate(self, report):
+        # type: (ValidationReport) -> None
+        super(OrientationMixin, self)._validate(report)
+
+        if self.orientation is not None and not 0.0 <= self.orientation < 1.0:
+            report.add(
+                ValueWarning,
+                "Orientation not in range [0.0, 1.0); will be cast to {} on import".format(
+                    self.orientation % 1.0
+                ),
+                (self,),
+            )
+
     def mergable_with(self, other):
         # type: (Entity) -> bool
         base_mergable = super(OrientationMixin, self).mergable_with(other)
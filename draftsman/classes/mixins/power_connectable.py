@@ -3,13 +3,20 @@
 
 from __future__ import unicode_literals
 
+from draftsman.constants import ValidationLevel
 from draftsman import signatures
+from draftsman import data
 from draftsman.data import entities
 from draftsman.error import DataFormatError
 
 from schema import SchemaError
 import six
 
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no coverage
+    from draftsman.classes.validation_report import ValidationReport
+
 
 class PowerConnectableMixin(object):
     """
@@ -26,16 +33,19 @@ class PowerConnectableMixin(object):
 
     def __init__(self, name, similar_entities, **kwargs):
         # type: (str, list[str], **dict) -> None
+        profile = data.get_profile()
         super(PowerConnectableMixin, self).__init__(name, similar_entities, **kwargs)
 
         self._power_connectable = True
 
-        if "maximum_wire_distance" in entities.raw[self.name]:
-            self._maximum_wire_distance = entities.raw[self.name][
+        if "maximum_wire_distance" in profile.entities.raw[self.name]:
+            self._maximum_wire_distance = profile.entities.raw[self.name][
                 "maximum_wire_distance"
             ]
         else:
-            self._maximum_wire_distance = entities.raw[self.name]["wire_max_distance"]
+            self._maximum_wire_distance = profile.entities.raw[self.name][
+                "wire_max_distance"
+            ]
 
         self.neighbours = []
         if "neighbours" in kwargs:
@@ -108,7 +118,21 @@ class PowerConnectableMixin(object):
     @neighbours.setter
     def neighbours(self, value):
         # type: (list) -> None
+        if self.validation_level is ValidationLevel.NONE:
+            self._neighbours = [] if value is None else value
+            return
         try:
             self._neighbours = signatures.NEIGHBOURS.validate(value)
         except SchemaError as e:
             six.raise_from(DataFormatError(e), None)
+
+    # =========================================================================
+
+    def _validate(self, report):
+        # type: (ValidationReport) -> None
+        super(PowerConnectableMixin, self)._validate(report)
+
+        if self.neighbours:
+            report.check_format(
+                "neighbours", self.neighbours, signatures.NEIGHBOURS, (self,)
+            )
@@ -4,7 +4,10 @@
 from __future__ import unicode_literals
 
 from draftsman import signatures
-from draftsman.data import recipes, modules
+from draftsman.classes.attribute_index import update_attribute
+from draftsman.constants import ValidationLevel
+from draftsman import data
+from draftsman.data import recipes
 from draftsman.error import InvalidRecipeError
 from draftsman.warning import ModuleLimitationWarning, ItemLimitationWarning
 
@@ -16,6 +19,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no coverage
     from draftsman.classes.entity import Entity
+    from draftsman.classes.validation_report import ValidationReport
 
 
 class RecipeMixin(object):
@@ -34,10 +38,11 @@ class RecipeMixin(object):
 
     def __init__(self, name, similar_entities, **kwargs):
         # type: (str, list[str], **dict) -> None
+        profile = data.get_profile()
         super(RecipeMixin, self).__init__(name, similar_entities, **kwargs)
 
         # List of all recipes that this machine can make
-        self._recipes = recipes.for_machine[self.name]
+        self._recipes = profile.recipes.for_machine[self.name]
 
         # Recipe that this machine is currently set to
         self.recipe = None
@@ -88,21 +93,31 @@ class RecipeMixin(object):
     @recipe.setter
     def recipe(self, value):
         # type: (str) -> None
+        profile = data.get_profile()
+        old_recipe = getattr(self, "_recipe", None)
         if value is None:
             self._recipe = None
+            update_attribute(self, "recipe", old_recipe)
             return
 
-        try:
-            value = signatures.STRING.validate(value)
-        except SchemaError as e:
-            six.raise_from(TypeError(e), None)
+        level = self.validation_level
+        if level is not ValidationLevel.NONE:
+            try:
+                value = signatures.STRING.validate(value)
+            except SchemaError as e:
+                six.raise_from(TypeError(e), None)
 
-        if value in self.recipes:
-            self._recipe = value
-        else:
-            raise InvalidRecipeError(
-                "'{}' not in this entity's valid recipes".format(value)
-            )
+            if level is ValidationLevel.STRICT and value not in self.recipes:
+                raise InvalidRecipeError(
+                    "'{}' not in this entity's valid recipes".format(value)
+                )
+
+        self._recipe = value
+        # Keep the indexes of any containing collections up to date
+        update_attribute(self, "recipe", old_recipe)
+
+        if level is not ValidationLevel.STRICT:
+            return
 
         # I'm gonna put this here, this technically only applies to
         # AssemblingMachine but technically this whole mixin only applies to
@@ -114,8 +129,8 @@ class RecipeMixin(object):
         if hasattr(self, "items") and self.items:
             for item in self.items:
                 # If the item is a module
-                if item in modules.raw:
-                    module = modules.raw[item]
+                if item in profile.modules.raw:
+                    module = profile.modules.raw[item]
                     # Check to see if the module is allowed with this recipe
                     if "limitation" in module:
                         if self.recipe not in module["limitation"]:
@@ -137,6 +152,45 @@ class RecipeMixin(object):
 
     # =========================================================================
 
+    def _validate(self, report):
+        # type: (ValidationReport) -> None
+        profile = data.get_profile()
+        super(RecipeMixin, self)._validate(report)
+
+        if self.recipe is None:
+            return
+        try:
+            recipe = signatures.STRING.validate(self.recipe)
+        except SchemaError as e:
+            report.add(TypeError, str(e), (self,))
+            return
+        if recipe not in self.recipes:
+            report.add(
+                InvalidRecipeError,
+                "'{}' not in this entity's valid recipes".format(recipe),
+                (self,),
+            )
+            return
+
+        # Check the item requests against the recipe
+        for item in self.items if hasattr(self, "items") else ():
+            if item in profile.modules.raw:
+                module = profile.modules.raw[item]
+                if "limitation" in module and recipe not in module["limitation"]:
+                    report.add(
+                        ModuleLimitationWarning,
+                        "Cannot use module '{}' with recipe '{}'".format(item, recipe),
+                        (self,),
+                    )
+            elif item not in recipes.get_recipe_ingredients(recipe):
+                report.add(
+                    ItemLimitationWarning,
+                    "Item '{}' is not used in the current recipe ({})".format(
+                        item, recipe
+                    ),
+                    (self,),
+                )
+
     def merge(self, other):
         # type: (Entity) -> None
         self.recipe = other.recipe
@@ -3,7 +3,9 @@
 
 from __future__ import unicode_literals
 
+from draftsman.constants import ValidationLevel
 from draftsman import signatures
+from draftsman import data
 from draftsman.data import items
 from draftsman.error import InvalidItemError, DataFormatError
 
@@ -14,6 +16,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no coverage
     from draftsman.classes.entity import Entity
+    from draftsman.classes.validation_report import ValidationReport
 
 
 class RequestFiltersMixin(object):
@@ -60,6 +63,7 @@ class RequestFiltersMixin(object):
         :exception InvalidItemError: If ``item`` is not a valid item name.
         :exception IndexError: If ``index`` is not in the range ``[0, 1000)``.
         """
+        profile = data.get_profile()
         try:
             index = signatures.INTEGER.validate(index)
             item = signatures.STRING_OR_NONE.validate(item)
@@ -67,12 +71,18 @@ class RequestFiltersMixin(object):
         except SchemaError as e:
             six.raise_from(TypeError(e), None)
 
-        if item is not None and item not in items.raw:
+        # The stack size of the item is needed when ``count`` is omitted
+        strict = self.validation_level is ValidationLevel.STRICT
+        if (
+            item is not None
+            and (strict or count is None)
+            and item not in profile.items.raw
+        ):
             raise InvalidItemError("'{}'".format(item))
         if not 0 <= index < 1000:
             raise IndexError("Filter index ({}) not in range [0, 1000)".format(index))
         if count is None:  # default count to the item's stack size
-            count = 0 if item is None else items.raw[item]["stack_size"]
+            count = 0 if item is None else profile.items.raw[item]["stack_size"]
         if count < 0:
             raise ValueError("Filter count ({}) must be positive".format(count))
 
@@ -108,6 +118,12 @@ class RequestFiltersMixin(object):
             specified above.
         :exception InvalidItemError: If ``item_x`` is not a valid item name.
         """
+        profile = data.get_profile()
+        level = self.validation_level
+        if level is ValidationLevel.NONE:
+            self.request_filters = filters
+            return
+
         # Validate filters
         try:
             filters = signatures.REQUEST_FILTERS.validate(filters)
@@ -115,14 +131,46 @@ class RequestFiltersMixin(object):
             six.raise_from(DataFormatError(e), None)
 
         # Make sure the items are items
-        for item in filters:
-            if item["name"] not in items.raw:
-                raise InvalidItemError(item["name"])
+        if level is ValidationLevel.STRICT:
+            for item in filters:
+                if item["name"] not in profile.items.raw:
+                    raise InvalidItemError(item["name"])
 
         self.request_filters = []
         for i in range(len(filters)):
             self.set_request_filter(i, filters[i]["name"], filters[i]["count"])
 
+    def _validate(self, report):
+        # type: (ValidationReport) -> None
+        profile = data.get_profile()
+        super(RequestFiltersMixin, self)._validate(report)
+
+        if not self.request_filters:
+            return
+        filters = report.check_format(
+            "request_filters",
+            self.request_filters,
+            signatures.REQUEST_FILTERS,
+            (self,),
+        )
+        for item in filters or ():
+            if item["name"] not in profile.items.raw:
+                report.add(InvalidItemError, "'{}'".format(item["name"]), (self,))
+            if not 0 <= item["index"] - 1 < 1000:
+                report.add(
+                    IndexError,
+                    "Filter index ({}) not in range [0, 1000)".format(
+                        item["index"] - 1
+                    ),
+                    (self,),
+                )
+            if item["count"] < 0:
+                report.add(
+                    ValueError,
+                    "Filter count ({}) must be positive".format(item["count"]),
+                    (self,),
+                )
+
     def merge(self, other):
         # type: (Entity) -> None
         super(RequestFiltersMixin, self).merge(other)
@@ -3,8 +3,10 @@
 
 from __future__ import unicode_literals
 
+from draftsman.constants import ValidationLevel
 from draftsman import signatures
-from draftsman.data import entities, modules, items
+from draftsman import data
+from draftsman.data import modules, items
 from draftsman.error import InvalidItemError
 from draftsman.utils import reissue_warnings
 from draftsman.warning import ModuleCapacityWarning
@@ -17,6 +19,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no coverage
     from draftsman.classes.entity import Entity
+    from draftsman.classes.validation_report import ValidationReport
 
 
 class RequestItemsMixin(object):
@@ -69,16 +72,19 @@ class RequestItemsMixin(object):
         :exception InvalidItemError: If ``item`` is not a valid item name.
         :exception ValueError: If ``count`` is less than zero.
         """
-        try:
-            item = signatures.STRING.validate(item)
-            count = signatures.INTEGER_OR_NONE.validate(count)
-        except SchemaError as e:
-            six.raise_from(TypeError(e), None)
-
-        if item not in items.raw:
-            raise InvalidItemError("'{}'".format(item))
-        if count is not None and count < 0:
-            raise ValueError("'count' must be a positive number")
+        profile = data.get_profile()
+        level = self.validation_level
+        if level is not ValidationLevel.NONE:
+            try:
+                item = signatures.STRING.validate(item)
+                count = signatures.INTEGER_OR_NONE.validate(count)
+            except SchemaError as e:
+                six.raise_from(TypeError(e), None)
+
+            if level is ValidationLevel.STRICT and item not in profile.items.raw:
+                raise InvalidItemError("'{}'".format(item))
+            if count is not None and count < 0:
+                raise ValueError("'count' must be a positive number")
 
         if count is None or count == 0:
             self.items.pop(item, None)
@@ -116,6 +122,24 @@ class RequestItemsMixin(object):
             for name, count in items.items():
                 self.set_item_request(name, count)
 
+    def _validate(self, report):
+        # type: (ValidationReport) -> None
+        profile = data.get_profile()
+        super(RequestItemsMixin, self)._validate(report)
+
+        for item, count in self.items.items():
+            try:
+                item = signatures.STRING.validate(item)
+                count = signatures.INTEGER_OR_NONE.validate(count)
+            except SchemaError as e:
+                report.add(TypeError, str(e), (self,))
+                continue
+
+            if item not in profile.items.raw:
+                report.add(InvalidItemError, "'{}'".format(item), (self,))
+            if count is not None and count < 0:
+                report.add(ValueError, "'count' must be a positive number", (self,))
+
     def merge(self, other):
         # type: (Entity) -> None
         super(RequestItemsMixin, self).merge(other)
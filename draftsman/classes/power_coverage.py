@@ -0,0 +1,338 @@
+# power_coverage.py
+# -*- encoding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+from draftsman import data
+from draftsman.error import InvalidAssociationError
+
+import math
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no coverage
+    from draftsman.classes.entity import Entity
+
+
+class PowerCoverage(object):
+    """
+    Snapshot of the electric networks formed by a list of entities. Answers
+    which entities are within the supply area of an electric pole, which poles
+    are wired together into the same copper network, and which entities that
+    consume electricity are not covered by any pole at all.
+
+    The supply areas of every pole are rasterized onto a grid of tiles when the
+    object is created. The grid is split into square chunks of
+    :py:attr:`chunk_size` tiles, each one a flat ``bytearray``, so that only
+    the parts of the blueprint that contain poles take up memory and each row
+    of a supply area is filled with a single slice assignment. Checking whether
+    an entity is covered then only looks at the tiles underneath it, making the
+    cost of the whole analysis proportional to the number of entities plus the
+    total area supplied by poles, instead of the number of poles times the
+    number of entities.
+
+    Copper networks are the connected components of the ``neighbours`` of each
+    pole. Connections to poles outside of the list are ignored, as are the
+    copper connections of power switches, since whether or not a switch joins
+    the networks on either side of it depends on its state in-game.
+
+    The analysis is a snapshot; it does not update when entities are moved or
+    connections are changed.
+    """
+
+    chunk_size = 32
+
+    def __init__(self, entities):
+        # type: (list[Entity]) -> None
+        """
+        Analyzes ``entities``.
+
+        :param entities: A flat list of entities, such as the one returned by
+            :py:func:`.flatten_entities`.
+        """
+        self.poles = []
+        self.consumers = []
+        self.chunks = {}
+        self.network_ids = {}
+        self.networks = []
+
+        # Tile rectangle ``(x1, y1, x2, y2)`` (inclusive) underneath each
+        # consumer, and the consumers binned by the chunks they touch
+        self._consumer_tiles = []
+        self._consumer_handles = {}
+        self._consumer_grid = {}
+
+        for entity in entities:
+            if entity.type == "electric-pole":
+                self.poles.append(entity)
+            elif uses_electricity(entity):
+                tiles = get_tile_rect(entity.get_world_bounding_box())
+                if tiles is None:
+                    continue
+                handle = len(self.consumers)
+                self.consumers.append(entity)
+                self._consumer_tiles.append(tiles)
+                self._consumer_handles[id(entity)] = handle
+                for chunk in self._chunks_in(tiles):
+                    try:
+                        self._consumer_grid[chunk].append(handle)
+                    except KeyError:
+                        self._consumer_grid[chunk] = [handle]
+
+        for pole in self.poles:
+            self._fill(get_tile_rect(get_supply_area(pole)))
+
+        self._find_networks()
+
+    # =========================================================================
+
+    def is_covered(self, entity):
+        # type: (Entity) -> bool
+        """
+        Checks whether any of the tiles underneath an entity are within the
+        supply area of a pole.
+
+        :param entity: The entity to check. Does not need to be one of the
+            analyzed entities.
+
+        :returns: ``True`` if the entity is inside of a supply area, ``False``
+            otherwise, or if the entity has no collision box.
+        """
+        handle = self._consumer_handles.get(id(entity), None)
+        if handle is not None:
+            tiles = self._consumer_tiles[handle]
+        else:
+            tiles = get_tile_rect(entity.get_world_bounding_box())
+            if tiles is None:
+                return False
+        return self._any(tiles)
+
+    def get_uncovered_entities(self):
+        # type: () -> list[Entity]
+        """
+        Gets every entity that consumes electricity but is not within the supply
+        area of any pole.
+
+        :returns: A ``list`` of entities, in the same order as they were given.
+        """
+        return [
+            consumer
+            for consumer, tiles in zip(self.consumers, self._consumer_tiles)
+            if not self._any(tiles)
+        ]
+
+    def get_supplied_entities(self, pole):
+        # type: (Entity) -> list[Entity]
+        """
+        Gets every entity that consumes electricity within the supply area of a
+        pole.
+
+        :param pole: The electric pole to query. Does not need to be one of the
+            analyzed entities.
+
+        :returns: A ``list`` of entities, in the same order as they were given.
+        """
+        x1, y1, x2, y2 = area = get_tile_rect(get_supply_area(pole))
+        handles = set()
+        for chunk in self._chunks_in(area):
+            handles.update(self._consumer_grid.get(chunk, ()))
+
+        result = []
+        for handle in sorted(handles):
+            tx1, ty1, tx2, ty2 = self._consumer_tiles[handle]
+            if tx1 <= x2 and tx2 >= x1 and ty1 <= y2 and ty2 >= y1:
+                result.append(self.consumers[handle])
+        return result
+
+    def get_network_id(self, pole):
+        # type: (Entity) -> int
+        """
+        Gets the copper network that a pole belongs to.
+
+        :param pole: The electric pole to query.
+
+        :returns: An ``int`` index into :py:attr:`networks`.
+
+        :exception InvalidAssociationError: If ``pole`` is not one of the
+            analyzed poles.
+        """
+        try:
+            return self.network_ids[id(pole)]
+        except KeyError:
+            raise InvalidAssociationError(
+                "'{}' is not an analyzed electric pole".format(pole)
+            )
+
+    def get_network(self, pole):
+        # type: (Entity) -> list[Entity]
+        """
+        Gets every pole that is wired to the same copper network as a pole,
+        including that pole itself.
+
+        :param pole: The electric pole to query.
+
+        :returns: A ``list`` of poles, in the same order as they were given.
+
+        :exception InvalidAssociationError: If ``pole`` is not one of the
+            analyzed poles.
+        """
+        return self.networks[self.get_network_id(pole)]
+
+    def __getstate__(self):
+        # type: () -> dict
+        # Both of these are keyed by ``id()``, which pickling does not preserve
+        state = self.__dict__.copy()
+        del state["_consumer_handles"]
+        del state["network_ids"]
+        return state
+
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        self.__dict__.update(state)
+        self._consumer_handles = {
+            id(consumer): handle for handle, consumer in enumerate(self.consumers)
+        }
+        self.network_ids = {
+            id(pole): network_id
+            for network_id, network in enumerate(self.networks)
+            for pole in network
+        }
+
+    # =========================================================================
+
+    def _find_networks(self):
+        # type: () -> None
+        handles = {id(pole): i for i, pole in enumerate(self.poles)}
+        parents = list(range(len(self.poles)))
+
+        def find(i):
+            root = i
+            while parents[root] != root:
+                root = parents[root]
+            while parents[i] != root:
+                parents[i], i = root, parents[i]
+            return root
+
+        for i, pole in enumerate(self.poles):
+            for neighbour in pole.neighbours:
+                j = handles.get(id(neighbour()), None)
+                if j is not None:
+                    parents[find(i)] = find(j)
+
+        roots = {}
+        for i, pole in enumerate(self.poles):
+            root = find(i)
+            if root not in roots:
+                roots[root] = len(self.networks)
+                self.networks.append([])
+            self.network_ids[id(pole)] = roots[root]
+            self.networks[roots[root]].append(pole)
+
+    def _chunks_in(self, tiles):
+        # type: (tuple[int, int, int, int]) -> list[tuple[int, int]]
+        size = self.chunk_size
+        x1, y1, x2, y2 = tiles
+        return [
+            (cx, cy)
+            for cx in range(x1 // size, x2 // size + 1)
+            for cy in range(y1 // size, y2 // size + 1)
+        ]
+
+    def _fill(self, tiles):
+        # type: (tuple[int, int, int, int]) -> None
+        size = self.chunk_size
+        x1, y1, x2, y2 = tiles
+        for cx, cy in self._chunks_in(tiles):
+            try:
+                chunk = self.chunks[(cx, cy)]
+            except KeyError:
+                chunk = self.chunks[(cx, cy)] = bytearray(size * size)
+            left = max(x1 - cx * size, 0)
+            right = min(x2 - cx * size, size - 1) + 1
+            row = b"\x01" * (right - left)
+            for y in range(max(y1 - cy * size, 0), min(y2 - cy * size, size - 1) + 1):
+                chunk[y * size + left : y * size + right] = row
+
+    def _any(self, tiles):
+        # type: (tuple[int, int, int, int]) -> bool
+        size = self.chunk_size
+        x1, y1, x2, y2 = tiles
+        for cx, cy in self._chunks_in(tiles):
+            chunk = self.chunks.get((cx, cy), None)
+            if chunk is None:
+                continue
+            left = max(x1 - cx * size, 0)
+            right = min(x2 - cx * size, size - 1) + 1
+            for y in range(max(y1 - cy * size, 0), min(y2 - cy * size, size - 1) + 1):
+                if 1 in chunk[y * size + left : y * size + right]:
+                    return True
+        return False
+
+
+# =============================================================================
+
+
+def uses_electricity(entity):
+    # type: (Entity) -> bool
+    """
+    Checks whether an entity has an electric energy source, and therefore needs
+    to be within the supply area of an electric pole to work. Electric poles
+    themselves do not.
+
+    :param entity: The entity to check.
+
+    :returns: ``True`` if the entity consumes (or produces) electricity,
+        ``False`` otherwise.
+    """
+    # Entity name -> result in the current profile
+    profile = data.get_profile()
+    cache = profile.cache("uses_electricity")
+    try:
+        return cache[entity.name]
+    except KeyError:
+        prototype = profile.entities.raw.get(entity.name, {})
+        energy_source = prototype.get("energy_source", None) or {}
+        result = (
+            prototype.get("type", None) != "electric-pole"
+            and energy_source.get("type", None) == "electric"
+        )
+        cache[entity.name] = result
+        return result
+
+
+def get_supply_area(pole):
+    # type: (Entity) -> list[list[float]]
+    """
+    Gets the world-space area that an electric pole supplies power to.
+
+    :param pole: The electric pole.
+
+    :returns: A ``list`` of two points, ``[top_left, bot_right]``.
+    """
+    distance = pole.supply_area_distance
+    position = pole.global_position
+    return [
+        [position.x - distance, position.y - distance],
+        [position.x + distance, position.y + distance],
+    ]
+
+
+def get_tile_rect(box):
+    # type: (list[list[float]]) -> tuple[int, int, int, int]
+    """
+    Gets the range of tiles that an area covers.
+
+    :param box: The area, either an :py:class:`.AABB` or a ``list`` of two
+        points, ``[top_left, bot_right]``.
+
+    :returns: A ``tuple`` of the first and last tile in each axis,
+        ``(x1, y1, x2, y2)``, or ``None`` if ``box`` is ``None``.
+    """
+    if box is None:
+        return None
+    if not isinstance(box, list):
+        box = [box.top_left, box.bot_right]
+    x1 = int(math.floor(box[0][0]))
+    y1 = int(math.floor(box[0][1]))
+    x2 = max(int(math.ceil(box[1][0])) - 1, x1)
+    y2 = max(int(math.ceil(box[1][1])) - 1, y1)
+    return (x1, y1, x2, y2)
@@ -0,0 +1,358 @@
+# profile.py
+# -*- encoding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+from draftsman.classes.prototype_database import PrototypeDatabase
+
+import abc
+from functools import wraps
+import importlib
+import os
+import types
+from typing import Any, Callable
+import warnings
+
+# The modules of `draftsman.data` that are loaded from files
+_modules = (
+    "entities",
+    "instruments",
+    "items",
+    "mods",
+    "modules",
+    "recipes",
+    "signals",
+    "tiles",
+)
+
+
+class Profile(object):
+    """
+    A set of Factorio data, such as the data for the base game or for a
+    particular mod pack, loaded from a folder written by ``draftsman-update``.
+    Profiles let a single program work with several sets of data side by side,
+    without having to re-import Draftsman for each of them.
+
+    The data of each module in :py:mod:`draftsman.data` is only loaded from the
+    folder the first time it's accessed through this profile, and is kept
+    afterwards. Creating a profile with the same folder as an existing one
+    returns the existing profile, so its data is only ever loaded once.
+
+    The names in :py:mod:`draftsman.data`, like ``entities.raw`` or
+    ``signals.type_of``, always refer to the data of the current profile; see
+    :py:func:`draftsman.data.get_profile` and
+    :py:func:`draftsman.data.profile`.
+
+    .. code-block:: python
+
+        from draftsman import data
+
+        modded = data.Profile("path/to/modded-data")
+        modded.entities.raw["modded-chest"] # Only the data of `modded`
+
+        with data.profile(modded):
+            "modded-chest" in data.entities.raw # True
+        "modded-chest" in data.entities.raw # False
+    """
+
+    # Folder -> Profile
+    _profiles = {}  # type: dict[str, Profile]
+
+    def __new__(cls, path):
+        # type: (str) -> Profile
+        """
+        Gets the profile of the data in the folder ``path``, creating it if it
+        doesn't exist yet.
+
+        :param path: The folder to load the data from, containing the files
+            written by ``draftsman-update`` (``entities.pkl``, ``items.pkl``,
+            etc.).
+
+        :exception ValueError: If ``path`` is not a folder.
+        """
+        path = os.path.realpath(path)
+        try:
+            return cls._profiles[path]
+        except KeyError:
+            pass
+        if not os.path.isdir(path):
+            raise ValueError("'{}' is not a folder".format(path))
+        self = super(Profile, cls).__new__(cls)
+        self._path = path
+        self._caches = {}
+        cls._profiles[path] = self
+        if len(cls._profiles) == 2:
+            ProfileMeta.decorate_pending()
+        return self
+
+    # =========================================================================
+
+    @property
+    def path(self):
+        # type: () -> str
+        """
+        The folder the data of this profile is loaded from. Read only.
+
+        :type: ``str``
+        """
+        return self._path
+
+    # =========================================================================
+
+    def __getattr__(self, name):
+        # type: (str) -> Any
+        # Only called the first time each module is accessed, as the loaded
+        # module is then stored as a regular attribute
+        if name not in _modules:
+            raise AttributeError(
+                "'{}' object has no attribute '{}'".format(type(self).__name__, name)
+            )
+        module = importlib.import_module("draftsman.data." + name)
+        result = ProfileModule(module._read(self._path))
+        setattr(self, name, result)
+        return result
+
+    def cache(self, name):
+        # type: (str) -> dict
+        """
+        Gets the ``dict`` used for caching values derived from the data of
+        this profile, such as the type of each signal. Each name gets its own
+        ``dict``, which is created empty the first time it's requested.
+
+        :param name: The name of the cache.
+
+        :returns: The ``dict`` of that name.
+        """
+        try:
+            return self._caches[name]
+        except KeyError:
+            return self._caches.setdefault(name, {})
+
+    def unload(self):
+        # type: () -> None
+        """
+        Discards all of the data loaded by this profile, along with its caches,
+        so that it's loaded again from :py:attr:`path` the next time it's
+        accessed. Should be called if the files in the folder change, such as
+        after running ``draftsman-update`` with the folder as its output.
+
+        Any :py:class:`.PrototypeDatabase` opened by this profile is closed, so
+        values from it that were not accessed before unloading can no longer be
+        read.
+        """
+        for name in list(vars(self)):
+            if not name.startswith("_"):
+                for value in vars(getattr(self, name)).values():
+                    if isinstance(value, PrototypeDatabase):
+                        value.close()
+                delattr(self, name)
+        self._caches.clear()
+
+    # There's only one profile per folder, so copies and pickles refer to it
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (Profile, (self._path,))
+
+    def __repr__(self):  # pragma: no coverage
+        # type: () -> str
+        return "<Profile '{}'>".format(self._path)
+
+
+class ProfileModule(object):
+    """
+    The data of one module of :py:mod:`draftsman.data` in a :py:class:`.Profile`,
+    with each name as an attribute.
+    """
+
+    def __init__(self, values):
+        # type: (dict) -> None
+        self.__dict__.update(values)
+
+
+def uses_profile(method):
+    # type: (Callable) -> Callable
+    """
+    Method decorator that calls ``method`` with the ``profile`` of the object
+    it's called on as the current data profile, so that any data it uses comes
+    from that profile even if a different one is current. Warnings issued while
+    the profile is changed are re-issued to the calling function, like
+    :py:func:`.reissue_warnings`.
+
+    :param method: The method to decorate.
+
+    :returns: The decorated method.
+    """
+
+    @wraps(method)
+    def inner(self, *args, **kwargs):
+        try:
+            profile = self.profile
+        except AttributeError:
+            # Not fully constructed yet, such as while being unpickled
+            return method(self, *args, **kwargs)
+        if profile is data.get_profile():
+            return method(self, *args, **kwargs)
+
+        with warnings.catch_warnings(record=True) as warning_list:
+            with data.profile(profile):
+                result = method(self, *args, **kwargs)
+
+        for warning in warning_list:
+            warnings.warn(warning.message, warning.category, stacklevel=2)
+
+        return result
+
+    inner._uses_profile = True
+    return inner
+
+
+class ProfileMeta(abc.ABCMeta):
+    """
+    Metaclass of the classes whose objects have a ``profile``, such as
+    :py:class:`.Blueprint` and :py:class:`.Entity`. Applies
+    :py:func:`uses_profile` to every public method and property setter of the
+    class, including the ones it inherits from mixins, so that modifying an
+    object always uses the data of its own profile.
+
+    As long as there is only one :py:class:`.Profile`, every object uses it,
+    so the methods are only decorated once a second profile is created.
+    """
+
+    # Classes whose methods are decorated once a second profile is created
+    _pending = []  # type: list[type]
+
+    def __init__(cls, name, bases, namespace):
+        super(ProfileMeta, cls).__init__(name, bases, namespace)
+        if len(Profile._profiles) > 1:
+            cls.decorate_methods()
+        else:
+            ProfileMeta._pending.append(cls)
+
+    def decorate_methods(cls):
+        # type: () -> None
+        """
+        Applies :py:func:`uses_profile` to the public methods and property
+        setters of this class and every class it inherits from.
+        """
+        for klass in cls.__mro__:
+            if klass is object or "_profile_methods" in vars(klass):
+                continue
+            for key, value in list(vars(klass).items()):
+                if key.startswith("_"):
+                    continue
+                if isinstance(value, types.FunctionType):
+                    if not hasattr(value, "_uses_profile"):
+                        setattr(klass, key, uses_profile(value))
+                elif isinstance(value, property) and value.fset is not None:
+                    if not hasattr(value.fset, "_uses_profile"):
+                        setattr(klass, key, value.setter(uses_profile(value.fset)))
+            # So that the methods of each class are only decorated once
+            setattr(klass, "_profile_methods", True)
+
+    @staticmethod
+    def decorate_pending():
+        # type: () -> None
+        """
+        Decorates the methods of every class created before the second
+        :py:class:`.Profile`.
+        """
+        while ProfileMeta._pending:
+            ProfileMeta._pending.pop().decorate_methods()
+
+
+class DataProxy(object):
+    """
+    Stands in for a name in one of the modules of :py:mod:`draftsman.data`,
+    such as ``entities.raw``, on Python versions without module ``__getattr__``
+    (PEP 562). Every operation is forwarded to the value of that name in the
+    current :py:class:`.Profile`, so that ``data.entities.raw`` keeps referring
+    to the data of the current profile. Draftsman itself reads the data from
+    the profile directly.
+    """
+
+    __slots__ = ("_module", "_name")
+
+    def __init__(self, module, name):
+        # type: (str, str) -> None
+        self._module = module
+        self._name = name
+
+    def _resolve(self):
+        # type: () -> Any
+        return getattr(getattr(data.get_profile(), self._module), self._name)
+
+    @property
+    def __class__(self):
+        # So that ``isinstance`` checks the current value
+        return type(self._resolve())
+
+    def __getattr__(self, name):
+        # type: (str) -> Any
+        return getattr(self._resolve(), name)
+
+    def __getitem__(self, key):
+        return self._resolve()[key]
+
+    def __setitem__(self, key, value):
+        self._resolve()[key] = value
+
+    def __delitem__(self, key):
+        del self._resolve()[key]
+
+    def __contains__(self, key):
+        return key in self._resolve()
+
+    def __iter__(self):
+        return iter(self._resolve())
+
+    def __reversed__(self):
+        return reversed(self._resolve())
+
+    def __len__(self):
+        return len(self._resolve())
+
+    def __bool__(self):
+        return bool(self._resolve())
+
+    __nonzero__ = __bool__
+
+    def __eq__(self, other):
+        if type(other) is DataProxy:
+            other = other._resolve()
+        return self._resolve() == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self._resolve())
+
+    def __add__(self, other):
+        return self._resolve() + other
+
+    def __radd__(self, other):
+        return other + self._resolve()
+
+    def __repr__(self):
+        return repr(self._resolve())
+
+    # Copies and pickles refer to the same name, rather than its current value
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (DataProxy, (self._module, self._name))
+
+
+# Imported last, since `draftsman.data` imports this module for `Profile`
+from draftsman import data  # noqa: E402
@@ -0,0 +1,163 @@
+# prototype_database.py
+# -*- encoding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+try:  # pragma: no coverage
+    from collections.abc import Mapping, MutableMapping
+except ImportError:  # pragma: no coverage
+    from collections import Mapping, MutableMapping
+import mmap
+import os
+import pickle
+import stat
+import struct
+import tempfile
+from typing import Any
+
+# Identifies the file format and its version
+MAGIC = b"DRAFTPDB\x00\x01"
+# Magic, then the offset and length of the index
+HEADER = struct.Struct("<{}sQQ".format(len(MAGIC)))
+
+# Atomically replaces a file; `os.rename` already does so on POSIX in Python 2
+_replace = getattr(os, "replace", os.rename)
+
+
+class PrototypeDatabase(MutableMapping):
+    """
+    A ``dict``-like view of a set of prototypes, indexed by name and stored in
+    a file written by :py:meth:`write`. The file is memory-mapped, and each
+    prototype is only decoded the first time it is accessed; after that, the
+    same object is returned every time. Only the names and
+    locations of the prototypes are read up front, so looking up a handful of
+    prototypes out of a large (possibly modded) set is cheap, and the file's
+    pages are shared between every process that has it open instead of each
+    having its own copy. Prototypes can be added, replaced and removed like a
+    regular ``dict``, but only in memory; the file itself is never modified.
+
+    :py:func:`draftsman.env.update` writes the ``raw`` data of the larger
+    :py:mod:`draftsman.data` modules in this format.
+
+    .. code-block:: python
+
+        db = PrototypeDatabase("entities.db")
+        "wooden-chest" in db  # No prototypes are decoded
+        db["wooden-chest"]  # Only "wooden-chest" is decoded
+    """
+
+    def __init__(self, filepath):
+        # type: (str) -> None
+        """
+        Opens a prototype database.
+
+        :param filepath: The path to the file written by :py:meth:`write`.
+
+        :exception ValueError: If the file is not a prototype database.
+        """
+        with open(filepath, "rb") as file:
+            header = file.read(HEADER.size)
+            if len(header) < HEADER.size or header[: len(MAGIC)] != MAGIC:
+                raise ValueError("'{}' is not a prototype database".format(filepath))
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        _, index_offset, index_length = HEADER.unpack(header)
+        index = pickle.loads(self._mmap[index_offset : index_offset + index_length])
+        # Name -> (offset, length), or None for prototypes only in memory
+        self._index = {name: (offset, length) for name, offset, length in index}
+        self._order = [entry[0] for entry in index]
+        self._decoded = {}
+
+    @staticmethod
+    def write(filepath, prototypes):
+        # type: (str, Mapping[str, Any]) -> None
+        """
+        Writes a set of prototypes to a new prototype database file. Each
+        prototype is pickled separately, so that it can be decoded on its own.
+        The order of ``prototypes`` is preserved.
+
+        The prototypes are first written to a temporary file in the same
+        folder, which then replaces ``filepath``. Any database that still has
+        the previous file open keeps reading from it, rather than from a file
+        that changes underneath its memory map.
+
+        :param filepath: The path of the file to write.
+        :param prototypes: A ``dict`` of prototypes, indexed by their names.
+        """
+        directory = os.path.dirname(os.path.abspath(filepath))
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as out:
+                index = []
+                out.write(HEADER.pack(MAGIC, 0, 0))
+                offset = HEADER.size
+                for name, prototype in prototypes.items():
+                    record = pickle.dumps(prototype, 2)
+                    out.write(record)
+                    index.append((name, offset, len(record)))
+                    offset += len(record)
+                encoded_index = pickle.dumps(index, 2)
+                out.write(encoded_index)
+                out.seek(0)
+                out.write(HEADER.pack(MAGIC, offset, len(encoded_index)))
+            # `mkstemp` only lets the owner read the file
+            try:
+                mode = stat.S_IMODE(os.stat(filepath).st_mode)
+            except OSError:
+                umask = os.umask(0)
+                os.umask(umask)
+                mode = 0o666 & ~umask
+            os.chmod(temp_path, mode)
+            _replace(temp_path, filepath)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+    def close(self):
+        # type: () -> None
+        """
+        Closes the memory map of the file. Prototypes that were already
+        decoded can still be accessed, but accessing any other prototype
+        afterwards raises ``ValueError``.
+        """
+        self._mmap.close()
+
+    def __getitem__(self, name):
+        # type: (str) -> Any
+        try:
+            return self._decoded[name]
+        except KeyError:
+            offset, length = self._index[name]
+            prototype = pickle.loads(self._mmap[offset : offset + length])
+            self._decoded[name] = prototype
+            return prototype
+
+    def __setitem__(self, name, prototype):
+        # type: (str, Any) -> None
+        if name not in self._index:
+            self._index[name] = None
+            self._order.append(name)
+        self._decoded[name] = prototype
+
+    def __delitem__(self, name):
+        # type: (str) -> None
+        del self._index[name]
+        self._decoded.pop(name, None)
+        self._order.remove(name)
+
+    def __contains__(self, name):
+        # type: (str) -> bool
+        return name in self._index
+
+    def __iter__(self):
+        return iter(self._order)
+
+    def __len__(self):
+        # type: () -> int
+        return len(self._order)
+
+    def __repr__(self):  # pragma: no coverage
+        # type: () -> str
+        return "<PrototypeDatabase>{{{} prototypes, {} decoded}}".format(
+            len(self), len(self._decoded)
+        )
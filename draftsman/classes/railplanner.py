@@ -7,7 +7,7 @@ from draftsman.classes.group import Group
 from draftsman.constants import Direction
 from draftsman.error import DraftsmanError
 
-from draftsman.data import items
+from draftsman import data
 
 import math
 from typing import Union
@@ -23,13 +23,17 @@ class RailPlanner(Group):
         self, name, start_position=[0, 0], head_direction=Direction.NORTH, **kwargs
     ):
         # type: (str, Union[list, dict, tuple], int, **dict) -> None
+        profile = data.get_profile()
         super(RailPlanner, self).__init__(**kwargs)
-        if name in items.raw and items.raw[name]["type"] == "rail-planner":
+        if (
+            name in profile.items.raw
+            and profile.items.raw[name]["type"] == "rail-planner"
+        ):
             self.name = name
         else:
             raise DraftsmanError("'{}' is not a valid rail-planner")
-        self.straight_rail = items.raw[name]["straight_rail"]
-        self.curved_rail = items.raw[name]["curved_rail"]
+        self.straight_rail = profile.items.raw[name]["straight_rail"]
+        self.curved_rail = profile.items.raw[name]["curved_rail"]
 
         self.head_position = start_position
         self.head_direction = head_direction
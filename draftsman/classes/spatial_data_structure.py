@@ -4,7 +4,7 @@
 import abc
 import six
 
-from typing import Sequence, TYPE_CHECKING
+from typing import Callable, Sequence, TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no coverage
     from draftsman.classes.spatiallike import SpatialLike
@@ -82,6 +82,19 @@ class SpatialDataStructure(object):
         """
         pass
 
+    @abc.abstractmethod
+    def get_overlapping_pairs(self):  # pragma: no coverage
+        # type: () -> list[tuple[SpatialLike, SpatialLike]]
+        """
+        Get every pair of objects in the structure that collide with each other,
+        using the same rules as :py:meth:`handle_overlapping`. Each pair is
+        reported once, regardless of how many cells the two objects share.
+
+        :returns: A ``list`` of ``(item, other)`` tuples, where ``item`` was
+            added to the structure before ``other``.
+        """
+        pass
+
     @abc.abstractmethod
     def get_in_radius(self, radius, point, limit=None):  # pragma: no coverage
         # type: (float, Sequence[float], int) -> list[SpatialLike]
@@ -127,3 +140,76 @@ class SpatialDataStructure(object):
             empty.
         """
         pass
+
+    def get_in_areas(self, areas, limit=None):
+        # type: (Sequence[AABB], int) -> list[list[SpatialLike]]
+        """
+        Batched version of :py:meth:`get_in_area`. Gets all the entities whose
+        ``collision_box`` overlaps each area in ``areas``. Implementations can
+        override this to share work between queries that touch the same
+        regions; by default each area is queried separately.
+
+        :param areas: A sequence of areas to examine, each an :py:class:`.AABB`.
+        :param limit: A maximum amount of entities to return per area.
+
+        :returns: A ``list`` of ``lists`` of entities, where each inner list
+            contains the entities that intersect the area at the same index in
+            ``areas``. Inner lists can be empty.
+        """
+        return [self.get_in_area(area, limit=limit) for area in areas]
+
+    def get_on_points(self, points, limit=None):
+        # type: (Sequence[Point], int) -> list[list[SpatialLike]]
+        """
+        Batched version of :py:meth:`get_on_point`. Gets all the entities whose
+        ``collision_set`` overlaps each point in ``points``. Implementations can
+        override this to share work between queries that touch the same
+        regions; by default each point is queried separately.
+
+        :param points: A sequence of positions to examine; each can be specified
+            as a PrimitiveVector or Vector.
+        :param limit: A maximum amount of entities to return per point.
+
+        :returns: A ``list`` of ``lists`` of entities, where each inner list
+            contains the entities that intersect the point at the same index in
+            ``points``. Inner lists can be empty.
+        """
+        return [self.get_on_point(point, limit=limit) for point in points]
+
+    def get_nearest(self, point, k=1, filter=None):
+        # type: (Point, int, Callable[[SpatialLike], bool]) -> list[SpatialLike]
+        """
+        Get the ``k`` entities whose ``global_position`` is closest to
+        ``point``. Implementations can override this to search outward from
+        ``point`` and stop early; by default every entity is checked.
+
+        :param point: The position to search from; Can be specified as a
+            PrimitiveVector or Vector.
+        :param k: The maximum amount of entities to return.
+        :param filter: An optional function that takes an entity and returns
+            ``True`` if it should be considered, or ``False`` if it should be
+            skipped.
+
+        :returns: A ``list`` of at most ``k`` entities, sorted from closest to
+            furthest. Entities at the same distance are returned in the order
+            they were found. Can be empty.
+        """
+        candidates = []
+        seen = set()
+        for item in self.get_all_entities():
+            # Items spread across multiple cells only count once
+            if id(item) in seen:
+                continue
+            seen.add(id(item))
+            if filter is not None and not filter(item):
+                continue
+            candidates.append(item)
+
+        def item_distance(item):
+            position = item.global_position
+            dx = position.x - point[0]
+            dy = position.y - point[1]
+            return dx * dx + dy * dy
+
+        candidates.sort(key=item_distance)
+        return candidates[:k]
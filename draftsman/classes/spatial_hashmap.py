@@ -6,14 +6,13 @@ from __future__ import unicode_literals
 from draftsman.classes.collection import EntityCollection
 from draftsman.classes.spatiallike import SpatialLike
 from draftsman.classes.spatial_data_structure import SpatialDataStructure
-from draftsman.prototypes.straight_rail import StraightRail
-from draftsman.prototypes.curved_rail import CurvedRail
-from draftsman.prototypes.gate import Gate
+from draftsman import entity
 from draftsman import utils
 from draftsman.warning import OverlappingObjectsWarning
 
+import heapq
 import math
-from typing import Sequence
+from typing import Callable, Sequence
 import warnings
 
 
@@ -77,6 +76,26 @@ class SpatialHashMap(SpatialDataStructure):
         # type: () -> None
         self.map.clear()
 
+    def clone(self, memo):
+        # type: (dict) -> SpatialHashMap
+        """
+        Creates a copy of this hashmap in which every item is replaced by its
+        copy in ``memo``. The cells of the copy are taken directly from this
+        hashmap, so the bounding boxes of the items are not recalculated and no
+        overlap checks are made.
+
+        :param memo: A ``dict`` mapping the ``id()`` of every item in this
+            hashmap to its copy.
+
+        :returns: A new :py:class:`.SpatialHashMap`.
+        """
+        result = SpatialHashMap(self.cell_size)
+        result.map = {
+            cell_coord: [memo[id(item)] for item in items]
+            for cell_coord, items in self.map.items()
+        }
+        return result
+
     def handle_overlapping(self, item, merge):
         # type: (SpatialLike, bool) -> None
         """
@@ -113,47 +132,8 @@ class SpatialHashMap(SpatialDataStructure):
                     return None
 
                 # Otherwise, we now check to issue and OverlappingObjectsWarning
-                # Only the broadphase has taken place up until this point, so we
-                # now do the proper collision check
-                item_collision_set = item.get_world_collision_set()
-                overlapping_collision_set = overlapping_item.get_world_collision_set()
-                if not item_collision_set.overlaps(overlapping_collision_set):
-                    continue
-
-                # If we get here, we know that geometrically at least they are
-                # overlapping, but we also need to check to see if they have the
-                # same collision layers
-                item_layers = item.collision_mask
-                other_layers = overlapping_item.collision_mask
-
-                # StraightRails and CurvedRails cannot collide with each other
-                # UNLESS they are the same type, face the same direction, and
-                # exist at the exact same place
-                if isinstance(item, (StraightRail, CurvedRail)) and isinstance(
-                    overlapping_item, (StraightRail, CurvedRail)
-                ):
-                    identical = (
-                        item.name == overlapping_item.name
-                        and item.direction == overlapping_item.direction
-                        and item.global_position == overlapping_item.global_position
-                    )
-                    if not identical:
-                        continue
-
-                # StraightRails and Gates collide with each other ONLY IF the
-                # direction of the gate and rail are parallel
-                if (
-                    isinstance(item, StraightRail)
-                    and isinstance(overlapping_item, Gate)
-                    or isinstance(item, Gate)
-                    and isinstance(overlapping_item, StraightRail)
-                ):
-
-                    parallel = (item.direction - overlapping_item.direction) % 4 == 0
-                    if not parallel:
-                        continue
-
-                if len(other_layers.intersection(item_layers)) > 0:
+                # Only the broadphase has taken place up until this point
+                if objects_collide(item, overlapping_item):
                     warnings.warn(
                         "Added object '{}' ({}) at {} intersects '{}' ({}) at {}".format(
                             item.name,
@@ -178,6 +158,38 @@ class SpatialHashMap(SpatialDataStructure):
 
         return items
 
+    def get_overlapping_pairs(self):
+        # type: () -> list[tuple[SpatialLike, SpatialLike]]
+        # Only items that share a cell can overlap, so each cell is checked on
+        # its own; pairs spanning more than one cell are only tested once
+        tested = set()
+        pairs = []
+        bounding_boxes = {}
+        for items in self.map.values():
+            if len(items) < 2:
+                continue
+            boxes = []
+            for item in items:
+                try:
+                    boxes.append(bounding_boxes[id(item)])
+                except KeyError:
+                    box = bounding_boxes[id(item)] = item.get_world_bounding_box()
+                    boxes.append(box)
+            for i, item in enumerate(items):
+                for j in range(i + 1, len(items)):
+                    other = items[j]
+                    # Broadphase first, then the proper collision check
+                    if not utils.aabb_overlaps_aabb(boxes[i], boxes[j]):
+                        continue
+                    key = (id(item), id(other))
+                    if key in tested:
+                        continue
+                    tested.add(key)
+                    if objects_collide(item, other):
+                        pairs.append((item, other))
+
+        return pairs
+
     def get_in_radius(self, radius, point, limit=None):
         # type: (float, Sequence[float], int) -> list[SpatialLike]
         cell_coords = self._cell_coords_from_radius(radius, point)
@@ -230,6 +242,124 @@ class SpatialHashMap(SpatialDataStructure):
 
         return items
 
+    def get_in_areas(self, areas, limit=None):
+        # type: (Sequence[utils.AABB], int) -> list[list[SpatialLike]]
+        # Group the queries by the cells they touch, so that each cell is only
+        # visited once and each item's bounding box is only calculated once
+        cell_queries = {}
+        for i, area in enumerate(areas):
+            for cell_coord in self._cell_coords_from_aabb(area):
+                if cell_coord in self.map:
+                    try:
+                        cell_queries[cell_coord].append(i)
+                    except KeyError:
+                        cell_queries[cell_coord] = [i]
+
+        results = [[] for _ in areas]
+        seen = [set() for _ in areas]
+        bounding_boxes = {}
+        # Visit the cells in row-major order so that each result list has the
+        # same ordering as the equivalent call to `get_in_area()`
+        for cell_coord in sorted(cell_queries, key=lambda c: (c[1], c[0])):
+            for item in self.map[cell_coord]:
+                try:
+                    item_box = bounding_boxes[id(item)]
+                except KeyError:
+                    item_box = item.get_world_bounding_box()
+                    bounding_boxes[id(item)] = item_box
+                for i in cell_queries[cell_coord]:
+                    items = results[i]
+                    if limit is not None and len(items) >= limit:
+                        continue
+                    # Make sure we dont add the same item multiple times if it
+                    # is spread across multiple cells
+                    if id(item) in seen[i]:
+                        continue
+                    if utils.aabb_overlaps_aabb(item_box, areas[i]):
+                        items.append(item)
+                        seen[i].add(id(item))
+
+        return results
+
+    def get_on_points(self, points, limit=None):
+        # type: (Sequence[utils.Point], int) -> list[list[SpatialLike]]
+        # Group the queries by the cell they land in, so that each cell is only
+        # visited once and each item's bounding box is only calculated once
+        cell_queries = {}
+        for i, point in enumerate(points):
+            cell_coord = self._map_coords(point)
+            if cell_coord in self.map:
+                try:
+                    cell_queries[cell_coord].append(i)
+                except KeyError:
+                    cell_queries[cell_coord] = [i]
+
+        results = [[] for _ in points]
+        for cell_coord, queries in cell_queries.items():
+            for item in self.map[cell_coord]:
+                item_box = item.get_world_bounding_box()
+                for i in queries:
+                    items = results[i]
+                    if limit is not None and len(items) >= limit:
+                        continue
+                    if utils.point_in_aabb(points[i], item_box):
+                        items.append(item)
+
+        return results
+
+    def get_nearest(self, point, k=1, filter=None):
+        # type: (utils.Point, int, Callable[[SpatialLike], bool]) -> list[SpatialLike]
+        if k <= 0 or not self.map:
+            return []
+
+        center = self._map_coords(point)
+        # The distance from point to the closest edge of the cell it lies in;
+        # everything in ring `n` is at least `(n - 1) * cell_size + edge` away
+        edge = min(
+            point[0] - center[0] * self.cell_size,
+            (center[0] + 1) * self.cell_size - point[0],
+            point[1] - center[1] * self.cell_size,
+            (center[1] + 1) * self.cell_size - point[1],
+        )
+
+        # Max-heap of the k best candidates, stored as (-distance, -order, item)
+        # so that the furthest (and most recently found) candidate is on top
+        best = []
+        seen = set()
+        order = 0
+        visited_cells = 0
+        ring = 0
+        while visited_cells < len(self.map):
+            # Stop early if nothing in this ring could be closer than what we
+            # already have
+            if ring > 0 and len(best) == k:
+                if -best[0][0] <= (ring - 1) * self.cell_size + edge:
+                    break
+
+            for cell_coord in self._cell_coords_from_ring(center, ring):
+                if cell_coord not in self.map:
+                    continue
+                visited_cells += 1
+                for item in self.map[cell_coord]:
+                    # Items spread across multiple cells only count once
+                    if id(item) in seen:
+                        continue
+                    seen.add(id(item))
+                    if filter is not None and not filter(item):
+                        continue
+                    item_pos = item.global_position
+                    dist = utils.distance(point, (item_pos.x, item_pos.y))
+                    entry = (-dist, -order, item)
+                    order += 1
+                    if len(best) < k:
+                        heapq.heappush(best, entry)
+                    elif entry > best[0]:
+                        heapq.heapreplace(best, entry)
+
+            ring += 1
+
+        return [entry[2] for entry in sorted(best, reverse=True)]
+
     def _map_coords(self, point):
         # type: (list[float]) -> tuple[int, int]
         """
@@ -300,3 +430,83 @@ class SpatialHashMap(SpatialDataStructure):
                     cells.append((i, j))
 
         return cells
+
+    def _cell_coords_from_ring(self, center, ring):
+        # type: (tuple[int, int], int) -> list[tuple[int, int]]
+        """
+        Get a list of map-coordinates that lie exactly ``ring`` cells away from
+        ``center``, forming the perimeter of a square.
+
+        :param center: The map-coordinate at the center of the ring.
+        :param ring: The distance of the ring from the center, in cells.
+
+        :returns: A ``list`` of tuples, each one a map-coordinate.
+        """
+        if ring == 0:
+            return [center]
+
+        min_x, max_x = center[0] - ring, center[0] + ring
+        min_y, max_y = center[1] - ring, center[1] + ring
+
+        cells = [(i, min_y) for i in range(min_x, max_x + 1)]
+        for j in range(min_y + 1, max_y):
+            cells.append((min_x, j))
+            cells.append((max_x, j))
+        cells.extend((i, max_y) for i in range(min_x, max_x + 1))
+
+        return cells
+
+
+# =============================================================================
+
+
+def objects_collide(item, other):
+    # type: (SpatialLike, SpatialLike) -> bool
+    """
+    Checks whether two objects collide with each other, meaning that they
+    overlap geometrically and share at least one collision layer. Rails only
+    collide with rails that are identical to them, and straight rails only
+    collide with gates that run parallel to them.
+
+    :param item: The first object.
+    :param other: The second object.
+
+    :returns: ``True`` if the two objects collide, ``False`` otherwise.
+    """
+    # Objects without any collision layers in common can never collide, which
+    # is much cheaper to check than their shapes
+    if not other.collision_mask.intersection(item.collision_mask):
+        return False
+
+    item_collision_set = item.get_world_collision_set()
+    other_collision_set = other.get_world_collision_set()
+    if not item_collision_set.overlaps(other_collision_set):
+        return False
+
+    # Looked up from draftsman.entity here, so that the rail and gate
+    # prototypes are only imported once something actually collides
+    StraightRail, CurvedRail, Gate = entity.StraightRail, entity.CurvedRail, entity.Gate
+
+    # StraightRails and CurvedRails cannot collide with each other UNLESS they
+    # are the same type, face the same direction, and exist at the exact same
+    # place
+    if isinstance(item, (StraightRail, CurvedRail)) and isinstance(
+        other, (StraightRail, CurvedRail)
+    ):
+        return (
+            item.name == other.name
+            and item.direction == other.direction
+            and item.global_position == other.global_position
+        )
+
+    # StraightRails and Gates collide with each other ONLY IF the direction of
+    # the gate and rail are parallel
+    if (
+        isinstance(item, StraightRail)
+        and isinstance(other, Gate)
+        or isinstance(item, Gate)
+        and isinstance(other, StraightRail)
+    ):
+        return (item.direction - other.direction) % 4 == 0
+
+    return True
@@ -13,19 +13,23 @@
 from __future__ import unicode_literals
 
 from draftsman.classes.collisionset import CollisionSet
+from draftsman.classes.profile import ProfileMeta
 from draftsman.classes.spatiallike import SpatialLike
 from draftsman.classes.vector import Vector
 from draftsman.error import InvalidTileError, DraftsmanError
 from draftsman.utils import AABB
 
-import draftsman.data.tiles as tiles
+from draftsman import data
 
+import six
 from typing import TYPE_CHECKING, Union, Tuple
 
 if TYPE_CHECKING:  # pragma: no coverage
     from draftsman.classes.blueprint import Blueprint
+    from draftsman.classes.profile import Profile
 
 
+@six.add_metaclass(ProfileMeta)
 class Tile(SpatialLike):
     """
     Tile class. Used for keeping track of tiles in Blueprints.
@@ -58,7 +62,8 @@ class Tile(SpatialLike):
         self._collision_set = CollisionSet([AABB(0, 0, 1, 1)])
 
         # Tile mask for SpatialHashMap
-        self._collision_mask = set(tiles.raw[self.name]["collision_mask"])
+        prototype = data.get_profile().tiles.raw[self.name]
+        self._collision_mask = set(prototype["collision_mask"])
 
     # =========================================================================
 
@@ -67,6 +72,21 @@ class Tile(SpatialLike):
         # type: () -> Blueprint
         return self._parent
 
+    @property
+    def profile(self):
+        # type: () -> Profile
+        """
+        The data :py:class:`.Profile` this Tile is used with. Equal to the
+        ``profile`` of the :py:class:`.Blueprint` that contains it, or the
+        current profile from :py:func:`draftsman.data.get_profile` if it's not
+        inside of one. Not exported; read only.
+
+        :type: :py:class:`.Profile`
+        """
+        if self._parent is None:
+            return data.get_profile()
+        return self._parent.profile
+
     # =========================================================================
 
     @property
@@ -90,7 +110,7 @@ class Tile(SpatialLike):
     @name.setter
     def name(self, value):
         # type: (str) -> None
-        if value in tiles.raw:
+        if value in data.get_profile().tiles.raw:
             self._name = value
         else:
             raise InvalidTileError("'{}'".format(value))
@@ -0,0 +1,241 @@
+# tile_hashmap.py
+# -*- encoding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+from draftsman.classes.spatial_data_structure import SpatialDataStructure
+from draftsman import utils
+from draftsman.warning import OverlappingObjectsWarning
+
+import math
+from typing import Sequence, TYPE_CHECKING
+import warnings
+
+if TYPE_CHECKING:  # pragma: no coverage
+    from draftsman.classes.tile import Tile
+
+
+class TileHashMap(SpatialDataStructure):
+    """
+    Implementation of a :py:class:`.SpatialDataStructure` specialized for
+    :py:class:`.Tile` objects. Because tiles are always exactly 1x1 and sit on
+    integer coordinates, they are keyed directly by their ``(x, y)`` position
+    instead of being sorted into larger cells, making insertion, lookup,
+    overlap handling and removal constant time.
+
+    Query results are sorted in row-major order of tile position; tiles that
+    share the same position are returned in the order they were added.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        """
+        Create a new :py:class:`.TileHashMap`.
+        """
+        self.map = {}
+
+    def add(self, item):
+        # type: (Tile) -> None
+        key = (item.position.x, item.position.y)
+        try:
+            self.map[key].append(item)
+        except KeyError:
+            self.map[key] = [item]
+
+    def recursive_add(self, item):
+        # type: (Tile) -> None
+        # Tiles cannot be nested
+        self.add(item)
+
+    def remove(self, item):
+        # type: (Tile) -> None
+        key = (item.position.x, item.position.y)
+        try:
+            tiles = self.map[key]
+            tiles.remove(item)
+            if not tiles:
+                del self.map[key]
+        except (KeyError, ValueError):
+            pass
+
+    def recursive_remove(self, item):
+        # type: (Tile) -> None
+        self.remove(item)
+
+    def clear(self):
+        # type: () -> None
+        self.map.clear()
+
+    def clone(self, memo):
+        # type: (dict) -> TileHashMap
+        """
+        Creates a copy of this hashmap in which every tile is replaced by its
+        copy in ``memo``, without any overlap checks.
+
+        :param memo: A ``dict`` mapping the ``id()`` of every tile in this
+            hashmap to its copy.
+
+        :returns: A new :py:class:`.TileHashMap`.
+        """
+        result = TileHashMap()
+        result.map = {
+            key: [memo[id(tile)] for tile in tiles] for key, tiles in self.map.items()
+        }
+        return result
+
+    def handle_overlapping(self, item, merge):
+        # type: (Tile, bool) -> Tile
+        """
+        Handles overlapping tiles if ``item`` were to be added to this hashmap.
+        Issues overlapping objects warnings and merges tiles if desired. Only
+        tiles at the exact same position can overlap, so only those are
+        checked.
+
+        .. Warning::
+
+            This function may not be permanent, or it may move somewhere else in
+            future versions.
+        """
+        key = (item.position.x, item.position.y)
+        for overlapping_item in self.map.get(key, ()):
+            # If we can merge the two items and this is desired, do so first
+            if merge and overlapping_item.mergable_with(item):
+                overlapping_item.merge(item)
+                return None
+
+            # Two tiles at the same position always overlap geometrically, so
+            # we only need to check their collision layers
+            item_layers = item.collision_mask
+            other_layers = overlapping_item.collision_mask
+            if len(other_layers.intersection(item_layers)) > 0:
+                warnings.warn(
+                    "Added object '{}' ({}) at {} intersects '{}' ({}) at {}".format(
+                        item.name,
+                        type(item).__name__,
+                        item.global_position,
+                        overlapping_item.name,
+                        type(overlapping_item).__name__,
+                        overlapping_item.global_position,
+                    ),
+                    OverlappingObjectsWarning,
+                    stacklevel=2,
+                )
+
+        return item
+
+    def get_all_entities(self):
+        # type: () -> list[Tile]
+        items = []
+        for tiles in self.map.values():
+            items.extend(tiles)
+
+        return items
+
+    def get_overlapping_pairs(self):
+        # type: () -> list[tuple[Tile, Tile]]
+        pairs = []
+        for tiles in self.map.values():
+            for i, tile in enumerate(tiles):
+                for other in tiles[i + 1 :]:
+                    if other.collision_mask.intersection(tile.collision_mask):
+                        pairs.append((tile, other))
+
+        return pairs
+
+    def get_in_radius(self, radius, point, limit=None):
+        # type: (float, Sequence[float], int) -> list[Tile]
+        keys = self._keys_in_range(
+            int(math.ceil(point[0] - radius)),
+            int(math.ceil(point[1] - radius)),
+            int(math.floor(point[0] + radius)),
+            int(math.floor(point[1] + radius)),
+        )
+        items = []
+        for key in keys:
+            if utils.point_in_circle(key, radius, point):
+                for item in self.map[key]:
+                    if limit is not None and len(items) >= limit:
+                        return items
+                    items.append(item)
+
+        return items
+
+    def get_on_point(self, point, limit=None):
+        # type: (utils.Point, int) -> list[Tile]
+        # Tiles include their edges, so a point on a grid line touches the tiles
+        # on both sides of it
+        x, y = int(math.floor(point[0])), int(math.floor(point[1]))
+        min_x = x - 1 if x == point[0] else x
+        min_y = y - 1 if y == point[1] else y
+        items = []
+        for key in self._keys_in_range(min_x, min_y, x, y):
+            for item in self.map[key]:
+                if limit is not None and len(items) >= limit:
+                    return items
+                items.append(item)
+
+        return items
+
+    def get_in_area(self, area, limit=None):
+        # type: (utils.AABB, int) -> list[Tile]
+        # Tiles only touching the edge of the area do not overlap it
+        keys = self._keys_in_range(
+            int(math.floor(area.world_top_left[0])),
+            int(math.floor(area.world_top_left[1])),
+            int(math.ceil(area.world_bot_right[0])) - 1,
+            int(math.ceil(area.world_bot_right[1])) - 1,
+        )
+        items = []
+        for key in keys:
+            for item in self.map[key]:
+                if limit is not None and len(items) >= limit:
+                    return items
+                items.append(item)
+
+        return items
+
+    def get_bounding_box(self):
+        # type: () -> utils.AABB
+        """
+        Gets the smallest AABB that encompasses every tile in the hashmap.
+        Calculated directly from the occupied tile positions, which is much
+        cheaper than extending the bounding box of each tile one at a time.
+
+        :returns: An :py:class:`.AABB`, or ``None`` if the hashmap is empty.
+        """
+        if not self.map:
+            return None
+
+        xs = [key[0] for key in self.map]
+        ys = [key[1] for key in self.map]
+        return utils.AABB(min(xs), min(ys), max(xs) + 1, max(ys) + 1)
+
+    def _keys_in_range(self, min_x, min_y, max_x, max_y):
+        # type: (int, int, int, int) -> list[tuple[int, int]]
+        """
+        Gets the occupied tile positions within an inclusive rectangle of
+        positions, in row-major order. Iterates over the rectangle if it is
+        smaller than the number of occupied positions, otherwise iterates over
+        the occupied positions instead.
+
+        :returns: A ``list`` of ``(x, y)`` tuples that are keys in :py:attr:`map`.
+        """
+        if max_x < min_x or max_y < min_y:
+            return []
+
+        area = (max_x - min_x + 1) * (max_y - min_y + 1)
+        if area <= len(self.map):
+            return [
+                (x, y)
+                for y in range(min_y, max_y + 1)
+                for x in range(min_x, max_x + 1)
+                if (x, y) in self.map
+            ]
+        else:
+            keys = [
+                key
+                for key in self.map
+                if min_x <= key[0] <= max_x and min_y <= key[1] <= max_y
+            ]
+            keys.sort(key=lambda key: (key[1], key[0]))
+            return keys
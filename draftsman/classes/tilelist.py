@@ -2,6 +2,7 @@
 # -*- encoding: utf-8 -*-
 
 from draftsman.classes.tile import Tile
+from draftsman import data
 from draftsman.error import UnreasonablySizedBlueprintError
 from draftsman import utils
 
@@ -46,7 +47,10 @@ class TileList(MutableSequence):
         Inserts an element into the TileList.
         """
         if isinstance(tile, six.string_types):
-            tile = Tile(six.text_type(tile), **kwargs)
+            # Construct the tile with the profile of the collection it's being
+            # added to
+            with data.profile(self._parent.profile):
+                tile = Tile(six.text_type(tile), **kwargs)
         elif copy:
             tile = deepcopy(tile)
 
@@ -82,9 +86,6 @@ class TileList(MutableSequence):
         # Add a reference to the container in the object
         value._parent = self._parent
 
-        # TODO: this sucks, but it has to be like this
-        self._parent.recalculate_area()
-
     def __delitem__(self, idx):
         # type: (int) -> None
         if isinstance(idx, slice):
@@ -99,12 +100,37 @@ class TileList(MutableSequence):
         # Remove from self
         del self.data[idx]
 
-        # TODO: this sucks, but it has to be like this
-        self._parent.recalculate_area()
-
     def __len__(self):
         return len(self.data)
 
+    def _clone(self, parent, memo):
+        # type: (TileCollection, dict) -> TileList
+        """
+        Creates a copy of the TileList and every Tile inside of it, with
+        ``parent`` as the new parent. The copied tiles are placed directly into
+        the new list without calling any of ``parent``'s callbacks; the caller
+        is responsible for updating it.
+
+        :param parent: The ``TileCollection`` that will own the copy.
+        :param memo: A ``dict`` which is populated with the copy of each
+            ``Tile``, keyed by the ``id()`` of the original.
+
+        :returns: The new ``TileList``.
+        """
+        new = TileList(parent)
+        for tile in self.data:
+            cls = tile.__class__
+            tile_copy = cls.__new__(cls)
+            memo[id(tile)] = tile_copy
+            for k, v in tile.__dict__.items():
+                if k == "_parent":
+                    setattr(tile_copy, k, parent)
+                else:
+                    setattr(tile_copy, k, utils.clone_value(v, memo))
+            new.data.append(tile_copy)
+
+        return new
+
     def check_tile(self, tile):
         # type: (Tile) -> None
         if not isinstance(tile, Tile):
@@ -1,6 +1,8 @@
 # transformable.py
 # -*- encoding: utf-8 -*-
 
+from draftsman.classes.attribute_index import update_attribute
+from draftsman.constants import ValidationLevel
 from draftsman.error import RotationError, FlippingError
 from draftsman.classes.vector import Vector
 from draftsman.warning import RailAlignmentWarning, FlippingWarning
@@ -29,7 +31,11 @@ class Transformable(object):
         """
         # Warn if attempting to translate by an odd amount when containing
         # double-grid-aligned entities
-        if self.double_grid_aligned and (x % 2 == 1 or y % 2 == 1):
+        if (
+            self.validation_level is ValidationLevel.STRICT
+            and self.double_grid_aligned
+            and (x % 2 == 1 or y % 2 == 1)
+        ):
             warnings.warn(
                 "Attempting to translate an odd number of tiles when this "
                 "Transformable contains double grid-aligned entities; Their "
@@ -124,6 +130,7 @@ class Transformable(object):
 
             # Alter the direction
             if entity.rotatable:
+                old_direction = entity.direction
                 entity.direction += angle
             # Alter (both) the position(s)
             entity.position = (
@@ -136,6 +143,10 @@ class Transformable(object):
             # Re-add to map
             self.entity_map.add(entity)
 
+            # Move to the bucket of the new direction
+            if entity.rotatable:
+                update_attribute(entity, "direction", old_direction)
+
         # Tiles
         if hasattr(self, "tiles"):
             for tile in self.tiles:
@@ -207,6 +218,7 @@ class Transformable(object):
             pos = Vector(entity.position.x, entity.position.y)
             # Alter the direction
             if entity.rotatable:
+                old_direction = entity.direction
                 if direction == "horizontal":
                     entity.direction += ((-2 * (entity.direction - 4)) % 8) % 8
                 else:  # direction == "vertical":
@@ -220,6 +232,10 @@ class Transformable(object):
             # Re-add to map
             self.entity_map.add(entity)
 
+            # Move to the bucket of the new direction
+            if entity.rotatable:
+                update_attribute(entity, "direction", old_direction)
+
         # Tiles
         if hasattr(self, "tiles"):
             for tile in self.tiles:
@@ -8,7 +8,7 @@
         "upgrade_planner": {
             "item": "upgrade-planner", # The associated item with this structure
             "label": str, # A user given name for this upgrade planner
-            "version": int, # The encoded version of Factorio this planner was created 
+            "version": int, # The encoded version of Factorio this planner was created
                             # with/designed for (64 bits)
             "settings": {
                 "mappers": [ # List of dicts, each one a "mapper"
@@ -40,6 +40,7 @@
 
 from __future__ import unicode_literals
 
+from draftsman.constants import ValidationLevel
 from draftsman import __factorio_version_info__
 from draftsman.classes.blueprintable import Blueprintable
 from draftsman.data import items
@@ -56,7 +57,6 @@ import six
 from typing import Union, Sequence
 import warnings
 
-
 # def get_allowed_items():
 #     """
 #     TODO
@@ -81,18 +81,24 @@ class UpgradePlanner(Blueprintable):
     """
 
     @utils.reissue_warnings
-    def __init__(self, upgrade_planner=None):
-        # type: (Union[str, dict]) -> None
+    def __init__(self, upgrade_planner=None, validation_level=None):
+        # type: (Union[str, dict], Union[ValidationLevel, str]) -> None
         """
         Constructs a new :py:class:`.UpgradePlanner`.
 
         :param upgrade_planner: Either a dictionary containing all the key
             attributes to set, or
+        :param validation_level: The :py:attr:`validation_level` of the
+            UpgradePlanner, which is also used when loading
+            ``upgrade_planner``. Defaults to the current level.
+
+        :exception ValueError: If ``validation_level`` is not a valid level.
         """
         super(UpgradePlanner, self).__init__(
             root_item="upgrade_planner",
             item="upgrade-planner",
             init_data=upgrade_planner,
+            validation_level=validation_level,
         )
 
     @utils.reissue_warnings
@@ -117,12 +123,13 @@ class UpgradePlanner(Blueprintable):
             self.icons = settings.pop("icons", None)
 
         # Issue warnings for any keyword not recognized by UpgradePlanner
-        for unused_arg in kwargs:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in kwargs:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
 
     # =========================================================================
     # Properties
@@ -0,0 +1,171 @@
+# validation_report.py
+# -*- encoding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+from draftsman.error import DataFormatError
+from draftsman.utils import clone_value
+
+from schema import Schema, SchemaError
+from typing import Any, Sequence
+import warnings
+
+
+class ValidationIssue(object):
+    """
+    A single problem found while validating a blueprint. Each issue is either
+    an error, which would have been raised as an exception if the offending
+    data were set with strict validation, or a warning, which would have been
+    issued.
+    """
+
+    def __init__(self, category, message, objects=()):
+        # type: (type, str, Sequence[Any]) -> None
+        """
+        :param category: The exception or warning class that describes the
+            problem, such as :py:class:`.DataFormatError` or
+            :py:class:`.OverlappingObjectsWarning`.
+        :param message: A description of the problem.
+        :param objects: The entities, tiles, or blueprint the problem concerns.
+        """
+        self.category = category
+        self.message = message
+        self.objects = tuple(objects)
+
+    @property
+    def is_error(self):
+        # type: () -> bool
+        """
+        Whether or not this issue is an error instead of a warning. Read only.
+
+        :type: ``bool``
+        """
+        return not issubclass(self.category, Warning)
+
+    def __repr__(self):  # pragma: no coverage
+        # type: () -> str
+        return "<ValidationIssue>{}: {}".format(self.category.__name__, self.message)
+
+
+class ValidationReport(object):
+    """
+    The result of :py:meth:`.Blueprint.validate()`. Collects every problem found
+    in a blueprint into lists of :py:class:`ValidationIssue`, instead of raising
+    or issuing them one at a time as the blueprint is modified.
+
+    .. code-block:: python
+
+        report = blueprint.validate()
+        if not report.valid:
+            for issue in report.errors:
+                print(issue.category.__name__, issue.message)
+        overlapping = report.get_issues(OverlappingObjectsWarning)
+    """
+
+    def __init__(self):
+        # type: () -> None
+        self.errors = []
+        self.warnings = []
+
+    def add(self, category, message, objects=()):
+        # type: (type, str, Sequence[Any]) -> ValidationIssue
+        """
+        Records a new issue, sorted into :py:attr:`errors` or
+        :py:attr:`warnings` by its ``category``.
+
+        :param category: The exception or warning class of the issue.
+        :param message: A description of the problem.
+        :param objects: The entities, tiles, or blueprint the problem concerns.
+
+        :returns: The new :py:class:`ValidationIssue`.
+        """
+        issue = ValidationIssue(category, message, objects)
+        if issue.is_error:
+            self.errors.append(issue)
+        else:
+            self.warnings.append(issue)
+        return issue
+
+    def check_format(self, name, value, signature, objects=()):
+        # type: (str, Any, Schema, Sequence[Any]) -> Any
+        """
+        Checks a value that was stored without validation against the
+        signature its setter validates it with. Records a
+        :py:class:`.DataFormatError` if ``value`` does not match ``signature``,
+        or if it's a shorthand that ``signature`` would have converted to a
+        different format; ``value`` itself is not modified.
+
+        :param name: The name of the attribute, to include in the message.
+        :param value: The stored value.
+        :param signature: The signature to check ``value`` against.
+        :param objects: The entities, tiles, or blueprint the value belongs to.
+
+        :returns: The value in the format ``signature`` converts it to, or
+            ``None`` if it doesn't match.
+        """
+        try:
+            # Some signatures normalize in place
+            normalized = signature.validate(clone_value(value))
+        except SchemaError as e:
+            self.add(DataFormatError, "'{}': {}".format(name, e), objects)
+            return None
+        if normalized != value:
+            self.add(
+                DataFormatError,
+                "'{}': {!r} should be {!r}".format(name, value, normalized),
+                objects,
+            )
+        return normalized
+
+    @property
+    def valid(self):
+        # type: () -> bool
+        """
+        Whether or not no errors were found. Warnings do not make a blueprint
+        invalid. Read only.
+
+        :type: ``bool``
+        """
+        return len(self.errors) == 0
+
+    def get_issues(self, category):
+        # type: (type) -> list[ValidationIssue]
+        """
+        Gets every issue of a particular kind.
+
+        :param category: The exception or warning class to filter by. Issues
+            whose category is a subclass of ``category`` are included, so
+            ``DraftsmanWarning`` returns every warning.
+
+        :returns: A ``list`` of :py:class:`ValidationIssue`, errors first.
+        """
+        return [issue for issue in self if issubclass(issue.category, category)]
+
+    def reissue(self):
+        # type: () -> None
+        """
+        Issues every warning in the report with ``warnings.warn()``, and then
+        raises the first error, if any, as an exception. This mimics what
+        setting the same data with strict validation would have done.
+
+        :exception Exception: The first error in :py:attr:`errors`, raised as
+            an instance of its category.
+        """
+        for issue in self.warnings:
+            warnings.warn(issue.message, issue.category, stacklevel=2)
+        if self.errors:
+            issue = self.errors[0]
+            raise issue.category(issue.message)
+
+    def __iter__(self):
+        return iter(self.errors + self.warnings)
+
+    def __len__(self):
+        # type: () -> int
+        return len(self.errors) + len(self.warnings)
+
+    def __repr__(self):  # pragma: no coverage
+        # type: () -> str
+        return "<ValidationReport>{{errors: {}, warnings: {}}}".format(
+            len(self.errors), len(self.warnings)
+        )
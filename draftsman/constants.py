@@ -124,3 +124,26 @@ class TileSelectionMode(IntEnum):
     ALWAYS = 1
     NEVER = 2
     ONLY = 3
+
+
+class ValidationLevel(IntEnum):
+    """
+    How thoroughly Draftsman checks the data that is given to it. Can be set
+    process-wide with :py:func:`draftsman.validation.set_level` or per
+    :py:class:`.Blueprint` with its ``validation_level`` attribute.
+
+    * ``NONE``: Nothing is checked. Values set on entities and blueprints are
+      stored exactly as given (without being copied), so they must already be
+      in the same format that they are exported in. No warnings are issued.
+      Intended for trusted generators and previously exported data.
+    * ``MINIMAL``: Values are checked against their schemas and converted to
+      their exported format, so malformed data still raises errors, but no
+      warnings are issued and the checks that look beyond the value itself
+      (overlapping entities, valid item names, wire distances, module and
+      recipe limitations, etc.) are skipped.
+    * ``STRICT``: Everything is checked and every warning is issued. (Default)
+    """
+
+    NONE = 0
+    MINIMAL = 1
+    STRICT = 2
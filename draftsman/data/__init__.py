@@ -1 +1,113 @@
 # __init__.py
+# -*- encoding: utf-8 -*-
+
+"""
+The Factorio data Draftsman uses, such as the prototypes of every entity, item
+and recipe. The data is grouped into :py:class:`.Profile` objects, each loaded
+from a folder written by ``draftsman-update``; the names in the modules of this
+package, like ``entities.raw``, always refer to the data of the current
+profile. The process-wide profile is the data shipped with Draftsman, unless
+changed; a ``with data.profile(...)`` block only changes the profile in the
+thread (or ``asyncio`` task) that runs it:
+
+.. code-block:: python
+
+    from draftsman import data
+
+    modded = data.Profile("path/to/modded-data")
+
+    # Use the modded data for the rest of the program
+    data.set_profile(modded)
+
+    # Or only for a particular block
+    with data.profile(modded):
+        blueprint = Blueprint(modded_string)
+
+Blueprintables can also be bound to a profile with their ``profile``
+attribute, which is used whenever they (or the entities inside of them) need
+the data.
+"""
+
+from __future__ import unicode_literals
+
+from draftsman.classes.context_local import ContextLocal
+from draftsman.classes.profile import Profile
+
+from contextlib import contextmanager
+import os
+import six
+from typing import Union
+
+default_profile = Profile(os.path.dirname(os.path.abspath(__file__)))
+
+_profile = default_profile
+# Set by `profile()`, and takes precedence over `_profile` in its context
+_context_profile = ContextLocal("draftsman_profile")
+
+
+def to_profile(value):
+    # type: (Union[Profile, str]) -> Profile
+    """
+    Converts a value to a :py:class:`.Profile`.
+
+    :param value: A ``Profile``, or the folder to load one from.
+
+    :returns: The corresponding ``Profile``.
+
+    :exception ValueError: If ``value`` is neither a ``Profile`` nor a folder.
+    """
+    if isinstance(value, Profile):
+        return value
+    if isinstance(value, six.string_types):
+        return Profile(value)
+    raise ValueError("'{}' is not a valid profile".format(value))
+
+
+def get_profile():
+    # type: () -> Profile
+    """
+    Gets the current data profile: the one set by :py:func:`profile` in the
+    current context if there is one, or the process-wide profile otherwise.
+
+    :returns: The current :py:class:`.Profile`.
+    """
+    value = _context_profile.get()
+    if value is None:
+        return _profile
+    return value
+
+
+def set_profile(value):
+    # type: (Union[Profile, str]) -> None
+    """
+    Sets the process-wide data profile. Any profile set by :py:func:`profile`
+    still takes precedence inside of its ``with`` block.
+
+    :param value: The profile to set, in any format accepted by
+        :py:func:`to_profile`.
+
+    :exception ValueError: If ``value`` does not correspond to any profile.
+    """
+    global _profile
+    _profile = to_profile(value)
+
+
+@contextmanager
+def profile(value):
+    # type: (Union[Profile, str]) -> None
+    """
+    Context manager that sets the data profile for the duration of a ``with``
+    block, and restores the previous profile afterwards. The profile is only
+    changed in the current context, so other threads and ``asyncio`` tasks
+    keep using their own profile at the same time.
+
+    :param value: The profile to set, in any format accepted by
+        :py:func:`to_profile`.
+
+    :exception ValueError: If ``value`` does not correspond to any profile.
+    """
+    token = _context_profile.set(to_profile(value))
+    try:
+        yield
+    finally:
+        _context_profile.reset(token)
@@ -1,87 +1,124 @@
 # entities.py
 # -*- encoding: utf-8 -*-
 
+import os
 import pickle
-
-try:  # pragma: no coverage
-    import importlib.resources as pkg_resources  # type: ignore
-except ImportError:  # pragma: no coverage
-    # Try backported to PY<37 `importlib_resources`.
-    import importlib_resources as pkg_resources  # type: ignore
+import sys
+from typing import Any
 
 from draftsman import data
+from draftsman.classes.profile import DataProxy
+from draftsman.classes.prototype_database import PrototypeDatabase
 
-
-with pkg_resources.open_binary(data, "entities.pkl") as inp:
-    _data = pickle.load(inp)
-
+# Names loaded from ``entities.pkl`` by each profile, which only unpickles it
+# once one of them is first accessed
+_lazy_attributes = (
     # Aggregation of all the the entity dicts from data.raw collected in one
     # place.
-    raw = _data["raw"]
-
+    "raw",
     # Whether or not each entity is flippable, indexed by their name.
-    flippable = _data["flippable"]
-
+    "flippable",
     # Ordered lists of strings, each containing a valid name for that entity
     # type, sorted by their Factorio order strings.
-    containers = _data["containers"]
-    storage_tanks = _data["storage_tanks"]
-    transport_belts = _data["transport_belts"]
-    underground_belts = _data["underground_belts"]
-    splitters = _data["splitters"]
-    inserters = _data["inserters"]
-    filter_inserters = _data["filter_inserters"]
-    loaders = _data["loaders"]
-    electric_poles = _data["electric_poles"]
-    pipes = _data["pipes"]
-    underground_pipes = _data["underground_pipes"]
-    pumps = _data["pumps"]
-    straight_rails = _data["straight_rails"]
-    curved_rails = _data["curved_rails"]
-    train_stops = _data["train_stops"]
-    rail_signals = _data["rail_signals"]
-    rail_chain_signals = _data["rail_chain_signals"]
-    locomotives = _data["locomotives"]
-    cargo_wagons = _data["cargo_wagons"]
-    fluid_wagons = _data["fluid_wagons"]
-    artillery_wagons = _data["artillery_wagons"]
-    logistic_passive_containers = _data["logistic_passive_containers"]
-    logistic_active_containers = _data["logistic_active_containers"]
-    logistic_storage_containers = _data["logistic_storage_containers"]
-    logistic_buffer_containers = _data["logistic_buffer_containers"]
-    logistic_request_containers = _data["logistic_request_containers"]
-    roboports = _data["roboports"]
-    lamps = _data["lamps"]
-    arithmetic_combinators = _data["arithmetic_combinators"]
-    decider_combinators = _data["decider_combinators"]
-    constant_combinators = _data["constant_combinators"]
-    power_switches = _data["power_switches"]
-    programmable_speakers = _data["programmable_speakers"]
-    boilers = _data["boilers"]
-    generators = _data["generators"]
-    solar_panels = _data["solar_panels"]
-    accumulators = _data["accumulators"]
-    reactors = _data["reactors"]
-    heat_pipes = _data["heat_pipes"]
-    mining_drills = _data["mining_drills"]
-    offshore_pumps = _data["offshore_pumps"]
-    furnaces = _data["furnaces"]
-    assembling_machines = _data["assembling_machines"]
-    labs = _data["labs"]
-    beacons = _data["beacons"]
-    rocket_silos = _data["rocket_silos"]
-    land_mines = _data["land_mines"]
-    walls = _data["walls"]
-    gates = _data["gates"]
-    turrets = _data["turrets"]
-    radars = _data["radars"]
-    simple_entities_with_owner = _data["simple_entities_with_owner"]
-    simple_entities_with_force = _data["simple_entities_with_force"]
-    electric_energy_interfaces = _data["electric_energy_interfaces"]
-    linked_containers = _data["linked_containers"]
-    heat_interfaces = _data["heat_interfaces"]
-    linked_belts = _data["linked_belts"]
-    infinity_containers = _data["infinity_containers"]
-    infinity_pipes = _data["infinity_pipes"]
-    burner_generators = _data["burner_generators"]
-    player_ports = _data["player_ports"]
+    "containers",
+    "storage_tanks",
+    "transport_belts",
+    "underground_belts",
+    "splitters",
+    "inserters",
+    "filter_inserters",
+    "loaders",
+    "electric_poles",
+    "pipes",
+    "underground_pipes",
+    "pumps",
+    "straight_rails",
+    "curved_rails",
+    "train_stops",
+    "rail_signals",
+    "rail_chain_signals",
+    "locomotives",
+    "cargo_wagons",
+    "fluid_wagons",
+    "artillery_wagons",
+    "logistic_passive_containers",
+    "logistic_active_containers",
+    "logistic_storage_containers",
+    "logistic_buffer_containers",
+    "logistic_request_containers",
+    "roboports",
+    "lamps",
+    "arithmetic_combinators",
+    "decider_combinators",
+    "constant_combinators",
+    "power_switches",
+    "programmable_speakers",
+    "boilers",
+    "generators",
+    "solar_panels",
+    "accumulators",
+    "reactors",
+    "heat_pipes",
+    "mining_drills",
+    "offshore_pumps",
+    "furnaces",
+    "assembling_machines",
+    "labs",
+    "beacons",
+    "rocket_silos",
+    "land_mines",
+    "walls",
+    "gates",
+    "turrets",
+    "radars",
+    "simple_entities_with_owner",
+    "simple_entities_with_force",
+    "electric_energy_interfaces",
+    "linked_containers",
+    "heat_interfaces",
+    "linked_belts",
+    "infinity_containers",
+    "infinity_pipes",
+    "burner_generators",
+    "player_ports",
+)
+
+
+def _read(path):
+    # type: (str) -> dict
+    """
+    Unpickles ``entities.pkl`` from the folder ``path``, along with ``raw``
+    from ``entities.db`` if it exists.
+
+    :returns: A ``dict`` of each name in ``_lazy_attributes`` to its value.
+    """
+    with open(os.path.join(path, "entities.pkl"), "rb") as inp:
+        _data = pickle.load(inp)
+    database_path = os.path.join(path, "entities.db")
+    if os.path.isfile(database_path):
+        _data["raw"] = PrototypeDatabase(database_path)
+    return {name: _data[name] for name in _lazy_attributes}
+
+
+def _load():
+    # type: () -> None
+    """
+    Loads the data of this module in the current :py:class:`.Profile`, if it
+    isn't already.
+    """
+    getattr(data.get_profile(), "entities")
+
+
+def __getattr__(name):
+    # type: (str) -> Any
+    # Every name refers to its value in the current profile
+    if name in _lazy_attributes:
+        return getattr(data.get_profile().entities, name)
+    raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
+
+
+if sys.version_info < (3, 7):  # pragma: no coverage
+    # No module ``__getattr__`` (PEP 562), so each name stands in for its value
+    # in the current profile instead
+    for _name in _lazy_attributes:
+        globals()[_name] = DataProxy("entities", _name)
@@ -1,16 +1,50 @@
 # mods.py
 # -*- encoding: utf-8 -*-
 
+import os
 import pickle
-
-try:  # pragma: no coverage
-    import importlib.resources as pkg_resources  # type: ignore
-except ImportError:  # pragma: no coverage
-    # Try backported to PY<37 `importlib_resources`.
-    import importlib_resources as pkg_resources  # type: ignore
+import sys
+from typing import Any
 
 from draftsman import data
+from draftsman.classes.profile import DataProxy
+
+# Names loaded from ``mods.pkl`` by each profile, which only unpickles it once
+# one of them is first accessed
+_lazy_attributes = ("mod_list",)
+
+
+def _read(path):
+    # type: (str) -> dict
+    """
+    Unpickles ``mods.pkl`` from the folder ``path``.
+
+    :returns: A ``dict`` of each name in ``_lazy_attributes`` to its value.
+    """
+    with open(os.path.join(path, "mods.pkl"), "rb") as inp:
+        _data = pickle.load(inp)
+    return {"mod_list": _data}
+
+
+def _load():
+    # type: () -> None
+    """
+    Loads the data of this module in the current :py:class:`.Profile`, if it
+    isn't already.
+    """
+    getattr(data.get_profile(), "mods")
+
+
+def __getattr__(name):
+    # type: (str) -> Any
+    # Every name refers to its value in the current profile
+    if name in _lazy_attributes:
+        return getattr(data.get_profile().mods, name)
+    raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
 
 
-with pkg_resources.open_binary(data, "mods.pkl") as inp:
-    mod_list = pickle.load(inp)
+if sys.version_info < (3, 7):  # pragma: no coverage
+    # No module ``__getattr__`` (PEP 562), so each name stands in for its value
+    # in the current profile instead
+    for _name in _lazy_attributes:
+        globals()[_name] = DataProxy("mods", _name)
@@ -3,22 +3,60 @@
 
 import os
 import pickle
+import sys
+from typing import Any
 
-try:  # pragma: no coverage
-    import importlib.resources as pkg_resources  # type: ignore
-except ImportError:  # pragma: no coverage
-    # Try backported to PY<37 `importlib_resources`.
-    import importlib_resources as pkg_resources  # type: ignore
+from draftsman import data
+from draftsman.classes.profile import DataProxy
+from draftsman.classes.prototype_database import PrototypeDatabase
 
-# from draftsman import data
-from .. import data
+# Names loaded from ``recipes.pkl`` by each profile, which only unpickles it
+# once one of them is first accessed
+_lazy_attributes = (
+    "raw",
+    "categories",
+    "for_machine",
+)
 
 
-with pkg_resources.open_binary(data, "recipes.pkl") as inp:
-    _data = pickle.load(inp)
-    raw = _data[0]
-    categories = _data[1]
-    for_machine = _data[2]
+def _read(path):
+    # type: (str) -> dict
+    """
+    Unpickles ``recipes.pkl`` from the folder ``path``, along with ``raw``
+    from ``recipes.db`` if it exists.
+
+    :returns: A ``dict`` of each name in ``_lazy_attributes`` to its value.
+    """
+    with open(os.path.join(path, "recipes.pkl"), "rb") as inp:
+        _data = pickle.load(inp)
+    database_path = os.path.join(path, "recipes.db")
+    if os.path.isfile(database_path):
+        _data[0] = PrototypeDatabase(database_path)
+    return dict(zip(_lazy_attributes, _data))
+
+
+def _load():
+    # type: () -> None
+    """
+    Loads the data of this module in the current :py:class:`.Profile`, if it
+    isn't already.
+    """
+    getattr(data.get_profile(), "recipes")
+
+
+def __getattr__(name):
+    # type: (str) -> Any
+    # Every name refers to its value in the current profile
+    if name in _lazy_attributes:
+        return getattr(data.get_profile().recipes, name)
+    raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
+
+
+if sys.version_info < (3, 7):  # pragma: no coverage
+    # No module ``__getattr__`` (PEP 562), so each name stands in for its value
+    # in the current profile instead
+    for _name in _lazy_attributes:
+        globals()[_name] = DataProxy("recipes", _name)
 
 
 def get_recipe_ingredients(recipe_name, expensive=False):
@@ -54,14 +92,14 @@ def get_recipe_ingredients(recipe_name, expensive=False):
         # {'iron-plate', 'copper-cable'}
 
     """
-    if "ingredients" in raw[recipe_name]:
+    recipe = data.get_profile().recipes.raw[recipe_name]
+    if "ingredients" in recipe:
         return {
-            x[0] if isinstance(x, list) else x["name"]
-            for x in raw[recipe_name]["ingredients"]
+            x[0] if isinstance(x, list) else x["name"] for x in recipe["ingredients"]
         }
     else:  # recipe has two costs, "normal" and "expensive"
         cost_type = "expensive" if expensive else "normal"
         return {
             x[0] if isinstance(x, list) else x["name"]
-            for x in raw[recipe_name][cost_type]["ingredients"]
+            for x in recipe[cost_type]["ingredients"]
         }
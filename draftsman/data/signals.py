@@ -4,26 +4,63 @@
 from __future__ import unicode_literals
 
 from draftsman import data
+from draftsman.classes.profile import DataProxy
 from draftsman.error import InvalidSignalError
 
+import os
 import pickle
 import six
+import sys
+from typing import Any
 
-try:  # pragma: no coverage
-    import importlib.resources as pkg_resources  # type: ignore
-except ImportError:  # pragma: no coverage
-    # Try backported to PY<37 `importlib_resources`.
-    import importlib_resources as pkg_resources  # type: ignore
+# Names loaded from ``signals.pkl`` by each profile, which only unpickles it
+# once one of them is first accessed
+_lazy_attributes = (
+    "raw",
+    "type_of",
+    "item",
+    "fluid",
+    "virtual",
+)
 
 
-with pkg_resources.open_binary(data, "signals.pkl") as inp:
-    _data = pickle.load(inp)
-    raw = _data[0]
-    type_of = _data[1]
-    item = _data[2]
-    fluid = _data[3]
-    virtual = _data[4]
-    pure_virtual = ["signal-everything", "signal-anything", "signal-each"]
+def _read(path):
+    # type: (str) -> dict
+    """
+    Unpickles ``signals.pkl`` from the folder ``path``.
+
+    :returns: A ``dict`` of each name in ``_lazy_attributes`` to its value.
+    """
+    with open(os.path.join(path, "signals.pkl"), "rb") as inp:
+        _data = pickle.load(inp)
+    return dict(zip(_lazy_attributes, _data))
+
+
+def _load():
+    # type: () -> None
+    """
+    Loads the data of this module in the current :py:class:`.Profile`, if it
+    isn't already.
+    """
+    getattr(data.get_profile(), "signals")
+
+
+def __getattr__(name):
+    # type: (str) -> Any
+    # Every name refers to its value in the current profile
+    if name in _lazy_attributes:
+        return getattr(data.get_profile().signals, name)
+    raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
+
+
+if sys.version_info < (3, 7):  # pragma: no coverage
+    # No module ``__getattr__`` (PEP 562), so each name stands in for its value
+    # in the current profile instead
+    for _name in _lazy_attributes:
+        globals()[_name] = DataProxy("signals", _name)
+
+
+pure_virtual = ["signal-everything", "signal-anything", "signal-each"]
 
 
 def get_signal_type(signal_name):
@@ -41,19 +78,10 @@ def get_signal_type(signal_name):
     :exception InvalidSignalError: If the signal name is not contained within
         :py:mod:`draftsman.data.signals`.
     """
-    # if signal_name in signals.virtual:
-    #     return "virtual"
-    # elif signal_name in signals.fluid:
-    #     return "fluid"
-    # elif signal_name in signals.item:
-    #     return "item"
-    # else:
-    #     raise InvalidSignalError("'{}'".format(str(signal_name)))
-
     try:
-        return six.text_type(type_of[signal_name])
+        return data.get_profile().cache("signal_ids")[signal_name]["type"]
     except KeyError:
-        raise InvalidSignalError("'{}'".format(signal_name))
+        return interned_signal_dict(signal_name)["type"]
 
 
 def signal_dict(signal_name):
@@ -67,4 +95,42 @@ def signal_dict(signal_name):
 
     :returns: A dict with the ``"name"`` and ``"type"`` keys set.
     """
-    return {"name": six.text_type(signal_name), "type": get_signal_type(signal_name)}
+    try:
+        return dict(data.get_profile().cache("signal_ids")[signal_name])
+    except KeyError:
+        return dict(interned_signal_dict(signal_name))
+
+
+def interned_signal_dict(signal_name):
+    # type: (str) -> dict
+    """
+    Gets the SignalID ``dict`` of the given signal name. Unlike
+    :py:func:`signal_dict`, the same ``dict`` is returned every time the same
+    name is passed in, so it is much faster, but the result must never be
+    modified or stored anywhere it could be. Used when the result is
+    immediately copied anyway, like when validating it with
+    :py:data:`.SIGNAL_ID`.
+
+    :param signal_name: The name of the signal.
+
+    :returns: A dict with the ``"name"`` and ``"type"`` keys set.
+
+    :exception InvalidSignalError: If the signal name is not contained within
+        :py:mod:`draftsman.data.signals`.
+    """
+    # Interned SignalID dicts of the current profile, keyed by signal name
+    profile = data.get_profile()
+    signal_ids = profile.cache("signal_ids")
+    try:
+        return signal_ids[signal_name]
+    except KeyError:
+        try:
+            signal_type = profile.signals.type_of[signal_name]
+        except KeyError:
+            raise InvalidSignalError("'{}'".format(signal_name))
+        result = {
+            "name": six.text_type(signal_name),
+            "type": six.text_type(signal_type),
+        }
+        signal_ids[signal_name] = result
+        return result
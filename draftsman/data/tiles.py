@@ -1,15 +1,55 @@
 # tiles.py
 
+import os
 import pickle
-
-try:  # pragma: no coverage
-    import importlib.resources as pkg_resources  # type: ignore
-except ImportError:  # pragma: no coverage
-    # Try backported to PY<37 `importlib_resources`.
-    import importlib_resources as pkg_resources  # type: ignore
+import sys
+from typing import Any
 
 from draftsman import data
+from draftsman.classes.profile import DataProxy
+from draftsman.classes.prototype_database import PrototypeDatabase
+
+# Names loaded from ``tiles.pkl`` by each profile, which only unpickles it once
+# one of them is first accessed
+_lazy_attributes = ("raw",)
+
+
+def _read(path):
+    # type: (str) -> dict
+    """
+    Opens ``tiles.db`` in the folder ``path`` as ``raw``, or unpickles
+    ``tiles.pkl`` if it doesn't exist.
+
+    :returns: A ``dict`` of each name in ``_lazy_attributes`` to its value.
+    """
+    database_path = os.path.join(path, "tiles.db")
+    if os.path.isfile(database_path):
+        raw = PrototypeDatabase(database_path)
+    else:
+        with open(os.path.join(path, "tiles.pkl"), "rb") as inp:
+            raw = pickle.load(inp)
+    return {"raw": raw}
+
+
+def _load():
+    # type: () -> None
+    """
+    Loads the data of this module in the current :py:class:`.Profile`, if it
+    isn't already.
+    """
+    getattr(data.get_profile(), "tiles")
+
+
+def __getattr__(name):
+    # type: (str) -> Any
+    # Every name refers to its value in the current profile
+    if name in _lazy_attributes:
+        return getattr(data.get_profile().tiles, name)
+    raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
 
 
-with pkg_resources.open_binary(data, "tiles.pkl") as inp:
-    raw = pickle.load(inp)
+if sys.version_info < (3, 7):  # pragma: no coverage
+    # No module ``__getattr__`` (PEP 562), so each name stands in for its value
+    # in the current profile instead
+    for _name in _lazy_attributes:
+        globals()[_name] = DataProxy("tiles", _name)
@@ -3,76 +3,134 @@
 """
 Entity alias module. Imports the base-class :py:class:`.Entity`, as well as
 all the prototypes in :py:mod:`draftsman.prototypes`.
+
+Prototype modules are only imported the first time one of their classes (or
+their list of valid names) is accessed from this module, or when
+:py:func:`new_entity` is first asked to create one of their entities, so
+``from draftsman.entity import TransportBelt`` only imports
+:py:mod:`draftsman.prototypes.transport_belt`.
 """
 
 from draftsman.classes.entity import Entity
+from draftsman import data
 from draftsman.error import InvalidEntityError
 
+import importlib
+import sys
+from typing import Any
 
+# Every prototype class, the module in :py:mod:`draftsman.prototypes` that
+# defines it, and the list in :py:mod:`draftsman.data.entities` of the entity
+# names it handles. If a name is in more than one list, the first class wins.
 # fmt: off
-from draftsman.prototypes.container import Container, containers
-from draftsman.prototypes.storage_tank import StorageTank, storage_tanks
-from draftsman.prototypes.transport_belt import TransportBelt, transport_belts
-from draftsman.prototypes.underground_belt import UndergroundBelt, underground_belts
-from draftsman.prototypes.splitter import Splitter, splitters
-from draftsman.prototypes.inserter import Inserter, inserters
-from draftsman.prototypes.filter_inserter import FilterInserter, filter_inserters
-from draftsman.prototypes.loader import Loader, loaders
-from draftsman.prototypes.electric_pole import ElectricPole, electric_poles
-from draftsman.prototypes.pipe import Pipe, pipes
-from draftsman.prototypes.underground_pipe import UndergroundPipe, underground_pipes
-from draftsman.prototypes.pump import Pump, pumps
-from draftsman.prototypes.straight_rail import StraightRail, straight_rails
-from draftsman.prototypes.curved_rail import CurvedRail, curved_rails
-from draftsman.prototypes.train_stop import TrainStop, train_stops
-from draftsman.prototypes.rail_signal import RailSignal, rail_signals
-from draftsman.prototypes.rail_chain_signal import RailChainSignal, rail_chain_signals
-from draftsman.prototypes.locomotive import Locomotive, locomotives
-from draftsman.prototypes.cargo_wagon import CargoWagon, cargo_wagons
-from draftsman.prototypes.fluid_wagon import FluidWagon, fluid_wagons
-from draftsman.prototypes.artillery_wagon import ArtilleryWagon, artillery_wagons
-from draftsman.prototypes.logistic_passive_container import LogisticPassiveContainer, logistic_passive_containers
-from draftsman.prototypes.logistic_active_container import LogisticActiveContainer, logistic_active_containers
-from draftsman.prototypes.logistic_storage_container import LogisticStorageContainer, logistic_storage_containers
-from draftsman.prototypes.logistic_buffer_container import LogisticBufferContainer, logistic_buffer_containers
-from draftsman.prototypes.logistic_request_container import LogisticRequestContainer, logistic_request_containers
-from draftsman.prototypes.roboport import Roboport, roboports
-from draftsman.prototypes.lamp import Lamp, lamps
-from draftsman.prototypes.arithmetic_combinator import ArithmeticCombinator, arithmetic_combinators
-from draftsman.prototypes.decider_combinator import DeciderCombinator, decider_combinators
-from draftsman.prototypes.constant_combinator import ConstantCombinator, constant_combinators
-from draftsman.prototypes.power_switch import PowerSwitch, power_switches
-from draftsman.prototypes.programmable_speaker import ProgrammableSpeaker, programmable_speakers
-from draftsman.prototypes.boiler import Boiler, boilers
-from draftsman.prototypes.generator import Generator, generators
-from draftsman.prototypes.solar_panel import SolarPanel, solar_panels
-from draftsman.prototypes.accumulator import Accumulator, accumulators
-from draftsman.prototypes.reactor import Reactor, reactors
-from draftsman.prototypes.heat_pipe import HeatPipe, heat_pipes
-from draftsman.prototypes.mining_drill import MiningDrill, mining_drills
-from draftsman.prototypes.offshore_pump import OffshorePump, offshore_pumps
-from draftsman.prototypes.furnace import Furnace, furnaces
-from draftsman.prototypes.assembling_machine import AssemblingMachine, assembling_machines
-from draftsman.prototypes.lab import Lab, labs
-from draftsman.prototypes.beacon import Beacon, beacons
-from draftsman.prototypes.rocket_silo import RocketSilo, rocket_silos
-from draftsman.prototypes.land_mine import LandMine, land_mines
-from draftsman.prototypes.wall import Wall, walls
-from draftsman.prototypes.gate import Gate, gates
-from draftsman.prototypes.turret import Turret, turrets
-from draftsman.prototypes.radar import Radar, radars
-from draftsman.prototypes.simple_entity_with_owner import SimpleEntityWithOwner, simple_entities_with_owner
-from draftsman.prototypes.simple_entity_with_force import SimpleEntityWithForce, simple_entities_with_force
-from draftsman.prototypes.electric_energy_interface import ElectricEnergyInterface, electric_energy_interfaces
-from draftsman.prototypes.linked_container import LinkedContainer, linked_containers
-from draftsman.prototypes.heat_interface import HeatInterface, heat_interfaces
-from draftsman.prototypes.linked_belt import LinkedBelt, linked_belts
-from draftsman.prototypes.infinity_container import InfinityContainer, infinity_containers
-from draftsman.prototypes.infinity_pipe import InfinityPipe, infinity_pipes
-from draftsman.prototypes.burner_generator import BurnerGenerator, burner_generators
-from draftsman.prototypes.player_port import PlayerPort, player_ports
+_prototypes = [
+    ("Container", "container", "containers"),
+    ("StorageTank", "storage_tank", "storage_tanks"),
+    ("TransportBelt", "transport_belt", "transport_belts"),
+    ("UndergroundBelt", "underground_belt", "underground_belts"),
+    ("Splitter", "splitter", "splitters"),
+    ("Inserter", "inserter", "inserters"),
+    ("FilterInserter", "filter_inserter", "filter_inserters"),
+    ("Loader", "loader", "loaders"),
+    ("ElectricPole", "electric_pole", "electric_poles"),
+    ("Pipe", "pipe", "pipes"),
+    ("UndergroundPipe", "underground_pipe", "underground_pipes"),
+    ("Pump", "pump", "pumps"),
+    ("StraightRail", "straight_rail", "straight_rails"),
+    ("CurvedRail", "curved_rail", "curved_rails"),
+    ("TrainStop", "train_stop", "train_stops"),
+    ("RailSignal", "rail_signal", "rail_signals"),
+    ("RailChainSignal", "rail_chain_signal", "rail_chain_signals"),
+    ("Locomotive", "locomotive", "locomotives"),
+    ("CargoWagon", "cargo_wagon", "cargo_wagons"),
+    ("FluidWagon", "fluid_wagon", "fluid_wagons"),
+    ("ArtilleryWagon", "artillery_wagon", "artillery_wagons"),
+    ("LogisticPassiveContainer", "logistic_passive_container", "logistic_passive_containers"),
+    ("LogisticActiveContainer", "logistic_active_container", "logistic_active_containers"),
+    ("LogisticStorageContainer", "logistic_storage_container", "logistic_storage_containers"),
+    ("LogisticBufferContainer", "logistic_buffer_container", "logistic_buffer_containers"),
+    ("LogisticRequestContainer", "logistic_request_container", "logistic_request_containers"),
+    ("Roboport", "roboport", "roboports"),
+    ("Lamp", "lamp", "lamps"),
+    ("ArithmeticCombinator", "arithmetic_combinator", "arithmetic_combinators"),
+    ("DeciderCombinator", "decider_combinator", "decider_combinators"),
+    ("ConstantCombinator", "constant_combinator", "constant_combinators"),
+    ("PowerSwitch", "power_switch", "power_switches"),
+    ("ProgrammableSpeaker", "programmable_speaker", "programmable_speakers"),
+    ("Boiler", "boiler", "boilers"),
+    ("Generator", "generator", "generators"),
+    ("SolarPanel", "solar_panel", "solar_panels"),
+    ("Accumulator", "accumulator", "accumulators"),
+    ("Reactor", "reactor", "reactors"),
+    ("HeatPipe", "heat_pipe", "heat_pipes"),
+    ("MiningDrill", "mining_drill", "mining_drills"),
+    ("OffshorePump", "offshore_pump", "offshore_pumps"),
+    ("Furnace", "furnace", "furnaces"),
+    ("AssemblingMachine", "assembling_machine", "assembling_machines"),
+    ("Lab", "lab", "labs"),
+    ("Beacon", "beacon", "beacons"),
+    ("RocketSilo", "rocket_silo", "rocket_silos"),
+    ("LandMine", "land_mine", "land_mines"),
+    ("Wall", "wall", "walls"),
+    ("Gate", "gate", "gates"),
+    ("Turret", "turret", "turrets"),
+    ("Radar", "radar", "radars"),
+    ("SimpleEntityWithOwner", "simple_entity_with_owner", "simple_entities_with_owner"),
+    ("SimpleEntityWithForce", "simple_entity_with_force", "simple_entities_with_force"),
+    ("ElectricEnergyInterface", "electric_energy_interface", "electric_energy_interfaces"),
+    ("LinkedContainer", "linked_container", "linked_containers"),
+    ("HeatInterface", "heat_interface", "heat_interfaces"),
+    ("LinkedBelt", "linked_belt", "linked_belts"),
+    ("InfinityContainer", "infinity_container", "infinity_containers"),
+    ("InfinityPipe", "infinity_pipe", "infinity_pipes"),
+    ("BurnerGenerator", "burner_generator", "burner_generators"),
+    ("PlayerPort", "player_port", "player_ports"),
+]
 # fmt: on
 
+# Class name -> module name
+_modules = {}
+# Name list name -> module name
+_lists = {}
+for _class_name, _module_name, _list_name in _prototypes:
+    _modules[_class_name] = _module_name
+    _lists[_list_name] = _module_name
+
+__all__ = ["Entity", "InvalidEntityError", "new_entity"] + list(_modules) + list(_lists)
+
+
+def _import_prototype(module_name):
+    # type: (str) -> None
+    """
+    Imports a prototype module and adds its class and name list to the globals
+    of this module, so that they're only looked up once.
+    """
+    module = importlib.import_module("draftsman.prototypes." + module_name)
+    for class_name, other_module_name, list_name in _prototypes:
+        if other_module_name == module_name:
+            globals()[class_name] = getattr(module, class_name)
+            globals()[list_name] = getattr(module, list_name)
+
+
+def __getattr__(name):
+    # type: (str) -> Any
+    module_name = _modules.get(name, None) or _lists.get(name, None)
+    if module_name is None:
+        raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
+    _import_prototype(module_name)
+    return globals()[name]
+
+
+def __dir__():
+    # type: () -> list[str]
+    return sorted(set(globals()) | set(__all__))
+
+
+if sys.version_info < (3, 7):  # pragma: no coverage
+    # No module ``__getattr__`` (PEP 562), so import everything up front
+    for _module_name in set(_modules.values()):
+        _import_prototype(_module_name)
+
 
 def new_entity(name, **kwargs):
     # type: (str, **dict) -> Entity
@@ -96,127 +154,20 @@ def new_entity(name, **kwargs):
     :exception InvalidEntityID: If the name passed in is not recognized as any
         valid entity name.
     """
-    if name in containers:
-        return Container(name, **kwargs)
-    if name in storage_tanks:
-        return StorageTank(name, **kwargs)
-    if name in transport_belts:
-        return TransportBelt(name, **kwargs)
-    if name in underground_belts:
-        return UndergroundBelt(name, **kwargs)
-    if name in splitters:
-        return Splitter(name, **kwargs)
-    if name in inserters:
-        return Inserter(name, **kwargs)
-    if name in filter_inserters:
-        return FilterInserter(name, **kwargs)
-    if name in loaders:
-        return Loader(name, **kwargs)
-    if name in electric_poles:
-        return ElectricPole(name, **kwargs)
-    if name in pipes:
-        return Pipe(name, **kwargs)
-    if name in underground_pipes:
-        return UndergroundPipe(name, **kwargs)
-    if name in pumps:
-        return Pump(name, **kwargs)
-    if name in straight_rails:
-        return StraightRail(name, **kwargs)
-    if name in curved_rails:
-        return CurvedRail(name, **kwargs)
-    if name in train_stops:
-        return TrainStop(name, **kwargs)
-    if name in rail_signals:
-        return RailSignal(name, **kwargs)
-    if name in rail_chain_signals:
-        return RailChainSignal(name, **kwargs)
-    if name in locomotives:
-        return Locomotive(name, **kwargs)
-    if name in cargo_wagons:
-        return CargoWagon(name, **kwargs)
-    if name in fluid_wagons:
-        return FluidWagon(name, **kwargs)
-    if name in artillery_wagons:
-        return ArtilleryWagon(name, **kwargs)
-    if name in logistic_passive_containers:
-        return LogisticPassiveContainer(name, **kwargs)
-    if name in logistic_active_containers:
-        return LogisticActiveContainer(name, **kwargs)
-    if name in logistic_storage_containers:
-        return LogisticStorageContainer(name, **kwargs)
-    if name in logistic_buffer_containers:
-        return LogisticBufferContainer(name, **kwargs)
-    if name in logistic_request_containers:
-        return LogisticRequestContainer(name, **kwargs)
-    if name in roboports:
-        return Roboport(name, **kwargs)
-    if name in lamps:
-        return Lamp(name, **kwargs)
-    if name in arithmetic_combinators:
-        return ArithmeticCombinator(name, **kwargs)
-    if name in decider_combinators:
-        return DeciderCombinator(name, **kwargs)
-    if name in constant_combinators:
-        return ConstantCombinator(name, **kwargs)
-    if name in power_switches:
-        return PowerSwitch(name, **kwargs)
-    if name in programmable_speakers:
-        return ProgrammableSpeaker(name, **kwargs)
-    if name in boilers:
-        return Boiler(name, **kwargs)
-    if name in generators:
-        return Generator(name, **kwargs)
-    if name in solar_panels:
-        return SolarPanel(name, **kwargs)
-    if name in accumulators:
-        return Accumulator(name, **kwargs)
-    if name in reactors:
-        return Reactor(name, **kwargs)
-    if name in heat_pipes:
-        return HeatPipe(name, **kwargs)
-    if name in mining_drills:
-        return MiningDrill(name, **kwargs)
-    if name in offshore_pumps:
-        return OffshorePump(name, **kwargs)
-    if name in furnaces:
-        return Furnace(name, **kwargs)
-    if name in assembling_machines:
-        return AssemblingMachine(name, **kwargs)
-    if name in labs:
-        return Lab(name, **kwargs)
-    if name in beacons:
-        return Beacon(name, **kwargs)
-    if name in rocket_silos:
-        return RocketSilo(name, **kwargs)
-    if name in land_mines:
-        return LandMine(name, **kwargs)
-    if name in walls:
-        return Wall(name, **kwargs)
-    if name in gates:
-        return Gate(name, **kwargs)
-    if name in turrets:
-        return Turret(name, **kwargs)
-    if name in radars:
-        return Radar(name, **kwargs)
-    if name in simple_entities_with_owner:
-        return SimpleEntityWithOwner(name, **kwargs)
-    if name in simple_entities_with_force:
-        return SimpleEntityWithForce(name, **kwargs)
-    if name in electric_energy_interfaces:
-        return ElectricEnergyInterface(name, **kwargs)
-    if name in linked_containers:
-        return LinkedContainer(name, **kwargs)
-    if name in heat_interfaces:
-        return HeatInterface(name, **kwargs)
-    if name in linked_belts:
-        return LinkedBelt(name, **kwargs)
-    if name in infinity_containers:
-        return InfinityContainer(name, **kwargs)
-    if name in infinity_pipes:
-        return InfinityPipe(name, **kwargs)
-    if name in burner_generators:
-        return BurnerGenerator(name, **kwargs)
-    if name in player_ports:
-        return PlayerPort(name, **kwargs)
-
-    raise InvalidEntityError("'{}'".format(name))
+    # Entity name -> class name in the current profile; created on first use
+    profile = data.get_profile()
+    class_names = profile.cache("entity_class_names")
+    if not class_names:
+        for class_name, _, list_name in reversed(_prototypes):
+            for entity_name in getattr(profile.entities, list_name):
+                class_names[entity_name] = class_name
+
+    try:
+        class_name = class_names[name]
+    except (KeyError, TypeError):
+        raise InvalidEntityError("'{}'".format(name))
+    try:
+        cls = globals()[class_name]
+    except KeyError:
+        cls = __getattr__(class_name)
+    return cls(name, **kwargs)
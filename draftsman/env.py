@@ -26,6 +26,8 @@ from draftsman.error import (
     IncorrectModVersionError,
     IncorrectModFormatError,
 )
+from draftsman.classes.profile import Profile
+from draftsman.classes.prototype_database import PrototypeDatabase
 from draftsman.utils import decode_version, version_string_to_tuple
 from draftsman._factorio_version import __factorio_version_info__
 
@@ -36,14 +38,24 @@ except ImportError:
 
 import argparse
 from collections import OrderedDict
+import hashlib
 import io
 import json
+import multiprocessing
 import os
 import pickle
+import posixpath
 import re
 import struct
+import timeit
+from typing import Any, Union
 import zipfile
 
+try:  # pragma: no coverage
+    from collections.abc import Mapping
+except ImportError:  # pragma: no coverage
+    from collections import Mapping
+
 
 mod_archive_pattern = "(([\\w\\D]+)_([\\d\\.]+))\\.zip"
 mod_archive_regex = re.compile(mod_archive_pattern)
@@ -59,6 +71,20 @@ dependency_regex = re.compile(dependency_string_pattern)
 lua_module_pattern = "\\.\\/factorio-mods\\/(.+?)\\/.*"
 lua_module_regex = re.compile(lua_module_pattern)
 
+# Every file written to `draftsman/data` by the extraction functions
+extracted_files = [
+    "entities.db",
+    "entities.pkl",
+    "instruments.pkl",
+    "items.pkl",
+    "mods.pkl",
+    "modules.pkl",
+    "recipes.db",
+    "recipes.pkl",
+    "signals.pkl",
+    "tiles.db",
+]
+
 
 class Mod(object):
     """
@@ -130,6 +156,74 @@ def archive_to_string(archive, filepath):
         return formatted_file.read()
 
 
+class ModArchive(object):
+    """
+    Read-only view of a mod's zip archive. The names of every file in the
+    archive are read once up front, so checking whether a file exists is a
+    single set lookup instead of a search of the zip's directory; and each
+    file is only decoded once, after which its contents are returned from a
+    cache. Paths are normalized before lookup, so backslashes and redundant
+    ``./`` segments don't matter.
+    """
+
+    def __init__(self, filepath):
+        # type: (str) -> None
+        """
+        Opens and indexes a mod archive.
+
+        :param filepath: The path to the ``.zip`` file.
+        """
+        self.archive = zipfile.ZipFile(filepath, mode="r")
+        # Normalized path -> name in the archive
+        self._members = {}
+        for name in self.archive.namelist():
+            if not name.endswith("/"):
+                self._members[self.normalize(name)] = name
+        # Normalized path -> decoded contents
+        self._contents = {}
+        # Results of `python_require`, so that repeated requires are a single
+        # lookup
+        self.requires = {}
+
+    @staticmethod
+    def normalize(path):
+        # type: (str) -> str
+        """
+        Normalizes a path inside of an archive to use forward slashes, without
+        any ``.`` or ``..`` segments.
+        """
+        return posixpath.normpath(path.replace("\\", "/"))
+
+    def namelist(self):
+        # type: () -> list[str]
+        """
+        Returns the names of every member of the archive, including folders.
+        """
+        return self.archive.namelist()
+
+    def read(self, filepath):
+        # type: (str) -> str
+        """
+        Returns the contents of a file in the archive as a string, stripped of
+        special unicode characters that Lupa dislikes.
+
+        :param filepath: The path of the file inside the archive.
+
+        :exception KeyError: If there is no such file in the archive.
+        """
+        filepath = self.normalize(filepath)
+        try:
+            return self._contents[filepath]
+        except KeyError:
+            contents = archive_to_string(self.archive, self._members[filepath])
+            self._contents[filepath] = contents
+            return contents
+
+    def __contains__(self, filepath):
+        # type: (str) -> bool
+        return self.normalize(filepath) in self._members
+
+
 def get_mod_settings(location):
     """
     Reads `mod_settings.dat` and stores it as an easy-to-read dict. Would be
@@ -235,7 +329,32 @@ def python_require(mod, mod_folder, module_name, package_path):
 
     # print("\t", mod.name)
 
-    # We emulate lua filepath searching
+    # The same modules are required over and over with the same arguments, so
+    # we remember where (and if) each one was found
+    try:
+        filepath = mod.files.requires[(module_name, package_path)]
+    except KeyError:
+        filepath = find_in_archive(mod, module_name, package_path)
+        mod.files.requires[(module_name, package_path)] = filepath
+
+    if filepath is not None:
+        string_contents = mod.files.read(filepath)
+        fixed_filepath = os.path.dirname(filepath[filepath.find("/") :])
+        return string_contents, fixed_filepath
+
+    # Otherwise, we found squat
+    return None, "no file '{}' found in '{}' archive".format(module_name, mod.name)
+
+
+def find_in_archive(mod, module_name, package_path):
+    # type: (Mod, str, str) -> str
+    """
+    Emulates Lua's search of ``package_path`` for ``module_name`` in the
+    :py:class:`ModArchive` of ``mod``.
+
+    :returns: The path of the module in the archive, or ``None`` if it
+        couldn't be found.
+    """
     filepaths = package_path.split(";")
     for filepath in filepaths:
         # Replace the question mark with the module_name
@@ -244,20 +363,11 @@ def python_require(mod, mod_folder, module_name, package_path):
         filepath = filepath.replace("\\", "/")
         # Make it local to the archive, replacing the global path to the local
         # internal path
-        # print("\tbefore filepath", filepath)
-        # print("mod_folder + mod.name", mod_folder + "/" + mod.name)
-        # print("mod.location", mod.location)
         filepath = filepath.replace(mod.location, mod.internal_folder)
-        # print("\tafter filepath:", filepath)
-        try:
-            string_contents = archive_to_string(mod.files, filepath)
-            fixed_filepath = os.path.dirname(filepath[filepath.find("/") :])
-            return string_contents, fixed_filepath
-        except KeyError:
-            pass
+        if filepath in mod.files:
+            return filepath
 
-    # Otherwise, we found squat
-    return None, "no file '{}' found in '{}' archive".format(module_name, mod.name)
+    return None
 
 
 def load_stage(lua, mod_list, mod, stage):
@@ -304,6 +414,173 @@ def convert_table_to_dict(table):
     return out
 
 
+class LuaTableConverter(object):
+    """
+    Converts Lua tables from a particular ``LuaRuntime`` to Python, with the
+    same results as :py:func:`convert_table_to_dict`, but:
+
+    * Without recursion, so arbitrarily deep tables can be converted;
+    * Each distinct Lua table is only converted once, no matter how many times
+      or in how many places it's referenced; every reference to it is the
+      same Python object. This includes tables that contain themselves;
+    * Whether a table is an array is determined in Lua, in a single pass;
+    * With :py:meth:`convert_lazy`, a table's values can be converted only
+      when they're first accessed.
+
+    Conversions are remembered for the lifetime of the converter, so a table
+    should not be modified after it's been converted.
+
+    .. code-block:: python
+
+        converter = LuaTableConverter(lua)
+        data_raw = converter.convert(lua.globals().data.raw)
+    """
+
+    # The most keys and values that are returned from Lua in a single call;
+    # Lua 5.2's stack is limited to 8000 values
+    max_unpacked = 7000
+
+    def __init__(self, lua):
+        # type: (lupa.LuaRuntime) -> None
+        # Gives each table a unique ID. The first time a table is seen, it
+        # also returns whether or not all of its keys are integers (in which
+        # case it's treated as an array), and all of its keys and values, so
+        # that they're fetched from Lua in a single call. Tables too large to
+        # fit on Lua's stack are iterated over from Python instead
+        self._describe = lua.eval(
+            """
+            (function()
+                local unpack = table.unpack or unpack
+                local ids = setmetatable({}, {__mode = "k"})
+                local count = 0
+                local buffer = {}
+                return function(t)
+                    local id = ids[t]
+                    if id ~= nil then
+                        return id, nil
+                    end
+                    count = count + 1
+                    id = count
+                    ids[t] = id
+                    local is_list = true
+                    local n = 0
+                    for k, v in pairs(t) do
+                        if is_list and (type(k) ~= "number" or k ~= math.floor(k)
+                        or k == math.huge or k == -math.huge) then
+                            is_list = false
+                        end
+                        buffer[n + 1] = k
+                        buffer[n + 2] = v
+                        n = n + 2
+                    end
+                    if n > %d then
+                        return id, is_list, false
+                    end
+                    return id, is_list, true, unpack(buffer, 1, n)
+                end
+            end)()
+            """
+            % self.max_unpacked
+        )
+        self._table_type = type(lua.table())
+        # Table ID -> converted object
+        self._converted = {}
+
+    def _visit(self, table, pending):
+        # type: (Any, list) -> Union[dict, list]
+        """
+        Returns the object ``table`` was (or is being) converted to, adding
+        it to ``pending`` to be filled if it hasn't been seen before.
+        """
+        description = self._describe(table)
+        if description[1] is None:
+            return self._converted[description[0]]
+
+        out = [] if description[1] else {}
+        self._converted[description[0]] = out
+        if description[2]:
+            flat = description[3:]
+            pending.append((out, zip(flat[::2], flat[1::2])))
+        else:
+            pending.append((out, table.items()))
+        return out
+
+    def convert(self, table):
+        # type: (Any) -> Union[dict, list]
+        """
+        Converts a Lua table and everything in it to Python.
+
+        :param table: The Lua table to convert.
+
+        :returns: A ``dict``, or a ``list`` if every key of ``table`` is an
+            integer.
+        """
+        table_type = self._table_type
+        pending = []
+        result = self._visit(table, pending)
+        while pending:
+            out, items = pending.pop()
+            if isinstance(out, list):
+                for _, value in items:
+                    if type(value) is table_type:
+                        value = self._visit(value, pending)
+                    out.append(value)
+            else:
+                for key, value in items:
+                    if type(value) is table_type:
+                        value = self._visit(value, pending)
+                    out[key] = value
+        return result
+
+    def convert_lazy(self, table):
+        # type: (Any) -> LazyLuaTable
+        """
+        Wraps a Lua table so that each of its values is only converted (with
+        :py:meth:`convert`) the first time it's accessed. Useful for tables
+        like ``data.raw`` where only some of the values are needed.
+
+        :param table: The Lua table to wrap.
+
+        :returns: A read-only ``dict``-like :py:class:`LazyLuaTable`.
+        """
+        return LazyLuaTable(self, table)
+
+
+class LazyLuaTable(Mapping):
+    """
+    A read-only ``dict``-like view of a Lua table, whose values are converted
+    to Python by a :py:class:`LuaTableConverter` the first time they're
+    accessed. Created with :py:meth:`LuaTableConverter.convert_lazy`.
+    """
+
+    def __init__(self, converter, table):
+        # type: (LuaTableConverter, Any) -> None
+        self._converter = converter
+        self._table = table
+        self._keys = list(table.keys())
+        self._values = {}
+
+    def __getitem__(self, key):
+        # type: (Any) -> Any
+        try:
+            return self._values[key]
+        except KeyError:
+            value = self._table[key]
+            if value is None:
+                raise KeyError(key)
+            if type(value) is self._converter._table_type:
+                value = self._converter.convert(value)
+            self._values[key] = value
+            return value
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        # type: () -> int
+        return len(self._keys)
+
+
 def get_order(objects_to_sort, sort_objects, sort_subgroups, sort_groups):
     """
     Sorts the list of objects according to their Factorio order. Attempts to
@@ -417,16 +694,14 @@ def get_order(objects_to_sort, sort_objects, sort_subgroups, sort_groups):
     return [x["obj"][3] for x in order]
 
 
-def get_items(lua):
+def get_items(data_raw):
     """
     Gets the loaded items, item subgroups, and item groups. Sorts them and
     returns them. Saves us the trouble of recalcualting this every time we sort
     something along item order, which we commonly do.
     """
-    data = lua.globals().data
-
-    groups = convert_table_to_dict(data.raw["item-group"])
-    subgroups = convert_table_to_dict(data.raw["item-subgroup"])
+    groups = data_raw["item-group"]
+    subgroups = data_raw["item-subgroup"]
 
     def to_ordered_dict(elem):
         sorted_elem = OrderedDict()
@@ -480,27 +755,26 @@ def get_items(lua):
         subgroup["items"].append(item)
 
     def add_items(category):
-        category = convert_table_to_dict(category)
         for item_name in category:
             add_item(category, item_name)
 
     # Iterate over every item
-    add_items(data.raw["item"])
-    add_items(data.raw["item-with-entity-data"])
-    add_items(data.raw["tool"])
-    add_items(data.raw["ammo"])
-    add_items(data.raw["module"])
-    add_items(data.raw["armor"])
-    add_items(data.raw["gun"])
-    add_items(data.raw["capsule"])
+    add_items(data_raw["item"])
+    add_items(data_raw["item-with-entity-data"])
+    add_items(data_raw["tool"])
+    add_items(data_raw["ammo"])
+    add_items(data_raw["module"])
+    add_items(data_raw["armor"])
+    add_items(data_raw["gun"])
+    add_items(data_raw["capsule"])
     # Extras
-    add_items(data.raw["blueprint"])
-    add_items(data.raw["blueprint-book"])
-    add_items(data.raw["upgrade-item"])
-    add_items(data.raw["deconstruction-item"])
-    add_items(data.raw["spidertron-remote"])
-    add_items(data.raw["repair-tool"])  # not an item somehow
-    add_items(data.raw["rail-planner"])
+    add_items(data_raw["blueprint"])
+    add_items(data_raw["blueprint-book"])
+    add_items(data_raw["upgrade-item"])
+    add_items(data_raw["deconstruction-item"])
+    add_items(data_raw["spidertron-remote"])
+    add_items(data_raw["repair-tool"])  # not an item somehow
+    add_items(data_raw["rail-planner"])
 
     # Sort everything
     for i, _ in enumerate(group_list):
@@ -560,13 +834,12 @@ def extract_mods(loaded_mods, data_location, verbose):
         print("Extracted mods...")
 
 
-def extract_entities(lua, data_location, verbose, sort_tuple):
+def extract_entities(data_raw, data_location, verbose, sort_tuple):
     """
-    Extracts the entities to ``entities.pkl`` in :py:mod:`draftsman.data`.
+    Extracts the entities to ``entities.pkl`` in :py:mod:`draftsman.data`, with
+    the raw prototypes in ``entities.db``.
     """
 
-    data = lua.globals().data
-
     entities = {}
     unordered_entities_raw = {}
     is_flippable = {}
@@ -657,8 +930,7 @@ def extract_entities(lua, data_location, verbose, sort_tuple):
         return True
 
     def categorize_entities(entity_table, target_list):
-        entity_dict = convert_table_to_dict(entity_table)
-        for entity_name, entity in entity_dict.items():
+        for entity_name, entity in entity_table.items():
             if not categorize_entity(entity_name, entity):
                 continue
             target_list.append(entity)
@@ -670,30 +942,30 @@ def extract_entities(lua, data_location, verbose, sort_tuple):
 
     #  Chests
     entities["containers"] = []
-    categorize_entities(data.raw["container"], entities["containers"])
+    categorize_entities(data_raw["container"], entities["containers"])
     sort(entities["containers"])
 
     #  Storage tanks
     entities["storage_tanks"] = []
-    categorize_entities(data.raw["storage-tank"], entities["storage_tanks"])
+    categorize_entities(data_raw["storage-tank"], entities["storage_tanks"])
     sort(entities["storage_tanks"])
 
     #  Belts
     entities["transport_belts"] = []
-    categorize_entities(data.raw["transport-belt"], entities["transport_belts"])
+    categorize_entities(data_raw["transport-belt"], entities["transport_belts"])
     sort(entities["transport_belts"])
     entities["underground_belts"] = []
-    categorize_entities(data.raw["underground-belt"], entities["underground_belts"])
+    categorize_entities(data_raw["underground-belt"], entities["underground_belts"])
     sort(entities["underground_belts"])
     entities["splitters"] = []
-    categorize_entities(data.raw["splitter"], entities["splitters"])
+    categorize_entities(data_raw["splitter"], entities["splitters"])
     sort(entities["splitters"])
 
     #  Inserters
     entities["inserters"] = []
     entities["filter_inserters"] = []
-    # categorize_entities(data.raw["inserter"], inserters)
-    temp_inserters = convert_table_to_dict(data.raw["inserter"])
+    # categorize_entities(data_raw["inserter"], inserters)
+    temp_inserters = data_raw["inserter"]
     for inserter_name, inserter in temp_inserters.items():
         if not categorize_entity(inserter_name, inserter):
             continue
@@ -707,60 +979,60 @@ def extract_entities(lua, data_location, verbose, sort_tuple):
 
     #  Loaders
     entities["loaders"] = []
-    categorize_entities(data.raw["loader"], entities["loaders"])
+    categorize_entities(data_raw["loader"], entities["loaders"])
     sort(entities["loaders"])
 
     #  Electric poles
     entities["electric_poles"] = []
-    categorize_entities(data.raw["electric-pole"], entities["electric_poles"])
+    categorize_entities(data_raw["electric-pole"], entities["electric_poles"])
     sort(entities["electric_poles"])
 
     #  Pipes
     entities["pipes"] = []
-    categorize_entities(data.raw["pipe"], entities["pipes"])
+    categorize_entities(data_raw["pipe"], entities["pipes"])
     sort(entities["pipes"])
     entities["underground_pipes"] = []
-    categorize_entities(data.raw["pipe-to-ground"], entities["underground_pipes"])
+    categorize_entities(data_raw["pipe-to-ground"], entities["underground_pipes"])
     sort(entities["underground_pipes"])
 
     #  Pumps
     entities["pumps"] = []
-    categorize_entities(data.raw["pump"], entities["pumps"])
+    categorize_entities(data_raw["pump"], entities["pumps"])
     sort(entities["pumps"])
 
     #  Rails
     entities["straight_rails"] = []
-    categorize_entities(data.raw["straight-rail"], entities["straight_rails"])
+    categorize_entities(data_raw["straight-rail"], entities["straight_rails"])
     sort(entities["straight_rails"])
     entities["curved_rails"] = []
-    categorize_entities(data.raw["curved-rail"], entities["curved_rails"])
+    categorize_entities(data_raw["curved-rail"], entities["curved_rails"])
     sort(entities["curved_rails"])
 
     #  Train stops
     entities["train_stops"] = []
-    categorize_entities(data.raw["train-stop"], entities["train_stops"])
+    categorize_entities(data_raw["train-stop"], entities["train_stops"])
     sort(entities["train_stops"])
 
     #  Rail signals
     entities["rail_signals"] = []
-    categorize_entities(data.raw["rail-signal"], entities["rail_signals"])
+    categorize_entities(data_raw["rail-signal"], entities["rail_signals"])
     sort(entities["rail_signals"])
     entities["rail_chain_signals"] = []
-    categorize_entities(data.raw["rail-chain-signal"], entities["rail_chain_signals"])
+    categorize_entities(data_raw["rail-chain-signal"], entities["rail_chain_signals"])
     sort(entities["rail_chain_signals"])
 
     #  Train cars
     entities["locomotives"] = []
-    categorize_entities(data.raw["locomotive"], entities["locomotives"])
+    categorize_entities(data_raw["locomotive"], entities["locomotives"])
     sort(entities["locomotives"])
     entities["cargo_wagons"] = []
-    categorize_entities(data.raw["cargo-wagon"], entities["cargo_wagons"])
+    categorize_entities(data_raw["cargo-wagon"], entities["cargo_wagons"])
     sort(entities["cargo_wagons"])
     entities["fluid_wagons"] = []
-    categorize_entities(data.raw["fluid-wagon"], entities["fluid_wagons"])
+    categorize_entities(data_raw["fluid-wagon"], entities["fluid_wagons"])
     sort(entities["fluid_wagons"])
     entities["artillery_wagons"] = []
-    categorize_entities(data.raw["artillery-wagon"], entities["artillery_wagons"])
+    categorize_entities(data_raw["artillery-wagon"], entities["artillery_wagons"])
     sort(entities["artillery_wagons"])
 
     #  Logistics containers (Special)
@@ -769,7 +1041,7 @@ def extract_entities(lua, data_location, verbose, sort_tuple):
     entities["logistic_storage_containers"] = []
     entities["logistic_buffer_containers"] = []
     entities["logistic_request_containers"] = []
-    logi_containers = convert_table_to_dict(data.raw["logistic-container"])
+    logi_containers = data_raw["logistic-container"]
     for container_name, container in logi_containers.items():
         if not categorize_entity(container_name, container):
             continue
@@ -793,192 +1065,188 @@ def extract_entities(lua, data_location, verbose, sort_tuple):
 
     #  Roboports
     entities["roboports"] = []
-    categorize_entities(data.raw["roboport"], entities["roboports"])
+    categorize_entities(data_raw["roboport"], entities["roboports"])
     sort(entities["roboports"])
 
     #  Lamps
     entities["lamps"] = []
-    categorize_entities(data.raw["lamp"], entities["lamps"])
+    categorize_entities(data_raw["lamp"], entities["lamps"])
     sort(entities["lamps"])
 
     #  Combinators
     entities["arithmetic_combinators"] = []
     categorize_entities(
-        data.raw["arithmetic-combinator"], entities["arithmetic_combinators"]
+        data_raw["arithmetic-combinator"], entities["arithmetic_combinators"]
     )
     sort(entities["arithmetic_combinators"])
     entities["decider_combinators"] = []
-    categorize_entities(data.raw["decider-combinator"], entities["decider_combinators"])
+    categorize_entities(data_raw["decider-combinator"], entities["decider_combinators"])
     sort(entities["decider_combinators"])
     entities["constant_combinators"] = []
     categorize_entities(
-        data.raw["constant-combinator"], entities["constant_combinators"]
+        data_raw["constant-combinator"], entities["constant_combinators"]
     )
     sort(entities["constant_combinators"])
     entities["power_switches"] = []
-    categorize_entities(data.raw["power-switch"], entities["power_switches"])
+    categorize_entities(data_raw["power-switch"], entities["power_switches"])
     sort(entities["power_switches"])
     entities["programmable_speakers"] = []
     categorize_entities(
-        data.raw["programmable-speaker"], entities["programmable_speakers"]
+        data_raw["programmable-speaker"], entities["programmable_speakers"]
     )
     sort(entities["programmable_speakers"])
 
     #  Boilers / Heat exchangers
     entities["boilers"] = []
-    categorize_entities(data.raw["boiler"], entities["boilers"])
+    categorize_entities(data_raw["boiler"], entities["boilers"])
     sort(entities["boilers"])
 
     #  Steam engines / turbines
     entities["generators"] = []
-    categorize_entities(data.raw["generator"], entities["generators"])
+    categorize_entities(data_raw["generator"], entities["generators"])
     sort(entities["generators"])
 
     #  Solar panels
     entities["solar_panels"] = []
-    categorize_entities(data.raw["solar-panel"], entities["solar_panels"])
+    categorize_entities(data_raw["solar-panel"], entities["solar_panels"])
     sort(entities["solar_panels"])
 
     #  Accumulators
     entities["accumulators"] = []
-    categorize_entities(data.raw["accumulator"], entities["accumulators"])
+    categorize_entities(data_raw["accumulator"], entities["accumulators"])
     sort(entities["accumulators"])
 
     #  Reactors
     entities["reactors"] = []
-    categorize_entities(data.raw["reactor"], entities["reactors"])
+    categorize_entities(data_raw["reactor"], entities["reactors"])
     sort(entities["reactors"])
 
     #  Heat pipes
     entities["heat_pipes"] = []
-    categorize_entities(data.raw["heat-pipe"], entities["heat_pipes"])
+    categorize_entities(data_raw["heat-pipe"], entities["heat_pipes"])
     sort(entities["heat_pipes"])
 
     #  Mining drills (Burner, Electric, Pumpjack)
     entities["mining_drills"] = []
-    categorize_entities(data.raw["mining-drill"], entities["mining_drills"])
+    categorize_entities(data_raw["mining-drill"], entities["mining_drills"])
     sort(entities["mining_drills"])
 
     #  Offshore pumps
     entities["offshore_pumps"] = []
-    categorize_entities(data.raw["offshore-pump"], entities["offshore_pumps"])
+    categorize_entities(data_raw["offshore-pump"], entities["offshore_pumps"])
     sort(entities["offshore_pumps"])
 
     #  Furnaces
     entities["furnaces"] = []
-    categorize_entities(data.raw["furnace"], entities["furnaces"])
+    categorize_entities(data_raw["furnace"], entities["furnaces"])
     sort(entities["furnaces"])
 
     #  Assembling machines (1-3 + chemical plant, refinery, and centrifuge)
     entities["assembling_machines"] = []
-    categorize_entities(data.raw["assembling-machine"], entities["assembling_machines"])
+    categorize_entities(data_raw["assembling-machine"], entities["assembling_machines"])
     sort(entities["assembling_machines"])
 
     #  Labs
     entities["labs"] = []
-    categorize_entities(data.raw["lab"], entities["labs"])
+    categorize_entities(data_raw["lab"], entities["labs"])
     sort(entities["labs"])
 
     #  Beacons
     entities["beacons"] = []
-    categorize_entities(data.raw["beacon"], entities["beacons"])
+    categorize_entities(data_raw["beacon"], entities["beacons"])
     sort(entities["beacons"])
 
     #  Rocket silos
     entities["rocket_silos"] = []
-    categorize_entities(data.raw["rocket-silo"], entities["rocket_silos"])
+    categorize_entities(data_raw["rocket-silo"], entities["rocket_silos"])
     sort(entities["rocket_silos"])
 
     #  Landmines
     entities["land_mines"] = []
-    categorize_entities(data.raw["land-mine"], entities["land_mines"])
+    categorize_entities(data_raw["land-mine"], entities["land_mines"])
     sort(entities["land_mines"])
 
     #  Walls
     entities["walls"] = []
-    categorize_entities(data.raw["wall"], entities["walls"])
+    categorize_entities(data_raw["wall"], entities["walls"])
     sort(entities["walls"])
 
     #  Gates
     entities["gates"] = []
-    categorize_entities(data.raw["gate"], entities["gates"])
+    categorize_entities(data_raw["gate"], entities["gates"])
     sort(entities["gates"])
 
     #  Turrets
     entities["turrets"] = []
-    categorize_entities(data.raw["ammo-turret"], entities["turrets"])
-    categorize_entities(data.raw["electric-turret"], entities["turrets"])
-    categorize_entities(data.raw["fluid-turret"], entities["turrets"])
-    categorize_entities(data.raw["artillery-turret"], entities["turrets"])
+    categorize_entities(data_raw["ammo-turret"], entities["turrets"])
+    categorize_entities(data_raw["electric-turret"], entities["turrets"])
+    categorize_entities(data_raw["fluid-turret"], entities["turrets"])
+    categorize_entities(data_raw["artillery-turret"], entities["turrets"])
     sort(entities["turrets"])
 
     #  Radars
     entities["radars"] = []
-    categorize_entities(data.raw["radar"], entities["radars"])
+    categorize_entities(data_raw["radar"], entities["radars"])
     sort(entities["radars"])
 
     #  Simple Entities with Owner
     entities["simple_entities_with_owner"] = []
     categorize_entities(
-        data.raw["simple-entity-with-owner"], entities["simple_entities_with_owner"]
+        data_raw["simple-entity-with-owner"], entities["simple_entities_with_owner"]
     )
     sort(entities["simple_entities_with_owner"])
 
     #  Simple Entities with Force
     entities["simple_entities_with_force"] = []
     categorize_entities(
-        data.raw["simple-entity-with-force"], entities["simple_entities_with_force"]
+        data_raw["simple-entity-with-force"], entities["simple_entities_with_force"]
     )
     sort(entities["simple_entities_with_force"])
 
     #  Electric Energy Interfaces
     entities["electric_energy_interfaces"] = []
     categorize_entities(
-        data.raw["electric-energy-interface"], entities["electric_energy_interfaces"]
+        data_raw["electric-energy-interface"], entities["electric_energy_interfaces"]
     )
     sort(entities["electric_energy_interfaces"])
 
     #  Linked Containers
     entities["linked_containers"] = []
-    try:
-        # Early versions of Factorio 1.0 didn't have linked containers yet; this
-        # checks for that outcome
-        categorize_entities(data.raw["linked-container"], entities["linked_containers"])
+    # Early versions of Factorio 1.0 didn't have linked containers yet; this
+    # checks for that outcome
+    if "linked-container" in data_raw:
+        categorize_entities(data_raw["linked-container"], entities["linked_containers"])
         sort(entities["linked_containers"])
-    except TypeError:
-        pass
 
     #  Heat interfaces
     entities["heat_interfaces"] = []
-    categorize_entities(data.raw["heat-interface"], entities["heat_interfaces"])
+    categorize_entities(data_raw["heat-interface"], entities["heat_interfaces"])
     sort(entities["heat_interfaces"])
 
     #  Linked belts
     entities["linked_belts"] = []
-    try:
-        categorize_entities(data.raw["linked-belt"], entities["linked_belts"])
+    if "linked-belt" in data_raw:
+        categorize_entities(data_raw["linked-belt"], entities["linked_belts"])
         sort(entities["linked_belts"])
-    except TypeError:
-        pass
 
     #  Infinity containers
     entities["infinity_containers"] = []
-    categorize_entities(data.raw["infinity-container"], entities["infinity_containers"])
+    categorize_entities(data_raw["infinity-container"], entities["infinity_containers"])
     sort(entities["infinity_containers"])
 
     #  Infinity pipes
     entities["infinity_pipes"] = []
-    categorize_entities(data.raw["infinity-pipe"], entities["infinity_pipes"])
+    categorize_entities(data_raw["infinity-pipe"], entities["infinity_pipes"])
     sort(entities["infinity_pipes"])
 
     #  Burner generators
     entities["burner_generators"] = []
-    categorize_entities(data.raw["burner-generator"], entities["burner_generators"])
+    categorize_entities(data_raw["burner-generator"], entities["burner_generators"])
     sort(entities["burner_generators"])
 
     #  Player Ports
     entities["player_ports"] = []
-    categorize_entities(data.raw["player-port"], entities["player_ports"])
+    categorize_entities(data_raw["player-port"], entities["player_ports"])
     sort(entities["player_ports"])
 
     raw_order = get_order(unordered_entities_raw, *sort_tuple)
@@ -988,6 +1256,11 @@ def extract_entities(lua, data_location, verbose, sort_tuple):
 
     entities["flippable"] = is_flippable
 
+    # The raw prototypes are written separately, so that they can be loaded on
+    # demand
+    PrototypeDatabase.write(
+        os.path.join(data_location, "entities.db"), entities.pop("raw")
+    )
     with open(os.path.join(data_location, "entities.pkl"), "wb") as out:
         pickle.dump(entities, out, 2)
 
@@ -998,16 +1271,14 @@ def extract_entities(lua, data_location, verbose, sort_tuple):
 # =============================================================================
 
 
-def extract_instruments(lua, data_location, verbose):
+def extract_instruments(data_raw, data_location, verbose):
     """
     Extracts the instruments to ``instruments.pkl`` in :py:mod:`draftsman.data`.
     """
-    data = lua.globals().data
-
     instrument_raw = OrderedDict()
     instrument_index = {}
     instrument_names = {}
-    speakers = convert_table_to_dict(data.raw["programmable-speaker"])
+    speakers = data_raw["programmable-speaker"]
     for speaker in speakers:
         instrument_list = speakers[speaker]["instruments"]
         instrument_raw[speaker] = instrument_list
@@ -1035,7 +1306,7 @@ def extract_instruments(lua, data_location, verbose):
 # =============================================================================
 
 
-def extract_items(lua, data_location, verbose, sort_tuple):
+def extract_items(data_raw, data_location, verbose, sort_tuple):
     """
     Extracts the items to ``items.pkl`` in :py:mod:`draftsman.data`.
     """
@@ -1051,19 +1322,17 @@ def extract_items(lua, data_location, verbose, sort_tuple):
 # =============================================================================
 
 
-def extract_modules(lua, data_location, verbose, sort_tuple):
+def extract_modules(data_raw, data_location, verbose, sort_tuple):
     """
     Extracts the modules to ``modules.pkl`` in :py:mod:`draftsman.data`.
     """
-    data = lua.globals().data
-
     # Init categories
-    categories = convert_table_to_dict(data.raw["module-category"])
+    categories = data_raw["module-category"]
     out_categories = OrderedDict()
     for category in categories:
         out_categories[category] = []
 
-    modules = convert_table_to_dict(data.raw["module"])
+    modules = data_raw["module"]
     unsorted_modules_raw = {}
     for module in modules:
         unsorted_modules_raw[module] = modules[module]
@@ -1085,25 +1354,24 @@ def extract_modules(lua, data_location, verbose, sort_tuple):
 # =============================================================================
 
 
-def extract_recipes(lua, data_location, verbose, sort_tuple):
+def extract_recipes(data_raw, data_location, verbose, sort_tuple):
     """
-    Extracts the recipes to ``recipes.pkl`` in :py:mod:`draftsman.data`.
+    Extracts the recipes to ``recipes.pkl`` in :py:mod:`draftsman.data`, with
+    the raw prototypes in ``recipes.db``.
     """
-    data = lua.globals().data
-
     out_categories = {}
     for_machine = {}
 
-    categories = convert_table_to_dict(data.raw["recipe-category"])
+    categories = data_raw["recipe-category"]
     for category in categories:
         out_categories[category] = []
 
-    unsorted_recipes = convert_table_to_dict(data.raw["recipe"])
+    unsorted_recipes = data_raw["recipe"]
     for recipe in unsorted_recipes:
         category = unsorted_recipes[recipe].get("category", "crafting")
         out_categories[category].append(unsorted_recipes[recipe]["name"])
 
-    machines = convert_table_to_dict(data.raw["assembling-machine"])
+    machines = data_raw["assembling-machine"]
     for machine_name in machines:
         for_machine[machine_name] = []
         machine = machines[machine_name]
@@ -1119,8 +1387,9 @@ def extract_recipes(lua, data_location, verbose, sort_tuple):
     for recipe in recipe_order:
         recipes[recipe] = unsorted_recipes[recipe]
 
+    PrototypeDatabase.write(os.path.join(data_location, "recipes.db"), recipes)
     with open(os.path.join(data_location, "recipes.pkl"), "wb") as out:
-        data = [recipes, out_categories, for_machine]
+        data = [None, out_categories, for_machine]
         pickle.dump(data, out, 2)
 
     if verbose:
@@ -1130,12 +1399,10 @@ def extract_recipes(lua, data_location, verbose, sort_tuple):
 # =============================================================================
 
 
-def extract_signals(lua, data_location, verbose, sort_tuple):
+def extract_signals(data_raw, data_location, verbose, sort_tuple):
     """
     Extracts the signals to ``signals.pkl`` in :py:mod:`draftsman.data`.
     """
-    data = lua.globals().data
-
     unsorted_raw_signals = {}
     type_of_signals = {}
     item_signals = []
@@ -1143,7 +1410,7 @@ def extract_signals(lua, data_location, verbose, sort_tuple):
     virtual_signals = []
 
     def add_signals(signal_category, target_location, signal_type):
-        signal_category = convert_table_to_dict(data.raw[signal_category])
+        signal_category = data_raw[signal_category]
         for signal_name in signal_category:
             if signal_name in {"item-unknown", "fluid-unknown", "signal-unknown"}:
                 continue
@@ -1202,13 +1469,11 @@ def extract_signals(lua, data_location, verbose, sort_tuple):
 # =============================================================================
 
 
-def extract_tiles(lua, data_location, verbose):
+def extract_tiles(data_raw, data_location, verbose):
     """
-    Extracts the tiles to ``tiles.pkl`` in :py:mod:`draftsman.data`.
+    Extracts the tiles to ``tiles.db`` in :py:mod:`draftsman.data`.
     """
-    data = lua.globals().data
-
-    tiles = convert_table_to_dict(data.raw["tile"])
+    tiles = data_raw["tile"]
 
     tile_list = []
     for tile in tiles:
@@ -1224,8 +1489,11 @@ def extract_tiles(lua, data_location, verbose):
     for tile in result:
         out_tiles[tile] = tiles[tile]
 
-    with open(os.path.join(data_location, "tiles.pkl"), "wb") as out:
-        pickle.dump(out_tiles, out, 2)
+    PrototypeDatabase.write(os.path.join(data_location, "tiles.db"), out_tiles)
+    # Superseded by tiles.db
+    tiles_pkl = os.path.join(data_location, "tiles.pkl")
+    if os.path.isfile(tiles_pkl):
+        os.remove(tiles_pkl)
 
     if verbose:
         print("Extracted tiles...")
@@ -1234,390 +1502,238 @@ def extract_tiles(lua, data_location, verbose):
 # =============================================================================
 
 
-def update(verbose=False, path=None, show_logs=False, no_mods=False, report=None):
+# `data.raw` and the sorted items, loaded once in each extraction process
+_extractor_data_raw = None
+_extractor_items = None
+
+
+def _init_extractor(snapshot_path, items):
+    # type: (str, tuple) -> None
     """
-    Updates the data in the :py:mod:`.draftsman.data` modules.
+    Loads the ``data.raw`` snapshot at ``snapshot_path`` for the extraction
+    functions run in this process.
+    """
+    global _extractor_data_raw, _extractor_items
+    with open(snapshot_path, "rb") as snapshot_file:
+        _extractor_data_raw = pickle.load(snapshot_file)
+    _extractor_items = items
 
-    Emulates the load pattern of Factorio and loads all of its data (hopefully)
-    in the same way. Then that data is extracted into the module, updating it's
-    contents. Updates and changes made to the ``factorio-data`` folder are also
-    reflected in this routine.
+
+def _run_extractor(job):
+    # type: (tuple) -> tuple[str, float]
     """
-    # Figure out what directory we're in
-    env_dir = os.path.dirname(__file__)
-    # Create some quick access folders
-    factorio_data = os.path.join(env_dir, "factorio-data")
-    data_location = os.path.join(env_dir, "data")
-    if path is None:
-        factorio_mods_folder = os.path.join(env_dir, "factorio-mods")
+    Runs one of the ``extractors`` on the ``data.raw`` loaded by
+    :py:func:`_init_extractor`.
+
+    :returns: The name of the extraction function and how long it took, in
+        seconds.
+    """
+    extractor, data_location, verbose = job
+    start = timeit.default_timer()
+    if extractor in (extract_instruments, extract_tiles):
+        extractor(_extractor_data_raw, data_location, verbose)
     else:
-        factorio_mods_folder = path
+        extractor(_extractor_data_raw, data_location, verbose, _extractor_items)
+    return extractor.__name__, timeit.default_timer() - start
 
-    if verbose:
-        print("Reading mods from:", factorio_mods_folder)
 
-    # Get the info from factorio-data and treat it as the "base" mod
-    with open(os.path.join(factorio_data, "base", "info.json")) as base_info_file:
-        base_info = json.load(base_info_file)
-        factorio_version = base_info["version"]
-        # Normalize it to 4 numbers to make our versioning lives easier
-        if factorio_version.count(".") == 2:
-            factorio_version += ".0"
-        factorio_version_info = version_string_to_tuple(factorio_version)
+def run_extractors(
+    functions, snapshot_path, items, data_location, verbose=False, processes=None
+):
+    # type: (list, str, tuple, str, bool, int) -> list[tuple[str, float]]
+    """
+    Runs each extraction function in ``functions`` on the ``data.raw``
+    snapshot at ``snapshot_path``, in a pool of ``processes`` processes which
+    each load their own copy of the snapshot. The functions write their
+    results to ``data_location`` concurrently.
 
-    # Write `_factorio_version.py` with the current factorio version
-    with open(os.path.join(env_dir, "_factorio_version.py"), "w") as version_file:
-        version_file.write("# _factorio_version.py\n\n")
-        version_file.write('__factorio_version__ = "' + factorio_version + '"\n')
-        version_file.write(
-            "__factorio_version_info__ = {}\n".format(str(factorio_version_info))
-        )
+    :param processes: The number of processes to use. Defaults to the number
+        of CPUs; ``1`` runs every function in this process instead.
 
-    # Dictionary of mods
-    mods: dict[str, Mod] = {}
+    :returns: A ``list`` of the name of each function and how long it took, in
+        seconds, in the same order as ``functions``.
+    """
+    if processes is None:
+        processes = multiprocessing.cpu_count()
+    processes = min(processes, len(functions))
+    jobs = [(function, data_location, verbose) for function in functions]
 
-    # Add "base" and "core" mods
-    # Core mod is somewhat special, and not loaded in the standard lifecycle
-    # Instead, it is loaded first thing and its functions are reused throughout
-    core_mod = Mod(
-        name="core",
-        internal_folder=None,
-        version=factorio_version,
-        archive=False,
-        location=os.path.join(
-            factorio_data, "core"
-        ),  # "./draftsman/factorio-data/core",
-        info=None,
-        files=None,
-        data={
-            "data.lua": file_to_string(
-                os.path.join(factorio_data, "core", "data.lua")
-            )  # file_to_string("draftsman/factorio-data/core/data.lua")
-        },
+    if processes <= 1:
+        _init_extractor(snapshot_path, items)
+        return [_run_extractor(job) for job in jobs]
+
+    pool = multiprocessing.Pool(processes, _init_extractor, (snapshot_path, items))
+    try:
+        return pool.map(_run_extractor, jobs)
+    finally:
+        pool.close()
+        pool.join()
+
+
+# Every extraction function that reads `data.raw`
+extractors = [
+    extract_entities,
+    extract_instruments,
+    extract_items,
+    extract_modules,
+    extract_recipes,
+    extract_signals,
+    extract_tiles,
+]
+
+
+# =============================================================================
+
+
+def fingerprint_file(filepath):
+    # type: (str) -> str
+    """
+    Returns the SHA-256 hash of the contents of a file, as a hex string.
+    """
+    hasher = hashlib.sha256()
+    with open(filepath, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def fingerprint_folder(folder):
+    # type: (str) -> str
+    """
+    Returns a SHA-256 hash of the relative paths and contents of every file in
+    a folder and its subfolders, as a hex string. Independent of where the
+    folder is located and the order the filesystem lists its contents.
+    """
+    hasher = hashlib.sha256()
+    for root, dirs, files in os.walk(folder):
+        dirs.sort()
+        for filename in sorted(files):
+            filepath = os.path.join(root, filename)
+            relative_path = os.path.relpath(filepath, folder).replace("\\", "/")
+            hasher.update(relative_path.encode("utf-8"))
+            hasher.update(fingerprint_file(filepath).encode("ascii"))
+    return hasher.hexdigest()
+
+
+def get_input_fingerprints(factorio_data, factorio_mods_folder, no_mods):
+    # type: (str, str, bool) -> OrderedDict[str, str]
+    """
+    Fingerprints everything that can affect the result of the settings and
+    data stages: ``factorio-data``, Draftsman's compatibility scripts, the
+    version of Lua, and every mod archive, mod folder, ``mod-list.json`` and
+    ``mod-settings.dat`` in ``factorio_mods_folder``.
+
+    :returns: An ``OrderedDict`` of input names to their fingerprints. The
+        contents of ``factorio_mods_folder`` are under ``"mods"``, in an
+        ``OrderedDict`` of their own, so that their names can't collide with
+        the other inputs.
+    """
+    env_dir = os.path.dirname(__file__)
+
+    fingerprints = OrderedDict()
+    fingerprints["lua"] = str(lupa.LUA_VERSION)
+    fingerprints["no_mods"] = str(bool(no_mods))
+    fingerprints["factorio-data"] = fingerprint_folder(factorio_data)
+    fingerprints["compatibility"] = fingerprint_folder(
+        os.path.join(env_dir, "compatibility")
     )
-    mods["base"] = Mod(
-        name="base",
-        internal_folder=None,
-        version=factorio_version,
-        archive=False,
-        location=os.path.join(
-            factorio_data, "base"
-        ),  # "./draftsman/factorio-data/base",
-        info=None,
-        files=None,
-        data={
-            "data.lua": file_to_string(
-                os.path.join(factorio_data, "base", "data.lua")
-            ),  # file_to_string("draftsman/factorio-data/base/data.lua"),
-            "data-updates.lua": file_to_string(
-                os.path.join(factorio_data, "base", "data-updates.lua")
-            ),  # file_to_string("draftsman/factorio-data/base/data-updates.lua")
-        },
+    mods = fingerprints["mods"] = OrderedDict()
+    for mod_obj in sorted(os.listdir(factorio_mods_folder)):
+        mod_location = os.path.join(factorio_mods_folder, mod_obj)
+        if os.path.isdir(mod_location):
+            mods[mod_obj] = fingerprint_folder(mod_location)
+        else:
+            mods[mod_obj] = fingerprint_file(mod_location)
+    return fingerprints
+
+
+def get_output_fingerprints(data_location):
+    # type: (str) -> OrderedDict[str, str]
+    """
+    Fingerprints the code that extracts the data, as well as every file it
+    extracted to ``data_location``. Files that don't exist are ``None``.
+
+    :returns: An ``OrderedDict`` of file names to their fingerprints.
+    """
+    env_dir = os.path.dirname(__file__)
+
+    fingerprints = OrderedDict()
+    fingerprints["env.py"] = fingerprint_file(os.path.join(env_dir, "env.py"))
+    fingerprints["prototype_database.py"] = fingerprint_file(
+        os.path.join(env_dir, "classes", "prototype_database.py")
     )
+    for filename in extracted_files:
+        filepath = os.path.join(data_location, filename)
+        if os.path.isfile(filepath):
+            fingerprints[filename] = fingerprint_file(filepath)
+        else:
+            fingerprints[filename] = None
+    return fingerprints
 
-    # This shouldn't need to be done, but lets create the factorio-mod folder if
-    # it doesn't exist in case the user deletes the whole thing accidently
-    if path is None and not os.path.isdir(factorio_mods_folder):
-        os.mkdir(factorio_mods_folder)
 
-    # Check that our path actually exists (in case it was user specified)
-    if not os.path.isdir(factorio_mods_folder):
-        raise OSError("Directory '{}' not found".format(factorio_mods_folder))
+def get_cache_location(data_location):
+    # type: (str) -> str
+    """
+    Returns the folder in ``draftsman/env-cache`` that caches the updates
+    which write their data to ``data_location``. Every output folder gets its
+    own, so that updates with different outputs don't overwrite (or reuse)
+    each other's ``data.raw``.
+    """
+    env_dir = os.path.dirname(__file__)
+    key = hashlib.sha256(os.path.realpath(data_location).encode("utf-8"))
+    return os.path.join(env_dir, "env-cache", key.hexdigest()[:16])
 
-    # Attempt to get the list of enabled mods from mod-list.json
-    enabled_mod_list = {}
+
+def read_cache(cache_location):
+    # type: (str) -> dict
+    """
+    Reads the fingerprints saved by the last successful call to
+    :py:func:`update` from ``cache_location``.
+
+    :returns: A ``dict`` with the ``"inputs"`` and ``"outputs"`` fingerprints
+        of the last update, or ``None`` if there is no usable cache.
+    """
     try:
-        with open(os.path.join(factorio_mods_folder, "mod-list.json")) as mod_list_file:
-            mod_json = json.load(mod_list_file)
-            for mod in mod_json["mods"]:
-                enabled_mod_list[mod["name"].replace(" ", "")] = (
-                    mod["enabled"] and not no_mods
-                )
-    except FileNotFoundError:  # If no such file is found
-        # Every mod is enabled by default, unless `no_mods` is True
-        enabled_mod_list["base"] = True
-        for mod_obj in os.listdir(factorio_mods_folder):
-            if mod_obj.lower().endswith(".zip"):
-                mod_name = mod_archive_regex.match(mod_obj).group(1).replace(" ", "")
-                enabled_mod_list[mod_name] = not no_mods
-            elif os.path.isdir(os.path.join(factorio_mods_folder, mod_obj)):
-                mod_name = mod_obj
-                enabled_mod_list[mod_name] = not no_mods
+        with open(os.path.join(cache_location, "fingerprints.json")) as cache_file:
+            cache = json.load(cache_file)
+    except (FileNotFoundError, ValueError):
+        return None
+    if not os.path.isfile(os.path.join(cache_location, "data-raw.pkl")):
+        return None
+    return cache
 
-    if verbose:
-        print("\nDiscovering mods...\n")
 
-    # Preload all the mods and their versions
-    for mod_obj in os.listdir(factorio_mods_folder):
-        # mod_location = os.path.join(factorio_mods, mod_obj)
-        mod_location = factorio_mods_folder + "/" + mod_obj
-        external_mod_version = None  # Optional (the version indicated by filepath)
+def get_changed(old, new):
+    # type: (dict, dict) -> list[str]
+    """
+    Returns the names of every fingerprint that was added, removed or changed
+    between ``old`` and ``new``. Fingerprints in nested ``dict``s are named
+    with the key of their ``dict`` in front, like ``"mods/mod-list.json"``.
+    """
+    changed = []
+    for key in sorted(set(old) | set(new)):
+        old_value, new_value = old.get(key), new.get(key)
+        if isinstance(old_value, dict) and isinstance(new_value, dict):
+            changed += [key + "/" + name for name in get_changed(old_value, new_value)]
+        elif old_value != new_value:
+            changed.append(key)
+    return changed
 
-        if mod_obj.lower().endswith(".zip"):
-            # Zip file
-            m = mod_archive_regex.match(mod_obj)
-            if not m:
-                raise IncorrectModFormatError(
-                    "Mod archive '{}' does not fit the 'name_version' format".format(
-                        mod_obj
-                    )
-                )
-            folder_name = m.group(1)
-            mod_name = m.group(2).replace(" ", "")
-            external_mod_version = m.group(3)
-            files = zipfile.ZipFile(mod_location, mode="r")
 
-            # There is no restriction on the name of the internal folder, just
-            # that there is only one at the root of the archive
-            # All the mods I've seen use the same "mod-name_mod-version", but
-            # the wiki says this is not enforced
-            # Hence, we use this scuffed code to actually get a list of all the
-            # root-most directories
-            topdirs = set()
-            for file in files.namelist():
-                basename = None  # guards against UnboundLocalError
-                while file:
-                    file, basename = os.path.split(file)
-                topdirs.add(basename)
+# =============================================================================
 
-            # REVISION: sometimes there are multiple folders in a single archive
-            # (even though the wiki says only one); eg: "__MACOSX" in
-            # "Mining Drones Harder" mod (seems to be reserved file when
-            # compressing on Mac)
-            if len(topdirs) == 1:
-                # If there's one folder, use that
-                mod_folder = topdirs.pop()
-            elif folder_name in topdirs:
-                # If there's multiple, but one matches exactly, use that
-                mod_folder = folder_name
-            else:
-                # Otherwise, who knows! Fix your mods or update the wiki!
-                # Why do I always get the short end of the stick!?
-                raise IncorrectModFormatError(
-                    "Mod archive '{}' has more than one internal folder, and "
-                    "none of the internal folders match it's external name".format(
-                        mod_name
-                    )
-                )
-
-            try:
-                # Zipfiles don't like backslashes, so we manually concatenate
-                mod_info = json.loads(
-                    archive_to_string(files, mod_folder + "/info.json")
-                )
-            except KeyError:
-                raise IncorrectModFormatError(
-                    "Mod '{}' has no 'info.json' file in its root folder".format(
-                        mod_name
-                    )
-                )
-
-            mod_version = mod_info["version"]
-            archive = True
-            location = factorio_mods_folder + "/" + mod_name
-
-        elif os.path.isdir(mod_location):
-            # Folder
-            print("folder", mod_obj)
-            # TODO: assert mod folder name matches either "name" or
-            # "name_version" format
-            m = mod_folder_regex.match(mod_obj)
-            if not m:
-                raise IncorrectModFormatError(
-                    "Mod folder '{}' does not fit the 'name' or 'name_version' format".format(
-                        mod_obj
-                    )
-                )
-            mod_name = m.group(1)
-            external_mod_version = m.group(2)
-            try:
-                with open(os.path.join(mod_location, "info.json"), "r") as info_file:
-                    mod_info = json.load(info_file)
-            except FileNotFoundError:
-                raise IncorrectModFormatError(
-                    "Mod '{}' has no 'info.json' file in its root folder".format(
-                        mod_name
-                    )
-                )
-
-            mod_folder = mod_location
-            mod_version = mod_info["version"]
-            archive = False
-            files = None
-            location = mod_location
-
-        else:  # Regular file
-            continue  # Ignore: cannot be considered a mod
-
-        # First make sure the mod is enabled, and skip if not
-        # (The mod itself is not guaranteed to be in the enabled_mod_list if we
-        # added it manually when mod-list.json already exists, so we default to
-        # True if a particular mod is not found)
-        if not enabled_mod_list.get(mod_name, True):
-            continue
-
-        # Idiot check: assert external version matches internal version
-        # if external_mod_version:
-        #     assert version_string_to_tuple(
-        #         external_mod_version
-        #     ) == version_string_to_tuple(
-        #         mod_version
-        #     ), "{}: External version ({}) does not match internal version ({})".format(
-        #         mod_name, external_mod_version, mod_version
-        #     )
-
-        # Ensure that the mod's factorio version is correct
-        mod_factorio_version = version_string_to_tuple(mod_info["factorio_version"])
-        assert mod_factorio_version <= factorio_version_info
-
-        mod_data = {}
-        if archive:
-            # Attempt to load setting files
-            try:
-                settings = archive_to_string(files, mod_folder + "/settings.lua")
-                mod_data["settings.lua"] = settings
-            except KeyError:
-                pass
-            try:
-                settings = archive_to_string(
-                    files, mod_folder + "/settings-updates.lua"
-                )
-                mod_data["settings-updates.lua"] = settings
-            except KeyError:
-                pass
-            try:
-                settings = archive_to_string(
-                    files, mod_folder + "/settings-final-fixes.lua"
-                )
-                mod_data["settings-final-fixes.lua"] = settings
-            except KeyError:
-                pass
-            # Attempt to load data files
-            try:
-                data = archive_to_string(files, mod_folder + "/data.lua")
-                mod_data["data.lua"] = data
-            except KeyError:
-                pass
-            try:
-                data_updates = archive_to_string(
-                    files, mod_folder + "/data-updates.lua"
-                )
-                mod_data["data-updates.lua"] = data_updates
-            except KeyError:
-                pass
-            try:
-                data_final_fixes = archive_to_string(
-                    files, mod_folder + "/data-final-fixes.lua"
-                )
-                mod_data["data-final-fixes.lua"] = data_final_fixes
-            except KeyError:
-                pass
-        else:  # folder
-            # Attempt to load setting files
-            try:
-                settings = file_to_string(mod_folder + "/settings.lua")
-                mod_data["settings.lua"] = settings
-            except FileNotFoundError:
-                pass
-            try:
-                settings = file_to_string(mod_folder + "/settings-updates.lua")
-                mod_data["settings-updates.lua"] = settings
-            except FileNotFoundError:
-                pass
-            try:
-                settings = file_to_string(mod_folder + "/settings-final-fixes.lua")
-                mod_data["settings-final-fixes.lua"] = settings
-            except FileNotFoundError:
-                pass
-            # Attempt to load data files
-            try:
-                data = file_to_string(mod_folder + "/data.lua")
-                mod_data["data.lua"] = data
-            except FileNotFoundError:
-                pass
-            try:
-                data_updates = file_to_string(mod_folder + "/data-updates.lua")
-                mod_data["data-updates.lua"] = data_updates
-            except FileNotFoundError:
-                pass
-            try:
-                data_final_fixes = file_to_string(mod_folder + "/data-final-fixes.lua")
-                mod_data["data-final-fixes.lua"] = data_final_fixes
-            except FileNotFoundError:
-                pass
-
-        # It's possible that a user might have multiples of the same mod with
-        # different versions (issue #15). This can cause conficts where a
-        # earlier version of the mod is loaded last which causes dependency
-        # errors.
-
-        # To fix this, we explicitly check for mods with a duplicate name, and
-        # we only overwrite it if the latter mod's version is greater than the
-        # existing mod's version.
-
-        # In addition, if there are two versions of the same mod with equivalent
-        # versions, but one is a zip archive and the other is a folder, then the
-        # folder will take precedence over the zip file.
-
-        current_mod = Mod(
-            name=mod_name,
-            internal_folder=mod_folder,
-            version=mod_version,
-            archive=archive,
-            location=location.replace("\\", "/"),  # Make sure forward slashes
-            info=mod_info,
-            files=files,
-            data=mod_data,
-        )
-
-        if verbose or report:
-            print("(zip)" if archive else "(dir)", mod_name, mod_version)
-
-        # If a mod with this name already exists
-        if mod_name in mods:
-            # We warn the user, as this can lead to undesired behavior
-            previous_mod = mods[mod_name]
-            print(
-                "WARNING: Duplicate of mod '{}' found (current: {} -> new: {})".format(
-                    mod_name, previous_mod.version, current_mod.version
-                )
-            )
-
-            # Skip overwriting this mod if the current one is of a later version
-            # than the current
-            if version_string_to_tuple(previous_mod.version) < version_string_to_tuple(
-                current_mod.version
-            ):
-                print(
-                    "\tOverwriting older version ({}) with newer version ({})".format(
-                        previous_mod.version, current_mod.version
-                    )
-                )
-            elif version_string_to_tuple(
-                previous_mod.version
-            ) > version_string_to_tuple(current_mod.version):
-                print(
-                    "\tSkipping older version ({}) in favor of newer version ({})".format(
-                        current_mod.version, previous_mod.version
-                    )
-                )
-                continue
-            else:  # versions are identical
-                # If the previous mod is a folder, and the new mod is an archive,
-                # defer to the folder
-                if previous_mod.archive and not current_mod.archive:
-                    print("\tUsing folder version instead of zip archive")
-                else:
-                    print("\tDeferring to folder version instead of zip archive")
-                    continue
 
-        # Add/Overwrite the mod to the list
-        mods[mod_name] = current_mod
+def run_data_lifecycle(
+    mods, core_mod, factorio_data, factorio_mods_folder, verbose=False, show_logs=False
+):
+    """
+    Runs the settings and data stages of every mod in ``mods``, in dependency
+    order, just like Factorio does when it starts.
 
-    if report:
-        # TODO: add some extra features, like piping output to a file instead of
-        # stdout, as well as some formatting things
-        return
+    :returns: The ``LuaRuntime`` the stages were run in, with ``data.raw``
+        fully populated.
+    """
+    env_dir = os.path.dirname(__file__)
 
     # Create the dependency tree
     if verbose:
@@ -1866,33 +1982,517 @@ def update(verbose=False, path=None, show_logs=False, no_mods=False, report=None
                 # Reset the MODS tree to an empty state
                 lua_wipe_mods()
 
-    # At this point, `data.raw` and all other constructs should(!) be properly
-    # initialized. Hence, we can now extract the data we wish:
+    return lua
 
-    if verbose:
-        print()
 
-    extract_mods(mods, data_location, verbose)  # Mod names and their versions
+# =============================================================================
 
-    # Lots of items are sorted by item order, subgroup and group
-    # Here we get these things once and pass them into each extraction function
-    # as necessary
-    items = get_items(lua)
 
-    extract_entities(lua, data_location, verbose, items)
-    extract_instruments(lua, data_location, verbose)
-    extract_items(lua, data_location, verbose, items)
-    extract_modules(lua, data_location, verbose, items)
-    extract_recipes(lua, data_location, verbose, items)
-    extract_signals(lua, data_location, verbose, items)
-    extract_tiles(lua, data_location, verbose)
+def update(
+    verbose=False,
+    path=None,
+    show_logs=False,
+    no_mods=False,
+    report=None,
+    use_cache=True,
+    processes=None,
+    output=None,
+):
+    """
+    Updates the data in the :py:mod:`.draftsman.data` modules.
 
-    # TODO: Think about a way that users can extract the data that they want
-    # instead of it being hardcoded for my purposes alone
+    Emulates the load pattern of Factorio and loads all of its data (hopefully)
+    in the same way. Then that data is extracted into the module, updating it's
+    contents. Updates and changes made to the ``factorio-data`` folder are also
+    reflected in this routine.
 
-    if verbose:
-        print("\nUpdate finished.")  # Phew.
-        print("hella slick; nothing broke!")
+    Every update fingerprints the contents of its inputs, and caches the
+    resulting ``data.raw`` in ``draftsman/env-cache``, separately for each
+    ``output`` folder. If none of the mods,
+    ``mod-list.json``, ``mod-settings.dat`` or ``factorio-data`` have changed
+    since the last update, the (slow) settings and data stages are skipped
+    and the cached ``data.raw`` is extracted instead; and if the extracted
+    files and the code that extracts them haven't changed either, the update
+    does nothing at all.
+
+    :param use_cache: Whether or not to reuse the results of the last update.
+        If ``False``, every stage is run again, and the cache is overwritten
+        with the new results.
+    :param processes: The number of processes to run the extraction functions
+        in. Defaults to the number of CPUs; ``1`` runs them all in this
+        process.
+    :param output: The folder to write the extracted data to, which can then
+        be loaded with :py:class:`.Profile`. Defaults to the
+        :py:mod:`.draftsman.data` folder, the data of the default profile.
+
+    :returns: An ``OrderedDict`` of the time each stage of the update took,
+        in seconds, or ``None`` if ``report`` was set.
+    """
+    # Figure out what directory we're in
+    env_dir = os.path.dirname(__file__)
+    # Create some quick access folders
+    factorio_data = os.path.join(env_dir, "factorio-data")
+    if output is None:
+        data_location = os.path.join(env_dir, "data")
+    else:
+        data_location = output
+        if not os.path.isdir(data_location):
+            os.makedirs(data_location)
+    if path is None:
+        factorio_mods_folder = os.path.join(env_dir, "factorio-mods")
+    else:
+        factorio_mods_folder = path
+
+    if verbose:
+        print("Reading mods from:", factorio_mods_folder)
+
+    # Get the info from factorio-data and treat it as the "base" mod
+    with open(os.path.join(factorio_data, "base", "info.json")) as base_info_file:
+        base_info = json.load(base_info_file)
+        factorio_version = base_info["version"]
+        # Normalize it to 4 numbers to make our versioning lives easier
+        if factorio_version.count(".") == 2:
+            factorio_version += ".0"
+        factorio_version_info = version_string_to_tuple(factorio_version)
+
+    # Write `_factorio_version.py` with the current factorio version
+    with open(os.path.join(env_dir, "_factorio_version.py"), "w") as version_file:
+        version_file.write("# _factorio_version.py\n\n")
+        version_file.write('__factorio_version__ = "' + factorio_version + '"\n')
+        version_file.write(
+            "__factorio_version_info__ = {}\n".format(str(factorio_version_info))
+        )
+
+    # Dictionary of mods
+    mods: dict[str, Mod] = {}
+
+    # Add "base" and "core" mods
+    # Core mod is somewhat special, and not loaded in the standard lifecycle
+    # Instead, it is loaded first thing and its functions are reused throughout
+    core_mod = Mod(
+        name="core",
+        internal_folder=None,
+        version=factorio_version,
+        archive=False,
+        location=os.path.join(
+            factorio_data, "core"
+        ),  # "./draftsman/factorio-data/core",
+        info=None,
+        files=None,
+        data={
+            "data.lua": file_to_string(
+                os.path.join(factorio_data, "core", "data.lua")
+            )  # file_to_string("draftsman/factorio-data/core/data.lua")
+        },
+    )
+    mods["base"] = Mod(
+        name="base",
+        internal_folder=None,
+        version=factorio_version,
+        archive=False,
+        location=os.path.join(
+            factorio_data, "base"
+        ),  # "./draftsman/factorio-data/base",
+        info=None,
+        files=None,
+        data={
+            "data.lua": file_to_string(
+                os.path.join(factorio_data, "base", "data.lua")
+            ),  # file_to_string("draftsman/factorio-data/base/data.lua"),
+            "data-updates.lua": file_to_string(
+                os.path.join(factorio_data, "base", "data-updates.lua")
+            ),  # file_to_string("draftsman/factorio-data/base/data-updates.lua")
+        },
+    )
+
+    # This shouldn't need to be done, but lets create the factorio-mod folder if
+    # it doesn't exist in case the user deletes the whole thing accidently
+    if path is None and not os.path.isdir(factorio_mods_folder):
+        os.mkdir(factorio_mods_folder)
+
+    # Check that our path actually exists (in case it was user specified)
+    if not os.path.isdir(factorio_mods_folder):
+        raise OSError("Directory '{}' not found".format(factorio_mods_folder))
+
+    # Attempt to get the list of enabled mods from mod-list.json
+    enabled_mod_list = {}
+    try:
+        with open(os.path.join(factorio_mods_folder, "mod-list.json")) as mod_list_file:
+            mod_json = json.load(mod_list_file)
+            for mod in mod_json["mods"]:
+                enabled_mod_list[mod["name"].replace(" ", "")] = (
+                    mod["enabled"] and not no_mods
+                )
+    except FileNotFoundError:  # If no such file is found
+        # Every mod is enabled by default, unless `no_mods` is True
+        enabled_mod_list["base"] = True
+        for mod_obj in os.listdir(factorio_mods_folder):
+            if mod_obj.lower().endswith(".zip"):
+                mod_name = mod_archive_regex.match(mod_obj).group(1).replace(" ", "")
+                enabled_mod_list[mod_name] = not no_mods
+            elif os.path.isdir(os.path.join(factorio_mods_folder, mod_obj)):
+                mod_name = mod_obj
+                enabled_mod_list[mod_name] = not no_mods
+
+    if verbose:
+        print("\nDiscovering mods...\n")
+
+    # Preload all the mods and their versions
+    for mod_obj in os.listdir(factorio_mods_folder):
+        # mod_location = os.path.join(factorio_mods, mod_obj)
+        mod_location = factorio_mods_folder + "/" + mod_obj
+        external_mod_version = None  # Optional (the version indicated by filepath)
+
+        if mod_obj.lower().endswith(".zip"):
+            # Zip file
+            m = mod_archive_regex.match(mod_obj)
+            if not m:
+                raise IncorrectModFormatError(
+                    "Mod archive '{}' does not fit the 'name_version' format".format(
+                        mod_obj
+                    )
+                )
+            folder_name = m.group(1)
+            mod_name = m.group(2).replace(" ", "")
+            external_mod_version = m.group(3)
+            files = ModArchive(mod_location)
+
+            # There is no restriction on the name of the internal folder, just
+            # that there is only one at the root of the archive
+            # All the mods I've seen use the same "mod-name_mod-version", but
+            # the wiki says this is not enforced
+            # Hence, we use this scuffed code to actually get a list of all the
+            # root-most directories
+            topdirs = set()
+            for file in files.namelist():
+                basename = None  # guards against UnboundLocalError
+                while file:
+                    file, basename = os.path.split(file)
+                topdirs.add(basename)
+
+            # REVISION: sometimes there are multiple folders in a single archive
+            # (even though the wiki says only one); eg: "__MACOSX" in
+            # "Mining Drones Harder" mod (seems to be reserved file when
+            # compressing on Mac)
+            if len(topdirs) == 1:
+                # If there's one folder, use that
+                mod_folder = topdirs.pop()
+            elif folder_name in topdirs:
+                # If there's multiple, but one matches exactly, use that
+                mod_folder = folder_name
+            else:
+                # Otherwise, who knows! Fix your mods or update the wiki!
+                # Why do I always get the short end of the stick!?
+                raise IncorrectModFormatError(
+                    "Mod archive '{}' has more than one internal folder, and "
+                    "none of the internal folders match it's external name".format(
+                        mod_name
+                    )
+                )
+
+            try:
+                # Zipfiles don't like backslashes, so we manually concatenate
+                mod_info = json.loads(files.read(mod_folder + "/info.json"))
+            except KeyError:
+                raise IncorrectModFormatError(
+                    "Mod '{}' has no 'info.json' file in its root folder".format(
+                        mod_name
+                    )
+                )
+
+            mod_version = mod_info["version"]
+            archive = True
+            location = factorio_mods_folder + "/" + mod_name
+
+        elif os.path.isdir(mod_location):
+            # Folder
+            print("folder", mod_obj)
+            # TODO: assert mod folder name matches either "name" or
+            # "name_version" format
+            m = mod_folder_regex.match(mod_obj)
+            if not m:
+                raise IncorrectModFormatError(
+                    "Mod folder '{}' does not fit the 'name' or 'name_version' format".format(
+                        mod_obj
+                    )
+                )
+            mod_name = m.group(1)
+            external_mod_version = m.group(2)
+            try:
+                with open(os.path.join(mod_location, "info.json"), "r") as info_file:
+                    mod_info = json.load(info_file)
+            except FileNotFoundError:
+                raise IncorrectModFormatError(
+                    "Mod '{}' has no 'info.json' file in its root folder".format(
+                        mod_name
+                    )
+                )
+
+            mod_folder = mod_location
+            mod_version = mod_info["version"]
+            archive = False
+            files = None
+            location = mod_location
+
+        else:  # Regular file
+            continue  # Ignore: cannot be considered a mod
+
+        # First make sure the mod is enabled, and skip if not
+        # (The mod itself is not guaranteed to be in the enabled_mod_list if we
+        # added it manually when mod-list.json already exists, so we default to
+        # True if a particular mod is not found)
+        if not enabled_mod_list.get(mod_name, True):
+            continue
+
+        # Idiot check: assert external version matches internal version
+        # if external_mod_version:
+        #     assert version_string_to_tuple(
+        #         external_mod_version
+        #     ) == version_string_to_tuple(
+        #         mod_version
+        #     ), "{}: External version ({}) does not match internal version ({})".format(
+        #         mod_name, external_mod_version, mod_version
+        #     )
+
+        # Ensure that the mod's factorio version is correct
+        mod_factorio_version = version_string_to_tuple(mod_info["factorio_version"])
+        assert mod_factorio_version <= factorio_version_info
+
+        mod_data = {}
+        if archive:
+            # Attempt to load setting files
+            try:
+                settings = files.read(mod_folder + "/settings.lua")
+                mod_data["settings.lua"] = settings
+            except KeyError:
+                pass
+            try:
+                settings = files.read(mod_folder + "/settings-updates.lua")
+                mod_data["settings-updates.lua"] = settings
+            except KeyError:
+                pass
+            try:
+                settings = files.read(mod_folder + "/settings-final-fixes.lua")
+                mod_data["settings-final-fixes.lua"] = settings
+            except KeyError:
+                pass
+            # Attempt to load data files
+            try:
+                data = files.read(mod_folder + "/data.lua")
+                mod_data["data.lua"] = data
+            except KeyError:
+                pass
+            try:
+                data_updates = files.read(mod_folder + "/data-updates.lua")
+                mod_data["data-updates.lua"] = data_updates
+            except KeyError:
+                pass
+            try:
+                data_final_fixes = files.read(mod_folder + "/data-final-fixes.lua")
+                mod_data["data-final-fixes.lua"] = data_final_fixes
+            except KeyError:
+                pass
+        else:  # folder
+            # Attempt to load setting files
+            try:
+                settings = file_to_string(mod_folder + "/settings.lua")
+                mod_data["settings.lua"] = settings
+            except FileNotFoundError:
+                pass
+            try:
+                settings = file_to_string(mod_folder + "/settings-updates.lua")
+                mod_data["settings-updates.lua"] = settings
+            except FileNotFoundError:
+                pass
+            try:
+                settings = file_to_string(mod_folder + "/settings-final-fixes.lua")
+                mod_data["settings-final-fixes.lua"] = settings
+            except FileNotFoundError:
+                pass
+            # Attempt to load data files
+            try:
+                data = file_to_string(mod_folder + "/data.lua")
+                mod_data["data.lua"] = data
+            except FileNotFoundError:
+                pass
+            try:
+                data_updates = file_to_string(mod_folder + "/data-updates.lua")
+                mod_data["data-updates.lua"] = data_updates
+            except FileNotFoundError:
+                pass
+            try:
+                data_final_fixes = file_to_string(mod_folder + "/data-final-fixes.lua")
+                mod_data["data-final-fixes.lua"] = data_final_fixes
+            except FileNotFoundError:
+                pass
+
+        # It's possible that a user might have multiples of the same mod with
+        # different versions (issue #15). This can cause conficts where a
+        # earlier version of the mod is loaded last which causes dependency
+        # errors.
+
+        # To fix this, we explicitly check for mods with a duplicate name, and
+        # we only overwrite it if the latter mod's version is greater than the
+        # existing mod's version.
+
+        # In addition, if there are two versions of the same mod with equivalent
+        # versions, but one is a zip archive and the other is a folder, then the
+        # folder will take precedence over the zip file.
+
+        current_mod = Mod(
+            name=mod_name,
+            internal_folder=mod_folder,
+            version=mod_version,
+            archive=archive,
+            location=location.replace("\\", "/"),  # Make sure forward slashes
+            info=mod_info,
+            files=files,
+            data=mod_data,
+        )
+
+        if verbose or report:
+            print("(zip)" if archive else "(dir)", mod_name, mod_version)
+
+        # If a mod with this name already exists
+        if mod_name in mods:
+            # We warn the user, as this can lead to undesired behavior
+            previous_mod = mods[mod_name]
+            print(
+                "WARNING: Duplicate of mod '{}' found (current: {} -> new: {})".format(
+                    mod_name, previous_mod.version, current_mod.version
+                )
+            )
+
+            # Skip overwriting this mod if the current one is of a later version
+            # than the current
+            if version_string_to_tuple(previous_mod.version) < version_string_to_tuple(
+                current_mod.version
+            ):
+                print(
+                    "\tOverwriting older version ({}) with newer version ({})".format(
+                        previous_mod.version, current_mod.version
+                    )
+                )
+            elif version_string_to_tuple(
+                previous_mod.version
+            ) > version_string_to_tuple(current_mod.version):
+                print(
+                    "\tSkipping older version ({}) in favor of newer version ({})".format(
+                        current_mod.version, previous_mod.version
+                    )
+                )
+                continue
+            else:  # versions are identical
+                # If the previous mod is a folder, and the new mod is an archive,
+                # defer to the folder
+                if previous_mod.archive and not current_mod.archive:
+                    print("\tUsing folder version instead of zip archive")
+                else:
+                    print("\tDeferring to folder version instead of zip archive")
+                    continue
+
+        # Add/Overwrite the mod to the list
+        mods[mod_name] = current_mod
+
+    if report:
+        # TODO: add some extra features, like piping output to a file instead of
+        # stdout, as well as some formatting things
+        return
+
+    timings = OrderedDict()
+
+    # The settings and data stages only depend on these inputs, so if none of
+    # them have changed since the last update we can reuse the `data.raw` that
+    # it produced instead of running the stages again
+    start = timeit.default_timer()
+    input_fingerprints = get_input_fingerprints(
+        factorio_data, factorio_mods_folder, no_mods
+    )
+    cache_location = get_cache_location(data_location)
+    snapshot_path = os.path.join(cache_location, "data-raw.pkl")
+    cache = read_cache(cache_location) if use_cache else None
+    timings["fingerprints"] = timeit.default_timer() - start
+
+    if cache is not None and cache["inputs"] == input_fingerprints:
+        if cache["outputs"] == get_output_fingerprints(data_location):
+            if verbose:
+                print("\nNothing has changed since the last update; skipping.")
+            return timings
+
+        if verbose:
+            print("\nMods and settings are unchanged; using cached data.raw.")
+    else:
+        if verbose and cache is not None:
+            changed = get_changed(cache["inputs"], input_fingerprints)
+            print("\nChanged since the last update:", ", ".join(changed))
+
+        start = timeit.default_timer()
+        lua = run_data_lifecycle(
+            mods, core_mod, factorio_data, factorio_mods_folder, verbose, show_logs
+        )
+        timings["settings and data stages"] = timeit.default_timer() - start
+
+        # Convert `data.raw` to Python once, instead of once per extractor
+        start = timeit.default_timer()
+        data_raw = LuaTableConverter(lua).convert(lua.globals().data.raw)
+        timings["convert data.raw"] = timeit.default_timer() - start
+
+        # Invalidate the old fingerprints before overwriting the snapshot, in
+        # case we're interrupted before the new ones are written
+        if not os.path.isdir(cache_location):
+            os.makedirs(cache_location)
+        fingerprints_path = os.path.join(cache_location, "fingerprints.json")
+        if os.path.isfile(fingerprints_path):
+            os.remove(fingerprints_path)
+        with open(snapshot_path, "wb") as snapshot_file:
+            pickle.dump(data_raw, snapshot_file, 2)
+
+    # At this point, `data.raw` and all other constructs should(!) be properly
+    # initialized. Hence, we can now extract the data we wish:
+
+    if verbose:
+        print()
+
+    # Lots of items are sorted by item order, subgroup and group
+    # Here we get these things once and pass them into each extraction function
+    # as necessary
+    # `get_items` modifies the prototypes it's given, so it gets its own copy
+    start = timeit.default_timer()
+    with open(snapshot_path, "rb") as snapshot_file:
+        items = get_items(pickle.load(snapshot_file))
+    timings["get_items"] = timeit.default_timer() - start
+
+    extract_mods(mods, data_location, verbose)  # Mod names and their versions
+
+    # The rest are independent of one another, so they're run in parallel
+    start = timeit.default_timer()
+    for name, elapsed in run_extractors(
+        extractors, snapshot_path, items, data_location, verbose, processes
+    ):
+        timings[name] = elapsed
+    timings["extraction"] = timeit.default_timer() - start
+
+    with open(os.path.join(cache_location, "fingerprints.json"), "w") as cache_file:
+        cache = {
+            "inputs": input_fingerprints,
+            "outputs": get_output_fingerprints(data_location),
+        }
+        json.dump(cache, cache_file, indent=4)
+
+    # Anything already loaded from the old files is now out of date
+    Profile(data_location).unload()
+
+    # TODO: Think about a way that users can extract the data that they want
+    # instead of it being hardcoded for my purposes alone
+
+    if verbose:
+        print("\nTimings:")
+        for stage, elapsed in timings.items():
+            print("\t{:<28} {:>8.3f} s".format(stage, elapsed))
+        print("\nUpdate finished.")  # Phew.
+        print("hella slick; nothing broke!")
+
+    return timings
 
 
 def main():
@@ -1940,6 +2540,27 @@ def main():
         const=True,
         help="Outputs a list of mods at '--path' as well as their configurations",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Run every stage of the update, even if none of the mods or their "
+        "settings have changed since the last update",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="The number of processes to extract the data with; defaults to the "
+        "number of CPUs",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=str,
+        help="The folder to write the extracted data to, to load as a data "
+        "profile; defaults to `python_install/site-packages/draftsman/data`",
+    )
     args = parser.parse_args()
     if args.lua_version:
         print(
@@ -1954,4 +2575,7 @@ def main():
             show_logs=args.log,
             no_mods=args.no_mods,
             report=args.report,
+            use_cache=not args.no_cache,
+            processes=args.jobs,
+            output=args.output,
         )
@@ -3,12 +3,14 @@
 
 from __future__ import unicode_literals
 
+from draftsman.constants import ValidationLevel
 from draftsman import signatures
 from draftsman.classes.entity import Entity
 from draftsman.classes.mixins import ControlBehaviorMixin, CircuitConnectableMixin
 from draftsman.error import DataFormatError
 from draftsman.warning import DraftsmanWarning
 
+from draftsman import data
 from draftsman.data.entities import accumulators
 from draftsman.data.signals import signal_dict
 
@@ -35,26 +37,34 @@ class Accumulator(ControlBehaviorMixin, CircuitConnectableMixin, Entity):
     _exports.update(CircuitConnectableMixin._exports)
     _exports.update(ControlBehaviorMixin._exports)
 
+    _control_behavior_signature = signatures.ACCUMULATOR_CONTROL_BEHAVIOR
+
     def __init__(self, name=accumulators[0], **kwargs):
         # type: (str, **dict) -> None
         """
         TODO
         """
 
-        super(Accumulator, self).__init__(name, accumulators, **kwargs)
+        super(Accumulator, self).__init__(
+            name, data.get_profile().entities.accumulators, **kwargs
+        )
 
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
 
     # =========================================================================
 
     @ControlBehaviorMixin.control_behavior.setter
     def control_behavior(self, value):
         # type: (dict) -> None
+        if self.validation_level is ValidationLevel.NONE:
+            self._control_behavior = {} if value is None else value
+            return
         try:
             self._control_behavior = signatures.ACCUMULATOR_CONTROL_BEHAVIOR.validate(
                 value
@@ -3,6 +3,7 @@
 
 from __future__ import unicode_literals
 
+from draftsman.constants import ValidationLevel
 from draftsman import signatures
 from draftsman.classes.entity import Entity
 from draftsman.classes.mixins import (
@@ -13,6 +14,7 @@ from draftsman.classes.mixins import (
 from draftsman.error import DataFormatError, InvalidSignalError, DraftsmanError
 from draftsman.warning import DraftsmanWarning
 
+from draftsman import data
 from draftsman.data.entities import arithmetic_combinators
 from draftsman import utils
 
@@ -45,6 +47,8 @@ class ArithmeticCombinator(
     _exports.update(CircuitConnectableMixin._exports)
     _exports.update(ControlBehaviorMixin._exports)
 
+    _control_behavior_signature = signatures.ARITHMETIC_COMBINATOR_CONTROL_BEHAVIOR
+
     def __init__(self, name=arithmetic_combinators[0], **kwargs):
         # type: (str, **dict) -> None
         """
@@ -52,23 +56,27 @@ class ArithmeticCombinator(
         """
 
         super(ArithmeticCombinator, self).__init__(
-            name, arithmetic_combinators, **kwargs
+            name, data.get_profile().entities.arithmetic_combinators, **kwargs
         )
 
         self._dual_circuit_connectable = True
 
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
 
     # =========================================================================
 
     @ControlBehaviorMixin.control_behavior.setter
     def control_behavior(self, value):
         # type: (dict) -> None
+        if self.validation_level is ValidationLevel.NONE:
+            self._control_behavior = {} if value is None else value
+            return
         try:
             self._control_behavior = (
                 signatures.ARITHMETIC_COMBINATOR_CONTROL_BEHAVIOR.validate(value)
@@ -117,10 +125,13 @@ class ArithmeticCombinator(
     @first_operand.setter
     def first_operand(self, value):
         # type: (Union[dict, int]) -> None
-        try:
-            value = signatures.SIGNAL_ID_OR_CONSTANT.validate(value)
-        except SchemaError as e:
-            six.raise_from(TypeError(e), None)
+        if self.validation_level is not ValidationLevel.NONE:
+            try:
+                value = signatures.SIGNAL_ID_OR_CONSTANT.validate(value)
+            except SchemaError as e:
+                six.raise_from(TypeError(e), None)
+        else:
+            value = signatures.normalize_signal_name(value)
 
         if "arithmetic_conditions" not in self.control_behavior:
             self.control_behavior["arithmetic_conditions"] = {}
@@ -132,24 +143,28 @@ class ArithmeticCombinator(
             arithmetic_conditions.pop("first_signal", None)
             arithmetic_conditions.pop("first_constant", None)
         elif isinstance(value, dict):  # Signal Dict
-            # Make sure the signals are not anything or everything
-            if value["name"] in {"signal-anything", "signal-everything"}:
-                raise DraftsmanError(
-                    "Signal '{}' is not allowed in ArithmeticCombinator".format(
-                        value["name"]
+            if self.validation_level is ValidationLevel.STRICT:
+                # Make sure the signals are not anything or everything
+                if value["name"] in {"signal-anything", "signal-everything"}:
+                    raise DraftsmanError(
+                        "Signal '{}' is not allowed in ArithmeticCombinator".format(
+                            value["name"]
+                        )
                     )
-                )
-
-            # Make sure both operands are not signal-each
-            if isinstance(self.second_operand, dict):
-                second_operand_name = self.second_operand["name"]
-            else:
-                second_operand_name = None
 
-            if value["name"] == "signal-each" and second_operand_name == "signal-each":
-                raise DraftsmanError(
-                    "Both operands cannot be set to 'signal-each' simultaneously"
-                )
+                # Make sure both operands are not signal-each
+                if isinstance(self.second_operand, dict):
+                    second_operand_name = self.second_operand["name"]
+                else:
+                    second_operand_name = None
+
+                if (
+                    value["name"] == "signal-each"
+                    and second_operand_name == "signal-each"
+                ):
+                    raise DraftsmanError(
+                        "Both operands cannot be set to 'signal-each' simultaneously"
+                    )
 
             arithmetic_conditions["first_signal"] = value
             arithmetic_conditions.pop("first_constant", None)
@@ -157,23 +172,24 @@ class ArithmeticCombinator(
             arithmetic_conditions["first_constant"] = value
             arithmetic_conditions.pop("first_signal", None)
 
-        # If the operand was 'signal-each' and we changed it to something else,
-        # delete the output signal if it was also 'signal-each'
-        if (
-            isinstance(old_value, dict)
-            and old_value["name"] == "signal-each"
-            and isinstance(value, dict)
-            and value["name"] != "signal-each"
-            and self.output_signal is not None
-            and self.output_signal["name"] == "signal-each"
-        ):
-            warnings.warn(
-                "first_operand unset from 'signal-each'; output_signal can no "
-                "longer be 'signal-each' and will be reset to `None`",
-                DraftsmanWarning,
-                stacklevel=2,
-            )
-            self.output_signal = None
+        if self.validation_level is ValidationLevel.STRICT:
+            # If the operand was 'signal-each' and we changed it to something else,
+            # delete the output signal if it was also 'signal-each'
+            if (
+                isinstance(old_value, dict)
+                and old_value["name"] == "signal-each"
+                and isinstance(value, dict)
+                and value["name"] != "signal-each"
+                and self.output_signal is not None
+                and self.output_signal["name"] == "signal-each"
+            ):
+                warnings.warn(
+                    "first_operand unset from 'signal-each'; output_signal can no "
+                    "longer be 'signal-each' and will be reset to `None`",
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
+                self.output_signal = None
 
     # =========================================================================
 
@@ -206,10 +222,13 @@ class ArithmeticCombinator(
     @operation.setter
     def operation(self, value):
         # type: (str) -> None
-        try:
-            value = signatures.OPERATION.validate(value)
-        except SchemaError as e:
-            six.raise_from(TypeError(e), None)
+        if self.validation_level is not ValidationLevel.NONE:
+            try:
+                value = signatures.OPERATION.validate(value)
+            except SchemaError as e:
+                six.raise_from(TypeError(e), None)
+        else:
+            value = value.upper() if isinstance(value, six.text_type) else value
 
         if "arithmetic_conditions" not in self.control_behavior:
             self.control_behavior["arithmetic_conditions"] = {}
@@ -262,10 +281,13 @@ class ArithmeticCombinator(
     @second_operand.setter
     def second_operand(self, value):
         # type: (Union[str, int]) -> None
-        try:
-            value = signatures.SIGNAL_ID_OR_CONSTANT.validate(value)
-        except SchemaError as e:
-            six.raise_from(TypeError(e), None)
+        if self.validation_level is not ValidationLevel.NONE:
+            try:
+                value = signatures.SIGNAL_ID_OR_CONSTANT.validate(value)
+            except SchemaError as e:
+                six.raise_from(TypeError(e), None)
+        else:
+            value = signatures.normalize_signal_name(value)
 
         if "arithmetic_conditions" not in self.control_behavior:
             self.control_behavior["arithmetic_conditions"] = {}
@@ -277,24 +299,28 @@ class ArithmeticCombinator(
             arithmetic_conditions.pop("second_signal", None)
             arithmetic_conditions.pop("second_constant", None)
         elif isinstance(value, dict):  # Signal Dict
-            # Make sure the signals are not anything or everything
-            if value["name"] in {"signal-anything", "signal-everything"}:
-                raise DraftsmanError(
-                    "Signal '{}' is not allowed in ArithmeticCombinator".format(
-                        value["name"]
+            if self.validation_level is ValidationLevel.STRICT:
+                # Make sure the signals are not anything or everything
+                if value["name"] in {"signal-anything", "signal-everything"}:
+                    raise DraftsmanError(
+                        "Signal '{}' is not allowed in ArithmeticCombinator".format(
+                            value["name"]
+                        )
                     )
-                )
 
-            # Make sure both operands are not signal-each
-            if isinstance(self.first_operand, dict):
-                first_operand_name = self.first_operand["name"]
-            else:
-                first_operand_name = None
-
-            if value["name"] == "signal-each" and first_operand_name == "signal-each":
-                raise DraftsmanError(
-                    "Both operands cannot be set to 'signal-each' simultaneously"
-                )
+                # Make sure both operands are not signal-each
+                if isinstance(self.first_operand, dict):
+                    first_operand_name = self.first_operand["name"]
+                else:
+                    first_operand_name = None
+
+                if (
+                    value["name"] == "signal-each"
+                    and first_operand_name == "signal-each"
+                ):
+                    raise DraftsmanError(
+                        "Both operands cannot be set to 'signal-each' simultaneously"
+                    )
 
             arithmetic_conditions["second_signal"] = value
             arithmetic_conditions.pop("second_constant", None)
@@ -302,23 +328,24 @@ class ArithmeticCombinator(
             arithmetic_conditions["second_constant"] = value
             arithmetic_conditions.pop("second_signal", None)
 
-        # If the operand was 'signal-each' and we changed it to something else,
-        # delete the output signal if it was also 'signal-each'
-        if (
-            isinstance(old_value, dict)
-            and old_value["name"] == "signal-each"
-            and isinstance(value, dict)
-            and value["name"] != "signal-each"
-            and self.output_signal is not None
-            and self.output_signal["name"] == "signal-each"
-        ):
-            warnings.warn(
-                "second_operand unset from 'signal-each'; output_signal can no "
-                "longer be 'signal-each' and will be reset to `None`",
-                DraftsmanWarning,
-                stacklevel=2,
-            )
-            self.output_signal = None
+        if self.validation_level is ValidationLevel.STRICT:
+            # If the operand was 'signal-each' and we changed it to something else,
+            # delete the output signal if it was also 'signal-each'
+            if (
+                isinstance(old_value, dict)
+                and old_value["name"] == "signal-each"
+                and isinstance(value, dict)
+                and value["name"] != "signal-each"
+                and self.output_signal is not None
+                and self.output_signal["name"] == "signal-each"
+            ):
+                warnings.warn(
+                    "second_operand unset from 'signal-each'; output_signal can no "
+                    "longer be 'signal-each' and will be reset to `None`",
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
+                self.output_signal = None
 
     # =========================================================================
 
@@ -353,10 +380,13 @@ class ArithmeticCombinator(
     @output_signal.setter
     def output_signal(self, value):
         # type: (str) -> None
-        try:
-            value = signatures.SIGNAL_ID_OR_NONE.validate(value)
-        except SchemaError as e:
-            six.raise_from(TypeError(e), None)
+        if self.validation_level is not ValidationLevel.NONE:
+            try:
+                value = signatures.SIGNAL_ID_OR_NONE.validate(value)
+            except SchemaError as e:
+                six.raise_from(TypeError(e), None)
+        else:
+            value = signatures.normalize_signal_name(value)
 
         if "arithmetic_conditions" not in self.control_behavior:
             self.control_behavior["arithmetic_conditions"] = {}
@@ -365,35 +395,36 @@ class ArithmeticCombinator(
         if value is None:  # Default
             arithmetic_conditions.pop("output_signal", None)
         else:  # Signal Dict
-            # Make sure the signals are not anything or everything
-            if value["name"] in {"signal-anything", "signal-everything"}:
-                raise InvalidSignalError(
-                    "Signal '{}' is not allowed in ArithmeticCombinator".format(
-                        value["name"]
+            if self.validation_level is ValidationLevel.STRICT:
+                # Make sure the signals are not anything or everything
+                if value["name"] in {"signal-anything", "signal-everything"}:
+                    raise InvalidSignalError(
+                        "Signal '{}' is not allowed in ArithmeticCombinator".format(
+                            value["name"]
+                        )
                     )
-                )
-
-            # Make sure if the signal is "signal-each" that one of the operands
-            # are also signal each
-            if isinstance(self.first_operand, dict):
-                first_operand_name = self.first_operand["name"]
-            else:
-                first_operand_name = None
-
-            if isinstance(self.second_operand, dict):
-                second_operand_name = self.second_operand["name"]
-            else:
-                second_operand_name = None
 
-            if (
-                value["name"] == "signal-each"
-                and first_operand_name != "signal-each"
-                and second_operand_name != "signal-each"
-            ):
-                raise DraftsmanError(
-                    "Cannot set 'output_signal' to 'signal-each' when neither "
-                    "first nor second operands are 'signal-each'"
-                )
+                # Make sure if the signal is "signal-each" that one of the operands
+                # are also signal each
+                if isinstance(self.first_operand, dict):
+                    first_operand_name = self.first_operand["name"]
+                else:
+                    first_operand_name = None
+
+                if isinstance(self.second_operand, dict):
+                    second_operand_name = self.second_operand["name"]
+                else:
+                    second_operand_name = None
+
+                if (
+                    value["name"] == "signal-each"
+                    and first_operand_name != "signal-each"
+                    and second_operand_name != "signal-each"
+                ):
+                    raise DraftsmanError(
+                        "Cannot set 'output_signal' to 'signal-each' when neither "
+                        "first nor second operands are 'signal-each'"
+                    )
 
             arithmetic_conditions["output_signal"] = value
 
@@ -421,13 +452,14 @@ class ArithmeticCombinator(
         """
 
         # Check all the parameters before we set anything to preserve original
-        try:
-            first_operand = signatures.SIGNAL_ID_OR_CONSTANT.validate(first_operand)
-            operation = signatures.OPERATION.validate(operation)
-            second_operand = signatures.SIGNAL_ID_OR_CONSTANT.validate(second_operand)
-            output_signal = signatures.SIGNAL_ID_OR_NONE.validate(output_signal)
-        except SchemaError as e:
-            six.raise_from(DataFormatError(e), None)
+        if self.validation_level is not ValidationLevel.NONE:
+            try:
+                first_operand = signatures.SIGNAL_ID_OR_CONSTANT.validate(first_operand)
+                operation = signatures.OPERATION.validate(operation)
+                second_operand = signatures.SIGNAL_ID_OR_CONSTANT.validate(second_operand)
+                output_signal = signatures.SIGNAL_ID_OR_NONE.validate(output_signal)
+            except SchemaError as e:
+                six.raise_from(DataFormatError(e), None)
 
         self.first_operand = first_operand
         self.operation = operation
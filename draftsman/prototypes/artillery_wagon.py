@@ -5,10 +5,11 @@ from __future__ import unicode_literals
 
 from draftsman.classes.entity import Entity
 from draftsman.classes.mixins import OrientationMixin
+from draftsman.constants import ValidationLevel
 from draftsman.warning import DraftsmanWarning
 
+from draftsman import data
 from draftsman.data.entities import artillery_wagons
-from draftsman.data import entities
 
 import warnings
 
@@ -35,16 +36,22 @@ class ArtilleryWagon(OrientationMixin, Entity):
         TODO
         """
 
-        super(ArtilleryWagon, self).__init__(name, artillery_wagons, **kwargs)
+        profile = data.get_profile()
+        super(ArtilleryWagon, self).__init__(
+            name, profile.entities.artillery_wagons, **kwargs
+        )
 
-        if "collision_mask" in entities.raw[self.name]:  # pragma: no coverage
-            self._collision_mask = set(entities.raw[self.name]["collision_mask"])
+        if "collision_mask" in profile.entities.raw[self.name]:  # pragma: no coverage
+            self._collision_mask = set(
+                profile.entities.raw[self.name]["collision_mask"]
+            )
         else:  # pragma: no coverage
             self._collision_mask = {"train-layer"}
 
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
@@ -10,6 +10,7 @@ from draftsman.classes.mixins import (
     RecipeMixin,
     DirectionalMixin,
 )
+from draftsman.constants import ValidationLevel
 from draftsman.error import InvalidItemError
 from draftsman import utils
 from draftsman.warning import (
@@ -18,8 +19,8 @@ from draftsman.warning import (
     ItemLimitationWarning,
 )
 
+from draftsman import data
 from draftsman.data.entities import assembling_machines
-from draftsman.data import modules
 from draftsman.data import recipes
 
 import warnings
@@ -57,46 +58,54 @@ class AssemblingMachine(
         TODO
         """
 
-        super(AssemblingMachine, self).__init__(name, assembling_machines, **kwargs)
+        super(AssemblingMachine, self).__init__(
+            name, data.get_profile().entities.assembling_machines, **kwargs
+        )
 
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
 
     @utils.reissue_warnings
     def set_item_request(self, item, count):
         # type: (str, int) -> None
-        if item in modules.raw:
-            # Check to make sure the recipe is within the module's limitations
-            # (If it has any)
-            module = modules.raw[item]
-            if "limitation" in module:
-                if self.recipe is not None and self.recipe not in module["limitation"]:
-                    tooltip = module.get("limitation_message_key", "no message key")
+        profile = data.get_profile()
+        if self.validation_level is ValidationLevel.STRICT:
+            if item in profile.modules.raw:
+                # Check to make sure the recipe is within the module's limitations
+                # (If it has any)
+                module = profile.modules.raw[item]
+                if "limitation" in module:
+                    if (
+                        self.recipe is not None
+                        and self.recipe not in module["limitation"]
+                    ):
+                        tooltip = module.get("limitation_message_key", "no message key")
+                        warnings.warn(
+                            "Cannot use module '{}' with recipe '{}' ({})".format(
+                                item, self.recipe, tooltip
+                            ),
+                            ModuleLimitationWarning,
+                            stacklevel=2,
+                        )
+
+            # Make sure the item is one of the input ingredients for the recipe
+            elif self.recipe is not None:
+                ingredients = recipes.get_recipe_ingredients(self.recipe)
+
+                if item not in ingredients:
                     warnings.warn(
-                        "Cannot use module '{}' with recipe '{}' ({})".format(
-                            item, self.recipe, tooltip
+                        "Cannot request items that the recipe '{}' doesn't use ({})".format(
+                            self.recipe, item
                         ),
-                        ModuleLimitationWarning,
+                        ItemLimitationWarning,
                         stacklevel=2,
                     )
 
-        # Make sure the item is one of the input ingredients for the recipe
-        elif self.recipe is not None:
-            ingredients = recipes.get_recipe_ingredients(self.recipe)
-
-            if item not in ingredients:
-                warnings.warn(
-                    "Cannot request items that the recipe '{}' doesn't use ({})".format(
-                        self.recipe, item
-                    ),
-                    ItemLimitationWarning,
-                    stacklevel=2,
-                )
-
         super(AssemblingMachine, self).set_item_request(item, count)
 
     # TODO: overwrite direction.setter so that it only works with specific recipes
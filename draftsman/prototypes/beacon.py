@@ -5,6 +5,7 @@ from __future__ import unicode_literals
 
 from draftsman.classes.entity import Entity
 from draftsman.classes.mixins import ModulesMixin, RequestItemsMixin
+from draftsman.constants import ValidationLevel
 from draftsman.error import InvalidItemError
 from draftsman import utils
 from draftsman.warning import (
@@ -13,9 +14,8 @@ from draftsman.warning import (
     ItemLimitationWarning,
 )
 
+from draftsman import data
 from draftsman.data.entities import beacons
-from draftsman.data import modules
-from draftsman.data import items
 
 import warnings
 
@@ -44,31 +44,55 @@ class Beacon(ModulesMixin, RequestItemsMixin, Entity):
         TODO
         """
 
-        super(Beacon, self).__init__(name, beacons, **kwargs)
+        super(Beacon, self).__init__(
+            name, data.get_profile().entities.beacons, **kwargs
+        )
 
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
 
     @utils.reissue_warnings
     def set_item_request(self, item, count):
         # type: (str, int) -> None
 
-        if item in items.raw and item not in modules.raw:
-            warnings.warn(
-                "Item '{}' cannot be placed in Beacon".format(item),
-                ItemLimitationWarning,
-                stacklevel=2,
-            )
+        profile = data.get_profile()
+        if self.validation_level is ValidationLevel.STRICT:
+            if item in profile.items.raw and item not in profile.modules.raw:
+                warnings.warn(
+                    "Item '{}' cannot be placed in Beacon".format(item),
+                    ItemLimitationWarning,
+                    stacklevel=2,
+                )
 
-        if item in modules.categories["productivity"]:
-            warnings.warn(
-                "Cannot use '{}' in Beacon".format(item),
-                ModuleLimitationWarning,
-                stacklevel=2,
-            )
+            if item in profile.modules.categories["productivity"]:
+                warnings.warn(
+                    "Cannot use '{}' in Beacon".format(item),
+                    ModuleLimitationWarning,
+                    stacklevel=2,
+                )
 
         super(Beacon, self).set_item_request(item, count)
+
+    def _validate(self, report):
+        # type: (ValidationReport) -> None
+        profile = data.get_profile()
+        super(Beacon, self)._validate(report)
+
+        for item in self.items:
+            if item in profile.items.raw and item not in profile.modules.raw:
+                report.add(
+                    ItemLimitationWarning,
+                    "Item '{}' cannot be placed in Beacon".format(item),
+                    (self,),
+                )
+            if item in profile.modules.categories["productivity"]:
+                report.add(
+                    ModuleLimitationWarning,
+                    "Cannot use '{}' in Beacon".format(item),
+                    (self,),
+                )
@@ -5,8 +5,10 @@ from __future__ import unicode_literals
 
 from draftsman.classes.entity import Entity
 from draftsman.classes.mixins import RequestItemsMixin, DirectionalMixin
+from draftsman.constants import ValidationLevel
 from draftsman.warning import DraftsmanWarning
 
+from draftsman import data
 from draftsman.data.entities import boilers
 
 import warnings
@@ -37,11 +39,14 @@ class Boiler(RequestItemsMixin, DirectionalMixin, Entity):
         TODO
         """
 
-        super(Boiler, self).__init__(name, boilers, **kwargs)
-
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        super(Boiler, self).__init__(
+            name, data.get_profile().entities.boilers, **kwargs
+        )
+
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
@@ -9,12 +9,13 @@ from draftsman.classes.mixins import (
     CircuitConnectableMixin,
     DirectionalMixin,
 )
+from draftsman.constants import ValidationLevel
 from draftsman.error import DataFormatError
 import draftsman.signatures as signatures
 from draftsman.warning import DraftsmanWarning
 
+from draftsman import data
 from draftsman.data.entities import constant_combinators
-from draftsman.data import entities
 from draftsman.data import signals
 
 from schema import SchemaError
@@ -45,24 +46,33 @@ class ConstantCombinator(
     _exports.update(CircuitConnectableMixin._exports)
     _exports.update(ControlBehaviorMixin._exports)
 
+    _control_behavior_signature = signatures.CONSTANT_COMBINATOR_CONTROL_BEHAVIOR
+
     def __init__(self, name=constant_combinators[0], **kwargs):
         # type: (str, **dict) -> None
-        super(ConstantCombinator, self).__init__(name, constant_combinators, **kwargs)
+        profile = data.get_profile()
+        super(ConstantCombinator, self).__init__(
+            name, profile.entities.constant_combinators, **kwargs
+        )
 
-        self._item_slot_count = entities.raw[self.name]["item_slot_count"]
+        self._item_slot_count = profile.entities.raw[self.name]["item_slot_count"]
 
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
 
     # =========================================================================
 
     @ControlBehaviorMixin.control_behavior.setter
     def control_behavior(self, value):
         # type: (dict) -> None
+        if self.validation_level is ValidationLevel.NONE:
+            self._control_behavior = {} if value is None else value
+            return
         try:
             self._control_behavior = (
                 signatures.CONSTANT_COMBINATOR_CONTROL_BEHAVIOR.validate(value)
@@ -122,21 +132,24 @@ class ConstantCombinator(
         # type: (list) -> None
         if value is None:
             self.control_behavior.pop("filters", None)
+        elif self.validation_level is ValidationLevel.NONE:
+            self.control_behavior["filters"] = value
         else:
             try:
                 value = signatures.SIGNAL_FILTERS.validate(value)
-                # Check for pure virtual signals
-                # APPARENTLY this is allowed, but because this is not "endorsed"
-                # by Factorio we issue warnings if we find one
-                for filter in value:
-                    if filter["signal"]["name"] in signals.pure_virtual:
-                        warnings.warn(
-                            "Set signal in index {} to '{}'; is this intentional?".format(
-                                filter["index"], filter["signal"]["name"]
-                            ),
-                            DraftsmanWarning,
-                            stacklevel=2,
-                        )
+                if self.validation_level is ValidationLevel.STRICT:
+                    # Check for pure virtual signals
+                    # APPARENTLY this is allowed, but because this is not "endorsed"
+                    # by Factorio we issue warnings if we find one
+                    for filter in value:
+                        if filter["signal"]["name"] in signals.pure_virtual:
+                            warnings.warn(
+                                "Set signal in index {} to '{}'; is this intentional?".format(
+                                    filter["index"], filter["signal"]["name"]
+                                ),
+                                DraftsmanWarning,
+                                stacklevel=2,
+                            )
                 self.control_behavior["filters"] = value
             except SchemaError as e:
                 six.raise_from(DataFormatError(e), None)
@@ -182,41 +195,40 @@ class ConstantCombinator(
             a ``str``, or if ``count`` is not an ``int``.
         """
         # Check validity before modifying self
-        try:
-            index = signatures.INTEGER.validate(index)
-            signal = signatures.SIGNAL_ID_OR_NONE.validate(signal)
-            # signal = signals.signal_dict(signal) if signal is not None else None
-            count = signatures.INTEGER.validate(count)
-        except SchemaError as e:
-            six.raise_from(TypeError(e), None)
+        if self.validation_level is not ValidationLevel.NONE:
+            try:
+                index = signatures.INTEGER.validate(index)
+                signal = signatures.SIGNAL_ID_OR_NONE.validate(signal)
+                # signal = signals.signal_dict(signal) if signal is not None else None
+                count = signatures.INTEGER.validate(count)
+            except SchemaError as e:
+                six.raise_from(TypeError(e), None)
 
-        if not 0 <= index < self.item_slot_count:
-            raise IndexError(
-                "Signal 'index' ({}) must be in the range [0, {})".format(
-                    index, self.item_slot_count
+            if not 0 <= index < self.item_slot_count:
+                raise IndexError(
+                    "Signal 'index' ({}) must be in the range [0, {})".format(
+                        index, self.item_slot_count
+                    )
                 )
-            )
+        else:
+            signal = signatures.normalize_signal_name(signal)
 
-        if "filters" not in self.control_behavior:
-            self.control_behavior["filters"] = []
+        try:
+            filters = self.control_behavior["filters"]
+        except KeyError:
+            filters = self.control_behavior["filters"] = []
 
         # Check to see if filters already contains an entry with the same index
-        for i, filter in enumerate(self.control_behavior["filters"]):
+        for i, filter in enumerate(filters):
             if index + 1 == filter["index"]:  # Index already exists in the list
                 if signal is None:  # Delete the entry
-                    del self.control_behavior["filters"][i]
+                    del filters[i]
                 else:  # Set the new value
-                    self.control_behavior["filters"][i] = {
-                        "index": index + 1,
-                        "signal": signal,
-                        "count": count,
-                    }
+                    filters[i] = {"index": index + 1, "signal": signal, "count": count}
                 return
 
         # If no entry with the same index was found, create a new one
-        self.control_behavior["filters"].append(
-            {"index": index + 1, "signal": signal, "count": count}
-        )
+        filters.append({"index": index + 1, "signal": signal, "count": count})
 
     def get_signal(self, index):
         # type: (int) -> dict
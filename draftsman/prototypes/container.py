@@ -9,8 +9,10 @@ from draftsman.classes.mixins import (
     CircuitConnectableMixin,
     InventoryMixin,
 )
+from draftsman.constants import ValidationLevel
 from draftsman.warning import DraftsmanWarning
 
+from draftsman import data
 from draftsman.data.entities import containers, raw
 
 import warnings
@@ -38,11 +40,14 @@ class Container(InventoryMixin, RequestItemsMixin, CircuitConnectableMixin, Enti
 
     def __init__(self, name=containers[0], **kwargs):
         # type: (str, **dict) -> None
-        super(Container, self).__init__(name, containers, **kwargs)
-
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        super(Container, self).__init__(
+            name, data.get_profile().entities.containers, **kwargs
+        )
+
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
@@ -3,19 +3,42 @@
 
 from __future__ import unicode_literals
 
-from draftsman.classes.collisionset import CollisionSet
+from draftsman.classes.collisionset import CollisionSet, get_collision_set_rotations
 from draftsman.classes.entity import Entity
 from draftsman.classes.mixins import DoubleGridAlignedMixin, EightWayDirectionalMixin
-from draftsman.constants import Direction
+from draftsman.constants import Direction, ValidationLevel
 from draftsman.utils import AABB, Rectangle
 from draftsman.warning import DraftsmanWarning
 
+from draftsman import data
 from draftsman.data.entities import curved_rails
-from draftsman.data import entities
 
 import warnings
 
 
+def _generate_collision_sets():
+    # type: () -> dict[int, CollisionSet]
+    """
+    Generates the collision sets of a curved rail for all 8 directions.
+    """
+    left_turn = CollisionSet(
+        [AABB(0.25, 1.8, 1.75, 3.9), Rectangle((-0.375, -0.7175), 1.4, 5.45, -35)]
+    )
+    right_turn = CollisionSet(
+        [AABB(-1.75, 1.8, -0.25, 3.9), Rectangle((0.375, -0.7175), 1.4, 5.45, 35)]
+    )
+    return {
+        Direction.NORTH: left_turn,
+        Direction.NORTHEAST: right_turn,
+        Direction.EAST: left_turn.rotate(2),
+        Direction.SOUTHEAST: right_turn.rotate(2),
+        Direction.SOUTH: left_turn.rotate(4),
+        Direction.SOUTHWEST: right_turn.rotate(4),
+        Direction.WEST: left_turn.rotate(6),
+        Direction.NORTHWEST: right_turn.rotate(6),
+    }
+
+
 class CurvedRail(DoubleGridAlignedMixin, EightWayDirectionalMixin, Entity):
     """
     A curved rail entity.
@@ -48,29 +71,21 @@ class CurvedRail(DoubleGridAlignedMixin, EightWayDirectionalMixin, Entity):
 
         # We set a (private) flag to ignore the dummy collision box that
         # Factorio provides
+        profile = data.get_profile()
         self._overwritten_collision_set = True
-        # We then provide a list of all the custom rotations
-        left_turn = CollisionSet(
-            [AABB(0.25, 1.8, 1.75, 3.9), Rectangle((-0.375, -0.7175), 1.4, 5.45, -35)]
-        )
-        right_turn = CollisionSet(
-            [AABB(-1.75, 1.8, -0.25, 3.9), Rectangle((0.375, -0.7175), 1.4, 5.45, 35)]
+        # We then provide a list of all the custom rotations, which are shared
+        # between all rails of the same name
+        self._collision_set_rotation = get_collision_set_rotations(
+            name, range(8), _generate_collision_sets
         )
-        self._collision_set = left_turn
-        self._collision_set_rotation = {}
-        self._collision_set_rotation[Direction.NORTH] = left_turn
-        self._collision_set_rotation[Direction.NORTHEAST] = right_turn
-        self._collision_set_rotation[Direction.EAST] = left_turn.rotate(2)
-        self._collision_set_rotation[Direction.SOUTHEAST] = right_turn.rotate(2)
-        self._collision_set_rotation[Direction.SOUTH] = left_turn.rotate(4)
-        self._collision_set_rotation[Direction.SOUTHWEST] = right_turn.rotate(4)
-        self._collision_set_rotation[Direction.WEST] = left_turn.rotate(6)
-        self._collision_set_rotation[Direction.NORTHWEST] = right_turn.rotate(6)
-
-        super(CurvedRail, self).__init__(name, curved_rails, **kwargs)
-
-        if "collision_mask" in entities.raw[self.name]:  # pragma: no coverage
-            self._collision_mask = set(entities.raw[self.name]["collision_mask"])
+        self._collision_set = self._collision_set_rotation[Direction.NORTH]
+
+        super(CurvedRail, self).__init__(name, profile.entities.curved_rails, **kwargs)
+
+        if "collision_mask" in profile.entities.raw[self.name]:  # pragma: no coverage
+            self._collision_mask = set(
+                profile.entities.raw[self.name]["collision_mask"]
+            )
         else:  # pragma: no coverage
             self._collision_mask = {
                 "item-layer",
@@ -80,9 +95,10 @@ class CurvedRail(DoubleGridAlignedMixin, EightWayDirectionalMixin, Entity):
                 "water-tile",
             }
 
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
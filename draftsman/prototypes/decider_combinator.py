@@ -9,10 +9,12 @@ from draftsman.classes.mixins import (
     CircuitConnectableMixin,
     DirectionalMixin,
 )
+from draftsman.constants import ValidationLevel
 from draftsman.error import DataFormatError, DraftsmanError
 import draftsman.signatures as signatures
 from draftsman.warning import DraftsmanWarning
 
+from draftsman import data
 from draftsman.data.entities import decider_combinators
 from draftsman.data import signals
 from draftsman import utils
@@ -45,18 +47,23 @@ class DeciderCombinator(
     _exports.update(CircuitConnectableMixin._exports)
     _exports.update(ControlBehaviorMixin._exports)
 
+    _control_behavior_signature = signatures.DECIDER_COMBINATOR_CONTROL_BEHAVIOR
+
     def __init__(self, name=decider_combinators[0], **kwargs):
         # type: (str, **dict) -> None
-        super(DeciderCombinator, self).__init__(name, decider_combinators, **kwargs)
+        super(DeciderCombinator, self).__init__(
+            name, data.get_profile().entities.decider_combinators, **kwargs
+        )
 
         self._dual_circuit_connectable = True
 
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
 
         # Matrix of values, where keys are the name of the first_operand and
         # the values are sets of signals that cannot be set as output_signal
@@ -71,6 +78,9 @@ class DeciderCombinator(
     @ControlBehaviorMixin.control_behavior.setter
     def control_behavior(self, value):
         # type: (dict) -> None
+        if self.validation_level is ValidationLevel.NONE:
+            self._control_behavior = {} if value is None else value
+            return
         try:
             self._control_behavior = (
                 signatures.DECIDER_COMBINATOR_CONTROL_BEHAVIOR.validate(value)
@@ -129,10 +139,13 @@ class DeciderCombinator(
     @first_operand.setter
     def first_operand(self, value):
         # type: (Union[dict, int]) -> None
-        try:
-            value = signatures.SIGNAL_ID_OR_NONE.validate(value)
-        except SchemaError as e:
-            six.raise_from(TypeError(e), None)
+        if self.validation_level is not ValidationLevel.NONE:
+            try:
+                value = signatures.SIGNAL_ID_OR_NONE.validate(value)
+            except SchemaError as e:
+                six.raise_from(TypeError(e), None)
+        else:
+            value = signatures.normalize_signal_name(value)
 
         if "decider_conditions" not in self.control_behavior:
             self.control_behavior["decider_conditions"] = {}
@@ -143,31 +156,32 @@ class DeciderCombinator(
         else:  # Signal Dict
             decider_conditions["first_signal"] = value
 
-        # If the signal blacklist of the new first operand conflicts with the
-        # current 'output_signal', we remove it
-        if isinstance(self.output_signal, dict):
-            output_signal_name = self.output_signal["name"]
-        else:
-            output_signal_name = None
+        if self.validation_level is ValidationLevel.STRICT:
+            # If the signal blacklist of the new first operand conflicts with the
+            # current 'output_signal', we remove it
+            if isinstance(self.output_signal, dict):
+                output_signal_name = self.output_signal["name"]
+            else:
+                output_signal_name = None
 
-        if isinstance(value, dict):
-            value_name = value["name"]
-        else:
-            value_name = None
+            if isinstance(value, dict):
+                value_name = value["name"]
+            else:
+                value_name = None
 
-        current_blacklist = self.signal_blacklist.get(
-            value_name, {"signal-anything", "signal-each"}
-        )
-        if output_signal_name in current_blacklist:
-            warnings.warn(
-                "'{}' cannot be an output_signal when '{}' is the first operand; "
-                "output_signal will be set to `None`".format(
-                    output_signal_name, value_name
-                ),
-                DraftsmanWarning,
-                stacklevel=2,
+            current_blacklist = self.signal_blacklist.get(
+                value_name, {"signal-anything", "signal-each"}
             )
-            self.output_signal = None
+            if output_signal_name in current_blacklist:
+                warnings.warn(
+                    "'{}' cannot be an output_signal when '{}' is the first operand; "
+                    "output_signal will be set to `None`".format(
+                        output_signal_name, value_name
+                    ),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
+                self.output_signal = None
 
     # =========================================================================
 
@@ -203,10 +217,13 @@ class DeciderCombinator(
     @operation.setter
     def operation(self, value):
         # type: (str) -> None
-        try:
-            value = signatures.COMPARATOR.validate(value)
-        except SchemaError as e:
-            six.raise_from(TypeError(e), None)
+        if self.validation_level is not ValidationLevel.NONE:
+            try:
+                value = signatures.COMPARATOR.validate(value)
+            except SchemaError as e:
+                six.raise_from(TypeError(e), None)
+        else:
+            value = signatures.normalize_comparator(value)
 
         if "decider_conditions" not in self.control_behavior:
             self.control_behavior["decider_conditions"] = {}
@@ -252,10 +269,13 @@ class DeciderCombinator(
     @second_operand.setter
     def second_operand(self, value):
         # type: (Union[str, int]) -> None
-        try:
-            value = signatures.SIGNAL_ID_OR_CONSTANT.validate(value)
-        except SchemaError as e:
-            six.raise_from(TypeError(e), None)
+        if self.validation_level is not ValidationLevel.NONE:
+            try:
+                value = signatures.SIGNAL_ID_OR_CONSTANT.validate(value)
+            except SchemaError as e:
+                six.raise_from(TypeError(e), None)
+        else:
+            value = signatures.normalize_signal_name(value)
 
         if "decider_conditions" not in self.control_behavior:
             self.control_behavior["decider_conditions"] = {}
@@ -265,13 +285,14 @@ class DeciderCombinator(
             decider_conditions.pop("second_signal", None)
             decider_conditions.pop("constant", None)
         elif isinstance(value, dict):  # Signal Dict
-            # Make sure second operand was not set to a fancy signal
-            if value["name"] in signals.pure_virtual:
-                raise DraftsmanError(
-                    "'second_operand' cannot be set to pure virtual signal '{}'".format(
-                        value["name"]
+            if self.validation_level is ValidationLevel.STRICT:
+                # Make sure second operand was not set to a fancy signal
+                if value["name"] in signals.pure_virtual:
+                    raise DraftsmanError(
+                        "'second_operand' cannot be set to pure virtual signal '{}'".format(
+                            value["name"]
+                        )
                     )
-                )
 
             decider_conditions["second_signal"] = value
             decider_conditions.pop("constant", None)
@@ -305,10 +326,13 @@ class DeciderCombinator(
     @output_signal.setter
     def output_signal(self, value):
         # type: (str) -> None
-        try:
-            value = signatures.SIGNAL_ID_OR_NONE.validate(value)
-        except SchemaError as e:
-            six.raise_from(TypeError(e), None)
+        if self.validation_level is not ValidationLevel.NONE:
+            try:
+                value = signatures.SIGNAL_ID_OR_NONE.validate(value)
+            except SchemaError as e:
+                six.raise_from(TypeError(e), None)
+        else:
+            value = signatures.normalize_signal_name(value)
 
         if "decider_conditions" not in self.control_behavior:
             self.control_behavior["decider_conditions"] = {}
@@ -317,23 +341,24 @@ class DeciderCombinator(
         if value is None:  # Default
             decider_conditions.pop("output_signal", None)
         else:  # Signal Dict
-            # Check the first operand and determine it's blacklisted signals;
-            # ensure the value we're setting 'output_signal' to is not in that
-            # blacklist
-            if isinstance(self.first_operand, dict):
-                first_operand_name = self.first_operand["name"]
-            else:
-                first_operand_name = None
-
-            current_blacklist = self.signal_blacklist.get(
-                first_operand_name, {"signal-anything", "signal-each"}
-            )
-            if value["name"] in current_blacklist:
-                raise DraftsmanError(
-                    "Cannot set 'output_signal' to '{}'; it must be in {}".format(
-                        value["name"], current_blacklist
-                    )
+            if self.validation_level is ValidationLevel.STRICT:
+                # Check the first operand and determine it's blacklisted signals;
+                # ensure the value we're setting 'output_signal' to is not in that
+                # blacklist
+                if isinstance(self.first_operand, dict):
+                    first_operand_name = self.first_operand["name"]
+                else:
+                    first_operand_name = None
+
+                current_blacklist = self.signal_blacklist.get(
+                    first_operand_name, {"signal-anything", "signal-each"}
                 )
+                if value["name"] in current_blacklist:
+                    raise DraftsmanError(
+                        "Cannot set 'output_signal' to '{}'; it must be in {}".format(
+                            value["name"], current_blacklist
+                        )
+                    )
             decider_conditions["output_signal"] = value
 
     # =========================================================================
@@ -403,16 +428,17 @@ class DeciderCombinator(
             their correct formats.
         """
         # Check all the parameters before we set anything to preserve original
-        try:
-            first_operand = signatures.SIGNAL_ID_OR_NONE.validate(first_operand)
-            operation = signatures.COMPARATOR.validate(operation)
-            second_operand = signatures.SIGNAL_ID_OR_CONSTANT.validate(second_operand)
-            output_signal = signatures.SIGNAL_ID_OR_NONE.validate(output_signal)
-            copy_count_from_input = signatures.BOOL_OR_NONE.validate(
-                copy_count_from_input
-            )
-        except SchemaError as e:
-            six.raise_from(DataFormatError(e), None)
+        if self.validation_level is not ValidationLevel.NONE:
+            try:
+                first_operand = signatures.SIGNAL_ID_OR_NONE.validate(first_operand)
+                operation = signatures.COMPARATOR.validate(operation)
+                second_operand = signatures.SIGNAL_ID_OR_CONSTANT.validate(second_operand)
+                output_signal = signatures.SIGNAL_ID_OR_NONE.validate(output_signal)
+                copy_count_from_input = signatures.BOOL_OR_NONE.validate(
+                    copy_count_from_input
+                )
+            except SchemaError as e:
+                six.raise_from(DataFormatError(e), None)
 
         self.first_operand = first_operand
         self.operation = operation
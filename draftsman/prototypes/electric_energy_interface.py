@@ -4,8 +4,10 @@
 from __future__ import unicode_literals
 
 from draftsman.classes.entity import Entity
+from draftsman.constants import ValidationLevel
 from draftsman.warning import DraftsmanWarning
 
+from draftsman import data
 from draftsman.data.entities import electric_energy_interfaces
 
 import six
@@ -63,7 +65,7 @@ class ElectricEnergyInterface(Entity):
     def __init__(self, name=electric_energy_interfaces[0], **kwargs):
         # type: (str, **dict) -> None
         super(ElectricEnergyInterface, self).__init__(
-            name, electric_energy_interfaces, **kwargs
+            name, data.get_profile().entities.electric_energy_interfaces, **kwargs
         )
 
         self.buffer_size = None  # TODO: default
@@ -84,12 +86,13 @@ class ElectricEnergyInterface(Entity):
             self.unused_args.pop("power_usage")
         # self._add_export("power_usage", lambda x: x is not None)
 
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
 
     # =========================================================================
 
@@ -5,8 +5,10 @@ from __future__ import unicode_literals
 
 from draftsman.classes.entity import Entity
 from draftsman.classes.mixins import CircuitConnectableMixin, PowerConnectableMixin
+from draftsman.constants import ValidationLevel
 from draftsman.warning import DraftsmanWarning
 
+from draftsman import data
 from draftsman.data.entities import electric_poles
 
 import warnings
@@ -32,11 +34,32 @@ class ElectricPole(CircuitConnectableMixin, PowerConnectableMixin, Entity):
 
     def __init__(self, name=electric_poles[0], **kwargs):
         # type: (str, **dict) -> None
-        super(ElectricPole, self).__init__(name, electric_poles, **kwargs)
-
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        profile = data.get_profile()
+        super(ElectricPole, self).__init__(
+            name, profile.entities.electric_poles, **kwargs
+        )
+
+        self._supply_area_distance = profile.entities.raw[self.name][
+            "supply_area_distance"
+        ]
+
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
+
+    # =========================================================================
+
+    @property
+    def supply_area_distance(self):
+        # type: () -> float
+        """
+        The distance from the center of this pole to the edge of the square area
+        it supplies with power. Not exported; read only.
+
+        :type: ``float``
+        """
+        return self._supply_area_distance
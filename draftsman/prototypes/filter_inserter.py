@@ -15,10 +15,12 @@ from draftsman.classes.mixins import (
     CircuitConnectableMixin,
     DirectionalMixin,
 )
+from draftsman.constants import ValidationLevel
 from draftsman.error import DataFormatError
 from draftsman import signatures
 from draftsman.warning import DraftsmanWarning
 
+from draftsman import data
 from draftsman.data.entities import filter_inserters
 
 from schema import SchemaError
@@ -90,9 +92,13 @@ class FilterInserter(
         }
     )
 
+    _control_behavior_signature = signatures.FILTER_INSERTER_CONTROL_BEHAVIOR
+
     def __init__(self, name=filter_inserters[0], **kwargs):
         # type: (str, **dict) -> None
-        super(FilterInserter, self).__init__(name, filter_inserters, **kwargs)
+        super(FilterInserter, self).__init__(
+            name, data.get_profile().entities.filter_inserters, **kwargs
+        )
 
         self.filter_mode = None
         if "filter_mode" in kwargs:
@@ -100,18 +106,22 @@ class FilterInserter(
             self.unused_args.pop("filter_mode")
         # self._add_export("filter_mode", lambda x: x is not None)
 
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
 
     # =========================================================================
 
     @ControlBehaviorMixin.control_behavior.setter
     def control_behavior(self, value):
         # type: (dict) -> None
+        if self.validation_level is ValidationLevel.NONE:
+            self._control_behavior = {} if value is None else value
+            return
         try:
             self._control_behavior = (
                 signatures.FILTER_INSERTER_CONTROL_BEHAVIOR.validate(value)
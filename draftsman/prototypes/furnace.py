@@ -5,11 +5,13 @@ from __future__ import unicode_literals
 
 from draftsman.classes.entity import Entity
 from draftsman.classes.mixins import ModulesMixin, RequestItemsMixin
+from draftsman.constants import ValidationLevel
 from draftsman import utils
 from draftsman.warning import DraftsmanWarning, ItemLimitationWarning
 
-from draftsman.data.entities import furnaces, raw
-from draftsman.data import modules, recipes
+from draftsman import data
+from draftsman.data.entities import furnaces
+from draftsman.data import recipes
 
 import warnings
 
@@ -37,11 +39,12 @@ class Furnace(ModulesMixin, RequestItemsMixin, Entity):
 
         # FIXME: the following
         # Create a set of valid ingredients for this entity
+        profile = data.get_profile()
         try:
-            crafting_categories = raw[name]["crafting_categories"]
+            crafting_categories = profile.entities.raw[name]["crafting_categories"]
             total_recipes = []
             for crafting_category in crafting_categories:
-                total_recipes.extend(recipes.categories[crafting_category])
+                total_recipes.extend(profile.recipes.categories[crafting_category])
 
             self._valid_input_ingredients = set()
             for recipe_name in total_recipes:
@@ -53,18 +56,19 @@ class Furnace(ModulesMixin, RequestItemsMixin, Entity):
 
         # print(name)
 
-        super(Furnace, self).__init__(name, furnaces, **kwargs)
+        super(Furnace, self).__init__(name, profile.entities.furnaces, **kwargs)
 
         # TODO: Get a set of valid fuel items for this entity
         # self._valid_fuel_items = set()
         # energy_source = raw[self.name]["energy_source"]
 
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
 
     # =========================================================================
 
@@ -84,15 +88,40 @@ class Furnace(ModulesMixin, RequestItemsMixin, Entity):
     @utils.reissue_warnings
     def set_item_request(self, item, count):
         # type: (str, int) -> None
-        if item not in modules.raw and item not in self.valid_input_ingredients:
-            warnings.warn(
-                "Cannot request items that this Furnace doesn't use ({})".format(item),
-                ItemLimitationWarning,
-                stacklevel=2,
-            )
+        profile = data.get_profile()
+        if self.validation_level is ValidationLevel.STRICT:
+            if (
+                item not in profile.modules.raw
+                and item not in self.valid_input_ingredients
+            ):
+                warnings.warn(
+                    "Cannot request items that this Furnace doesn't use ({})".format(
+                        item
+                    ),
+                    ItemLimitationWarning,
+                    stacklevel=2,
+                )
 
         # TODO: handle fuel input items
 
         # self._handle_module_slots(item, count)
 
         super(Furnace, self).set_item_request(item, count)
+
+    def _validate(self, report):
+        # type: (ValidationReport) -> None
+        profile = data.get_profile()
+        super(Furnace, self)._validate(report)
+
+        for item in self.items:
+            if (
+                item not in profile.modules.raw
+                and item not in self.valid_input_ingredients
+            ):
+                report.add(
+                    ItemLimitationWarning,
+                    "Cannot request items that this Furnace doesn't use ({})".format(
+                        item
+                    ),
+                    (self,),
+                )
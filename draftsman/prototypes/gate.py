@@ -5,10 +5,11 @@ from __future__ import unicode_literals
 
 from draftsman.classes.entity import Entity
 from draftsman.classes.mixins import DirectionalMixin
+from draftsman.constants import ValidationLevel
 from draftsman.warning import DraftsmanWarning
 
+from draftsman import data
 from draftsman.data.entities import gates
-from draftsman.data import entities
 
 import warnings
 
@@ -31,10 +32,13 @@ class Gate(DirectionalMixin, Entity):
 
     def __init__(self, name=gates[0], **kwargs):
         # type: (str, **dict) -> None
-        super(Gate, self).__init__(name, gates, **kwargs)
+        profile = data.get_profile()
+        super(Gate, self).__init__(name, profile.entities.gates, **kwargs)
 
-        if "collision_mask" in entities.raw[self.name]:  # pragma: no coverage
-            self._collision_mask = set(entities.raw[self.name]["collision_mask"])
+        if "collision_mask" in profile.entities.raw[self.name]:  # pragma: no coverage
+            self._collision_mask = set(
+                profile.entities.raw[self.name]["collision_mask"]
+            )
         else:  # pragma: no coverage
             self._collision_mask = {
                 "item-layer",
@@ -44,9 +48,10 @@ class Gate(DirectionalMixin, Entity):
                 "train-layer",
             }
 
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
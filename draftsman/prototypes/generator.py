@@ -5,8 +5,10 @@ from __future__ import unicode_literals
 
 from draftsman.classes.entity import Entity
 from draftsman.classes.mixins import DirectionalMixin
+from draftsman.constants import ValidationLevel
 from draftsman.warning import DraftsmanWarning
 
+from draftsman import data
 from draftsman.data.entities import generators
 
 import warnings
@@ -30,11 +32,14 @@ class Generator(DirectionalMixin, Entity):
 
     def __init__(self, name=generators[0], **kwargs):
         # type: (str, **dict) -> None
-        super(Generator, self).__init__(name, generators, **kwargs)
-
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        super(Generator, self).__init__(
+            name, data.get_profile().entities.generators, **kwargs
+        )
+
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
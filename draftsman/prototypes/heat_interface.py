@@ -4,10 +4,12 @@
 from __future__ import unicode_literals
 
 from draftsman.classes.entity import Entity
+from draftsman.constants import ValidationLevel
 from draftsman.error import InvalidModeError
 import draftsman.signatures as signatures
 from draftsman.warning import DraftsmanWarning, TemperatureRangeWarning
 
+from draftsman import data
 from draftsman.data.entities import heat_interfaces
 
 import warnings
@@ -53,7 +55,9 @@ class HeatInterface(Entity):
 
     def __init__(self, name=heat_interfaces[0], **kwargs):
         # type: (str, **dict) -> None
-        super(HeatInterface, self).__init__(name, heat_interfaces, **kwargs)
+        super(HeatInterface, self).__init__(
+            name, data.get_profile().entities.heat_interfaces, **kwargs
+        )
 
         self.temperature = 0
         if "temperature" in kwargs:
@@ -67,12 +71,13 @@ class HeatInterface(Entity):
             self.unused_args.pop("mode")
         # self._add_export("mode", lambda x: x is not None and x != "at-least")
 
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
 
     # =========================================================================
 
@@ -100,7 +105,10 @@ class HeatInterface(Entity):
         if value is None:
             self._temperature = value
         elif isinstance(value, int):
-            if not 0 <= value <= 1000:
+            if (
+                self.validation_level is ValidationLevel.STRICT
+                and not 0 <= value <= 1000
+            ):
                 warnings.warn(
                     "'temperature' ({}) not in range [0, 1000]; will be clamped"
                     " on import".format(value),
@@ -147,6 +155,18 @@ class HeatInterface(Entity):
 
     # =========================================================================
 
+    def _validate(self, report):
+        # type: (ValidationReport) -> None
+        super(HeatInterface, self)._validate(report)
+
+        if self.temperature is not None and not 0 <= self.temperature <= 1000:
+            report.add(
+                TemperatureRangeWarning,
+                "'temperature' ({}) not in range [0, 1000]; will be clamped"
+                " on import".format(self.temperature),
+                (self,),
+            )
+
     def merge(self, other):
         # type: (HeatInterface) -> None
         super(HeatInterface, self).merge(other)
@@ -4,10 +4,11 @@
 from __future__ import unicode_literals
 
 from draftsman.classes.entity import Entity
+from draftsman.constants import ValidationLevel
 from draftsman.warning import DraftsmanWarning
 
+from draftsman import data
 from draftsman.data.entities import heat_pipes
-from draftsman.data import entities
 
 import warnings
 
@@ -28,16 +29,20 @@ class HeatPipe(Entity):
 
     def __init__(self, name=heat_pipes[0], **kwargs):
         # type: (str, **dict) -> None
-        super(HeatPipe, self).__init__(name, heat_pipes, **kwargs)
+        profile = data.get_profile()
+        super(HeatPipe, self).__init__(name, profile.entities.heat_pipes, **kwargs)
 
-        if "collision_mask" in entities.raw[self.name]:  # pragma: no coverage
-            self._collision_mask = set(entities.raw[self.name]["collision_mask"])
+        if "collision_mask" in profile.entities.raw[self.name]:  # pragma: no coverage
+            self._collision_mask = set(
+                profile.entities.raw[self.name]["collision_mask"]
+            )
         else:  # pragma: no coverage
             self._collision_mask = {"object-layer", "floor-layer", "water-tile"}
 
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
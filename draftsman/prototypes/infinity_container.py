@@ -5,12 +5,13 @@ from __future__ import unicode_literals
 
 from draftsman.classes.entity import Entity
 from draftsman.classes.mixins import RequestItemsMixin
+from draftsman.constants import ValidationLevel
 from draftsman.error import DataFormatError, InvalidItemError, InvalidModeError
 import draftsman.signatures as signatures
 from draftsman.warning import DraftsmanWarning
 
+from draftsman import data
 from draftsman.data.entities import infinity_containers
-from draftsman.data import items
 
 from schema import SchemaError
 import six
@@ -49,7 +50,9 @@ class InfinityContainer(RequestItemsMixin, Entity):
 
     def __init__(self, name=infinity_containers[0], **kwargs):
         # type: (str, **dict) -> None
-        super(InfinityContainer, self).__init__(name, infinity_containers, **kwargs)
+        super(InfinityContainer, self).__init__(
+            name, data.get_profile().entities.infinity_containers, **kwargs
+        )
 
         self.infinity_settings = {}
         if "infinity_settings" in kwargs:
@@ -57,12 +60,13 @@ class InfinityContainer(RequestItemsMixin, Entity):
             self.unused_args.pop("infinity_settings")
         # self._add_export("infinity_settings", lambda x: len(x) != 0)
 
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
 
     # =========================================================================
 
@@ -86,6 +90,9 @@ class InfinityContainer(RequestItemsMixin, Entity):
     @infinity_settings.setter
     def infinity_settings(self, value):
         # type: (dict) -> None
+        if self.validation_level is ValidationLevel.NONE:
+            self._infinity_settings = {} if value is None else value
+            return
         try:
             value = signatures.INFINITY_CONTAINER.validate(value)
             self._infinity_settings = value
@@ -140,6 +147,7 @@ class InfinityContainer(RequestItemsMixin, Entity):
         :exception InvalidModeError: If ``mode`` is not one of the three values
             specified above.
         """
+        profile = data.get_profile()
         try:
             index = signatures.INTEGER.validate(index)
             item = signatures.STRING_OR_NONE.validate(item)
@@ -150,12 +158,17 @@ class InfinityContainer(RequestItemsMixin, Entity):
 
         if not 0 <= index < 1000:
             raise IndexError("Filter index {} not in range [0, 1000)")
-        if item is not None and item not in items.raw:
+        # The stack size of the item is needed when ``count`` is omitted
+        if (
+            item is not None
+            and (self.validation_level is ValidationLevel.STRICT or count is None)
+            and item not in profile.items.raw
+        ):
             raise InvalidItemError(item)
         if mode not in {"at-least", "at-most", "exactly"}:
             raise InvalidModeError(mode)
         if count is None:  # default count to the item's stack size
-            count = 0 if item is None else items.raw[item]["stack_size"]
+            count = 0 if item is None else profile.items.raw[item]["stack_size"]
         if count < 0:
             raise ValueError(
                 "Infinity filter count ({}) must be positive".format(count)
@@ -209,6 +222,18 @@ class InfinityContainer(RequestItemsMixin, Entity):
 
     #     super(InfinityContainer, self).set_item_request(item, count)
 
+    def _validate(self, report):
+        # type: (ValidationReport) -> None
+        super(InfinityContainer, self)._validate(report)
+
+        if self.infinity_settings:
+            report.check_format(
+                "infinity_settings",
+                self.infinity_settings,
+                signatures.INFINITY_CONTAINER,
+                (self,),
+            )
+
     def merge(self, other):
         super(InfinityContainer, self).merge(other)
 
@@ -4,12 +4,13 @@
 from __future__ import unicode_literals
 
 from draftsman.classes.entity import Entity
+from draftsman.constants import ValidationLevel
 from draftsman.error import InvalidFluidError, InvalidModeError, DataFormatError
 import draftsman.signatures as signatures
 from draftsman.warning import DraftsmanWarning, TemperatureRangeWarning
 
+from draftsman import data
 from draftsman.data.entities import infinity_pipes
-import draftsman.data.signals as signals
 
 from schema import SchemaError
 import six
@@ -46,7 +47,9 @@ class InfinityPipe(Entity):
 
     def __init__(self, name=infinity_pipes[0], **kwargs):
         # type: (str, **dict) -> None
-        super(InfinityPipe, self).__init__(name, infinity_pipes, **kwargs)
+        super(InfinityPipe, self).__init__(
+            name, data.get_profile().entities.infinity_pipes, **kwargs
+        )
 
         self.infinity_settings = {}
         if "infinity_settings" in kwargs:
@@ -54,12 +57,13 @@ class InfinityPipe(Entity):
             self.unused_args.pop("infinity_settings")
         # self._add_export("infinity_settings", lambda x: len(x) != 0)
 
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
 
     # =========================================================================
 
@@ -83,6 +87,9 @@ class InfinityPipe(Entity):
     @infinity_settings.setter
     def infinity_settings(self, value):
         # type: (dict) -> None
+        if self.validation_level is ValidationLevel.NONE:
+            self._infinity_settings = {} if value is None else value
+            return
         try:
             value = signatures.INFINITY_PIPE.validate(value)
             self._infinity_settings = value
@@ -109,11 +116,15 @@ class InfinityPipe(Entity):
     @infinite_fluid_name.setter
     def infinite_fluid_name(self, value):
         # type: (str) -> None
+        profile = data.get_profile()
         if value is None:
             self.infinity_settings.pop("name", None)
         elif isinstance(value, six.string_types):
             value = six.text_type(value)
-            if value not in signals.fluid:
+            if (
+                self.validation_level is ValidationLevel.STRICT
+                and value not in profile.signals.fluid
+            ):
                 raise InvalidFluidError(value)
             self.infinity_settings["name"] = value
         else:
@@ -218,7 +229,10 @@ class InfinityPipe(Entity):
         if value is None:
             self.infinity_settings.pop("temperature", None)
         elif isinstance(value, (int, float)):
-            if not 0 <= value <= 1000:
+            if (
+                self.validation_level is ValidationLevel.STRICT
+                and not 0 <= value <= 1000
+            ):
                 warnings.warn(
                     "'infinite_fluid_temperature' ({}) not in range [0, 1000]; "
                     "will be clamped on import".format(value),
@@ -256,6 +270,7 @@ class InfinityPipe(Entity):
             specified above.
         :exception ValueError: If percentage was set to a negative value.
         """
+        profile = data.get_profile()
         try:
             name = signatures.STRING.validate(name)
             percentage = signatures.INTEGER.validate(percentage)
@@ -264,7 +279,8 @@ class InfinityPipe(Entity):
         except SchemaError as e:
             six.raise_from(TypeError(e), None)
 
-        if name not in signals.fluid:
+        strict = self.validation_level is ValidationLevel.STRICT
+        if strict and name not in profile.signals.fluid:
             raise InvalidFluidError(name)
         if mode not in {"at-least", "at-most", "exactly", "add", "remove"}:
             raise InvalidModeError(mode)
@@ -273,7 +289,7 @@ class InfinityPipe(Entity):
             raise ValueError("'percentage' cannot be negative")
 
         # Warn if temperature is less than 0 or greater than 1000
-        if not 0 <= temperature <= 1000:
+        if strict and not 0 <= temperature <= 1000:
             warnings.warn(
                 "'infinite_fluid_temperature' ({}) not in range [0, 1000]; "
                 "will be clamped on import".format(percentage),
@@ -286,6 +302,18 @@ class InfinityPipe(Entity):
         self.infinity_settings["mode"] = mode
         self.infinity_settings["temperature"] = temperature
 
+    def _validate(self, report):
+        # type: (ValidationReport) -> None
+        super(InfinityPipe, self)._validate(report)
+
+        if self.infinity_settings:
+            report.check_format(
+                "infinity_settings",
+                self.infinity_settings,
+                signatures.INFINITY_PIPE,
+                (self,),
+            )
+
     def merge(self, other):
         super(InfinityPipe, self).merge(other)
 
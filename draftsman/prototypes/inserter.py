@@ -14,11 +14,12 @@ from draftsman.classes.mixins import (
     CircuitConnectableMixin,
     DirectionalMixin,
 )
-from draftsman.constants import InserterModeOfOperation
+from draftsman.constants import InserterModeOfOperation, ValidationLevel
 from draftsman.error import DataFormatError
 from draftsman import signatures
 from draftsman.warning import DraftsmanWarning
 
+from draftsman import data
 from draftsman.data.entities import inserters
 
 from schema import SchemaError
@@ -72,22 +73,30 @@ class Inserter(
     _exports.update(CircuitReadHandMixin._exports)
     _exports.update(StackSizeMixin._exports)
 
+    _control_behavior_signature = signatures.INSERTER_CONTROL_BEHAVIOR
+
     def __init__(self, name=inserters[0], **kwargs):
         # type: (str, **dict) -> None
-        super(Inserter, self).__init__(name, inserters, **kwargs)
+        super(Inserter, self).__init__(
+            name, data.get_profile().entities.inserters, **kwargs
+        )
 
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
 
     # =========================================================================
 
     @ControlBehaviorMixin.control_behavior.setter
     def control_behavior(self, value):
         # type: (dict) -> None
+        if self.validation_level is ValidationLevel.NONE:
+            self._control_behavior = {} if value is None else value
+            return
         try:
             self._control_behavior = signatures.INSERTER_CONTROL_BEHAVIOR.validate(
                 value
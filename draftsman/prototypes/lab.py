@@ -5,11 +5,12 @@ from __future__ import unicode_literals
 
 from draftsman.classes.entity import Entity
 from draftsman.classes.mixins import ModulesMixin, RequestItemsMixin
+from draftsman.constants import ValidationLevel
 from draftsman import utils
 from draftsman.warning import DraftsmanWarning, ItemLimitationWarning
 
-from draftsman.data.entities import labs, raw
-from draftsman.data import items, modules
+from draftsman import data
+from draftsman.data.entities import labs
 
 import warnings
 
@@ -34,17 +35,19 @@ class Lab(ModulesMixin, RequestItemsMixin, Entity):
 
     def __init__(self, name=labs[0], **kwargs):
         # type: (str, **dict) -> None
-        super(Lab, self).__init__(name, labs, **kwargs)
+        profile = data.get_profile()
+        super(Lab, self).__init__(name, profile.entities.labs, **kwargs)
 
         # Keep track of science packs that this lab can use
-        self._inputs = raw[self.name]["inputs"]
+        self._inputs = profile.entities.raw[self.name]["inputs"]
 
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
 
     # =========================================================================
 
@@ -63,12 +66,14 @@ class Lab(ModulesMixin, RequestItemsMixin, Entity):
     @utils.reissue_warnings
     def set_item_request(self, item, count):
         # type: (str, int) -> None
-        if item not in modules.raw and item not in self.inputs:
-            warnings.warn(
-                "Item '{}' cannot be placed in Lab".format(item),
-                ItemLimitationWarning,
-                stacklevel=2,
-            )
+        profile = data.get_profile()
+        if self.validation_level is ValidationLevel.STRICT:
+            if item not in profile.modules.raw and item not in self.inputs:
+                warnings.warn(
+                    "Item '{}' cannot be placed in Lab".format(item),
+                    ItemLimitationWarning,
+                    stacklevel=2,
+                )
 
         # TODO: check the lab's limitations to see if the module is allowed
         # ('allowed_effects')
@@ -78,3 +83,16 @@ class Lab(ModulesMixin, RequestItemsMixin, Entity):
         # than 10(?) issue an ItemCapacityWarning
 
         super(Lab, self).set_item_request(item, count)
+
+    def _validate(self, report):
+        # type: (ValidationReport) -> None
+        profile = data.get_profile()
+        super(Lab, self)._validate(report)
+
+        for item in self.items:
+            if item not in profile.modules.raw and item not in self.inputs:
+                report.add(
+                    ItemLimitationWarning,
+                    "Item '{}' cannot be placed in Lab".format(item),
+                    (self,),
+                )
@@ -9,10 +9,12 @@ from draftsman.classes.mixins import (
     ControlBehaviorMixin,
     CircuitConnectableMixin,
 )
+from draftsman.constants import ValidationLevel
 from draftsman.error import DataFormatError
 import draftsman.signatures as signatures
 from draftsman.warning import DraftsmanWarning
 
+from draftsman import data
 from draftsman.data.entities import lamps
 
 from schema import SchemaError
@@ -42,22 +44,28 @@ class Lamp(
     _exports.update(ControlBehaviorMixin._exports)
     _exports.update(CircuitConditionMixin._exports)
 
+    _control_behavior_signature = signatures.LAMP_CONTROL_BEHAVIOR
+
     def __init__(self, name=lamps[0], **kwargs):
         # type: (str, **dict) -> None
-        super(Lamp, self).__init__(name, lamps, **kwargs)
+        super(Lamp, self).__init__(name, data.get_profile().entities.lamps, **kwargs)
 
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
 
     # =========================================================================
 
     @ControlBehaviorMixin.control_behavior.setter
     def control_behavior(self, value):
         # type: (dict) -> None
+        if self.validation_level is ValidationLevel.NONE:
+            self._control_behavior = {} if value is None else value
+            return
         try:
             self._control_behavior = signatures.LAMP_CONTROL_BEHAVIOR.validate(value)
         except SchemaError as e:
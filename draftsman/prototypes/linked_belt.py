@@ -5,11 +5,12 @@ from __future__ import unicode_literals
 
 from draftsman.classes.entity import Entity
 from draftsman.classes.mixins import DirectionalMixin
+from draftsman.constants import ValidationLevel
 from draftsman.error import DraftsmanError
 from draftsman.warning import DraftsmanWarning
 
+from draftsman import data
 from draftsman.data.entities import linked_belts
-from draftsman.data import entities
 
 import warnings
 
@@ -43,15 +44,18 @@ class LinkedBelt(DirectionalMixin, Entity):
 
     def __init__(self, name=default_linked_belt, **kwargs):
         # type: (str, **dict) -> None
-        if len(linked_belts) == 0:  # pragma: no coverage
+        profile = data.get_profile()
+        if len(profile.entities.linked_belts) == 0:  # pragma: no coverage
             raise DraftsmanError(
                 "There is no LinkedBelt to create; check your Factorio version"
             )
 
-        super(LinkedBelt, self).__init__(name, linked_belts, **kwargs)
+        super(LinkedBelt, self).__init__(name, profile.entities.linked_belts, **kwargs)
 
-        if "collision_mask" in entities.raw[self.name]:  # pragma: no coverage
-            self._collision_mask = set(entities.raw[self.name]["collision_mask"])
+        if "collision_mask" in profile.entities.raw[self.name]:  # pragma: no coverage
+            self._collision_mask = set(
+                profile.entities.raw[self.name]["collision_mask"]
+            )
         else:  # pragma: no coverage
             self._collision_mask = {
                 "object-layer",
@@ -60,9 +64,10 @@ class LinkedBelt(DirectionalMixin, Entity):
                 "water-tile",
             }
 
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
@@ -5,9 +5,11 @@ from __future__ import unicode_literals
 
 from draftsman.classes.entity import Entity
 from draftsman.classes.mixins import InventoryMixin, RequestItemsMixin
+from draftsman.constants import ValidationLevel
 from draftsman import signatures
 from draftsman.warning import DraftsmanWarning
 
+from draftsman import data
 from draftsman.data.entities import linked_containers
 
 import six
@@ -49,7 +51,9 @@ class LinkedContainer(InventoryMixin, RequestItemsMixin, Entity):
 
     def __init__(self, name=linked_containers[0], **kwargs):
         # type: (str, **dict) -> None
-        super(LinkedContainer, self).__init__(name, linked_containers, **kwargs)
+        super(LinkedContainer, self).__init__(
+            name, data.get_profile().entities.linked_containers, **kwargs
+        )
 
         self.link_id = 0
         if "link_id" in kwargs:
@@ -57,12 +61,13 @@ class LinkedContainer(InventoryMixin, RequestItemsMixin, Entity):
             self.unused_args.pop("link_id")
         # self._add_export("link_id", lambda x: x != 0)
 
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
 
     # =========================================================================
 
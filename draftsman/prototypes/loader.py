@@ -5,10 +5,11 @@ from __future__ import unicode_literals
 
 from draftsman.classes.entity import Entity
 from draftsman.classes.mixins import FiltersMixin, IOTypeMixin, DirectionalMixin
+from draftsman.constants import ValidationLevel
 from draftsman.warning import DraftsmanWarning
 
+from draftsman import data
 from draftsman.data.entities import loaders
-from draftsman.data import entities
 
 import warnings
 
@@ -36,10 +37,13 @@ class Loader(FiltersMixin, IOTypeMixin, DirectionalMixin, Entity):
 
     def __init__(self, name=loaders[0], **kwargs):
         # type: (str, **dict) -> None
-        super(Loader, self).__init__(name, loaders, **kwargs)
+        profile = data.get_profile()
+        super(Loader, self).__init__(name, profile.entities.loaders, **kwargs)
 
-        if "collision_mask" in entities.raw[self.name]:  # pragma: no coverage
-            self._collision_mask = set(entities.raw[self.name]["collision_mask"])
+        if "collision_mask" in profile.entities.raw[self.name]:  # pragma: no coverage
+            self._collision_mask = set(
+                profile.entities.raw[self.name]["collision_mask"]
+            )
         else:  # pragma: no coverage
             self._collision_mask = {
                 "object-layer",
@@ -48,9 +52,10 @@ class Loader(FiltersMixin, IOTypeMixin, DirectionalMixin, Entity):
                 "water-tile",
             }
 
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
@@ -9,8 +9,10 @@ from draftsman.classes.mixins import (
     CircuitConnectableMixin,
     InventoryMixin,
 )
+from draftsman.constants import ValidationLevel
 from draftsman.warning import DraftsmanWarning
 
+from draftsman import data
 from draftsman.data.entities import logistic_active_containers
 
 import warnings
@@ -42,12 +44,13 @@ class LogisticActiveContainer(
     def __init__(self, name=logistic_active_containers[0], **kwargs):
         # type: (str, **dict) -> None
         super(LogisticActiveContainer, self).__init__(
-            name, logistic_active_containers, **kwargs
+            name, data.get_profile().entities.logistic_active_containers, **kwargs
         )
 
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
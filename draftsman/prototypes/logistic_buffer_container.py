@@ -12,11 +12,12 @@ from draftsman.classes.mixins import (
     RequestFiltersMixin,
     InventoryMixin,
 )
-from draftsman.constants import LogisticModeOfOperation
+from draftsman.constants import LogisticModeOfOperation, ValidationLevel
 from draftsman.error import DataFormatError
 from draftsman import signatures
 from draftsman.warning import DraftsmanWarning
 
+from draftsman import data
 from draftsman.data.entities import logistic_buffer_containers
 
 from schema import SchemaError
@@ -58,27 +59,33 @@ class LogisticBufferContainer(
     _exports.update(RequestItemsMixin._exports)
     _exports.update(InventoryMixin._exports)
 
+    _control_behavior_signature = signatures.LOGISTIC_BUFFER_CONTROL_BEHAVIOR
+
     def __init__(self, name=logistic_buffer_containers[0], **kwargs):
         # type: (str, **dict) -> None
         # Set the mode of operation type for this entity
         self._mode_of_operation_type = LogisticModeOfOperation
 
         super(LogisticBufferContainer, self).__init__(
-            name, logistic_buffer_containers, **kwargs
+            name, data.get_profile().entities.logistic_buffer_containers, **kwargs
         )
 
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
 
     # =========================================================================
 
     @ControlBehaviorMixin.control_behavior.setter
     def control_behavior(self, value):
         # type: (dict) -> None
+        if self.validation_level is ValidationLevel.NONE:
+            self._control_behavior = {} if value is None else value
+            return
         try:
             self._control_behavior = (
                 signatures.LOGISTIC_BUFFER_CONTROL_BEHAVIOR.validate(value)
@@ -12,10 +12,12 @@ from draftsman.classes.mixins import (
     RequestFiltersMixin,
     InventoryMixin,
 )
+from draftsman.constants import ValidationLevel
 from draftsman.error import DataFormatError
 from draftsman import signatures
 from draftsman.warning import DraftsmanWarning
 
+from draftsman import data
 from draftsman.data.entities import logistic_request_containers
 
 from schema import SchemaError
@@ -71,10 +73,12 @@ class LogisticRequestContainer(
         }
     )
 
+    _control_behavior_signature = signatures.LOGISTIC_REQUESTER_CONTROL_BEHAVIOR
+
     def __init__(self, name=logistic_request_containers[0], **kwargs):
         # type: (str, **dict) -> None
         super(LogisticRequestContainer, self).__init__(
-            name, logistic_request_containers, **kwargs
+            name, data.get_profile().entities.logistic_request_containers, **kwargs
         )
 
         self.request_from_buffers = None
@@ -83,18 +87,22 @@ class LogisticRequestContainer(
             self.unused_args.pop("request_from_buffers")
         # self._add_export("request_from_buffers", lambda x: x is not None)
 
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
 
     # =========================================================================
 
     @ControlBehaviorMixin.control_behavior.setter
     def control_behavior(self, value):
         # type: (dict) -> None
+        if self.validation_level is ValidationLevel.NONE:
+            self._control_behavior = {} if value is None else value
+            return
         try:
             self._control_behavior = (
                 signatures.LOGISTIC_REQUESTER_CONTROL_BEHAVIOR.validate(value)
@@ -10,8 +10,10 @@ from draftsman.classes.mixins import (
     RequestFiltersMixin,
     InventoryMixin,
 )
+from draftsman.constants import ValidationLevel
 from draftsman.warning import DraftsmanWarning
 
+from draftsman import data
 from draftsman.data.entities import logistic_storage_containers
 
 import warnings
@@ -49,12 +51,13 @@ class LogisticStorageContainer(
     def __init__(self, name=logistic_storage_containers[0], **kwargs):
         # type: (str, **dict) -> None
         super(LogisticStorageContainer, self).__init__(
-            name, logistic_storage_containers, **kwargs
+            name, data.get_profile().entities.logistic_storage_containers, **kwargs
         )
 
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
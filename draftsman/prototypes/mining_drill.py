@@ -15,14 +15,14 @@ from draftsman.classes.mixins import (
     CircuitConnectableMixin,
     DirectionalMixin,
 )
+from draftsman.constants import ValidationLevel
 from draftsman.error import DataFormatError
 from draftsman import signatures
 from draftsman import utils
 from draftsman.warning import DraftsmanWarning, ItemLimitationWarning
 
+from draftsman import data
 from draftsman.data.entities import mining_drills
-from draftsman.data import modules
-from draftsman.data import items
 
 from schema import SchemaError
 import six
@@ -72,22 +72,30 @@ class MiningDrill(
     _exports.update(RequestItemsMixin._exports)
     _exports.update(ModulesMixin._exports)
 
+    _control_behavior_signature = signatures.MINING_DRILL_CONTROL_BEHAVIOR
+
     def __init__(self, name=mining_drills[0], **kwargs):
         # type: (str, **dict) -> None
-        super(MiningDrill, self).__init__(name, mining_drills, **kwargs)
-
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        super(MiningDrill, self).__init__(
+            name, data.get_profile().entities.mining_drills, **kwargs
+        )
+
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
 
     # =========================================================================
 
     @ControlBehaviorMixin.control_behavior.setter
     def control_behavior(self, value):
         # type: (dict) -> None
+        if self.validation_level is ValidationLevel.NONE:
+            self._control_behavior = {} if value is None else value
+            return
         try:
             self._control_behavior = signatures.MINING_DRILL_CONTROL_BEHAVIOR.validate(
                 value
@@ -104,13 +112,28 @@ class MiningDrill(
         # if item not in items.raw:
         #     raise InvalidItemError(item)
 
-        if item in items.raw and item not in modules.raw:
-            warnings.warn(
-                "Item '{}' cannot be placed in MiningDrill".format(item),
-                ItemLimitationWarning,
-                stacklevel=2,
-            )
+        profile = data.get_profile()
+        if self.validation_level is ValidationLevel.STRICT:
+            if item in profile.items.raw and item not in profile.modules.raw:
+                warnings.warn(
+                    "Item '{}' cannot be placed in MiningDrill".format(item),
+                    ItemLimitationWarning,
+                    stacklevel=2,
+                )
 
         # self._handle_module_slots(item, amount)
 
         super(MiningDrill, self).set_item_request(item, amount)
+
+    def _validate(self, report):
+        # type: (ValidationReport) -> None
+        profile = data.get_profile()
+        super(MiningDrill, self)._validate(report)
+
+        for item in self.items:
+            if item in profile.items.raw and item not in profile.modules.raw:
+                report.add(
+                    ItemLimitationWarning,
+                    "Item '{}' cannot be placed in MiningDrill".format(item),
+                    (self,),
+                )
@@ -4,8 +4,10 @@
 from __future__ import unicode_literals
 
 from draftsman.classes.entity import Entity
+from draftsman.constants import ValidationLevel
 from draftsman.warning import DraftsmanWarning
 
+from draftsman import data
 from draftsman.data.entities import pipes
 
 import warnings
@@ -27,11 +29,12 @@ class Pipe(Entity):
 
     def __init__(self, name=pipes[0], **kwargs):
         # type: (str, **dict) -> None
-        super(Pipe, self).__init__(name, pipes, **kwargs)
-
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        super(Pipe, self).__init__(name, data.get_profile().entities.pipes, **kwargs)
+
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
@@ -1,8 +1,10 @@
 # player_port.py
 
 from draftsman.classes.entity import Entity
+from draftsman.constants import ValidationLevel
 from draftsman.warning import DraftsmanWarning
 
+from draftsman import data
 from draftsman.data import entities
 from draftsman.data.entities import player_ports
 
@@ -19,11 +21,14 @@ class PlayerPort(Entity):
 
     def __init__(self, name=player_ports[0], **kwargs):
         # type: (str, **dict) -> None
-        super(PlayerPort, self).__init__(name, player_ports, **kwargs)
-
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        super(PlayerPort, self).__init__(
+            name, data.get_profile().entities.player_ports, **kwargs
+        )
+
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
@@ -12,10 +12,12 @@ from draftsman.classes.mixins import (
     PowerConnectableMixin,
     DirectionalMixin,
 )
+from draftsman.constants import ValidationLevel
 from draftsman.error import DataFormatError
 from draftsman import signatures
 from draftsman.warning import DraftsmanWarning
 
+from draftsman import data
 from draftsman.data.entities import power_switches
 
 from schema import SchemaError
@@ -72,9 +74,13 @@ class PowerSwitch(
         }
     )
 
+    _control_behavior_signature = signatures.POWER_SWITCH_CONTROL_BEHAVIOR
+
     def __init__(self, name=power_switches[0], **kwargs):
         # type: (str, **dict) -> None
-        super(PowerSwitch, self).__init__(name, power_switches, **kwargs)
+        super(PowerSwitch, self).__init__(
+            name, data.get_profile().entities.power_switches, **kwargs
+        )
 
         self._dual_power_connectable = True
 
@@ -84,18 +90,22 @@ class PowerSwitch(
             self.unused_args.pop("switch_state")
         # self._add_export("switch_state", lambda x: x is not None)
 
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
 
     # =========================================================================
 
     @ControlBehaviorMixin.control_behavior.setter
     def control_behavior(self, value):
         # type: (dict) -> None
+        if self.validation_level is ValidationLevel.NONE:
+            self._control_behavior = {} if value is None else value
+            return
         try:
             self._control_behavior = signatures.POWER_SWITCH_CONTROL_BEHAVIOR.validate(
                 value
@@ -3,6 +3,7 @@
 
 from __future__ import unicode_literals
 
+from draftsman.constants import ValidationLevel
 from draftsman import signatures
 from draftsman.classes.entity import Entity
 from draftsman.classes.mixins import (
@@ -18,8 +19,8 @@ from draftsman.error import (
 )
 from draftsman.warning import DraftsmanWarning, VolumeRangeWarning
 
+from draftsman import data
 from draftsman.data.entities import programmable_speakers
-import draftsman.data.instruments as instruments_data
 from draftsman.data.signals import signal_dict
 
 from schema import SchemaError
@@ -75,17 +76,22 @@ class ProgrammableSpeaker(
         }
     )
 
+    _control_behavior_signature = signatures.PROGRAMMABLE_SPEAKER_CONTROL_BEHAVIOR
+
     def __init__(self, name=programmable_speakers[0], **kwargs):
         # type: (str, **dict) -> None
-        super(ProgrammableSpeaker, self).__init__(name, programmable_speakers, **kwargs)
+        profile = data.get_profile()
+        super(ProgrammableSpeaker, self).__init__(
+            name, profile.entities.programmable_speakers, **kwargs
+        )
 
         # Name translations for all of the instruments and their notes
-        self._instrument_ids = instruments_data.index[self.name]
-        self._instrument_names = instruments_data.names[self.name]
+        self._instrument_ids = profile.instruments.index[self.name]
+        self._instrument_names = profile.instruments.names[self.name]
         # self.instruments = entities.raw[self.name]["instruments"]
         self._instruments = {}
         # print(instruments_data.raw[self.name][0])
-        for instrument in instruments_data.raw[self.name]:
+        for instrument in profile.instruments.raw[self.name]:
             notes = set()
             for note in instrument["notes"]:
                 notes.add(note["name"])
@@ -122,18 +128,22 @@ class ProgrammableSpeaker(
         # if "control_behavior" in kwargs:
         #     self._normalize_circuit_parameters()
 
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
 
     # =========================================================================
 
     @ControlBehaviorMixin.control_behavior.setter
     def control_behavior(self, value):
         # type: (dict) -> None
+        if self.validation_level is ValidationLevel.NONE:
+            self._control_behavior = {} if value is None else value
+            return
         try:
             self._control_behavior = (
                 signatures.PROGRAMMABLE_SPEAKER_CONTROL_BEHAVIOR.validate(value)
@@ -174,6 +184,9 @@ class ProgrammableSpeaker(
     @parameters.setter
     def parameters(self, value):
         # type: (dict) -> None
+        if self.validation_level is ValidationLevel.NONE:
+            self._parameters = {} if value is None else value
+            return
         try:
             self._parameters = signatures.PARAMETERS.validate(value)
         except SchemaError as e:
@@ -200,6 +213,9 @@ class ProgrammableSpeaker(
     @alert_parameters.setter
     def alert_parameters(self, value):
         # type: (dict) -> None
+        if self.validation_level is ValidationLevel.NONE:
+            self._alert_parameters = {} if value is None else value
+            return
         try:
             self._alert_parameters = signatures.ALERT_PARAMETERS.validate(value)
         except SchemaError as e:
@@ -232,7 +248,10 @@ class ProgrammableSpeaker(
         if value is None:
             self.parameters.pop("playback_volume", None)
         elif isinstance(value, float):
-            if not 0.0 <= value <= 1.0:
+            if (
+                self.validation_level is ValidationLevel.STRICT
+                and not 0.0 <= value <= 1.0
+            ):
                 warnings.warn(
                     "volume ({}) not in range of [0.0, 1.0], will be clamped "
                     "on import".format(value),
@@ -629,6 +648,30 @@ class ProgrammableSpeaker(
 
     # =========================================================================
 
+    def _validate(self, report):
+        # type: (ValidationReport) -> None
+        super(ProgrammableSpeaker, self)._validate(report)
+
+        if self.parameters:
+            parameters = report.check_format(
+                "parameters", self.parameters, signatures.PARAMETERS, (self,)
+            )
+            volume = (parameters or {}).get("playback_volume", None)
+            if volume is not None and not 0.0 <= volume <= 1.0:
+                report.add(
+                    VolumeRangeWarning,
+                    "volume ({}) not in range of [0.0, 1.0], will be clamped "
+                    "on import".format(volume),
+                    (self,),
+                )
+        if self.alert_parameters:
+            report.check_format(
+                "alert_parameters",
+                self.alert_parameters,
+                signatures.ALERT_PARAMETERS,
+                (self,),
+            )
+
     def merge(self, other):
         # type: (ProgrammableSpeaker) -> None
         super(ProgrammableSpeaker, self).merge(other)
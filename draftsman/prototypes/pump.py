@@ -10,10 +10,12 @@ from draftsman.classes.mixins import (
     CircuitConnectableMixin,
     DirectionalMixin,
 )
+from draftsman.constants import ValidationLevel
 from draftsman.error import DataFormatError
 from draftsman import signatures
 from draftsman.warning import DraftsmanWarning
 
+from draftsman import data
 from draftsman.data.entities import pumps
 
 from schema import SchemaError
@@ -49,22 +51,28 @@ class Pump(
     _exports.update(ControlBehaviorMixin._exports)
     _exports.update(CircuitConditionMixin._exports)
 
+    _control_behavior_signature = signatures.PUMP_CONTROL_BEHAVIOR
+
     def __init__(self, name=pumps[0], **kwargs):
         # type: (str, **dict) -> None
-        super(Pump, self).__init__(name, pumps, **kwargs)
+        super(Pump, self).__init__(name, data.get_profile().entities.pumps, **kwargs)
 
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
 
     # =========================================================================
 
     @ControlBehaviorMixin.control_behavior.setter
     def control_behavior(self, value):
         # type: (dict) -> None
+        if self.validation_level is ValidationLevel.NONE:
+            self._control_behavior = {} if value is None else value
+            return
         try:
             self._control_behavior = signatures.PUMP_CONTROL_BEHAVIOR.validate(value)
         except SchemaError as e:
@@ -4,8 +4,10 @@
 from __future__ import unicode_literals
 
 from draftsman.classes.entity import Entity
+from draftsman.constants import ValidationLevel
 from draftsman.warning import DraftsmanWarning
 
+from draftsman import data
 from draftsman.data.entities import radars
 
 import warnings
@@ -27,11 +29,12 @@ class Radar(Entity):
 
     def __init__(self, name=radars[0], **kwargs):
         # type: (str, **dict) -> None
-        super(Radar, self).__init__(name, radars, **kwargs)
-
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        super(Radar, self).__init__(name, data.get_profile().entities.radars, **kwargs)
+
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
@@ -10,13 +10,14 @@ from draftsman.classes.mixins import (
     CircuitConnectableMixin,
     EightWayDirectionalMixin,
 )
+from draftsman.constants import ValidationLevel
 from draftsman.error import DataFormatError
 from draftsman import signatures
 from draftsman.warning import DraftsmanWarning
 
+from draftsman import data
 from draftsman.data.entities import rail_chain_signals
 from draftsman.data.signals import signal_dict
-from draftsman.data import entities
 
 from schema import SchemaError
 import six
@@ -53,33 +54,44 @@ class RailChainSignal(
     _exports.update(ControlBehaviorMixin._exports)
     _exports.update(ReadRailSignalMixin._exports)
 
+    _control_behavior_signature = signatures.RAIL_CHAIN_SIGNAL_CONTROL_BEHAVIOR
+
     def __init__(self, name=rail_chain_signals[0], **kwargs):
         # type: (str, **dict) -> None
 
         # Set a (private) flag to indicate to the constructor to not generate
         # rotations, and rather just use the same collision set regardless of
         # rotation
+        profile = data.get_profile()
         self._disable_collision_set_rotation = True
 
-        super(RailChainSignal, self).__init__(name, rail_chain_signals, **kwargs)
+        super(RailChainSignal, self).__init__(
+            name, profile.entities.rail_chain_signals, **kwargs
+        )
 
-        if "collision_mask" in entities.raw[self.name]:  # pragma: no coverage
-            self._collision_mask = set(entities.raw[self.name]["collision_mask"])
+        if "collision_mask" in profile.entities.raw[self.name]:  # pragma: no coverage
+            self._collision_mask = set(
+                profile.entities.raw[self.name]["collision_mask"]
+            )
         else:  # pragma: no coverage
             self._collision_mask = {"floor-layer", "rail-layer", "item-layer"}
 
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
 
     # =========================================================================
 
     @ControlBehaviorMixin.control_behavior.setter
     def control_behavior(self, value):
         # type: (dict) -> None
+        if self.validation_level is ValidationLevel.NONE:
+            self._control_behavior = {} if value is None else value
+            return
         try:
             self._control_behavior = (
                 signatures.RAIL_CHAIN_SIGNAL_CONTROL_BEHAVIOR.validate(value)
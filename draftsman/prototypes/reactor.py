@@ -5,8 +5,10 @@ from __future__ import unicode_literals
 
 from draftsman.classes.entity import Entity
 from draftsman.classes.mixins import RequestItemsMixin
+from draftsman.constants import ValidationLevel
 from draftsman.warning import DraftsmanWarning
 
+from draftsman import data
 from draftsman.data.entities import reactors
 
 import warnings
@@ -30,11 +32,14 @@ class Reactor(RequestItemsMixin, Entity):
 
     def __init__(self, name=reactors[0], **kwargs):
         # type: (str, **dict) -> None
-        super(Reactor, self).__init__(name, reactors, **kwargs)
-
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        super(Reactor, self).__init__(
+            name, data.get_profile().entities.reactors, **kwargs
+        )
+
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
@@ -3,11 +3,13 @@
 
 from __future__ import unicode_literals
 
+from draftsman.constants import ValidationLevel
 from draftsman import signatures
 from draftsman.classes.entity import Entity
 from draftsman.classes.mixins import RequestItemsMixin
 from draftsman.warning import DraftsmanWarning
 
+from draftsman import data
 from draftsman.data.entities import rocket_silos
 
 import warnings
@@ -45,7 +47,9 @@ class RocketSilo(RequestItemsMixin, Entity):
 
     def __init__(self, name=rocket_silos[0], **kwargs):
         # type: (str, **dict) -> None
-        super(RocketSilo, self).__init__(name, rocket_silos, **kwargs)
+        super(RocketSilo, self).__init__(
+            name, data.get_profile().entities.rocket_silos, **kwargs
+        )
 
         self.auto_launch = None
         if "auto_launch" in kwargs:
@@ -53,12 +57,13 @@ class RocketSilo(RequestItemsMixin, Entity):
             self.unused_args.pop("auto_launch")
         # self._add_export("auto_launch", lambda x: x is not None)
 
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
 
     # =========================================================================
 
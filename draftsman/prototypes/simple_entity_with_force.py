@@ -1,8 +1,10 @@
 # simple_entity_with_force.py
 
 from draftsman.classes.entity import Entity
+from draftsman.constants import ValidationLevel
 from draftsman.warning import DraftsmanWarning
 
+from draftsman import data
 from draftsman.data import entities
 from draftsman.data.entities import simple_entities_with_force
 
@@ -29,7 +31,7 @@ class SimpleEntityWithForce(Entity):
     def __init__(self, name=simple_entities_with_force[0], **kwargs):
         # type: (str, **dict) -> None
         super(SimpleEntityWithForce, self).__init__(
-            name, simple_entities_with_force, **kwargs
+            name, data.get_profile().entities.simple_entities_with_force, **kwargs
         )
 
         self.variation = 1
@@ -37,12 +39,13 @@ class SimpleEntityWithForce(Entity):
             self.variation = kwargs["variation"]
             self.unused_args.pop("variation")
 
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
 
     @property
     def variation(self):
@@ -4,8 +4,10 @@
 from __future__ import unicode_literals
 
 from draftsman.classes.entity import Entity
+from draftsman.constants import ValidationLevel
 from draftsman.warning import DraftsmanWarning
 
+from draftsman import data
 from draftsman.data.entities import solar_panels
 
 import warnings
@@ -27,11 +29,14 @@ class SolarPanel(Entity):
 
     def __init__(self, name=solar_panels[0], **kwargs):
         # type: (str, **dict) -> None
-        super(SolarPanel, self).__init__(name, solar_panels, **kwargs)
-
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        super(SolarPanel, self).__init__(
+            name, data.get_profile().entities.solar_panels, **kwargs
+        )
+
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
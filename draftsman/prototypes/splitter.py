@@ -5,13 +5,12 @@ from __future__ import unicode_literals
 
 from draftsman.classes.entity import Entity
 from draftsman.classes.mixins import DirectionalMixin
+from draftsman.constants import ValidationLevel
 from draftsman.error import InvalidItemError, InvalidSideError
 from draftsman.warning import DraftsmanWarning
 
-from draftsman.data import items
-
+from draftsman import data
 from draftsman.data.entities import splitters
-from draftsman.data import entities
 
 import six
 import warnings
@@ -73,10 +72,13 @@ class Splitter(DirectionalMixin, Entity):
 
     def __init__(self, name=splitters[0], **kwargs):
         # type: (str, **dict) -> None
-        super(Splitter, self).__init__(name, splitters, **kwargs)
+        profile = data.get_profile()
+        super(Splitter, self).__init__(name, profile.entities.splitters, **kwargs)
 
-        if "collision_mask" in entities.raw[self.name]:  # pragma: no coverage
-            self._collision_mask = set(entities.raw[self.name]["collision_mask"])
+        if "collision_mask" in profile.entities.raw[self.name]:  # pragma: no coverage
+            self._collision_mask = set(
+                profile.entities.raw[self.name]["collision_mask"]
+            )
         else:  # pragma: no coverage
             self._collision_mask = {
                 "object-layer",
@@ -103,12 +105,13 @@ class Splitter(DirectionalMixin, Entity):
             self.unused_args.pop("filter")
         # self._add_export("filter", lambda x: x is not None)
 
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
 
     # =========================================================================
 
@@ -196,11 +199,12 @@ class Splitter(DirectionalMixin, Entity):
     @filter.setter
     def filter(self, value):
         # type: (str) -> None
+        profile = data.get_profile()
         if value is None:
             self._filter = value
         elif isinstance(value, six.string_types):
             value = six.text_type(value)
-            if value not in items.raw:
+            if value not in profile.items.raw:
                 raise InvalidItemError("'{}'".format(value))
             self._filter = value
         else:
@@ -5,8 +5,10 @@ from __future__ import unicode_literals
 
 from draftsman.classes.entity import Entity
 from draftsman.classes.mixins import CircuitConnectableMixin, DirectionalMixin
+from draftsman.constants import ValidationLevel
 from draftsman.warning import DraftsmanWarning
 
+from draftsman import data
 from draftsman.data.entities import storage_tanks
 
 import warnings
@@ -32,11 +34,14 @@ class StorageTank(CircuitConnectableMixin, DirectionalMixin, Entity):
 
     def __init__(self, name=storage_tanks[0], **kwargs):
         # type: (str, **dict) -> None
-        super(StorageTank, self).__init__(name, storage_tanks, **kwargs)
-
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        super(StorageTank, self).__init__(
+            name, data.get_profile().entities.storage_tanks, **kwargs
+        )
+
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
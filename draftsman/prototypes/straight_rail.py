@@ -3,19 +3,40 @@
 
 from __future__ import unicode_literals
 
-from draftsman.constants import Direction
-from draftsman.classes.collisionset import CollisionSet
+from draftsman.constants import Direction, ValidationLevel
+from draftsman.classes.collisionset import CollisionSet, get_collision_set_rotations
 from draftsman.classes.entity import Entity
 from draftsman.classes.mixins import DoubleGridAlignedMixin, EightWayDirectionalMixin
 from draftsman.utils import AABB, Rectangle
 from draftsman.warning import DraftsmanWarning
 
+from draftsman import data
 from draftsman.data.entities import straight_rails
-from draftsman.data import entities
 
 import warnings
 
 
+def _generate_collision_sets():
+    # type: () -> dict[int, CollisionSet]
+    """
+    Generates the collision sets of a straight rail for all 8 directions.
+    """
+    eps = 0.001
+    vertical_collision = CollisionSet([AABB(-0.75, -1.0 + eps, 0.75, 1.0 - eps)])
+    horizontal_collision = vertical_collision.rotate(2)
+    diagonal_collision = CollisionSet([Rectangle((-0.5, -0.5), 1.25, 1.40, 45)])
+    return {
+        Direction.NORTH: vertical_collision,
+        Direction.NORTHEAST: diagonal_collision.rotate(2),
+        Direction.EAST: horizontal_collision,
+        Direction.SOUTHEAST: diagonal_collision.rotate(4),
+        Direction.SOUTH: vertical_collision,
+        Direction.SOUTHWEST: diagonal_collision.rotate(-2),
+        Direction.WEST: horizontal_collision,
+        Direction.NORTHWEST: diagonal_collision,
+    }
+
+
 class StraightRail(DoubleGridAlignedMixin, EightWayDirectionalMixin, Entity):
     """
     A straight rail entity.
@@ -48,31 +69,23 @@ class StraightRail(DoubleGridAlignedMixin, EightWayDirectionalMixin, Entity):
 
         # We set a (private) flag to ignore the dummy collision box that
         # Factorio provides
+        profile = data.get_profile()
         self._overwritten_collision_set = True
-        # We then provide a list of all the custom rotations
-        eps = 0.001
-        vertical_collision = CollisionSet([AABB(-0.75, -1.0 + eps, 0.75, 1.0 - eps)])
-        horizontal_collision = vertical_collision.rotate(2)
-        diagonal_collision = CollisionSet([Rectangle((-0.5, -0.5), 1.25, 1.40, 45)])
-        self._collision_set = vertical_collision
-        self._collision_set_rotation = {}
-        self._collision_set_rotation[Direction.NORTH] = vertical_collision
-        self._collision_set_rotation[Direction.NORTHEAST] = diagonal_collision.rotate(2)
-        self._collision_set_rotation[Direction.EAST] = horizontal_collision
-        self._collision_set_rotation[Direction.SOUTHEAST] = diagonal_collision.rotate(4)
-        self._collision_set_rotation[Direction.SOUTH] = vertical_collision
-        self._collision_set_rotation[Direction.SOUTHWEST] = diagonal_collision.rotate(
-            -2
+        # We then provide a list of all the custom rotations, which are shared
+        # between all rails of the same name
+        self._collision_set_rotation = get_collision_set_rotations(
+            name, range(8), _generate_collision_sets
         )
-        self._collision_set_rotation[Direction.WEST] = horizontal_collision
-        self._collision_set_rotation[
-            Direction.NORTHWEST
-        ] = diagonal_collision  # .rotate(4)
+        self._collision_set = self._collision_set_rotation[Direction.NORTH]
 
-        super(StraightRail, self).__init__(name, straight_rails, **kwargs)
+        super(StraightRail, self).__init__(
+            name, profile.entities.straight_rails, **kwargs
+        )
 
-        if "collision_mask" in entities.raw[self.name]:  # pragma: no coverage
-            self._collision_mask = set(entities.raw[self.name]["collision_mask"])
+        if "collision_mask" in profile.entities.raw[self.name]:  # pragma: no coverage
+            self._collision_mask = set(
+                profile.entities.raw[self.name]["collision_mask"]
+            )
         else:  # pragma: no coverage
             self._collision_mask = {
                 "item-layer",
@@ -82,9 +95,10 @@ class StraightRail(DoubleGridAlignedMixin, EightWayDirectionalMixin, Entity):
                 "water-tile",
             }
 
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
@@ -14,10 +14,12 @@ from draftsman.classes.mixins import (
     DoubleGridAlignedMixin,
     DirectionalMixin,
 )
+from draftsman.constants import ValidationLevel
 from draftsman.error import DataFormatError
 from draftsman import signatures
 from draftsman.warning import DraftsmanWarning
 
+from draftsman import data
 from draftsman.data.entities import train_stops
 from draftsman.data.signals import signal_dict
 
@@ -91,8 +93,12 @@ class TrainStop(
         }
     )
 
-    def __init__(self, name=train_stops[0], similar_entities=train_stops, **kwargs):
+    _control_behavior_signature = signatures.TRAIN_STOP_CONTROL_BEHAVIOR
+
+    def __init__(self, name=train_stops[0], similar_entities=None, **kwargs):
         # type: (str, list[str], **dict) -> None
+        if similar_entities is None:
+            similar_entities = data.get_profile().entities.train_stops
         super(TrainStop, self).__init__(name, similar_entities, **kwargs)
 
         self.station = None
@@ -107,18 +113,22 @@ class TrainStop(
             self.unused_args.pop("manual_trains_limit")
         # self._add_export("manual_trains_limit", lambda x: x is not None)
 
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
 
     # =========================================================================
 
     @ControlBehaviorMixin.control_behavior.setter
     def control_behavior(self, value):
         # type: (dict) -> None
+        if self.validation_level is ValidationLevel.NONE:
+            self._control_behavior = {} if value is None else value
+            return
         try:
             self._control_behavior = signatures.TRAIN_STOP_CONTROL_BEHAVIOR.validate(
                 value
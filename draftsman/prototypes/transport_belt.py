@@ -13,12 +13,13 @@ from draftsman.classes.mixins import (
     CircuitConnectableMixin,
     DirectionalMixin,
 )
+from draftsman.constants import ValidationLevel
 from draftsman.error import DataFormatError
 from draftsman import signatures
 from draftsman.warning import DraftsmanWarning
 
+from draftsman import data
 from draftsman.data.entities import transport_belts
-from draftsman.data import entities
 
 from schema import SchemaError
 import six
@@ -62,12 +63,19 @@ class TransportBelt(
     _exports.update(CircuitConditionMixin._exports)
     _exports.update(CircuitReadContentsMixin._exports)
 
+    _control_behavior_signature = signatures.TRANSPORT_BELT_CONTROL_BEHAVIOR
+
     def __init__(self, name=transport_belts[0], **kwargs):
         # type: (str, **dict) -> None
-        super(TransportBelt, self).__init__(name, transport_belts, **kwargs)
+        profile = data.get_profile()
+        super(TransportBelt, self).__init__(
+            name, profile.entities.transport_belts, **kwargs
+        )
 
-        if "collision_mask" in entities.raw[self.name]:  # pragma: no coverage
-            self._collision_mask = set(entities.raw[self.name]["collision_mask"])
+        if "collision_mask" in profile.entities.raw[self.name]:  # pragma: no coverage
+            self._collision_mask = set(
+                profile.entities.raw[self.name]["collision_mask"]
+            )
         else:  # pragma: no coverage
             self._collision_mask = {
                 "object-layer",
@@ -76,18 +84,22 @@ class TransportBelt(
                 "water-tile",
             }
 
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
 
     # =========================================================================
 
     @ControlBehaviorMixin.control_behavior.setter
     def control_behavior(self, value):
         # type: (dict) -> None
+        if self.validation_level is ValidationLevel.NONE:
+            self._control_behavior = {} if value is None else value
+            return
         try:
             self._control_behavior = (
                 signatures.TRANSPORT_BELT_CONTROL_BEHAVIOR.validate(value)
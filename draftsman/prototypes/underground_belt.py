@@ -5,8 +5,10 @@ from __future__ import unicode_literals
 
 from draftsman.classes.entity import Entity
 from draftsman.classes.mixins import IOTypeMixin, DirectionalMixin
+from draftsman.constants import ValidationLevel
 from draftsman.warning import DraftsmanWarning
 
+from draftsman import data
 from draftsman.data.entities import underground_belts
 from draftsman.data import entities
 
@@ -33,10 +35,15 @@ class UndergroundBelt(IOTypeMixin, DirectionalMixin, Entity):
 
     def __init__(self, name=underground_belts[0], **kwargs):
         # type: (str, **dict) -> None
-        super(UndergroundBelt, self).__init__(name, underground_belts, **kwargs)
-
-        if "collision_mask" in entities.raw[self.name]:  # pragma: no coverage
-            self._collision_mask = set(entities.raw[self.name]["collision_mask"])
+        profile = data.get_profile()
+        super(UndergroundBelt, self).__init__(
+            name, profile.entities.underground_belts, **kwargs
+        )
+
+        if "collision_mask" in profile.entities.raw[self.name]:  # pragma: no coverage
+            self._collision_mask = set(
+                profile.entities.raw[self.name]["collision_mask"]
+            )
         else:  # pragma: no coverage
             self._collision_mask = {
                 "object-layer",
@@ -45,9 +52,10 @@ class UndergroundBelt(IOTypeMixin, DirectionalMixin, Entity):
                 "water-tile",
             }
 
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
@@ -10,10 +10,12 @@ from draftsman.classes.mixins import (
     ControlBehaviorMixin,
     CircuitConnectableMixin,
 )
+from draftsman.constants import ValidationLevel
 from draftsman.error import DataFormatError
 from draftsman import signatures
 from draftsman.warning import DraftsmanWarning
 
+from draftsman import data
 from draftsman.data.entities import walls
 from draftsman.data.signals import signal_dict
 
@@ -51,22 +53,28 @@ class Wall(
     _exports.update(EnableDisableMixin._exports)
     _exports.update(CircuitConditionMixin._exports)
 
+    _control_behavior_signature = signatures.WALL_CONTROL_BEHAVIOR
+
     def __init__(self, name=walls[0], **kwargs):
         # type: (str, **dict) -> None
-        super(Wall, self).__init__(name, walls, **kwargs)
+        super(Wall, self).__init__(name, data.get_profile().entities.walls, **kwargs)
 
-        for unused_arg in self.unused_args:
-            warnings.warn(
-                "{} has no attribute '{}'".format(type(self), unused_arg),
-                DraftsmanWarning,
-                stacklevel=2,
-            )
+        if self.validation_level is ValidationLevel.STRICT:
+            for unused_arg in self.unused_args:
+                warnings.warn(
+                    "{} has no attribute '{}'".format(type(self), unused_arg),
+                    DraftsmanWarning,
+                    stacklevel=2,
+                )
 
     # =========================================================================
 
     @ControlBehaviorMixin.control_behavior.setter
     def control_behavior(self, value):
         # type: (dict) -> None
+        if self.validation_level is ValidationLevel.NONE:
+            self._control_behavior = {} if value is None else value
+            return
         try:
             self._control_behavior = signatures.WALL_CONTROL_BEHAVIOR.validate(value)
         except SchemaError as e:
@@ -5,13 +5,19 @@
 Module of data formats, implemented as ``Schema`` objects. Used to validate and
 normalize data. Each one raises a ``SchemaError`` if the passed in data does not 
 match the data format specified, which is usually wrapped with ``DraftsmanError``.
+
+Each format is compiled into a :py:class:`.CompiledSchema` when this module is
+imported, which validates identically to the original ``Schema`` (accessible
+with ``.schema``) but runs much faster.
 """
 
 
 from __future__ import unicode_literals
 
 from draftsman.classes.association import Association
-from draftsman.data.signals import signal_dict
+from draftsman.classes.compiled_schema import CompiledSchema
+from draftsman.data.signals import signal_dict, interned_signal_dict
+from draftsman.error import InvalidSignalError
 
 from builtins import int
 from schema import Schema, Use, Optional, Or, And
@@ -86,8 +92,21 @@ COLOR = Schema(
 
 
 def normalize_signal_id(name):
+    # The SignalID is copied when it's validated, so it's safe to share
     if isinstance(name, six.string_types):
-        return signal_dict(name)
+        return interned_signal_dict(name)
+    else:
+        return name
+
+
+def normalize_signal_name(name):
+    # Used instead of validating with SIGNAL_ID when validation is disabled,
+    # so that known signals given by name are still exported as SignalIDs
+    if isinstance(name, six.string_types):
+        try:
+            return signal_dict(name)
+        except InvalidSignalError:
+            return name
     else:
         return name
 
@@ -716,3 +735,10 @@ SCHEDULES = Schema([SCHEDULE])
 #         ),
 #     )
 # )
+
+
+# Compile every data format defined above, replacing the original Schema
+for _name, _signature in list(globals().items()):
+    if isinstance(_signature, Schema):
+        globals()[_name] = CompiledSchema(_signature)
+del _name, _signature
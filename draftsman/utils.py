@@ -14,6 +14,7 @@ from draftsman.error import MalformedBlueprintStringError
 
 from abc import ABCMeta, abstractmethod
 import base64
+import copy
 import json
 import math
 from functools import wraps
@@ -21,6 +22,7 @@ import six
 import sys
 from typing import Any, Union
 import warnings
+import weakref
 import zlib
 
 # =============================================================================
@@ -168,6 +170,20 @@ class AABB(Shape):
             for point in self.points
         ]
 
+    def get_projections(self):
+        # type: () -> list[tuple[float, float]]
+        """
+        Returns the extent of this AABB's corners projected onto each of it's
+        normals, relative to it's position. Calculated once and cached.
+
+        :returns: A ``list`` of ``(min, max)`` tuples, one for each normal.
+        """
+        projections = getattr(self, "_projections", None)
+        if projections is None:
+            projections = local_projections(self.points, self.normals)
+            self._projections = projections
+        return projections
+
     def get_bounding_box(self):
         # type: () -> AABB
         """
@@ -273,16 +289,42 @@ class Rectangle(Shape):
         super(Rectangle, self).__init__(position)
         self.width = width
         self.height = height
-        self.angle = angle
 
         hw = width / 2
         hh = height / 2
         self.points = [[-hw, -hh], [hw, -hh], [hw, hh], [-hw, hh]]
 
+        # Setting the angle also calculates the rotated points and normals
+        self.angle = angle
+
+    @property
+    def angle(self):
+        # type: () -> float
+        """
+        The angle of rotation of the Rectangle, in degrees. Setting this value
+        recalculates the rotated corner points and the face normals of the
+        Rectangle, which are cached so that collision tests do not have to
+        recompute them every time.
+
+        :type: ``float``
+        """
+        return self._angle
+
+    @angle.setter
+    def angle(self, value):
+        # type: (float) -> None
+        self._angle = value
+
+        radians = math.radians(value)
+        self._rotated_points = tuple(
+            tuple(rotate_vector(point, radians)) for point in self.points
+        )
+        self._projections = None
+
         # Calculate normals
         self.normals = [0] * 4
-        rel_points = self.get_points()
-        for i in range(len(self.points)):
+        rel_points = self._rotated_points
+        for i in range(len(rel_points)):
             p1 = rel_points[i]
             p2 = rel_points[i + 1] if i < len(rel_points) - 1 else rel_points[0]
             edge = [p2[0] - p1[0], p2[1] - p1[1]]
@@ -301,14 +343,24 @@ class Rectangle(Shape):
         :returns: a ``list`` of 4 :py:class:`.Vector` objects for each of the
             Rectangle's corners.
         """
-        rot_points = [
-            rotate_vector(point, math.radians(self.angle)) for point in self.points
-        ]
         return [
             [point[0] + self.position[0], point[1] + self.position[1]]
-            for point in rot_points
+            for point in self._rotated_points
         ]
 
+    def get_projections(self):
+        # type: () -> list[tuple[float, float]]
+        """
+        Returns the extent of this Rectangle's corners projected onto each of
+        it's own normals, relative to it's position. Calculated once per angle
+        and cached.
+
+        :returns: A ``list`` of ``(min, max)`` tuples, one for each normal.
+        """
+        if self._projections is None:
+            self._projections = local_projections(self._rotated_points, self.normals)
+        return self._projections
+
     def get_bounding_box(self):
         # type: () -> AABB
         """
@@ -719,6 +771,27 @@ def is_separating_axis(a_points, b_points, axis):
     return False
 
 
+def local_projections(points, normals):
+    # type: (list[PrimitiveVector], list[PrimitiveVector]) -> list[tuple[float, float]]
+    """
+    Projects a set of points onto each of a set of normals, returning the
+    smallest and largest extent along each. Used to precompute the projections
+    of a shape onto it's own separating axes, which do not change when the shape
+    is translated.
+
+    :param points: The points to project.
+    :param normals: The axes to project the points onto.
+
+    :returns: A ``list`` of ``(min, max)`` tuples, one for each normal.
+    """
+    result = [0, 0]
+    projections = []
+    for normal in normals:
+        flatten_points_on(points, normal, result)
+        projections.append((result[0], result[1]))
+    return projections
+
+
 def rect_overlaps_rect(a, b):
     # type: (Rectangle, Rectangle) -> bool
     """
@@ -726,6 +799,9 @@ def rect_overlaps_rect(a, b):
     intersect with each other. Sourced from:
     `<https://github.com/qwertyquerty/collision/blob/master/collision/util.py>`_
 
+    The projections of each shape onto it's own normals are cached on the shape
+    and simply offset by it's position, so only the projections of the opposite
+    shape have to be calculated.
 
     :param a: The first :py:class:`.Recangle` to check.
     :param b: The second :py:class:`.Recangle` to check.
@@ -736,12 +812,19 @@ def rect_overlaps_rect(a, b):
     a_points = a.get_points()
     b_points = b.get_points()
 
-    for n in a.normals:
-        if is_separating_axis(a_points, b_points, n):
+    range_b = [0, 0]
+    for n, range_a in zip(a.normals, a.get_projections()):
+        offset = dot_product(a.position, n)
+        flatten_points_on(b_points, n, range_b)
+        # We use greater or equal than to allow separating lines on edges
+        if range_a[0] + offset >= range_b[1] or range_b[0] >= range_a[1] + offset:
             return False
 
-    for n in b.normals:
-        if is_separating_axis(a_points, b_points, n):
+    range_a = [0, 0]
+    for n, range_b in zip(b.normals, b.get_projections()):
+        offset = dot_product(b.position, n)
+        flatten_points_on(a_points, n, range_a)
+        if range_a[0] >= range_b[1] + offset or range_b[0] + offset >= range_a[1]:
             return False
 
     return True
@@ -863,3 +946,100 @@ def reissue_warnings(func):
         return result
 
     return inner
+
+
+# Types whose instances are never modified in place, and can be shared between
+# an object and its copy
+_atomic_types = (
+    type(None),
+    bool,
+    int,
+    float,
+    six.text_type,
+    bytes,
+    type,
+    weakref.ref,
+)
+if six.PY2:  # pragma: no coverage
+    _atomic_types += (long, str)  # noqa: F821
+
+# Cache of whether or not each class can be copied attribute by attribute
+_plain_types = {}
+
+
+def _is_plain_type(cls):
+    # type: (type) -> bool
+    """
+    Checks whether instances of ``cls`` can be copied by creating a new
+    instance and copying each attribute in it's ``__dict__``, which is what
+    ``copy.deepcopy`` does for classes that do not customize copying or
+    pickling. Only Draftsman's own classes are considered.
+    """
+    try:
+        return _plain_types[cls]
+    except KeyError:
+        plain = (
+            cls.__module__.split(".")[0] == "draftsman"
+            and getattr(cls, "__deepcopy__", None) is None
+            and cls.__reduce_ex__ is object.__reduce_ex__
+            and cls.__reduce__ is object.__reduce__
+            and getattr(cls, "__getstate__", None)
+            is getattr(object, "__getstate__", None)
+            and getattr(cls, "__setstate__", None) is None
+            and not any("__slots__" in vars(base) for base in cls.__mro__)
+        )
+        _plain_types[cls] = plain
+        return plain
+
+
+def clone_value(value, memo=None):
+    # type: (Any, dict) -> Any
+    """
+    Creates a deep copy of ``value``. Behaves like ``copy.deepcopy``, but
+    copies the types that make up the bulk of entity data (``dict``, ``list``,
+    ``set``, :py:class:`.Vector`, immutable primitives, and simple Draftsman
+    objects like shapes and collision sets) directly instead of going through
+    the generic ``deepcopy`` machinery, which is much faster. Anything else is
+    deepcopied with ``memo`` as usual.
+
+    Unlike ``copy.deepcopy``, a ``dict``, ``list``, ``set`` or ``Vector`` that
+    is referenced multiple times inside of ``value`` will be copied multiple
+    times. Other objects are tracked in ``memo`` and only copied once.
+
+    :param value: The object to copy.
+    :param memo: The memo ``dict`` to pass to ``copy.deepcopy``, if any.
+
+    :returns: A copy of ``value``.
+    """
+    atomic = _atomic_types
+    if isinstance(value, atomic):
+        return value
+
+    value_type = type(value)
+    # Atomic items are checked inline to avoid a function call for each one
+    if value_type is dict:
+        return {
+            k: v if isinstance(v, atomic) else clone_value(v, memo)
+            for k, v in value.items()
+        }
+    elif value_type is list:
+        return [v if isinstance(v, atomic) else clone_value(v, memo) for v in value]
+    elif value_type is set:
+        return {v if isinstance(v, atomic) else clone_value(v, memo) for v in value}
+    elif value_type is Vector:
+        return Vector(value.data[0], value.data[1])
+
+    if memo is None:
+        memo = {}
+    elif id(value) in memo:
+        return memo[id(value)]
+
+    if _is_plain_type(value_type):
+        result = value_type.__new__(value_type)
+        memo[id(value)] = result
+        result_dict = result.__dict__
+        for k, v in value.__dict__.items():
+            result_dict[k] = clone_value(v, memo)
+        return result
+    else:
+        return copy.deepcopy(value, memo)
@@ -0,0 +1,110 @@
+# validation.py
+# -*- encoding: utf-8 -*-
+
+"""
+Controls how much checking Draftsman does when data is set or imported. The
+current level applies to every object that doesn't specify its own; see
+:py:class:`.ValidationLevel` for what each level does. A
+``with validation.level(...)`` block only changes the level in the thread (or
+``asyncio`` task) that runs it.
+
+.. code-block:: python
+
+    from draftsman import validation
+
+    # Skip validation entirely for the rest of the program
+    validation.set_level("none")
+
+    # Or only for a particular block
+    with validation.level("minimal"):
+        blueprint = Blueprint(trusted_string)
+"""
+
+from __future__ import unicode_literals
+
+from draftsman.classes.context_local import ContextLocal
+from draftsman.constants import ValidationLevel
+
+from contextlib import contextmanager
+import six
+from typing import Union
+
+_level = ValidationLevel.STRICT
+# Set by `level()`, and takes precedence over `_level` in its context
+_context_level = ContextLocal("draftsman_validation_level")
+
+
+def to_level(value):
+    # type: (Union[ValidationLevel, str, int]) -> ValidationLevel
+    """
+    Converts a value to a :py:class:`.ValidationLevel`.
+
+    :param value: A ``ValidationLevel``, its integer value, or its name as a
+        case-insensitive string, such as ``"none"``, ``"minimal"``, or
+        ``"strict"``.
+
+    :returns: The corresponding ``ValidationLevel``.
+
+    :exception ValueError: If ``value`` does not correspond to any level.
+    """
+    if isinstance(value, six.string_types):
+        try:
+            return ValidationLevel[value.upper()]
+        except KeyError:
+            pass
+    elif not isinstance(value, bool):
+        try:
+            return ValidationLevel(value)
+        except ValueError:
+            pass
+    raise ValueError("'{}' is not a valid validation level".format(value))
+
+
+def get_level():
+    # type: () -> ValidationLevel
+    """
+    Gets the current validation level: the one set by :py:func:`level` in the
+    current context if there is one, or the process-wide level otherwise.
+
+    :returns: The current :py:class:`.ValidationLevel`.
+    """
+    value = _context_level.get()
+    if value is None:
+        return _level
+    return value
+
+
+def set_level(value):
+    # type: (Union[ValidationLevel, str, int]) -> None
+    """
+    Sets the process-wide validation level. Any level set by :py:func:`level`
+    still takes precedence inside of its ``with`` block.
+
+    :param value: The level to set, in any format accepted by
+        :py:func:`to_level`.
+
+    :exception ValueError: If ``value`` does not correspond to any level.
+    """
+    global _level
+    _level = to_level(value)
+
+
+@contextmanager
+def level(value):
+    # type: (Union[ValidationLevel, str, int]) -> None
+    """
+    Context manager that sets the validation level for the duration of a
+    ``with`` block, and restores the previous level afterwards. The level is
+    only changed in the current context, so other threads and ``asyncio``
+    tasks keep using their own level at the same time.
+
+    :param value: The level to set, in any format accepted by
+        :py:func:`to_level`.
+
+    :exception ValueError: If ``value`` does not correspond to any level.
+    """
+    token = _context_level.set(to_level(value))
+    try:
+        yield
+    finally:
+        _context_level.reset(token)
@@ -29,6 +29,10 @@ class ElectricPoleTesting(unittest.TestCase):
         with self.assertRaises(InvalidEntityError):
             ElectricPole("this is not an electric pole")
 
+    def test_supply_area_distance(self):
+        self.assertEqual(ElectricPole("small-electric-pole").supply_area_distance, 2.5)
+        self.assertEqual(ElectricPole("substation").supply_area_distance, 9)
+
     def test_mergable_with(self):
         group = Group()
         group.entities.append("small-electric-pole")
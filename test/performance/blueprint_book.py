@@ -0,0 +1,199 @@
+# blueprint_book.py
+
+"""
+Compares loading a large blueprint book with ``BlueprintBook(string)``, which
+constructs every blueprint inside of it one after another, against
+``BlueprintBook(string, processes=n)``, which constructs them in a pool of
+processes and pickles them back. The book is synthetic: blueprints of wired
+combinators, inserters and lamps, along with a deconstruction planner, an
+upgrade planner and a nested book, with the active index set to the last
+blueprint.
+
+Besides the total times, the costs that decide whether a pool pays off are
+measured separately for a single blueprint: constructing it, pickling it in a
+worker, unpickling it in this process, and starting the pool. Unpickling
+happens in this process no matter how many processes there are, so it limits
+the speedup; the estimate is the best case ignoring the pool's startup, and
+the crossover is the number of blueprints from which a pool of 2 processes is
+faster, given enough CPUs.
+"""
+
+from draftsman.blueprintable import (
+    Blueprint,
+    BlueprintBook,
+    DeconstructionPlanner,
+    UpgradePlanner,
+)
+
+import copy
+import gc
+import multiprocessing
+import pickle
+import timeit
+
+BLUEPRINTS = 200
+ENTITIES = 100
+
+
+def make_blueprint(n_entities):
+    # type: (int) -> Blueprint
+    """
+    Creates a Blueprint with roughly ``n_entities`` entities.
+    """
+    blueprint = Blueprint()
+    width = 50
+    for i in range(n_entities // 5):
+        x = (i % width) * 5
+        y = (i // width) * 2
+        blueprint.entities.append(
+            "decider-combinator",
+            tile_position=(x, y),
+            control_behavior={
+                "decider_conditions": {
+                    "first_signal": "signal-A",
+                    "comparator": ">",
+                    "constant": i,
+                    "output_signal": "signal-B",
+                    "copy_count_from_input": False,
+                }
+            },
+        )
+        blueprint.entities.append(
+            "arithmetic-combinator",
+            tile_position=(x + 1, y),
+            control_behavior={
+                "arithmetic_conditions": {
+                    "first_signal": "signal-B",
+                    "operation": "*",
+                    "second_constant": 2,
+                    "output_signal": "signal-C",
+                }
+            },
+        )
+        blueprint.entities.append(
+            "constant-combinator",
+            tile_position=(x + 2, y),
+            control_behavior={
+                "filters": [{"index": 1, "signal": "signal-A", "count": i}]
+            },
+        )
+        blueprint.entities.append(
+            "inserter",
+            tile_position=(x + 3, y),
+            control_behavior={
+                "circuit_enable_disable": True,
+                "circuit_condition": {
+                    "first_signal": "signal-C",
+                    "comparator": "<",
+                    "constant": 10,
+                },
+            },
+        )
+        blueprint.entities.append("small-lamp", tile_position=(x + 4, y))
+        blueprint.add_circuit_connection("red", -5, -4, 2, 1)
+        blueprint.add_circuit_connection("green", -3, -2)
+    return blueprint
+
+
+def make_book_string(n_blueprints, n_entities):
+    # type: (int, int) -> str
+    """
+    Creates a blueprint book string with ``n_blueprints`` blueprints of roughly
+    ``n_entities`` entities each.
+    """
+    blueprint = make_blueprint(n_entities)
+    book = BlueprintBook()
+    book.label = "Book benchmark"
+    for i in range(n_blueprints):
+        blueprint.label = "Blueprint {}".format(i)
+        book.blueprints.append(Blueprint(blueprint.to_dict()))
+    book.blueprints.insert(1, DeconstructionPlanner())
+    book.blueprints.insert(2, UpgradePlanner())
+    nested = BlueprintBook()
+    nested.blueprints.append(Blueprint(blueprint.to_dict()))
+    book.blueprints.append(nested)
+    book.active_index = n_blueprints + 1
+    return book.to_string()
+
+
+def time(function, *args):
+    # type: (callable, ...) -> float
+    gc.collect()
+    start = timeit.default_timer()
+    function(*args)
+    return timeit.default_timer() - start
+
+
+def time_each(function, inputs):
+    # type: (callable, list) -> float
+    """
+    Returns the average time ``function`` takes on each of ``inputs``.
+    """
+    gc.collect()
+    start = timeit.default_timer()
+    for value in inputs:
+        function(value)
+    return (timeit.default_timer() - start) / len(inputs)
+
+
+def start_pool():
+    # type: () -> None
+    pool = multiprocessing.Pool(2)
+    pool.map(abs, [0, 0])
+    pool.close()
+    pool.join()
+
+
+def main():
+    print(
+        "{} blueprints of {} entities, {} CPUs, '{}' start method".format(
+            BLUEPRINTS,
+            ENTITIES,
+            multiprocessing.cpu_count(),
+            multiprocessing.get_start_method(),
+        )
+    )
+
+    # Costs for a single blueprint
+    repeat = 20
+    blueprint_dict = make_blueprint(ENTITIES).to_dict()
+    construct = time_each(
+        Blueprint, [copy.deepcopy(blueprint_dict) for _ in range(repeat)]
+    )
+    blueprint = Blueprint(copy.deepcopy(blueprint_dict))
+    dump = time_each(lambda b: pickle.dumps(b, 2), [blueprint] * repeat)
+    load = time_each(pickle.loads, [pickle.dumps(blueprint, 2)] * repeat)
+    startup = min(time(start_pool) for _ in range(3))
+    print("\nPer blueprint:")
+    print("\t{:<24} {:>8.2f} ms".format("construct", construct * 1000))
+    print("\t{:<24} {:>8.2f} ms".format("pickle (worker)", dump * 1000))
+    print("\t{:<24} {:>8.2f} ms".format("unpickle (this process)", load * 1000))
+    print("\t{:<24} {:>8.2f} ms".format("start a pool of 2", startup * 1000))
+    print("\nBest case speedup:")
+    for processes in (2, 4, 8, 16):
+        parallel = max((construct + dump) / processes, load)
+        print("\t{:>2} processes {:>8.2f}x".format(processes, construct / parallel))
+    saved = construct - max((construct + dump) / 2, load)
+    print("Crossover with 2 processes: {:.0f} blueprints".format(startup / saved))
+
+    book_string = make_book_string(BLUEPRINTS, ENTITIES)
+    expected = BlueprintBook(book_string).to_dict()
+
+    # At least 2, so that the pool is measured even on a single CPU
+    pool_size = max(2, multiprocessing.cpu_count())
+    print("\n{:>12} {:>10} {:>10}".format("processes", "time (s)", "speedup"))
+    serial = None
+    for processes in (1, 2, pool_size) if pool_size > 2 else (1, 2):
+        book = [None]
+
+        def load_book():
+            book[0] = BlueprintBook(book_string, processes=processes)
+
+        elapsed = time(load_book)
+        assert book[0].to_dict() == expected
+        serial = serial or elapsed
+        print("{:>12} {:>10.3f} {:>9.2f}x".format(processes, elapsed, serial / elapsed))
+
+
+if __name__ == "__main__":
+    main()
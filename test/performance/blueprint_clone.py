@@ -0,0 +1,87 @@
+# blueprint_clone.py
+
+"""
+Compares ``Blueprint.clone()`` against ``copy.deepcopy(Blueprint)`` on
+blueprints of increasing size. Each blueprint contains rows of wired arithmetic
+combinators, a line of connected power poles, a grouped sub-assembly, and a
+tile underneath every entity. Both copies are checked to export the same data
+as the original.
+"""
+
+from draftsman.blueprintable import Blueprint
+from draftsman.classes.group import Group
+
+import copy
+import gc
+import timeit
+
+
+def make_blueprint(n_entities):
+    # type: (int) -> Blueprint
+    """
+    Creates a Blueprint with roughly ``n_entities`` entities and as many tiles.
+    """
+    blueprint = Blueprint()
+    width = 100
+    combinators = n_entities // 2
+    for i in range(combinators):
+        blueprint.entities.append(
+            "arithmetic-combinator", tile_position=(i % width, (i // width) * 2)
+        )
+    blueprint.connect_chain("red", range(combinators))
+
+    row = (combinators // width + 1) * 2
+    poles = n_entities // 4
+    for i in range(poles):
+        blueprint.entities.append(
+            "small-electric-pole", tile_position=(i % width, row + i // width)
+        )
+    for i in range(combinators, combinators + poles - 1):
+        if (i - combinators) % width != width - 1:
+            blueprint.add_power_connection(i, i + 1)
+
+    group = Group("group", position=(0, row + poles // width + 2))
+    for i in range(n_entities - combinators - poles):
+        group.entities.append("wooden-chest", tile_position=(i % width, i // width))
+    blueprint.entities.append(group, copy=False)
+
+    for x in range(width):
+        for y in range(n_entities // width):
+            blueprint.tiles.append("refined-concrete", position=(x, y))
+
+    return blueprint
+
+
+def time(function):
+    # type: (callable) -> float
+    gc.collect()
+    start = timeit.default_timer()
+    function()
+    return timeit.default_timer() - start
+
+
+def main():
+    sizes = [500, 1000, 2000, 4000, 8000]
+
+    print(
+        "{:>10} {:>14} {:>14} {:>10}".format(
+            "entities", "deepcopy (s)", "clone (s)", "speedup"
+        )
+    )
+    for n_entities in sizes:
+        blueprint = make_blueprint(n_entities)
+        expected = blueprint.to_dict()
+
+        deepcopy_time = time(lambda: copy.deepcopy(blueprint))
+        clone_time = time(blueprint.clone)
+        assert blueprint.clone().to_dict() == expected
+
+        print(
+            "{:>10} {:>14.3f} {:>14.3f} {:>9.1f}x".format(
+                n_entities, deepcopy_time, clone_time, deepcopy_time / clone_time
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+# blueprint_import.py
+
+"""
+Compares the time it takes to import a blueprint string with ``Blueprint(string)``
+when the data formats in :py:mod:`draftsman.signatures` are validated by the
+compiled validators (the default) versus the original ``schema.Schema`` objects.
+The blueprint contains a mix of wired combinators, inserters with circuit
+conditions, lamps and poles, so that most of the common signatures are
+exercised.
+"""
+
+from draftsman import signatures
+from draftsman.blueprintable import Blueprint
+from draftsman.classes.compiled_schema import CompiledSchema
+
+import gc
+import timeit
+
+
+def make_blueprint_string(n_entities):
+    # type: (int) -> str
+    """
+    Creates a blueprint string with roughly ``n_entities`` entities.
+    """
+    blueprint = Blueprint()
+    blueprint.label = "Import benchmark"
+    blueprint.icons = ["decider-combinator", "signal-A"]
+    width = 50
+    for i in range(n_entities // 5):
+        x = (i % width) * 6
+        y = (i // width) * 2
+        blueprint.entities.append(
+            "decider-combinator",
+            tile_position=(x, y),
+            control_behavior={
+                "decider_conditions": {
+                    "first_signal": "signal-A",
+                    "comparator": ">",
+                    "constant": i,
+                    "output_signal": "signal-B",
+                    "copy_count_from_input": False,
+                }
+            },
+        )
+        blueprint.entities.append(
+            "arithmetic-combinator",
+            tile_position=(x + 1, y),
+            control_behavior={
+                "arithmetic_conditions": {
+                    "first_signal": "signal-B",
+                    "operation": "*",
+                    "second_constant": 2,
+                    "output_signal": "signal-C",
+                }
+            },
+        )
+        blueprint.entities.append(
+            "constant-combinator",
+            tile_position=(x + 2, y),
+            control_behavior={
+                "filters": [
+                    {"index": 1, "signal": "signal-A", "count": i},
+                    {"index": 2, "signal": "iron-plate", "count": 100},
+                ]
+            },
+        )
+        blueprint.entities.append(
+            "inserter",
+            tile_position=(x + 3, y),
+            control_behavior={
+                "circuit_enable_disable": True,
+                "circuit_condition": {
+                    "first_signal": "signal-C",
+                    "comparator": "<",
+                    "constant": 10,
+                },
+            },
+        )
+        blueprint.entities.append(
+            "small-lamp",
+            tile_position=(x + 4, y),
+            control_behavior={"use_colors": True},
+        )
+        blueprint.add_circuit_connection("red", -5, -4, 2, 1)
+        blueprint.add_circuit_connection("green", -3, -2)
+        blueprint.add_circuit_connection("green", -2, -1)
+    return blueprint.to_string()
+
+
+# Every compiled signature, by name
+compiled_signatures = {
+    name: value
+    for name, value in vars(signatures).items()
+    if isinstance(value, CompiledSchema)
+}
+
+
+def use_schemas(compiled):
+    # type: (bool) -> None
+    """
+    Switches every signature between its compiled validator and the
+    ``Schema`` it was compiled from.
+    """
+    for name, value in compiled_signatures.items():
+        setattr(signatures, name, value if compiled else value.schema)
+
+
+def time(function):
+    # type: (callable) -> float
+    gc.collect()
+    start = timeit.default_timer()
+    function()
+    return timeit.default_timer() - start
+
+
+def main():
+    sizes = [500, 1000, 2000, 4000]
+
+    print(
+        "{:>10} {:>12} {:>14} {:>10}".format(
+            "entities", "schema (s)", "compiled (s)", "speedup"
+        )
+    )
+    for n_entities in sizes:
+        blueprint_string = make_blueprint_string(n_entities)
+
+        use_schemas(compiled=False)
+        try:
+            schema_time = time(lambda: Blueprint(blueprint_string))
+            expected = Blueprint(blueprint_string).to_dict()
+        finally:
+            use_schemas(compiled=True)
+        compiled_time = time(lambda: Blueprint(blueprint_string))
+        assert Blueprint(blueprint_string).to_dict() == expected
+
+        print(
+            "{:>10} {:>12.3f} {:>14.3f} {:>9.1f}x".format(
+                n_entities, schema_time, compiled_time, schema_time / compiled_time
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
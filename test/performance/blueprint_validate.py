@@ -0,0 +1,106 @@
+# blueprint_validate.py
+
+"""
+Compares building a large generated blueprint with every check made as it is
+modified (``validation_level="strict"``) against building it with no checks at
+all (``validation_level="none"``) and checking it once at the end with
+:py:meth:`.Blueprint.validate`. The blueprint is a grid of assembling machines
+with recipes and modules, fed by inserters from chests, powered by wired medium
+electric poles and monitored by circuit-connected combinators.
+"""
+
+from draftsman.blueprintable import Blueprint
+
+import gc
+import timeit
+
+
+def build_blueprint(n_cells, validation_level):
+    # type: (int, str) -> Blueprint
+    """
+    Builds a blueprint out of ``n_cells`` cells of 5 entities each.
+    """
+    blueprint = Blueprint(validation_level=validation_level)
+    width = 40
+    for i in range(n_cells):
+        x = (i % width) * 6
+        y = (i // width) * 6
+        blueprint.entities.append(
+            "assembling-machine-2",
+            tile_position=(x, y),
+            recipe="iron-gear-wheel",
+            items={"speed-module": 2},
+        )
+        blueprint.entities.append(
+            "wooden-chest", tile_position=(x + 3, y), items={"iron-plate": 100}
+        )
+        blueprint.entities.append(
+            "fast-inserter",
+            tile_position=(x + 3, y + 1),
+            control_behavior={
+                "circuit_enable_disable": True,
+                "circuit_condition": {
+                    "first_signal": {"name": "iron-plate", "type": "item"},
+                    "comparator": ">",
+                    "constant": 10,
+                },
+            },
+        )
+        blueprint.entities.append("medium-electric-pole", tile_position=(x + 4, y + 2))
+        blueprint.entities.append(
+            "constant-combinator",
+            tile_position=(x + 3, y + 2),
+            control_behavior={
+                "filters": [
+                    {
+                        "index": 1,
+                        "signal": {"name": "signal-A", "type": "virtual"},
+                        "count": i,
+                    }
+                ]
+            },
+        )
+        blueprint.add_circuit_connection("red", -1, -3)
+        blueprint.add_circuit_connection("green", -4, -3)
+        if i % width:
+            blueprint.add_power_connection(-2, -7)
+    return blueprint
+
+
+def time(function):
+    # type: (callable) -> float
+    gc.collect()
+    start = timeit.default_timer()
+    function()
+    return timeit.default_timer() - start
+
+
+def main():
+    sizes = [200, 400, 800, 1600]
+
+    print(
+        "{:>10} {:>12} {:>10} {:>14} {:>12}".format(
+            "entities", "strict (s)", "none (s)", "validate (s)", "of strict"
+        )
+    )
+    for n_cells in sizes:
+        strict_time = time(lambda: build_blueprint(n_cells, "strict"))
+        none_time = time(lambda: build_blueprint(n_cells, "none"))
+
+        blueprint = build_blueprint(n_cells, "none")
+        validate_time = time(blueprint.validate)
+        assert len(blueprint.validate()) == 0
+
+        print(
+            "{:>10} {:>12.3f} {:>10.3f} {:>14.3f} {:>12.0%}".format(
+                n_cells * 5,
+                strict_time,
+                none_time,
+                validate_time,
+                validate_time / strict_time,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
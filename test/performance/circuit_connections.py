@@ -0,0 +1,78 @@
+# circuit_connections.py
+
+"""
+Benchmark comparing ``EntityCollection.add_circuit_connection()`` against the
+bulk ``connect_chain()`` and ``connect_pairs()`` methods. Creates a row of
+arithmetic combinators of increasing length and times how long it takes to wire
+every combinator to the next one with each approach.
+"""
+
+from draftsman.blueprintable import Blueprint
+
+import gc
+import timeit
+
+
+def make_combinator_row(n_combinators):
+    # type: (int) -> Blueprint
+    """
+    Creates a Blueprint with a horizontal row of ``n_combinators`` arithmetic
+    combinators.
+    """
+    blueprint = Blueprint()
+    for i in range(n_combinators):
+        blueprint.entities.append("arithmetic-combinator", tile_position=(i, 0))
+    return blueprint
+
+
+def wire_individually(blueprint):
+    # type: (Blueprint) -> None
+    for i in range(len(blueprint.entities) - 1):
+        blueprint.add_circuit_connection("red", i, i + 1)
+
+
+def wire_chain(blueprint):
+    # type: (Blueprint) -> None
+    blueprint.connect_chain("red", range(len(blueprint.entities)))
+
+
+def wire_pairs(blueprint):
+    # type: (Blueprint) -> None
+    blueprint.connect_pairs(
+        "red", [(i, i + 1) for i in range(len(blueprint.entities) - 1)]
+    )
+
+
+def main():
+    sizes = [125, 250, 500, 1000, 2000]
+    methods = [
+        ("add_circuit_connection", wire_individually),
+        ("connect_chain", wire_chain),
+        ("connect_pairs", wire_pairs),
+    ]
+
+    print(
+        "{:>12} {:>24} {:>12} {:>10}".format(
+            "combinators", "method", "seconds", "speedup"
+        )
+    )
+    for n_combinators in sizes:
+        baseline = None
+        for name, method in methods:
+            blueprint = make_combinator_row(n_combinators)
+            gc.collect()
+            start = timeit.default_timer()
+            method(blueprint)
+            elapsed = timeit.default_timer() - start
+
+            if baseline is None:
+                baseline = elapsed
+            print(
+                "{:>12} {:>24} {:>12.4f} {:>9.1f}x".format(
+                    n_combinators, name, elapsed, baseline / elapsed
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# connections_export.py
+
+"""
+Scaling benchmark for exporting, importing and copying heavily wired
+blueprints. Creates rows of arithmetic combinators of increasing length, wires
+every combinator to the next one with both colors, and times
+``Blueprint.to_dict()``, ``Blueprint(dict)`` and ``copy.deepcopy(Blueprint)``.
+If each operation scales with the number of connections, the time spent per
+combinator should stay roughly constant as the number of combinators grows.
+"""
+
+from draftsman.blueprintable import Blueprint
+
+import copy
+import gc
+import timeit
+
+
+def make_wired_row(n_combinators):
+    # type: (int) -> Blueprint
+    """
+    Creates a Blueprint with a row of ``n_combinators`` arithmetic combinators,
+    each connected to the next with red and green wire.
+    """
+    blueprint = Blueprint()
+    for i in range(n_combinators):
+        blueprint.entities.append("arithmetic-combinator", tile_position=(i, 0))
+    blueprint.connect_chain("red", range(n_combinators), side=1)
+    blueprint.connect_chain("green", range(n_combinators), side=2)
+    return blueprint
+
+
+def time(function):
+    # type: (callable) -> float
+    gc.collect()
+    start = timeit.default_timer()
+    function()
+    return timeit.default_timer() - start
+
+
+def main():
+    sizes = [500, 1000, 2000, 4000, 8000]
+
+    print(
+        "{:>12} {:>14} {:>14} {:>14}".format(
+            "combinators", "to_dict (us)", "import (us)", "deepcopy (us)"
+        )
+    )
+    for n_combinators in sizes:
+        blueprint = make_wired_row(n_combinators)
+        export_time = time(blueprint.to_dict)
+        data = blueprint.to_dict()
+        import_time = time(lambda: Blueprint(data))
+        copy_time = time(lambda: copy.deepcopy(blueprint))
+
+        print(
+            "{:>12} {:>14.2f} {:>14.2f} {:>14.2f}   (per combinator)".format(
+                n_combinators,
+                export_time / n_combinators * 1e6,
+                import_time / n_combinators * 1e6,
+                copy_time / n_combinators * 1e6,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# data_import.py
+
+"""
+Times a handful of typical jobs in fresh interpreters, now that the modules in
+:py:mod:`draftsman.data` only unpickle their data when it is first accessed.
+Each job is also run after loading every data module up front, which is what
+importing them used to cost, so the difference is the time saved by jobs that
+never touch some of the data.
+"""
+
+import subprocess
+import sys
+
+DATA_MODULES = [
+    "entities",
+    "instruments",
+    "items",
+    "mods",
+    "modules",
+    "recipes",
+    "signals",
+    "tiles",
+]
+
+# Loads every data module the way importing them used to
+LOAD_ALL = "; ".join(
+    "import draftsman.data.{0}; draftsman.data.{0}._load()".format(module)
+    for module in DATA_MODULES
+)
+
+JOBS = [
+    ("import draftsman", "import draftsman"),
+    (
+        "decode string",
+        "from draftsman import utils; "
+        "utils.JSON_to_string({'blueprint': {'item': 'blueprint'}})",
+    ),
+    (
+        "tiles only",
+        "from draftsman.classes.tile import Tile; Tile('concrete').to_dict()",
+    ),
+    (
+        "signals only",
+        "from draftsman.data.signals import signal_dict; signal_dict('signal-A')",
+    ),
+    ("import draftsman.entity", "import draftsman.entity"),
+]
+
+
+def time_job(statement, setup="pass", repeat=5):
+    # type: (str, str, int) -> float
+    """
+    Returns the fastest of ``repeat`` runs of ``statement`` in a new
+    interpreter, after running ``setup`` in that interpreter, including the
+    time it took to import anything.
+    """
+    script = (
+        "import timeit\n"
+        "start = timeit.default_timer()\n"
+        "{}\n"
+        "{}\n"
+        "print(timeit.default_timer() - start)\n"
+    ).format(setup, statement)
+    best = float("inf")
+    for _ in range(repeat):
+        output = subprocess.check_output([sys.executable, "-c", script])
+        best = min(best, float(output))
+    return best
+
+
+def main():
+    print("{:>25} {:>12} {:>12}".format("", "lazy (s)", "eager (s)"))
+    for label, statement in JOBS:
+        lazy = time_job(statement)
+        eager = time_job(statement, setup=LOAD_ALL)
+        print("{:>25} {:>12.3f} {:>12.3f}".format(label, lazy, eager))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+# entity_import.py
+
+"""
+Times cold starts of scripts that only use a few kinds of entities, in fresh
+interpreters, now that :py:mod:`draftsman.entity` only imports the modules in
+:py:mod:`draftsman.prototypes` that are actually used. Each job is also run
+after importing every prototype up front, which is what importing
+:py:mod:`draftsman.entity` used to do.
+"""
+
+from test.performance.data_import import time_job
+
+# Imports every prototype the way importing draftsman.entity used to
+IMPORT_ALL = (
+    "import draftsman.entity; "
+    "[getattr(draftsman.entity, p[0]) for p in draftsman.entity._prototypes]"
+)
+
+JOBS = [
+    ("import draftsman.entity", "import draftsman.entity"),
+    (
+        "belts and inserters",
+        "from draftsman.entity import new_entity; "
+        "new_entity('transport-belt'); new_entity('fast-inserter')",
+    ),
+    (
+        "from ... import class",
+        "from draftsman.entity import TransportBelt, Inserter; "
+        "TransportBelt(); Inserter()",
+    ),
+    (
+        "blueprint of belts",
+        "from draftsman.blueprintable import Blueprint; "
+        "blueprint = Blueprint(); "
+        "[blueprint.entities.append('transport-belt', tile_position=(i, 0)) "
+        "for i in range(10)]; "
+        "blueprint.to_string()",
+    ),
+]
+
+
+def main():
+    print("{:>25} {:>12} {:>12}".format("", "lazy (s)", "eager (s)"))
+    for label, statement in JOBS:
+        lazy = time_job(statement)
+        eager = time_job(statement, setup=IMPORT_ALL)
+        print("{:>25} {:>12.3f} {:>12.3f}".format(label, lazy, eager))
+
+
+if __name__ == "__main__":
+    main()
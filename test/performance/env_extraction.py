@@ -0,0 +1,88 @@
+# env_extraction.py
+
+"""
+Times the extraction stage of :py:func:`draftsman.env.update`, running every
+extraction function one after another in this process against running them in
+a pool of processes. ``factorio-data`` isn't needed; instead, a ``data.raw`` is
+rebuilt from the prototypes already in :py:mod:`draftsman.data`, so the
+absolute times are smaller than for a real ``data.raw``.
+"""
+
+from draftsman import env
+from draftsman.data import entities, items, modules, recipes, signals, tiles
+
+from collections import defaultdict
+import copy
+import multiprocessing
+import os
+import pickle
+import shutil
+import tempfile
+import timeit
+
+
+def rebuild_data_raw():
+    # type: () -> dict
+    """
+    Rebuilds a ``data.raw`` from the prototypes in :py:mod:`draftsman.data`,
+    grouped by type and name. Prototype types that draftsman doesn't keep are
+    empty.
+    """
+    data_raw = defaultdict(dict)
+
+    def add(prototype):
+        data_raw[prototype["type"]][prototype["name"]] = copy.deepcopy(prototype)
+
+    for prototypes in (entities.raw, items.raw, recipes.raw, signals.raw, tiles.raw):
+        for name in prototypes:
+            add(prototypes[name])
+    # Groups and subgroups also hold the items sorted into them; strip those
+    for group in items.groups.values():
+        add({k: v for k, v in group.items() if k != "subgroups"})
+    for subgroup in items.subgroups.values():
+        add({k: v for k, v in subgroup.items() if k != "items"})
+    for category in recipes.categories:
+        add({"type": "recipe-category", "name": category})
+    for category in modules.categories:
+        add({"type": "module-category", "name": category})
+
+    return data_raw
+
+
+def main():
+    directory = tempfile.mkdtemp()
+    try:
+        snapshot_path = os.path.join(directory, "data-raw.pkl")
+        with open(snapshot_path, "wb") as out:
+            pickle.dump(rebuild_data_raw(), out, 2)
+        with open(snapshot_path, "rb") as inp:
+            items = env.get_items(pickle.load(inp))
+
+        # At least 2, so that the pool is measured even on a single CPU
+        pool_size = max(2, multiprocessing.cpu_count())
+        results = {}
+        for processes in (1, pool_size):
+            best = float("inf")
+            for _ in range(5):
+                start = timeit.default_timer()
+                timings = env.run_extractors(
+                    env.extractors, snapshot_path, items, directory, False, processes
+                )
+                best = min(best, timeit.default_timer() - start)
+            results[processes] = best, timings
+
+        serial, serial_timings = results[1]
+        parallel, parallel_timings = results[pool_size]
+        print("{} processes".format(pool_size))
+        print("{:>22} {:>14} {:>14}".format("", "serial (s)", "parallel (s)"))
+        for (name, serial_time), (_, parallel_time) in zip(
+            serial_timings, parallel_timings
+        ):
+            print("{:>22} {:>14.4f} {:>14.4f}".format(name, serial_time, parallel_time))
+        print("{:>22} {:>14.4f} {:>14.4f}".format("total", serial, parallel))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
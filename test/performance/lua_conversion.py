@@ -0,0 +1,85 @@
+# lua_conversion.py
+
+"""
+Compares converting ``data.raw`` from Lua to Python with the recursive
+:py:func:`draftsman.env.convert_table_to_dict` against
+:py:class:`draftsman.env.LuaTableConverter`. ``factorio-data`` isn't needed;
+instead, the vanilla ``data.raw`` is rebuilt from the prototypes in
+:py:mod:`draftsman.data` and copied into a Lua runtime.
+
+Factorio prototypes often share sub-tables, like sprites and sounds, which the
+rebuilt ``data.raw`` doesn't; so the "shared" case also gives every prototype a
+reference to the same copy of the largest prototype, to show the effect of
+converting each table once.
+"""
+
+from draftsman.env import LuaTableConverter, convert_table_to_dict, lupa
+from draftsman.data import entities
+
+from test.performance.env_extraction import rebuild_data_raw
+
+import timeit
+
+SHARE = """
+local raw = ...
+local shared = nil
+local size = 0
+for _, prototypes in pairs(raw) do
+    for _, prototype in pairs(prototypes) do
+        local count = 0
+        for _ in pairs(prototype) do count = count + 1 end
+        if count > size then shared, size = prototype, count end
+    end
+end
+for _, prototypes in pairs(raw) do
+    for _, prototype in pairs(prototypes) do
+        if prototype ~= shared then
+            prototype.shared = shared
+        end
+    end
+end
+"""
+
+
+def best_of(function, repeat=5):
+    # type: (callable, int) -> float
+    best = float("inf")
+    for _ in range(repeat):
+        start = timeit.default_timer()
+        function()
+        best = min(best, timeit.default_timer() - start)
+    return best
+
+
+def main():
+    data_raw = {key: dict(value) for key, value in rebuild_data_raw().items()}
+    entity_types = {prototype["type"] for prototype in entities.raw.values()}
+
+    print(
+        "{:>10} {:>14} {:>14} {:>14}".format(
+            "", "recursive (s)", "converter (s)", "lazy (s)"
+        )
+    )
+    for label in ("vanilla", "shared"):
+        lua = lupa.LuaRuntime(unpack_returned_tuples=True)
+        raw = lua.table_from(data_raw, recursive=True)
+        if label == "shared":
+            lua.execute(SHARE, raw)
+
+        def lazy():
+            # Only the entities
+            converted = LuaTableConverter(lua).convert_lazy(raw)
+            for entity_type in entity_types:
+                converted[entity_type]
+
+        recursive = best_of(lambda: convert_table_to_dict(raw))
+        converter = best_of(lambda: LuaTableConverter(lua).convert(raw))
+        print(
+            "{:>10} {:>14.4f} {:>14.4f} {:>14.4f}".format(
+                label, recursive, converter, best_of(lazy)
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# mod_archive.py
+
+"""
+Compares resolving ``require()`` calls from a mod archive the way
+:py:func:`draftsman.env.python_require` used to, by trying to open every
+candidate path in the ``zipfile`` and catching the ``KeyError`` for each miss,
+against the indexed and cached :py:class:`draftsman.env.ModArchive`. The mod is
+a synthetic archive of 500 Lua files, each required 4 times, with the module
+found by the last of 4 ``package.path`` patterns.
+"""
+
+from draftsman import env
+
+import os
+import shutil
+import tempfile
+import timeit
+import zipfile
+
+FILES = 500
+REQUIRES = 4
+
+LOCATION = "./factorio-mods/big-mod_1.0.0"
+PACKAGE_PATH = ";".join(
+    [
+        "./draftsman/?.lua",
+        "./draftsman/factorio-data/core/lualib/?.lua",
+        "?.lua",
+        LOCATION + "/?.lua",
+    ]
+)
+
+
+def old_python_require(mod, module_name, package_path):
+    # The previous implementation, for comparison
+    for filepath in package_path.split(";"):
+        filepath = filepath.replace("?", module_name)
+        filepath = filepath.replace("\\", "/")
+        filepath = filepath.replace(mod.location, mod.internal_folder)
+        try:
+            string_contents = env.archive_to_string(mod.files, filepath)
+            fixed_filepath = os.path.dirname(filepath[filepath.find("/") :])
+            return string_contents, fixed_filepath
+        except KeyError:
+            pass
+    return None, "no file '{}' found in '{}' archive".format(module_name, mod.name)
+
+
+def make_mod(files):
+    return env.Mod(
+        name="big-mod",
+        internal_folder="big-mod_1.0.0",
+        version="1.0.0",
+        archive=True,
+        location=LOCATION,
+        info=None,
+        files=files,
+        data={},
+    )
+
+
+def main():
+    directory = tempfile.mkdtemp()
+    try:
+        filepath = os.path.join(directory, "big-mod_1.0.0.zip")
+        with zipfile.ZipFile(filepath, "w", zipfile.ZIP_DEFLATED) as out:
+            for i in range(FILES):
+                out.writestr(
+                    "big-mod_1.0.0/prototypes/file-{}.lua".format(i),
+                    "local t = {}\n" * 100 + "return t\n",
+                )
+        modules = ["prototypes/file-{}".format(i) for i in range(FILES)] * REQUIRES
+
+        def old():
+            mod = make_mod(zipfile.ZipFile(filepath))
+            for module in modules:
+                old_python_require(mod, module, PACKAGE_PATH)
+
+        def new():
+            mod = make_mod(env.ModArchive(filepath))
+            for module in modules:
+                env.python_require(mod, None, module, PACKAGE_PATH)
+
+        print("{} requires of {} files".format(len(modules), FILES))
+        print("{:>20} {:>10.4f} s".format("zipfile", min(timeit.repeat(old, number=1))))
+        print(
+            "{:>20} {:>10.4f} s".format("ModArchive", min(timeit.repeat(new, number=1)))
+        )
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
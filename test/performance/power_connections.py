@@ -0,0 +1,56 @@
+# power_connections.py
+
+"""
+Scaling benchmark for ``EntityCollection.generate_power_connections()``.
+Creates square grids of electric poles of increasing size and times how long it
+takes to connect them. If the algorithm scales near-linearly, the time spent per
+pole should stay roughly constant as the number of poles grows.
+"""
+
+from draftsman.blueprintable import Blueprint
+
+import gc
+import math
+import timeit
+
+
+def make_pole_grid(n_poles, spacing=7):
+    # type: (int, int) -> Blueprint
+    """
+    Creates a Blueprint with a square grid of ``n_poles`` small electric poles.
+    """
+    blueprint = Blueprint()
+    side = int(math.ceil(math.sqrt(n_poles)))
+    for i in range(n_poles):
+        x, y = i % side, i // side
+        blueprint.entities.append(
+            "small-electric-pole", tile_position=(x * spacing, y * spacing)
+        )
+    return blueprint
+
+
+def main():
+    sizes = [250, 500, 1000, 2000, 4000]
+
+    print("{:>8} {:>12} {:>16}".format("poles", "seconds", "us per pole"))
+    previous = None
+    for n_poles in sizes:
+        blueprint = make_pole_grid(n_poles)
+        gc.collect()
+        start = timeit.default_timer()
+        blueprint.generate_power_connections()
+        elapsed = timeit.default_timer() - start
+
+        line = "{:>8} {:>12.4f} {:>16.2f}".format(
+            n_poles, elapsed, elapsed / n_poles * 1e6
+        )
+        if previous is not None:
+            line += "   (x{:.2f} time for x{:.2f} poles)".format(
+                elapsed / previous[1], n_poles / float(previous[0])
+            )
+        print(line)
+        previous = (n_poles, elapsed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# power_coverage.py
+
+"""
+Scaling benchmark for ``PowerCoverage``. Lays out a square field of inserters
+covered by a grid of medium electric poles wired together in rows, leaving one
+strip of the field without poles, and times the full analysis (rasterizing
+supply areas, finding copper networks, and reporting uncovered entities). If
+the analysis scales with the number of entities, the time spent per entity
+should stay roughly constant as the field grows.
+"""
+
+from draftsman.classes.association import Association
+from draftsman.classes.power_coverage import PowerCoverage
+from draftsman.entity import new_entity
+
+import gc
+import math
+import timeit
+
+
+def make_field(n_entities):
+    # type: (int) -> list
+    """
+    Creates a flat list of roughly ``n_entities`` inserters and poles. The
+    entities are not placed in a Blueprint, so that only the analysis is timed.
+    """
+    width = int(math.sqrt(n_entities))
+    entities = []
+    for y in range(width):
+        row = []
+        for x in range(width):
+            # A medium pole every 7 tiles supplies a 7x7 square
+            if x % 7 == 3 and y % 7 == 3 and x < width - 7:
+                pole = new_entity("medium-electric-pole", tile_position=(x, y))
+                if row:
+                    pole.neighbours.append(Association(row[-1]))
+                    row[-1].neighbours.append(Association(pole))
+                row.append(pole)
+                entities.append(pole)
+            else:
+                entities.append(new_entity("inserter", tile_position=(x, y)))
+    return entities
+
+
+def time(function):
+    # type: (callable) -> float
+    gc.collect()
+    start = timeit.default_timer()
+    function()
+    return timeit.default_timer() - start
+
+
+def main():
+    sizes = [10000, 25000, 50000, 100000]
+
+    print(
+        "{:>10} {:>12} {:>12} {:>14}".format(
+            "entities", "uncovered", "total (s)", "per entity (us)"
+        )
+    )
+    for n_entities in sizes:
+        entities = make_field(n_entities)
+        result = {}
+
+        def analyze():
+            coverage = PowerCoverage(entities)
+            result["uncovered"] = coverage.get_uncovered_entities()
+
+        analysis_time = time(analyze)
+        print(
+            "{:>10} {:>12} {:>12.3f} {:>14.2f}".format(
+                len(entities),
+                len(result["uncovered"]),
+                analysis_time,
+                analysis_time / len(entities) * 1e6,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# prototype_database.py
+
+"""
+Compares loading ``entities.raw`` and ``tiles.raw`` as monolithic pickles, which
+is how :py:mod:`draftsman.data` stored them before, against opening them as
+memory-mapped :py:class:`.PrototypeDatabase` files and looking up a handful of
+prototypes. Each case is run in a fresh interpreter, and reports both the time
+taken and how much memory that process allocated for it, which is private to
+each process for the pickles but not for the memory-mapped file.
+"""
+
+import os
+import pickle
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from draftsman.data import entities, tiles
+
+SCRIPT = """
+import pickle, sys, timeit, tracemalloc
+from draftsman.classes.prototype_database import PrototypeDatabase
+# Tracing slows everything down, so memory and time are measured separately
+if sys.argv[1] == "memory":
+    tracemalloc.start()
+start = timeit.default_timer()
+{}
+elapsed = timeit.default_timer() - start
+print(elapsed, tracemalloc.get_traced_memory()[0] // 1024)
+"""
+
+PICKLE = """
+with open({!r}, "rb") as inp:
+    raw = pickle.load(inp)
+for name in {!r}:
+    raw[name]
+"""
+
+DATABASE = """
+raw = PrototypeDatabase({!r})
+for name in {!r}:
+    raw[name]
+"""
+
+
+def run(code, repeat=5):
+    # type: (str, int) -> tuple[float, int]
+    """
+    Returns the fastest time and the smallest memory growth, in kilobytes, of
+    ``repeat`` runs of ``code``, each in a new interpreter.
+    """
+    best_time, best_memory = float("inf"), float("inf")
+    for _ in range(repeat):
+        script = SCRIPT.format(code)
+        output = subprocess.check_output([sys.executable, "-c", script, "time"])
+        best_time = min(best_time, float(output.split()[0]))
+        output = subprocess.check_output([sys.executable, "-c", script, "memory"])
+        best_memory = min(best_memory, int(output.split()[1]))
+    return best_time, best_memory
+
+
+def main():
+    directory = tempfile.mkdtemp()
+    try:
+        print(
+            "{:>10} {:>12} {:>12} {:>14} {:>14}".format(
+                "", "pickle (s)", "mmap db (s)", "pickle (KiB)", "mmap db (KiB)"
+            )
+        )
+        for label, raw, lookups in [
+            ("entities", entities.raw, ["wooden-chest", "inserter", "small-lamp"]),
+            ("tiles", tiles.raw, ["concrete", "landfill"]),
+        ]:
+            pickle_path = os.path.join(directory, label + ".pkl")
+            with open(pickle_path, "wb") as out:
+                pickle.dump(dict(raw), out, 2)
+            database_path = os.path.join(
+                os.path.dirname(entities.__file__), label + ".db"
+            )
+
+            pickle_time, pickle_memory = run(PICKLE.format(pickle_path, lookups))
+            db_time, db_memory = run(DATABASE.format(database_path, lookups))
+            print(
+                "{:>10} {:>12.4f} {:>12.4f} {:>14} {:>14}".format(
+                    label, pickle_time, db_time, pickle_memory, db_memory
+                )
+            )
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
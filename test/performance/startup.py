@@ -0,0 +1,260 @@
+# startup.py
+
+"""
+Startup benchmark harness. Imports each of draftsman's main entry points in a
+fresh interpreter with ``python -X importtime``, times the whole import, and
+parses the ``-X importtime`` output into the cost of every module it imported.
+The results of every run are saved as JSON, so that they can be compared
+against a previous run to catch regressions in startup time::
+
+    python -m test.performance.startup --output before.json
+    ... # Make some changes
+    python -m test.performance.startup --output after.json --compare before.json
+
+When comparing, the exit code is 1 if any target got slower by more than
+``--threshold``, so that this can be used in scripts. Only meaningful when
+both runs were made on the same machine.
+"""
+
+from __future__ import print_function
+
+import argparse
+import json
+import platform
+import re
+import subprocess
+import sys
+import time
+
+from draftsman import __version__
+
+DATA_MODULES = [
+    "entities",
+    "instruments",
+    "items",
+    "mods",
+    "modules",
+    "recipes",
+    "signals",
+    "tiles",
+]
+
+# Label -> statement to time
+TARGETS = [
+    ("draftsman", "import draftsman"),
+    ("draftsman.blueprintable", "import draftsman.blueprintable"),
+    ("draftsman.entity", "import draftsman.entity"),
+]
+for _module in DATA_MODULES:
+    TARGETS.append(("draftsman.data." + _module, "import draftsman.data." + _module))
+    # Data modules are only loaded the first time they're used
+    TARGETS.append(
+        (
+            "draftsman.data.{} (loaded)".format(_module),
+            "import draftsman.data.{0}; draftsman.data.{0}._load()".format(_module),
+        )
+    )
+
+SCRIPT = """
+import timeit
+start = timeit.default_timer()
+{}
+print(timeit.default_timer() - start)
+"""
+
+# import time: self [us] | cumulative | imported package
+IMPORTTIME_REGEX = re.compile(r"^import time:\s*(\d+)\s*\|\s*(\d+)\s*\|( *)(\S+)\s*$")
+
+
+def parse_importtime(output):
+    # type: (str) -> dict[str, dict[str, int]]
+    """
+    Parses the output of ``python -X importtime`` into a ``dict`` that maps
+    the name of each imported module to its ``"self"`` and ``"cumulative"``
+    import times in microseconds, and its ``"depth"`` in the import tree.
+    Lines that aren't import times are ignored.
+
+    :param output: The ``stderr`` of an interpreter run with
+        ``-X importtime``.
+
+    :returns: A ``dict`` of module names to times, in the order they finished
+        importing.
+    """
+    modules = {}
+    for line in output.splitlines():
+        match = IMPORTTIME_REGEX.match(line)
+        if match is None:
+            continue
+        self_time, cumulative, indent, name = match.groups()
+        modules[name] = {
+            "self": int(self_time),
+            "cumulative": int(cumulative),
+            "depth": len(indent) // 2,
+        }
+    return modules
+
+
+def median(values):
+    # type: (list[float]) -> float
+    values = sorted(values)
+    middle = len(values) // 2
+    if len(values) % 2:
+        return values[middle]
+    return (values[middle - 1] + values[middle]) / 2.0
+
+
+def measure(statement, repeat):
+    # type: (str, int) -> dict
+    """
+    Runs ``statement`` in ``repeat`` fresh interpreters, and returns the median
+    wall time in seconds along with the median import times of every module
+    imported.
+    """
+    walls = []
+    runs = []
+    for _ in range(repeat):
+        process = subprocess.Popen(
+            [sys.executable, "-X", "importtime", "-c", SCRIPT.format(statement)],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+        )
+        stdout, stderr = process.communicate()
+        if process.returncode != 0:
+            raise RuntimeError("'{}' failed:\n{}".format(statement, stderr))
+        walls.append(float(stdout.split()[-1]))
+        runs.append(parse_importtime(stderr))
+
+    modules = {}
+    for name, times in runs[0].items():
+        samples = [run[name] for run in runs if name in run]
+        modules[name] = {
+            "self": median([sample["self"] for sample in samples]),
+            "cumulative": median([sample["cumulative"] for sample in samples]),
+            "depth": times["depth"],
+        }
+    return {
+        "statement": statement,
+        "wall": median(walls),
+        "walls": walls,
+        "modules": modules,
+    }
+
+
+def run_all(targets, repeat):
+    # type: (list[tuple[str, str]], int) -> dict
+    """
+    Measures every target, and returns the results along with a description of
+    the environment they were measured in.
+    """
+    results = {}
+    for label, statement in targets:
+        results[label] = measure(statement, repeat)
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "draftsman": __version__,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def print_results(report, top):
+    # type: (dict, int) -> None
+    for label, result in report["results"].items():
+        print("{:<40} {:>10.1f} ms".format(label, result["wall"] * 1000))
+        draftsman_modules = [
+            (times["self"], name)
+            for name, times in result["modules"].items()
+            if name.startswith("draftsman")
+        ]
+        for self_time, name in sorted(draftsman_modules, reverse=True)[:top]:
+            print("    {:<36} {:>10.1f} ms self".format(name, self_time / 1000.0))
+
+
+def compare(report, baseline, threshold):
+    # type: (dict, dict, float) -> list[str]
+    """
+    Prints the change in wall time of every target that is in both
+    ``report`` and ``baseline``, and returns the labels of those that got
+    slower by more than ``threshold`` (a fraction).
+    """
+    regressions = []
+    print()
+    print("{:<40} {:>10} {:>10} {:>8}".format("", "before", "after", "change"))
+    for label, result in report["results"].items():
+        if label not in baseline["results"]:
+            continue
+        before = baseline["results"][label]["wall"]
+        after = result["wall"]
+        change = (after - before) / before
+        flag = ""
+        if change > threshold:
+            regressions.append(label)
+            flag = "  REGRESSION"
+        print(
+            "{:<40} {:>8.1f}ms {:>8.1f}ms {:>+7.0%}{}".format(
+                label, before * 1000, after * 1000, change, flag
+            )
+        )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Measure the startup time of draftsman's entry points."
+    )
+    parser.add_argument("-o", "--output", help="write the results to this JSON file")
+    parser.add_argument(
+        "-c", "--compare", help="compare against the results in this JSON file"
+    )
+    parser.add_argument(
+        "-n",
+        "--repeat",
+        type=int,
+        default=5,
+        help="number of fresh interpreters per target (default: 5)",
+    )
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="slowdown that counts as a regression (default: 0.2, or 20%%)",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=5,
+        help="number of slowest draftsman modules to show per target",
+    )
+    parser.add_argument(
+        "targets",
+        nargs="*",
+        help="labels of the targets to measure (default: all)",
+    )
+    args = parser.parse_args(argv)
+
+    targets = TARGETS
+    if args.targets:
+        targets = [target for target in TARGETS if target[0] in args.targets]
+
+    report = run_all(targets, args.repeat)
+    print_results(report, args.top)
+
+    if args.output:
+        with open(args.output, "w") as out:
+            json.dump(report, out, indent=2)
+
+    if args.compare:
+        with open(args.compare) as inp:
+            baseline = json.load(inp)
+        if compare(report, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+# validation_levels.py
+
+"""
+Compares the cost of each :py:class:`.ValidationLevel`, both when constructing
+entities one at a time with :py:func:`.new_entity` and when importing a
+blueprint string with ``Blueprint(string)``. The entities are given their data
+in the same format they export, since ``"none"`` stores values as given.
+"""
+
+from draftsman import validation
+from draftsman.blueprintable import Blueprint
+from draftsman.constants import ValidationLevel
+from draftsman.entity import new_entity
+
+from test.performance.blueprint_import import make_blueprint_string
+
+import gc
+import timeit
+
+
+def construct_entities(n_entities):
+    # type: (int) -> None
+    for i in range(n_entities):
+        new_entity(
+            "decider-combinator",
+            tile_position=(i, 0),
+            control_behavior={
+                "decider_conditions": {
+                    "first_signal": {"name": "signal-A", "type": "virtual"},
+                    "comparator": ">",
+                    "constant": i,
+                    "output_signal": {"name": "signal-B", "type": "virtual"},
+                    "copy_count_from_input": False,
+                }
+            },
+        )
+
+
+def time(function, repeat=3):
+    # type: (callable, int) -> float
+    """
+    Returns the fastest of ``repeat`` runs of ``function``.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = timeit.default_timer()
+        function()
+        best = min(best, timeit.default_timer() - start)
+    return best
+
+
+def print_row(label, times):
+    # type: (str, list[float]) -> None
+    print(
+        "{:>20} {:>12.3f} {:>12.3f} {:>12.3f} {:>7.1f}x".format(
+            label, times[0], times[1], times[2], times[2] / times[0]
+        )
+    )
+
+
+def main():
+    levels = [ValidationLevel.NONE, ValidationLevel.MINIMAL, ValidationLevel.STRICT]
+
+    print(
+        "{:>20} {:>12} {:>12} {:>12} {:>8}".format(
+            "", "none (s)", "minimal (s)", "strict (s)", "speedup"
+        )
+    )
+    for n_entities in [1000, 4000]:
+        times = []
+        for level in levels:
+            with validation.level(level):
+                times.append(time(lambda: construct_entities(n_entities)))
+        print_row("new_entity() x{}".format(n_entities), times)
+
+    for n_entities in [1000, 4000]:
+        blueprint_string = make_blueprint_string(n_entities)
+        expected = Blueprint(blueprint_string).to_dict()
+        times = []
+        for level in levels:
+            times.append(
+                time(lambda: Blueprint(blueprint_string, validation_level=level))
+            )
+            result = Blueprint(blueprint_string, validation_level=level).to_dict()
+            assert result == expected
+        print_row("import x{}".format(n_entities), times)
+
+
+if __name__ == "__main__":
+    main()
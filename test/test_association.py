@@ -6,6 +6,7 @@ from draftsman.classes.blueprint import Blueprint
 from draftsman.entity import Container
 from draftsman.error import InvalidAssociationError
 
+import pickle
 import sys
 
 if sys.version_info >= (3, 3):  # pragma: no coverage
@@ -38,3 +39,15 @@ class AssociationTesting(unittest.TestCase):
 
         with self.assertRaises(InvalidAssociationError):
             blueprint.to_dict()
+
+    def test_pickle(self):
+        blueprint = Blueprint()
+
+        blueprint.entities.append("wooden-chest")
+        blueprint.entities.append("wooden-chest", tile_position=(1, 0))
+        blueprint.add_circuit_connection("red", 0, 1)
+
+        blueprint = pickle.loads(pickle.dumps(blueprint, 2))
+        association = blueprint.entities[0].connections["1"]["red"][0]["entity_id"]
+        self.assertIsInstance(association, Association)
+        self.assertIs(association(), blueprint.entities[1])
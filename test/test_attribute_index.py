@@ -0,0 +1,135 @@
+# test_attribute_index.py
+# -*- encoding: utf-8 -*-
+
+from draftsman.blueprintable import Blueprint
+from draftsman.classes.attribute_index import AttributeIndex, ancestor_indexes
+from draftsman.classes.group import Group
+from draftsman.constants import Direction
+from draftsman.entity import AssemblingMachine, ConstantCombinator, Inserter
+
+import sys
+
+if sys.version_info >= (3, 3):  # pragma: no coverage
+    import unittest
+else:  # pragma: no coverage
+    import unittest2 as unittest
+
+
+class AttributeIndexTesting(unittest.TestCase):
+    def test_add_remove(self):
+        index = AttributeIndex()
+        inserter = Inserter("inserter", direction=Direction.EAST)
+        machine = AssemblingMachine(recipe="iron-gear-wheel")
+        combinator = ConstantCombinator()
+
+        index.add(inserter)
+        index.add(machine)
+        index.add(combinator)
+        self.assertEqual(len(index.entities), 3)
+        self.assertEqual(index.get("name", {"inserter"}), [{id(inserter): inserter}])
+        self.assertEqual(
+            index.get("direction", {Direction.EAST}),
+            [{id(inserter): inserter}],
+        )
+        self.assertEqual(
+            index.get("recipe", {"iron-gear-wheel", "copper-cable"}),
+            [{id(machine): machine}],
+        )
+        self.assertEqual(
+            index.control_behavior,
+            {id(inserter): inserter, id(combinator): combinator},
+        )
+
+        index.remove(inserter)
+        self.assertEqual(index.get("name", {"inserter"}), [])
+        self.assertEqual(index.get("direction", {Direction.EAST}), [])
+        # Removing something not in the index does nothing
+        index.remove(inserter)
+
+        index.clear()
+        self.assertEqual(index.entities, {})
+        self.assertEqual(index.buckets["type"], {})
+
+    def test_recursive_add_remove(self):
+        index = AttributeIndex()
+        group = Group("test")
+        group.entities.append("inserter")
+        group.entities.append("inserter", tile_position=(1, 0))
+
+        index.recursive_add(group)
+        self.assertEqual(len(index.get("name", {"inserter"})[0]), 2)
+        self.assertNotIn(id(group), index.entities)
+
+        index.recursive_remove(group)
+        self.assertEqual(index.entities, {})
+
+    def test_update(self):
+        group = Group("test")
+        group.entities.append("assembling-machine-1")
+        machine = group.entities[0]
+        self.assertEqual(ancestor_indexes(group), [group.entity_index])
+        self.assertEqual(ancestor_indexes(machine), [group.entity_index])
+
+        machine.recipe = "iron-gear-wheel"
+        self.assertEqual(
+            group.entity_index.get("recipe", {"iron-gear-wheel"}),
+            [{id(machine): machine}],
+        )
+        self.assertEqual(group.entity_index.get("recipe", {None}), [])
+
+    def test_rotate_flip(self):
+        blueprint = Blueprint()
+        blueprint.entities.append("inserter")
+        inserter = blueprint.entities[0]
+
+        blueprint.rotate(2)
+        self.assertEqual(inserter.direction, Direction.EAST)
+        self.assertEqual(
+            blueprint.find_entities_filtered(direction=Direction.EAST), [inserter]
+        )
+        self.assertEqual(
+            blueprint.find_entities_filtered(direction=Direction.NORTH), []
+        )
+
+        blueprint.flip("horizontal")
+        self.assertEqual(inserter.direction, Direction.WEST)
+        self.assertEqual(
+            blueprint.find_entities_filtered(direction=Direction.WEST), [inserter]
+        )
+        self.assertEqual(blueprint.find_entities_filtered(direction=Direction.EAST), [])
+
+        # Transforming a group updates the indexes of its parents too
+        blueprint = Blueprint()
+        group = Group("test")
+        group.entities.append("inserter")
+        blueprint.entities.append(group)
+        group = blueprint.entities["test"]
+        inserter = group.entities[0]
+
+        group.rotate(2)
+        self.assertEqual(inserter.direction, Direction.EAST)
+        for collection in (group, blueprint):
+            self.assertEqual(
+                collection.find_entities_filtered(direction=Direction.EAST),
+                [inserter],
+            )
+            self.assertEqual(
+                collection.find_entities_filtered(direction=Direction.NORTH), []
+            )
+
+        group.flip("horizontal")
+        self.assertEqual(inserter.direction, Direction.WEST)
+        self.assertEqual(
+            blueprint.find_entities_filtered(direction=Direction.WEST), [inserter]
+        )
+        self.assertEqual(blueprint.find_entities_filtered(direction=Direction.EAST), [])
+
+    def test_sort(self):
+        group = Group("test")
+        group.entities.append("inserter")
+        group.entities.insert(0, "inserter", tile_position=(1, 0))
+
+        entities = list(group.entity_index.entities.values())
+        self.assertEqual(
+            group.entity_index.sort(entities, group.entities), group.entities.data
+        )
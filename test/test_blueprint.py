@@ -12,7 +12,7 @@ from draftsman.classes.entitylike import EntityLike
 from draftsman.classes.entitylist import EntityList
 from draftsman.classes.group import Group
 from draftsman.classes.vector import Vector
-from draftsman.constants import Direction
+from draftsman.constants import Direction, ValidationLevel
 from draftsman.entity import Container, ElectricPole, new_entity
 from draftsman.tile import Tile
 from draftsman.error import (
@@ -27,15 +27,25 @@ from draftsman.error import (
     EntityNotCircuitConnectableError,
     DataFormatError,
     InvalidAssociationError,
+    InvalidItemError,
+    InvalidRecipeError,
+    InvalidWireTypeError,
 )
-from draftsman.utils import encode_version, AABB
+from draftsman.utils import encode_version, distance, flatten_entities, AABB
 from draftsman.warning import (
+    ConnectionDistanceWarning,
+    ConnectionSideWarning,
+    DirectionWarning,
     DraftsmanWarning,
+    ItemCapacityWarning,
+    ModuleCapacityWarning,
+    OverlappingObjectsWarning,
     RailAlignmentWarning,
     TooManyConnectionsWarning,
 )
 
 import sys
+import warnings
 
 if sys.version_info >= (3, 3):  # pragma: no coverage
     import unittest
@@ -661,6 +671,190 @@ class BlueprintTesting(unittest.TestCase):
 
     # =========================================================================
 
+    def test_validate(self):
+        # Valid
+        blueprint = Blueprint()
+        blueprint.label_color = (1.0, 0.0, 0.0)
+        blueprint.icons = ["wooden-chest"]
+        blueprint.entities.append("wooden-chest", items={"iron-plate": 100})
+        blueprint.entities.append("small-electric-pole", tile_position=(1, 0))
+        blueprint.entities.append("small-electric-pole", tile_position=(5, 0))
+        blueprint.entities.append("decider-combinator", tile_position=(2, 0))
+        blueprint.add_power_connection(1, 2)
+        blueprint.add_circuit_connection("red", 1, 3, 1, 2)
+        blueprint.tiles.append("refined-concrete")
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            report = blueprint.validate()
+            self.assertEqual(len(w), 0)
+        self.assertTrue(report.valid)
+        self.assertEqual(len(report), 0)
+
+        # Everything skipped while building
+        blueprint = Blueprint(validation_level="none")
+        blueprint.label_color = {"r": "wrong"}
+        blueprint.entities.append("wooden-chest")
+        blueprint.entities[0].items = {"iron-plate": 100000}
+        blueprint.entities.append("wooden-chest", id="overlapping")
+        blueprint.entities.append(
+            "small-lamp",
+            tile_position=(1, 0),
+            control_behavior={"circuit_condition": {"comparator": "incorrect"}},
+        )
+        blueprint.entities.append("small-electric-pole", id="a", tile_position=(2, 0))
+        blueprint.entities.append("small-electric-pole", id="b", tile_position=(20, 0))
+        blueprint.add_power_connection("a", "b")
+        blueprint.add_circuit_connection("red", "a", "b", 2, 1)
+        blueprint.tiles.append("refined-concrete")
+        blueprint.tiles.append("refined-concrete")
+        expected = blueprint.to_dict()
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            report = blueprint.validate()
+            self.assertEqual(len(w), 0)
+        self.assertFalse(report.valid)
+        self.assertEqual(
+            [(issue.category, issue.objects) for issue in report.errors],
+            [
+                (DataFormatError, (blueprint,)),
+                (DataFormatError, (blueprint.entities[2],)),
+            ],
+        )
+        self.assertEqual(
+            [(issue.category, issue.objects) for issue in report.warnings],
+            [
+                (ItemCapacityWarning, (blueprint.entities[0],)),
+                (
+                    OverlappingObjectsWarning,
+                    (blueprint.entities[1], blueprint.entities[0]),
+                ),
+                (
+                    OverlappingObjectsWarning,
+                    (blueprint.tiles[1], blueprint.tiles[0]),
+                ),
+                (
+                    ConnectionSideWarning,
+                    (blueprint.entities["a"], blueprint.entities["b"]),
+                ),
+                (
+                    ConnectionDistanceWarning,
+                    (blueprint.entities["a"], blueprint.entities["b"]),
+                ),
+                (
+                    ConnectionDistanceWarning,
+                    (blueprint.entities["a"], blueprint.entities["b"]),
+                ),
+            ],
+        )
+        # Nothing was modified
+        self.assertEqual(blueprint.to_dict(), expected)
+        self.assertIs(blueprint.validation_level, ValidationLevel.NONE)
+
+        # Data lookups and entities inside of groups
+        blueprint = Blueprint(validation_level="minimal")
+        group = Group("group", position=(10, 10))
+        group.entities.append("wooden-chest")
+        group.entities.append("wooden-chest")
+        blueprint.entities.append(group)
+        blueprint.entities[("group", 0)].set_item_request("unknown-item", 10)
+        blueprint.entities.append("small-electric-pole", tile_position=(0, 0))
+        for i in range(6):
+            blueprint.entities.append("small-electric-pole", tile_position=(i + 1, 0))
+            blueprint.add_power_connection(1, i + 2)
+        report = blueprint.validate()
+        self.assertEqual(
+            [(issue.category, issue.objects) for issue in report],
+            [
+                (InvalidItemError, (blueprint.entities[("group", 0)],)),
+                (
+                    OverlappingObjectsWarning,
+                    (
+                        blueprint.entities[("group", 1)],
+                        blueprint.entities[("group", 0)],
+                    ),
+                ),
+                (TooManyConnectionsWarning, (blueprint.entities[1],)),
+            ],
+        )
+        self.assertIn("(10.5, 10.5)", report.warnings[0].message)
+
+        # Dangling connections
+        blueprint = Blueprint()
+        blueprint.entities.append("small-electric-pole")
+        blueprint.entities[0].neighbours.append(
+            Association(new_entity("small-electric-pole"))
+        )
+        report = blueprint.validate()
+        self.assertEqual(
+            [issue.category for issue in report.errors], [InvalidAssociationError]
+        )
+
+        # Connections between entities that cannot be connected
+        blueprint = Blueprint(validation_level="none")
+        blueprint.entities.append("small-electric-pole")
+        blueprint.entities.append("pipe", tile_position=(1, 0))
+        blueprint.entities[0].neighbours.append(Association(blueprint.entities[1]))
+        blueprint.entities[0].connections = {
+            "1": {"red": [{"entity_id": Association(blueprint.entities[1])}]}
+        }
+        report = blueprint.validate()
+        self.assertEqual(
+            [issue.category for issue in report.errors],
+            [EntityNotCircuitConnectableError, EntityNotPowerConnectableError],
+        )
+
+        # Entities with nothing but a name and a position are checked too
+        blueprint = Blueprint(validation_level="none")
+        blueprint.entities.append("straight-rail", tile_position=(21, 21))
+        report = blueprint.validate()
+        self.assertEqual(
+            [(issue.category, issue.objects) for issue in report],
+            [(RailAlignmentWarning, (blueprint.entities[0],))],
+        )
+
+        # Shorthand stored without being converted to its exported format
+        blueprint = Blueprint(validation_level="none")
+        blueprint.icons = ["signal-A"]
+        blueprint.entities.append(
+            "constant-combinator",
+            control_behavior={"filters": [("signal-A", 5)]},
+        )
+        expected = blueprint.to_dict()
+        report = blueprint.validate()
+        self.assertEqual(
+            [(issue.category, issue.objects) for issue in report],
+            [
+                (DataFormatError, (blueprint,)),
+                (DataFormatError, (blueprint.entities[0],)),
+            ],
+        )
+        self.assertIn("'control_behavior'", report.errors[1].message)
+        self.assertEqual(blueprint.to_dict(), expected)
+
+        # Every issue of an entity is reported, not just the first
+        blueprint = Blueprint(validation_level="none")
+        blueprint.entities.append(
+            "assembling-machine-1",
+            recipe="unknown-recipe",
+            items={"speed-module": 3, "unknown-item": 1},
+        )
+        blueprint.entities.append(
+            "filter-inserter", tile_position=(3, 0), direction=Direction.NORTHEAST
+        )
+        report = blueprint.validate()
+        self.assertEqual(
+            [(issue.category, issue.objects) for issue in report],
+            [
+                (InvalidRecipeError, (blueprint.entities[0],)),
+                (InvalidItemError, (blueprint.entities[0],)),
+                (ModuleCapacityWarning, (blueprint.entities[0],)),
+                (DirectionWarning, (blueprint.entities[1],)),
+            ],
+        )
+
+    # =========================================================================
+
     def test_to_dict(self):
         # List case
         blueprint = Blueprint()
@@ -1024,6 +1218,117 @@ class BlueprintTesting(unittest.TestCase):
             },
         )
 
+    def test_clone(self):
+        blueprint = Blueprint()
+        blueprint.label = "template"
+        blueprint.entities.append("wooden-chest", id="test container")
+        blueprint.entities.append("locomotive", tile_position=(10, 10), id="train")
+        blueprint.entities.append("arithmetic-combinator", tile_position=(2, 0))
+        blueprint.tiles.append("landfill", position=(0, 5))
+
+        group = Group("powerlines")
+        group.entities.append("small-electric-pole")
+        group.entities.append("small-electric-pole", tile_position=(5, 0))
+        group.entities.append("power-switch", tile_position=(1, 1))
+        group.add_circuit_connection("red", 0, 1)
+        group.add_power_connection(0, 1)
+        group.add_power_connection(0, 2, side=1)
+        group.position = (0, 1)
+        blueprint.entities.append(group)
+        blueprint.add_circuit_connection("green", "test container", ("powerlines", 0))
+        blueprint.add_circuit_connection("red", 2, 2, 1, 2)
+        blueprint.schedules = [
+            {"locomotives": [Association(blueprint.entities["train"])], "schedule": []}
+        ]
+
+        blueprint_clone = blueprint.clone()
+
+        # Identical to the original
+        self.maxDiff = None
+        self.assertEqual(blueprint_clone.to_dict(), blueprint.to_dict())
+
+        # Parents
+        self.assertIs(blueprint_clone.entities[0].parent, blueprint_clone)
+        self.assertIs(blueprint_clone.entities["powerlines"].parent, blueprint_clone)
+        self.assertIs(
+            blueprint_clone.entities[("powerlines", 0)].parent,
+            blueprint_clone.entities["powerlines"],
+        )
+        self.assertIs(blueprint_clone.tiles[0].parent, blueprint_clone)
+
+        # Every object is distinct from the original
+        for original, clone in zip(
+            flatten_entities(blueprint.entities),
+            flatten_entities(blueprint_clone.entities),
+        ):
+            self.assertIsNot(original, clone)
+            self.assertIsNot(original.position, clone.position)
+        self.assertIsNot(blueprint.tiles[0], blueprint_clone.tiles[0])
+
+        # Associations point to the clones
+        container = blueprint_clone.entities["test container"]
+        pole = blueprint_clone.entities[("powerlines", 0)]
+        self.assertIs(container.connections["1"]["green"][0]["entity_id"](), pole)
+        self.assertIs(pole.neighbours[0](), blueprint_clone.entities[("powerlines", 1)])
+        self.assertIs(
+            blueprint_clone.entities[("powerlines", 2)].connections["Cu0"][0][
+                "entity_id"
+            ](),
+            pole,
+        )
+        self.assertIs(
+            blueprint_clone.schedules[0]["locomotives"][0](),
+            blueprint_clone.entities["train"],
+        )
+
+        # Keys and indexes
+        self.assertIs(blueprint_clone.entities[0], container)
+        self.assertIs(blueprint_clone.find_entity_at_position((0.5, 0.5)), container)
+        self.assertIs(
+            blueprint_clone.find_entity("small-electric-pole", (0.5, 1.5)), pole
+        )
+        self.assertEqual(
+            blueprint_clone.find_entities_filtered(name="wooden-chest"), [container]
+        )
+        self.assertIs(blueprint_clone.find_tile((0, 5)), blueprint_clone.tiles[0])
+        self.assertEqual(
+            blueprint_clone.get_circuit_network("test container", "green"),
+            [(container, 1), (pole, 1)],
+        )
+        self.assertEqual(blueprint_clone.area, blueprint.area)
+
+        # Modifying the clone does not modify the original
+        blueprint_clone.label = "modified"
+        blueprint_clone.entities["test container"].bar = 5
+        blueprint_clone.entities["powerlines"].entities[1].tags = {"a": 1}
+        del blueprint_clone.entities["train"]
+        blueprint_clone.remove_circuit_connections()
+        self.assertEqual(blueprint.label, "template")
+        self.assertEqual(blueprint.entities["test container"].bar, None)
+        self.assertEqual(blueprint.entities["powerlines"].entities[1].tags, {})
+        self.assertEqual(len(blueprint.entities), 4)
+        self.assertIs(
+            blueprint.find_entity_at_position((0.5, 0.5)), blueprint.entities[0]
+        )
+        self.assertEqual(
+            len(blueprint.get_circuit_network("test container", "green")), 2
+        )
+
+        # Adding to the clone still checks for overlapping
+        with self.assertWarns(OverlappingObjectsWarning):
+            blueprint_clone.entities.append("iron-chest")
+
+        # Dead associations
+        blueprint = Blueprint()
+        blueprint.entities.append("wooden-chest")
+        blueprint.entities.append("wooden-chest", tile_position=(1, 0))
+        blueprint.add_circuit_connection("red", 0, 1)
+        blueprint.entities[0].connections["1"]["red"][0]["entity_id"] = Association(
+            Container()
+        )
+        with self.assertRaises(InvalidAssociationError):
+            blueprint.clone()
+
     # =========================================================================
     # EntityCollection
     # =========================================================================
@@ -1105,6 +1410,98 @@ class BlueprintTesting(unittest.TestCase):
         found_entities = blueprint.find_entities([-10, -10, 0, 0])
         self.assertEqual(found_entities, [blueprint.entities[("test", 0)]])
 
+    def test_find_entity_at_positions(self):
+        blueprint = Blueprint()
+        blueprint.entities.append("wooden-chest", tile_position=(1, 1))
+        blueprint.entities.append("iron-chest", tile_position=(5, 0))
+        blueprint.entities.append("steel-chest", tile_position=(10, 10))
+        group = Group("test", position=(-5, -5))
+        group.entities.append("wooden-chest", tile_position=(-5, -5))
+        blueprint.entities.append(group)
+
+        positions = [(1.5, 1.5), (-4.5, -4.5), (10.5, 10.5), (-9.5, -9.5), (1.2, 1.7)]
+        found_entities = blueprint.find_entity_at_positions(positions)
+        self.assertEqual(len(found_entities), len(positions))
+        self.assertIs(found_entities[0], blueprint.entities[0])
+        self.assertIs(found_entities[1], None)
+        self.assertIs(found_entities[2], blueprint.entities[2])
+        self.assertIs(found_entities[3], blueprint.entities[("test", 0)])
+        self.assertIs(found_entities[4], blueprint.entities[0])
+        # Identical to the single query version
+        for position, found in zip(positions, found_entities):
+            self.assertIs(found, blueprint.find_entity_at_position(position))
+
+        self.assertEqual(blueprint.find_entity_at_positions([]), [])
+
+    def test_find_entities_many(self):
+        blueprint = Blueprint()
+        blueprint.entities.append("wooden-chest", tile_position=(1, 1))
+        blueprint.entities.append("iron-chest", tile_position=(5, 0))
+        blueprint.entities.append("steel-chest", tile_position=(10, 10))
+        group = Group("test", position=(-5, -5))
+        group.entities.append("wooden-chest", tile_position=(-5, -5))
+        blueprint.entities.append(group)
+
+        areas = [
+            AABB(0, 0, 6, 6),
+            [-10, -10, 0, 0],
+            [-100, -100, 100, 100],
+            [20, 20, 30, 30],
+            [0, 0, 6, 6],
+        ]
+        found_entities = blueprint.find_entities_many(areas)
+        self.assertEqual(len(found_entities), len(areas))
+        self.assertEqual(
+            found_entities[0], [blueprint.entities[0], blueprint.entities[1]]
+        )
+        self.assertEqual(found_entities[1], [blueprint.entities[("test", 0)]])
+        self.assertEqual(found_entities[3], [])
+        # Identical to the single query version
+        for area, found in zip(areas, found_entities):
+            self.assertEqual(found, blueprint.find_entities(area))
+
+        self.assertEqual(blueprint.find_entities_many([]), [])
+
+    def test_find_nearest_entities(self):
+        blueprint = Blueprint()
+        blueprint.entities.append("wooden-chest", tile_position=(1, 1))
+        blueprint.entities.append("small-electric-pole", tile_position=(5, 0))
+        blueprint.entities.append("medium-electric-pole", tile_position=(30, 30))
+        group = Group("test", position=(-5, -5))
+        group.entities.append("small-electric-pole", tile_position=(-5, -5))
+        blueprint.entities.append(group)
+
+        found = blueprint.find_nearest_entities((0, 0))
+        self.assertEqual(found, [blueprint.entities[0]])
+
+        found = blueprint.find_nearest_entities((0, 0), type="electric-pole")
+        self.assertEqual(found, [blueprint.entities[1]])
+
+        found = blueprint.find_nearest_entities((-10, -10), k=2, type="electric-pole")
+        self.assertEqual(
+            found, [blueprint.entities[("test", 0)], blueprint.entities[1]]
+        )
+
+        found = blueprint.find_nearest_entities(
+            (0, 0), k=3, name={"small-electric-pole", "medium-electric-pole"}
+        )
+        self.assertEqual(
+            found,
+            [
+                blueprint.entities[1],
+                blueprint.entities[("test", 0)],
+                blueprint.entities[2],
+            ],
+        )
+
+        found = blueprint.find_nearest_entities(
+            (0, 0), filter=lambda x: x.tile_position.x > 10
+        )
+        self.assertEqual(found, [blueprint.entities[2]])
+
+        found = blueprint.find_nearest_entities((0, 0), name="steel-chest")
+        self.assertEqual(found, [])
+
     # =========================================================================
 
     def test_find_entities_filtered(self):
@@ -1186,6 +1583,57 @@ class BlueprintTesting(unittest.TestCase):
         found = blueprint.find_entities_filtered()
         self.assertEqual(found, [blueprint.entities[("test", 0)]])
 
+        # Recipe
+        blueprint.entities = None
+        blueprint.entities.append("assembling-machine-1", id="a")
+        blueprint.entities.append(
+            "assembling-machine-1", tile_position=(3, 0), recipe="iron-gear-wheel"
+        )
+        blueprint.entities.append("constant-combinator", tile_position=(6, 0), id="c")
+        found = blueprint.find_entities_filtered(recipe="iron-gear-wheel")
+        self.assertEqual(found, [blueprint.entities[1]])
+        blueprint.entities["a"].recipe = "iron-gear-wheel"
+        found = blueprint.find_entities_filtered(recipe="iron-gear-wheel")
+        self.assertEqual(found, [blueprint.entities[0], blueprint.entities[1]])
+        blueprint.entities[1].recipe = None
+        found = blueprint.find_entities_filtered(recipe={"iron-gear-wheel", None})
+        self.assertEqual(found, [blueprint.entities[0], blueprint.entities[1]])
+        found = blueprint.find_entities_filtered(
+            recipe="iron-gear-wheel", area=[0, 0, 3, 3]
+        )
+        self.assertEqual(found, [blueprint.entities[0]])
+
+        # Control behavior
+        found = blueprint.find_entities_filtered(has_control_behavior=True)
+        self.assertEqual(found, [])
+        blueprint.entities["c"].set_signal(0, "signal-A", 1)
+        found = blueprint.find_entities_filtered(has_control_behavior=True)
+        self.assertEqual(found, [blueprint.entities["c"]])
+        found = blueprint.find_entities_filtered(has_control_behavior=False)
+        self.assertEqual(found, [blueprint.entities[0], blueprint.entities[1]])
+
+        # Insertion order, replacement and removal
+        blueprint.entities.insert(0, "wooden-chest", tile_position=(10, 0))
+        blueprint.entities.append("wooden-chest", tile_position=(11, 0))
+        found = blueprint.find_entities_filtered(name="wooden-chest")
+        self.assertEqual(found, [blueprint.entities[0], blueprint.entities[4]])
+        blueprint.entities[0] = Container("iron-chest", tile_position=(10, 0))
+        del blueprint.entities[4]
+        found = blueprint.find_entities_filtered(name="wooden-chest")
+        self.assertEqual(found, [])
+        found = blueprint.find_entities_filtered(type="container")
+        self.assertEqual(found, [blueprint.entities[0]])
+
+        # Entities added to a group after it was added to the blueprint
+        group = Group("test", position=(20, 0))
+        blueprint.entities.append(group)
+        blueprint.entities["test"].entities.append("wooden-chest", id="inner")
+        found = blueprint.find_entities_filtered(name="wooden-chest")
+        self.assertEqual(found, [blueprint.entities[("test", "inner")]])
+        blueprint.entities["test"].entities = None
+        found = blueprint.find_entities_filtered(name="wooden-chest")
+        self.assertEqual(found, [])
+
     # =========================================================================
 
     def test_power_connections(self):
@@ -1680,6 +2128,32 @@ class BlueprintTesting(unittest.TestCase):
             blueprint.entities.append("medium-electric-pole", tile_position=(0, i))
             blueprint.entities.append("medium-electric-pole", tile_position=(3, i))
         blueprint.generate_power_connections()
+        for entity in blueprint.entities:
+            self.assertLessEqual(len(entity.neighbours), 5)
+
+        # Test poles nested in groups, spread across a large area
+        blueprint.entities = None
+        group = Group("group", position=(100, 0))
+        for i in range(20):
+            blueprint.entities.append("small-electric-pole", tile_position=(i * 7, 0))
+            group.entities.append("small-electric-pole", tile_position=(i * 7, 3))
+        blueprint.entities.append(group)
+        blueprint.generate_power_connections()
+        poles = blueprint.find_entities_filtered(type="electric-pole")
+        for pole in poles:
+            self.assertLessEqual(len(pole.neighbours), 5)
+            for neighbour in pole.neighbours:
+                # Connections are always symmetric and within reach
+                self.assertIn(Association(pole), neighbour().neighbours)
+                self.assertLessEqual(
+                    distance(
+                        pole.global_position.data, neighbour().global_position.data
+                    ),
+                    pole.maximum_wire_distance,
+                )
+        self.assertEqual(
+            blueprint.entities[0].neighbours, [Association(blueprint.entities[1])]
+        )
 
     # =========================================================================
 
@@ -1958,6 +2432,233 @@ class BlueprintTesting(unittest.TestCase):
             },
         )
 
+    # =========================================================================
+
+    def test_get_circuit_network(self):
+        blueprint = Blueprint()
+        blueprint.entities.append("small-lamp", id="a")
+        blueprint.entities.append("arithmetic-combinator", tile_position=(1, 0), id="b")
+        blueprint.entities.append("small-lamp", tile_position=(3, 0), id="c")
+        blueprint.entities.append("small-lamp", tile_position=(4, 0), id="d")
+        a, b, c, d = blueprint.entities
+
+        blueprint.add_circuit_connection("red", "a", "b")
+        blueprint.add_circuit_connection("red", "b", "c", 2, 1)
+        blueprint.add_circuit_connection("green", "c", "d")
+
+        # Both sides of a combinator are separate networks
+        self.assertEqual(blueprint.get_circuit_network("a", "red"), [(a, 1), (b, 1)])
+        self.assertEqual(blueprint.get_circuit_network("c", "red"), [(b, 2), (c, 1)])
+        self.assertEqual(blueprint.get_circuit_network(3, "red"), [(d, 1)])
+        self.assertEqual(blueprint.get_circuit_network(d, "green"), [(c, 1), (d, 1)])
+        self.assertEqual(
+            blueprint.get_circuit_network_id("a", "red"),
+            blueprint.get_circuit_network_id("b", "red"),
+        )
+        self.assertNotEqual(
+            blueprint.get_circuit_network_id("a", "red"),
+            blueprint.get_circuit_network_id("b", "red", 2),
+        )
+
+        # Connecting merges networks
+        blueprint.add_circuit_connection("red", "b", "b", 1, 2)
+        self.assertEqual(
+            blueprint.get_circuit_network("a", "red"), [(a, 1), (b, 1), (b, 2), (c, 1)]
+        )
+
+        # Disconnecting splits them
+        blueprint.remove_circuit_connection("red", "b", "b", 1, 2)
+        self.assertEqual(blueprint.get_circuit_network("a", "red"), [(a, 1), (b, 1)])
+
+        # Removing entities splits them
+        del blueprint.entities["c"]
+        self.assertEqual(blueprint.get_circuit_network("d", "green"), [(d, 1)])
+
+        blueprint.remove_circuit_connections()
+        self.assertEqual(blueprint.get_circuit_network("a", "red"), [(a, 1)])
+
+        # Groups
+        group = Group("group", position=(0, 5))
+        group.entities.append("small-lamp")
+        group.entities.append("small-lamp", tile_position=(1, 0))
+        group.add_circuit_connection("red", 0, 1)
+        blueprint.entities.append(group, copy=False)
+        self.assertEqual(
+            blueprint.get_circuit_network(("group", 0), "red"),
+            [(group.entities[0], 1), (group.entities[1], 1)],
+        )
+        blueprint.add_circuit_connection("red", "a", ("group", 1))
+        self.assertEqual(
+            group.get_circuit_network(0, "red"),
+            [(group.entities[0], 1), (group.entities[1], 1)],
+        )
+        self.assertEqual(
+            blueprint.get_circuit_network(("group", 0), "red"),
+            [(a, 1), (group.entities[0], 1), (group.entities[1], 1)],
+        )
+        group.remove_circuit_connection("red", 0, 1)
+        self.assertEqual(
+            blueprint.get_circuit_network(("group", 0), "red"),
+            [(group.entities[0], 1)],
+        )
+
+        # Imported connections
+        blueprint = Blueprint(blueprint.to_string())
+        self.assertEqual(
+            blueprint.get_circuit_network(0, "red"),
+            [(blueprint.entities[0], 1), (blueprint.entities[4], 1)],
+        )
+
+        # Errors
+        with self.assertRaises(InvalidAssociationError):
+            blueprint.get_circuit_network(Container(), "red")
+        with self.assertRaises(InvalidWireTypeError):
+            blueprint.get_circuit_network(0, "blue")
+        with self.assertRaises(InvalidConnectionSideError):
+            blueprint.get_circuit_network(0, "red", 3)
+        blueprint.entities.append("pipe", tile_position=(10, 10), id="pipe")
+        with self.assertRaises(EntityNotCircuitConnectableError):
+            blueprint.get_circuit_network("pipe", "red")
+
+    def test_connect_chain(self):
+        blueprint = Blueprint()
+        for i in range(4):
+            blueprint.entities.append("small-lamp", tile_position=(i, 0), id=str(i))
+        a, b, c, d = blueprint.entities
+
+        blueprint.connect_chain("red", ["0", 1, c, "3"])
+        self.assertEqual(a.connections, {"1": {"red": [{"entity_id": Association(b)}]}})
+        self.assertEqual(
+            b.connections,
+            {
+                "1": {
+                    "red": [
+                        {"entity_id": Association(a)},
+                        {"entity_id": Association(c)},
+                    ]
+                }
+            },
+        )
+        self.assertEqual(
+            blueprint.get_circuit_network("0", "red"),
+            [(a, 1), (b, 1), (c, 1), (d, 1)],
+        )
+
+        # Same result as individual connections
+        other = Blueprint()
+        for i in range(4):
+            other.entities.append("small-lamp", tile_position=(i, 0))
+        for i in range(3):
+            other.add_circuit_connection("red", i, i + 1)
+        self.assertEqual(blueprint.to_dict(), other.to_dict())
+
+        # Existing connections are not duplicated
+        blueprint.connect_chain("red", ["0", "1"])
+        self.assertEqual(len(a.connections["1"]["red"]), 1)
+
+        # Trivial chains
+        blueprint.connect_chain("green", [])
+        blueprint.connect_chain("green", ["0"])
+        self.assertEqual(a.connections, {"1": {"red": [{"entity_id": Association(b)}]}})
+
+        # Dual circuit connectable entities
+        blueprint = Blueprint()
+        for i in range(3):
+            blueprint.entities.append("arithmetic-combinator", tile_position=(i, 0))
+        blueprint.connect_chain("green", [0, 1, 2], side=2)
+        self.assertEqual(
+            blueprint.entities[1].connections,
+            {
+                "2": {
+                    "green": [
+                        {
+                            "entity_id": Association(blueprint.entities[0]),
+                            "circuit_id": 2,
+                        },
+                        {
+                            "entity_id": Association(blueprint.entities[2]),
+                            "circuit_id": 2,
+                        },
+                    ]
+                }
+            },
+        )
+
+        # Warnings are issued once per batch
+        blueprint = Blueprint()
+        blueprint.entities.append("small-lamp")
+        blueprint.entities.append("small-lamp", tile_position=(50, 0))
+        blueprint.entities.append("small-lamp", tile_position=(100, 0))
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            blueprint.connect_chain("red", [0, 1, 2], side=2)
+        self.assertEqual(
+            [warning.category for warning in w],
+            [ConnectionSideWarning, ConnectionDistanceWarning],
+        )
+
+        # Errors leave the blueprint unmodified
+        blueprint = Blueprint()
+        blueprint.entities.append("small-lamp")
+        blueprint.entities.append("small-lamp", tile_position=(1, 0))
+        blueprint.entities.append("pipe", tile_position=(2, 0))
+        with self.assertRaises(EntityNotCircuitConnectableError):
+            blueprint.connect_chain("red", [0, 1, 2])
+        self.assertEqual(blueprint.entities[0].connections, {})
+        with self.assertRaises(InvalidWireTypeError):
+            blueprint.connect_chain("blue", [0, 1])
+        with self.assertRaises(InvalidConnectionSideError):
+            blueprint.connect_chain("red", [0, 1], side=3)
+        with self.assertRaises(InvalidAssociationError):
+            blueprint.connect_chain("red", [0, Container()])
+        with self.assertRaises(IndexError):
+            blueprint.connect_chain("red", [0, 10])
+        self.assertEqual(blueprint.entities[0].connections, {})
+
+    def test_connect_pairs(self):
+        blueprint = Blueprint()
+        blueprint.entities.append("small-lamp", id="a")
+        blueprint.entities.append("arithmetic-combinator", tile_position=(1, 0), id="b")
+        blueprint.entities.append("small-lamp", tile_position=(3, 0), id="c")
+        a, b, c = blueprint.entities
+
+        blueprint.connect_pairs("red", [("a", "b"), ("b", c, 2, 1)])
+        self.assertEqual(
+            a.connections,
+            {"1": {"red": [{"entity_id": Association(b), "circuit_id": 1}]}},
+        )
+        self.assertEqual(
+            b.connections,
+            {
+                "1": {"red": [{"entity_id": Association(a)}]},
+                "2": {"red": [{"entity_id": Association(c)}]},
+            },
+        )
+        self.assertEqual(
+            c.connections,
+            {"1": {"red": [{"entity_id": Association(b), "circuit_id": 2}]}},
+        )
+        self.assertEqual(blueprint.get_circuit_network("c", "red"), [(b, 2), (c, 1)])
+
+        # Groups
+        group = Group("group", position=(0, 5))
+        group.entities.append("small-lamp")
+        group.entities.append("small-lamp", tile_position=(1, 0))
+        blueprint.entities.append(group, copy=False)
+        group.connect_pairs("green", [(0, 1)])
+        blueprint.connect_pairs("green", [("c", ("group", 0))])
+        self.assertEqual(
+            blueprint.get_circuit_network("c", "green"),
+            [(c, 1), (group.entities[0], 1), (group.entities[1], 1)],
+        )
+
+        # Errors leave the blueprint unmodified
+        with self.assertRaises(InvalidConnectionSideError):
+            blueprint.connect_pairs("red", [("a", "c"), ("a", "b", 1, 3)])
+        with self.assertRaises(ValueError):
+            blueprint.connect_pairs("red", [("a", "c", 1)])
+        self.assertEqual(blueprint.get_circuit_network("a", "red"), [(a, 1), (b, 1)])
+
     # =========================================================================
     # TileCollection
     # =========================================================================
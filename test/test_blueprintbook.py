@@ -14,8 +14,13 @@ from draftsman.error import (
     DataFormatError,
 )
 from draftsman.utils import encode_version, string_to_JSON
-from draftsman.warning import DraftsmanWarning, IndexWarning
+from draftsman.warning import (
+    DraftsmanWarning,
+    IndexWarning,
+    OverlappingObjectsWarning,
+)
 
+import copy
 import sys
 
 if sys.version_info >= (3, 3):  # pragma: no coverage
@@ -437,6 +442,68 @@ class BlueprintBookTesting(unittest.TestCase):
         with self.assertRaises(TypeError):
             blueprint_book.blueprints = TypeError
 
+    def test_parallel_load(self):
+        blueprints = []
+        for i in range(6):
+            blueprint = Blueprint()
+            blueprint.label = "Blueprint {}".format(i)
+            blueprint.entities.append("small-electric-pole", id="a")
+            blueprint.entities.append("small-electric-pole", tile_position=(i, 1))
+            blueprint.add_power_connection("a", 1)
+            blueprints.append(blueprint)
+        blueprints.insert(2, DeconstructionPlanner())
+        blueprints.insert(4, UpgradePlanner())
+        nested = BlueprintBook()
+        nested.blueprints.append(blueprints[0])
+        blueprints.append(nested)
+        blueprint_book = BlueprintBook()
+        blueprint_book.blueprints = blueprints
+        blueprint_book.active_index = 5
+        expected = blueprint_book.to_dict()
+        blueprint_string = blueprint_book.to_string()
+
+        blueprint_book = BlueprintBook(blueprint_string, processes=2)
+        self.assertEqual(blueprint_book.to_dict(), expected)
+        self.assertEqual(blueprint_book.active_index, 5)
+        self.assertIsInstance(blueprint_book.blueprints[2], DeconstructionPlanner)
+        self.assertIsInstance(blueprint_book.blueprints[8], BlueprintBook)
+        # Connections refer to the entities of the blueprint they were sent with
+        blueprint = blueprint_book.blueprints[0]
+        pole = blueprint.entities[0]
+        self.assertIs(pole.neighbours[0](), blueprint.entities[1])
+        self.assertIs(pole.parent, blueprint)
+        # As do the indexes of each blueprint
+        self.assertEqual(
+            blueprint.find_entities_filtered(name="small-electric-pole"),
+            blueprint.entities.data,
+        )
+        self.assertEqual(blueprint.find_entities_filtered(type="container"), [])
+        blueprint.entities.append("wooden-chest", tile_position=(5, 5))
+        self.assertEqual(
+            blueprint.find_entities_filtered(type="container"), [blueprint.entities[2]]
+        )
+        blueprint.entities.pop(0)
+        self.assertEqual(
+            blueprint.find_entities_filtered(name="small-electric-pole"),
+            [blueprint.entities[0]],
+        )
+
+        blueprint_book = BlueprintBook(copy.deepcopy(expected), processes=None)
+        self.assertEqual(blueprint_book.to_dict(), expected)
+
+        # Warnings are reissued in this process
+        overlapping = Blueprint()
+        overlapping.entities.append("wooden-chest")
+        with self.assertWarns(OverlappingObjectsWarning):
+            overlapping.entities.append("wooden-chest")
+        blueprint_book.blueprints = [Blueprint(), overlapping]
+        with self.assertWarns(OverlappingObjectsWarning):
+            BlueprintBook(blueprint_book.to_dict(), processes=2)
+
+        # And errors are raised in this process
+        with self.assertRaises(TypeError):
+            BlueprintableList([{"blueprint": {}}, {"incorrect": {}}], processes=2)
+
     def test_version_tuple(self):
         blueprint_book = BlueprintBook()
         self.assertEqual(blueprint_book.version_tuple(), __factorio_version_info__)
@@ -0,0 +1,179 @@
+# test_circuit_index.py
+# -*- encoding: utf-8 -*-
+
+from draftsman.classes.association import Association
+from draftsman.classes.circuit_index import (
+    CircuitNetworkIndex,
+    has_circuit_connections,
+)
+from draftsman.classes.group import Group
+from draftsman.entity import ArithmeticCombinator, Lamp
+
+import pickle
+import sys
+
+if sys.version_info >= (3, 3):  # pragma: no coverage
+    import unittest
+else:  # pragma: no coverage
+    import unittest2 as unittest
+
+
+class CircuitNetworkIndexTesting(unittest.TestCase):
+    def test_union(self):
+        index = CircuitNetworkIndex()
+        a, b, c = Lamp(), ArithmeticCombinator(), Lamp()
+
+        # Unconnected points are their own network
+        self.assertEqual(index.get_network(a, "red"), [(a, 1)])
+
+        index.union("red", a, b, 1, 1)
+        index.union("red", b, c, 2, 1)
+        self.assertEqual(index.get_network(a, "red"), [(a, 1), (b, 1)])
+        self.assertEqual(index.get_network(c, "red"), [(b, 2), (c, 1)])
+        self.assertEqual(index.get_network(a, "green"), [(a, 1)])
+        self.assertEqual(
+            index.get_network_id(a, "red"), index.get_network_id(b, "red", 1)
+        )
+        self.assertNotEqual(
+            index.get_network_id(a, "red"), index.get_network_id(c, "red")
+        )
+
+        # Merging
+        index.union("red", b, b, 1, 2)
+        self.assertEqual(len(index.get_network(a, "red")), 4)
+        # Already connected
+        index.union("red", a, c)
+        self.assertEqual(len(index.get_network(c, "red")), 4)
+
+    def test_invalidate(self):
+        index = CircuitNetworkIndex()
+        a, b = Lamp(), Lamp()
+        index.union("red", a, b)
+        self.assertFalse(index.stale)
+
+        # Entities without connections are ignored
+        index.add(Lamp())
+        self.assertFalse(index.stale)
+        index.remove(Lamp())
+        self.assertFalse(index.stale)
+
+        # Removing a tracked entity splits its network instead
+        index.remove(a)
+        self.assertFalse(index.stale)
+        self.assertEqual(index.entities, {})
+
+        index.invalidate()
+        self.assertTrue(index.stale)
+        index.clear()
+        self.assertFalse(index.stale)
+
+        # Adding an entity with connections invalidates the index
+        a.connections = {"1": {"red": [{"entity_id": Association(b)}]}}
+        index.add(a)
+        self.assertTrue(index.stale)
+
+    def test_split(self):
+        group = Group()
+        for i in range(4):
+            group.entities.append("small-lamp", tile_position=(i, 0))
+        group.add_circuit_connection("red", 0, 1)
+        group.add_circuit_connection("red", 1, 2)
+        group.add_circuit_connection("red", 2, 3)
+        group.add_circuit_connection("red", 3, 0)
+        group.add_circuit_connection("green", 0, 1)
+        a, b, c, d = group.entities
+        index = group.circuit_index
+        self.assertEqual(len(group.get_circuit_network(a, "red")), 4)
+
+        # Still connected the other way around the loop
+        group.remove_circuit_connection("red", 0, 1)
+        self.assertFalse(index.stale)
+        self.assertEqual(len(group.get_circuit_network(a, "red")), 4)
+        self.assertEqual(group.get_circuit_network(a, "green"), [(a, 1), (b, 1)])
+
+        group.remove_circuit_connection("red", 2, 3)
+        self.assertFalse(index.stale)
+        self.assertEqual(
+            sorted(group.get_circuit_network(a, "red"), key=lambda p: p[0].tile_position.x),
+            [(a, 1), (d, 1)],
+        )
+        self.assertEqual(len(group.get_circuit_network(b, "red")), 2)
+        self.assertNotEqual(
+            group.get_circuit_network_id(a, "red"),
+            group.get_circuit_network_id(b, "red"),
+        )
+        # Other networks are untouched
+        self.assertEqual(group.get_circuit_network(b, "green"), [(a, 1), (b, 1)])
+
+        # Removing an entity splits its network and forgets it
+        group.entities.remove(b)
+        self.assertFalse(index.stale)
+        self.assertEqual(group.get_circuit_network(c, "red"), [(c, 1)])
+        self.assertEqual(group.get_circuit_network(a, "green"), [(a, 1)])
+        self.assertNotIn(id(b), index.entities)
+        self.assertNotIn(id(c), index.entities)
+
+        group.remove_circuit_connections()
+        self.assertFalse(index.stale)
+        self.assertEqual(index.entities, {})
+        self.assertEqual(group.get_circuit_network(a, "red"), [(a, 1)])
+
+    def test_read_only_queries(self):
+        index = CircuitNetworkIndex()
+        a, b = Lamp(), Lamp()
+        self.assertEqual(index.get_network(a, "red"), [(a, 1)])
+        self.assertNotEqual(
+            index.get_network_id(a, "red"), index.get_network_id(b, "red")
+        )
+        self.assertNotEqual(
+            index.get_network_id(a, "red"), index.get_network_id(a, "green")
+        )
+        self.assertEqual(index.parents, {})
+        self.assertEqual(index.entities, {})
+
+        # Untracked ids don't collide with the ids of tracked networks
+        index.union("red", a, b)
+        self.assertNotEqual(
+            index.get_network_id(a, "red"), index.get_network_id(a, "green")
+        )
+
+    def test_rebuild(self):
+        group = Group()
+        group.entities.append("small-lamp")
+        group.entities.append("arithmetic-combinator", tile_position=(1, 0))
+        group.entities.append("small-lamp", tile_position=(3, 0))
+        group.add_circuit_connection("green", 0, 1, 1, 2)
+        group.add_circuit_connection("green", 1, 2, 1, 1)
+        a, b, c = group.entities
+
+        index = CircuitNetworkIndex()
+        index.rebuild(group.entities)
+        self.assertEqual(index.get_network(a, "green"), [(a, 1), (b, 2)])
+        self.assertEqual(index.get_network(c, "green"), [(b, 1), (c, 1)])
+
+        # Connections to entities outside of the list are ignored
+        index.rebuild(group.entities[0:2])
+        self.assertEqual(index.get_network(a, "green"), [(a, 1), (b, 2)])
+        self.assertEqual(index.get_network(b, "green", 1), [(b, 1)])
+
+    def test_pickle(self):
+        group = Group()
+        group.entities.append("small-lamp")
+        group.entities.append("small-lamp", tile_position=(1, 0))
+        group.add_circuit_connection("red", 0, 1)
+        self.assertEqual(len(group.get_circuit_network(group.entities[0], "red")), 2)
+
+        # Unpickled indexes are rebuilt from the unpickled entities
+        group = pickle.loads(pickle.dumps(group, 2))
+        self.assertTrue(group.circuit_index.stale)
+        a, b = group.entities
+        self.assertEqual(group.get_circuit_network(a, "red"), [(a, 1), (b, 1)])
+
+    def test_has_circuit_connections(self):
+        group = Group()
+        group.entities.append("small-lamp")
+        group.entities.append("small-lamp", tile_position=(1, 0))
+        self.assertFalse(has_circuit_connections(group))
+        group.add_circuit_connection("red", 0, 1)
+        self.assertTrue(has_circuit_connections(group))
+        self.assertTrue(has_circuit_connections(group.entities[0]))
@@ -1,7 +1,12 @@
 # test_collisionset.py
 # -*- encoding: utf-8 -*-
 
-from draftsman.classes.collisionset import CollisionSet
+from draftsman.classes.collisionset import (
+    CollisionSet,
+    get_collision_set_rotations,
+    clear_collision_set_cache,
+)
+from draftsman.entity import StraightRail, CurvedRail, Inserter
 from draftsman.utils import AABB, Rectangle
 
 import sys
@@ -49,3 +54,38 @@ class CollisionSetTesting(unittest.TestCase):
 
     def test_eq(self):
         pass  # TODO
+
+    def test_rotation_cache(self):
+        clear_collision_set_cache()
+        calls = []
+
+        def generate():
+            calls.append(None)
+            return {0: CollisionSet([AABB(0, 0, 1, 2)]), 2: CollisionSet([])}
+
+        first = get_collision_set_rotations("test", (0, 2), generate)
+        second = get_collision_set_rotations("test", (0, 2), generate)
+        self.assertEqual(len(calls), 1)
+        self.assertIs(first[0], second[0])
+        self.assertIs(first[2], second[2])
+
+        # Different names are cached separately
+        get_collision_set_rotations("other", (0, 2), generate)
+        self.assertEqual(len(calls), 2)
+
+        clear_collision_set_cache()
+        get_collision_set_rotations("test", (0, 2), generate)
+        self.assertEqual(len(calls), 3)
+
+    def test_entity_rotation_sharing(self):
+        rail1 = StraightRail("straight-rail", direction=1)
+        rail2 = StraightRail("straight-rail", direction=1)
+        self.assertIs(rail1.collision_set, rail2.collision_set)
+
+        curved1 = CurvedRail("curved-rail", direction=3)
+        curved2 = CurvedRail("curved-rail", direction=3)
+        self.assertIs(curved1.collision_set, curved2.collision_set)
+
+        inserter1 = Inserter("inserter", direction=2)
+        inserter2 = Inserter("inserter", direction=2)
+        self.assertIs(inserter1.collision_set, inserter2.collision_set)
@@ -0,0 +1,192 @@
+# test_compiled_schema.py
+# -*- encoding: utf-8 -*-
+
+from draftsman import signatures
+from draftsman.classes.association import Association
+from draftsman.classes.compiled_schema import CompiledSchema
+from draftsman.entity import new_entity
+
+from collections import OrderedDict
+from schema import Schema, And, Or, Use, Optional, Regex, SchemaError
+import six
+import sys
+
+if sys.version_info >= (3, 3):  # pragma: no coverage
+    import unittest
+else:  # pragma: no coverage
+    import unittest2 as unittest
+
+
+class CompiledSchemaTesting(unittest.TestCase):
+    def assertSameResult(self, schema, data):
+        """
+        Checks that the compiled and original schemas both accept ``data`` and
+        produce identical results, or both reject it with the same message.
+        """
+        compiled = CompiledSchema(schema)
+        try:
+            expected = schema.validate(data)
+        except SchemaError as error:
+            with self.assertRaises(SchemaError) as context:
+                compiled.validate(data)
+            self.assertEqual(str(context.exception), str(error))
+        else:
+            result = compiled.validate(data)
+            self.assertEqual(result, expected)
+            self.assertIs(type(result), type(expected))
+            if isinstance(result, dict):
+                self.assertEqual(list(result), list(expected))
+            # Make sure the compiled function itself accepted the data
+            self.assertEqual(compiled.function(data), expected)
+
+    def test_constructor(self):
+        compiled = CompiledSchema(Schema(int))
+        self.assertIsInstance(compiled.schema, Schema)
+        self.assertIn("def ", compiled.source)
+
+        with self.assertRaises(TypeError):
+            CompiledSchema(Schema({str: int}))
+        with self.assertRaises(TypeError):
+            CompiledSchema(Schema({Optional("a", default=1): int}))
+
+    def test_types(self):
+        self.assertSameResult(Schema(int), 10)
+        self.assertSameResult(Schema(int), True)
+        self.assertSameResult(Schema(int), "10")
+        self.assertSameResult(Schema(bool), False)
+        self.assertSameResult(Schema(bool), 0)
+        self.assertSameResult(Schema(six.text_type), "test")
+
+    def test_literals(self):
+        self.assertSameResult(Schema("a"), "a")
+        self.assertSameResult(Schema("a"), "b")
+        self.assertSameResult(Schema(Or("a", "b", None)), None)
+        self.assertSameResult(Schema(Or("a", "b", None)), "c")
+        self.assertSameResult(Schema(Or(1, 2)), True)
+        self.assertSameResult(Schema(Or(1, 2)), [1])
+        self.assertSameResult(Schema(Or(1.5, "a")), 1.5)
+
+    def test_and_or_use(self):
+        schema = Schema(And(Use(int), lambda x: 0 <= x <= 10, error="Bad value"))
+        self.assertSameResult(schema, "5")
+        self.assertSameResult(schema, "50")
+        self.assertSameResult(schema, "five")
+
+        schema = Schema(Or(And(str, Use(len)), int, [int]))
+        self.assertSameResult(schema, "test")
+        self.assertSameResult(schema, 5)
+        self.assertSameResult(schema, [1, 2])
+        self.assertSameResult(schema, 5.0)
+
+        # Callables used as validators
+        self.assertSameResult(Schema(lambda x: x), [])
+        self.assertSameResult(Schema(lambda x: x[0]), [])
+
+        # Other validators
+        self.assertSameResult(Schema(Regex("^a+$")), "aaa")
+        self.assertSameResult(Schema(Regex("^a+$")), "b")
+
+    def test_use_errors(self):
+        # Errors raised by ``Use`` functions are reported with the same message
+        schema = Schema({"a": [Use(float)], Optional("b"): Or(None, Use(int))})
+        self.assertSameResult(schema, {"a": ["1", "x"]})
+        self.assertSameResult(schema, {"a": [], "b": "x"})
+        self.assertSameResult(schema, {"a": [], "b": "1"})
+        schema = Schema(And({"a": Use(int, error="bad a")}, error="bad dict"))
+        self.assertSameResult(schema, {"a": "x"})
+        schema = Schema(Or(Use(int), [int], error="bad value"))
+        self.assertSameResult(schema, "x")
+        self.assertSameResult(schema, ["x"])
+
+        # But without calling them again
+        calls = []
+
+        def function(value):
+            calls.append(value)
+            raise ValueError("rejected")
+
+        schema = Schema({"a": Or(int, Use(function))})
+        with self.assertRaises(SchemaError) as expected:
+            schema.validate({"a": "x"})
+        del calls[:]
+        with self.assertRaises(SchemaError) as context:
+            CompiledSchema(schema).validate({"a": "x"})
+        self.assertEqual(calls, ["x"])
+        self.assertEqual(str(context.exception), str(expected.exception))
+
+    def test_lists(self):
+        schema = Schema([Or(int, "a")])
+        self.assertSameResult(schema, [])
+        self.assertSameResult(schema, [1, "a", 2])
+        self.assertSameResult(schema, [1, "b"])
+        self.assertSameResult(schema, (1, 2))
+        self.assertSameResult(Schema((int,)), (1, 2))
+        self.assertSameResult(Schema([Association]), "test")
+
+    def test_dicts(self):
+        schema = Schema(
+            {
+                "a": int,
+                Optional("b"): {"c": Use(str)},
+                Optional("d"): [int],
+            }
+        )
+        # Values that are not dicts are inserted first
+        self.assertSameResult(schema, {"b": {"c": 1}, "a": 1, "d": [1]})
+        self.assertSameResult(schema, OrderedDict([("b", {"c": 1}), ("a", 1)]))
+        self.assertSameResult(schema, {"a": 1})
+        # Missing keys
+        self.assertSameResult(schema, {"b": {"c": 1}})
+        # Wrong keys
+        self.assertSameResult(schema, {"a": 1, "e": 1})
+        self.assertSameResult(schema, {"a": 1, 10: 1})
+        # Wrong values
+        self.assertSameResult(schema, {"a": "1"})
+        self.assertSameResult(schema, {"a": 1, "b": {}})
+        self.assertSameResult(schema, [])
+
+        # Larger dicts are validated with a table of handlers
+        schema = Schema({Optional(key): int for key in "abcdef"})
+        self.assertSameResult(schema, {"a": 1, "f": 2})
+        self.assertSameResult(schema, {"a": 1, "g": 2})
+        self.assertSameResult(schema, {"a": "1"})
+        self.assertSameResult(schema, {})
+
+    def test_signatures(self):
+        self.assertIsInstance(signatures.SIGNAL_ID, CompiledSchema)
+        self.assertIsInstance(signatures.LAMP_CONTROL_BEHAVIOR, CompiledSchema)
+
+        self.assertSameResult(signatures.SIGNAL_ID.schema, "signal-A")
+        self.assertSameResult(signatures.SIGNAL_ID.schema, "incorrect")
+        self.assertSameResult(
+            signatures.CONDITION.schema,
+            {"first_signal": "signal-A", "comparator": "==", "constant": 5},
+        )
+        self.assertSameResult(
+            signatures.DECIDER_COMBINATOR_CONTROL_BEHAVIOR.schema,
+            {
+                "decider_conditions": {
+                    "first_signal": {"name": "signal-A", "type": "virtual"},
+                    "comparator": ">=",
+                    "second_signal": "signal-B",
+                    "output_signal": "signal-C",
+                }
+            },
+        )
+        self.assertSameResult(
+            signatures.DECIDER_COMBINATOR_CONTROL_BEHAVIOR.schema,
+            {"decider_conditions": {"comparator": "incorrect"}},
+        )
+        self.assertSameResult(signatures.COLOR.schema, (255, 0, 0))
+        self.assertSameResult(signatures.COLOR.schema, (256, 0, 0))
+        self.assertSameResult(
+            signatures.SIGNAL_FILTERS.schema, [("signal-A", 100), ("signal-B", 200)]
+        )
+        self.assertSameResult(signatures.REQUEST_FILTERS.schema, [])
+        entity = new_entity("small-electric-pole")
+        self.assertSameResult(signatures.NEIGHBOURS.schema, [Association(entity), 2])
+        self.assertSameResult(signatures.CONNECTIONS.schema, None)
+        self.assertSameResult(
+            signatures.CONNECTIONS.schema,
+            {"1": {"red": [{"entity_id": 1, "circuit_id": 3}]}},
+        )
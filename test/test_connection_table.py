@@ -0,0 +1,150 @@
+# test_connection_table.py
+# -*- encoding: utf-8 -*-
+
+from draftsman.classes.association import Association
+from draftsman.classes.blueprint import Blueprint
+from draftsman.classes.connection_table import ConnectionTable
+from draftsman.classes.group import Group
+from draftsman.error import InvalidAssociationError
+from draftsman.utils import flatten_entities
+
+import copy
+import pickle
+import sys
+
+if sys.version_info >= (3, 3):  # pragma: no coverage
+    import unittest
+else:  # pragma: no coverage
+    import unittest2 as unittest
+
+
+def make_blueprint():
+    blueprint = Blueprint()
+    blueprint.entities.append("small-electric-pole")
+    blueprint.entities.append("power-switch", tile_position=(2, 0))
+    blueprint.entities.append("small-electric-pole", tile_position=(5, 0))
+    blueprint.entities.append("arithmetic-combinator", tile_position=(0, 2))
+    blueprint.entities.append("small-lamp", tile_position=(1, 2))
+    blueprint.add_power_connection(0, 1, 1)
+    blueprint.add_power_connection(2, 1, 2)
+    blueprint.add_power_connection(0, 2)
+    blueprint.add_circuit_connection("red", 3, 4, 2, 1)
+    blueprint.add_circuit_connection("green", 3, 0, 1, 1)
+    return blueprint
+
+
+class ConnectionTableTesting(unittest.TestCase):
+    def test_constructor(self):
+        blueprint = make_blueprint()
+        table = ConnectionTable(blueprint.entities)
+        self.assertEqual(table.entities, blueprint.entities.data)
+        self.assertEqual(table.starts, [0, 2, 4, 5, 7, 8])
+        self.assertEqual(len(table), 8)
+        self.assertEqual(
+            table.get_edges(1),
+            [(1, "Cu0", None, 0, 0), (1, "Cu1", None, 2, 0)],
+        )
+        self.assertEqual(
+            table.get_edges(3),
+            [(3, "2", "red", 4, None), (3, "1", "green", 0, None)],
+        )
+        self.assertEqual(table.get_edges(4), [(4, "1", "red", 3, 2)])
+
+        # Empty
+        table = ConnectionTable([])
+        self.assertEqual(table.starts, [0])
+        self.assertEqual(len(table), 0)
+
+        # Connections to entities not in the table
+        with self.assertRaises(InvalidAssociationError):
+            ConnectionTable(blueprint.entities[0:2])
+
+        # Connections to entities that no longer exist
+        blueprint = make_blueprint()
+        lamp = blueprint.entities[4]
+        copied = copy.deepcopy(blueprint.entities[3])
+        del blueprint.entities[4]
+        del lamp
+        with self.assertRaises(InvalidAssociationError):
+            ConnectionTable([copied])
+
+    def test_handle(self):
+        blueprint = make_blueprint()
+        table = ConnectionTable(blueprint.entities)
+        self.assertEqual(table.handle(blueprint.entities[2]), 2)
+        with self.assertRaises(InvalidAssociationError):
+            table.handle(Blueprint())
+
+    def test_connections(self):
+        blueprint = make_blueprint()
+        table = ConnectionTable(blueprint.entities)
+        self.assertEqual(
+            table.connections(0), {"1": {"green": [{"entity_id": 4, "circuit_id": 1}]}}
+        )
+        self.assertEqual(
+            table.connections(1),
+            {
+                "Cu0": [{"entity_id": 1, "wire_id": 0}],
+                "Cu1": [{"entity_id": 3, "wire_id": 0}],
+            },
+        )
+        self.assertEqual(
+            table.connections(4, offset=0),
+            {"1": {"red": [{"entity_id": 3, "circuit_id": 2}]}},
+        )
+        # Power switch connections are only stored on the switch
+        self.assertEqual(table.connections(2), {})
+
+    def test_neighbours(self):
+        blueprint = make_blueprint()
+        table = ConnectionTable(blueprint.entities)
+        self.assertEqual(table.neighbours(0), [3])
+        self.assertEqual(table.neighbours(2, offset=0), [0])
+        self.assertEqual(table.neighbours(3), [])
+
+    def test_apply(self):
+        blueprint = make_blueprint()
+        table = ConnectionTable(blueprint.entities)
+        copies = [copy.deepcopy(entity) for entity in blueprint.entities]
+        table.apply(copies)
+
+        # The copies now point at each other instead of the originals
+        self.assertEqual(copies[0].neighbours, [Association(copies[2])])
+        self.assertEqual(
+            copies[1].connections,
+            {
+                "Cu0": [{"entity_id": Association(copies[0]), "wire_id": 0}],
+                "Cu1": [{"entity_id": Association(copies[2]), "wire_id": 0}],
+            },
+        )
+        self.assertEqual(
+            copies[3].connections,
+            {
+                "2": {"red": [{"entity_id": Association(copies[4])}]},
+                "1": {"green": [{"entity_id": Association(copies[0])}]},
+            },
+        )
+        self.assertEqual(ConnectionTable(copies).edges, table.edges)
+
+        # Nested entities
+        group = Group("group", position=(0, 5))
+        group.entities.append("small-lamp")
+        blueprint.entities.append(group, copy=False)
+        blueprint.add_circuit_connection("red", 4, ("group", 0))
+        entities = flatten_entities(blueprint.entities)
+        table = ConnectionTable(entities)
+        copies = [copy.deepcopy(entity) for entity in entities]
+        table.apply(copies)
+        self.assertEqual(
+            copies[5].connections,
+            {"1": {"red": [{"entity_id": Association(copies[4])}]}},
+        )
+
+    def test_pickle(self):
+        blueprint = make_blueprint()
+        table = pickle.loads(pickle.dumps(ConnectionTable(blueprint.entities), 2))
+        self.assertEqual(table.edges, ConnectionTable(blueprint.entities).edges)
+        # Handles refer to the unpickled entities
+        for i, entity in enumerate(table.entities):
+            self.assertEqual(table.handle(entity), i)
+        table.apply(table.entities)
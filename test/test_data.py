@@ -3,6 +3,7 @@
 
 from draftsman.data import entities
 
+import subprocess
 import sys
 
 if sys.version_info >= (3, 3):  # pragma: no coverage
@@ -18,3 +19,25 @@ class EntitiesDataTesting(unittest.TestCase):
                 entities.flippable[entity_name]
             except KeyError:  # pragma: no coverage
                 self.fail("'{}' had no entry in entities.flippable".format(entity_name))
+
+
+class LazyDataTesting(unittest.TestCase):
+    def test_lazy_attributes(self):
+        from draftsman.data import items, mods, tiles
+
+        for module in (entities, items, mods, tiles):
+            for name in module._lazy_attributes:
+                self.assertIsNotNone(getattr(module, name))
+            with self.assertRaises(AttributeError):
+                module.incorrect
+
+    def test_not_loaded_on_import(self):
+        # Has to be a fresh interpreter, since other tests load the data
+        script = (
+            "import draftsman.data as data\n"
+            "import draftsman.data.tiles as tiles\n"
+            "assert 'tiles' not in vars(data.get_profile())\n"
+            "assert 'concrete' in tiles.raw\n"
+            "assert 'tiles' in vars(data.get_profile())\n"
+        )
+        subprocess.check_call([sys.executable, "-c", script])
@@ -9,6 +9,7 @@ from draftsman.error import *
 from draftsman.warning import *
 from draftsman.utils import AABB
 
+import subprocess
 import sys
 
 if sys.version_info >= (3, 3):  # pragma: no coverage
@@ -125,6 +126,28 @@ class EntityTesting(unittest.TestCase):
         self.assertIs(example.parent, blueprint)
         self.assertIs(copy_example.parent, None)  # Make sure parent in copy is None
 
+    def test_clone(self):
+        example = Inserter(
+            "inserter", id="test", direction=Direction.EAST, tags={"a": [1, 2]}
+        )
+        blueprint = Blueprint()
+        blueprint.entities.append(example, copy=False)
+
+        copy_example = example.clone()
+        self.assertIsNot(example, copy_example)
+        self.assertEqual(example.to_dict(), copy_example.to_dict())
+        self.assertEqual(example.id, copy_example.id)
+        self.assertIs(example.parent, blueprint)
+        self.assertIs(copy_example.parent, None)
+        self.assertIsNot(example.tags, copy_example.tags)
+        self.assertIsNot(example.position, copy_example.position)
+        self.assertIs(example.similar_entities, copy_example.similar_entities)
+        # Rotated collision sets are shared, and still follow direction changes
+        self.assertIs(example.collision_set, copy_example.collision_set)
+        copy_example.direction = Direction.NORTH
+        self.assertEqual(example.direction, Direction.EAST)
+        self.assertIsNot(example.collision_set, copy_example.collision_set)
+
     def test_change_id_in_blueprint(self):
         blueprint = Blueprint()
         example = Container("wooden-chest", id="whatever")
@@ -352,5 +375,33 @@ class EntityFactoryTesting(unittest.TestCase):
             new_entity,
             "I have a lot of entities that I need to test...",
         )
+        self.assertRaises(InvalidEntityError, new_entity, ["unhashable"])
+
+    def test_lazy_prototypes(self):
+        import draftsman.entity
+
+        self.assertIs(draftsman.entity.Container, Container)
+        self.assertIs(draftsman.entity.containers, containers)
+        self.assertIn("Container", dir(draftsman.entity))
+        with self.assertRaises(AttributeError):
+            draftsman.entity.incorrect
+
+    @unittest.skipIf(sys.version_info < (3, 7), "Requires module __getattr__")
+    def test_prototypes_not_imported(self):
+        # Has to be a fresh interpreter, since other tests import everything
+        script = (
+            "import sys\n"
+            "from draftsman.entity import new_entity, TransportBelt\n"
+            "new_entity('inserter')\n"
+            "prototypes = {\n"
+            "    name for name in sys.modules\n"
+            "    if name.startswith('draftsman.prototypes.')\n"
+            "}\n"
+            "assert prototypes == {\n"
+            "    'draftsman.prototypes.transport_belt',\n"
+            "    'draftsman.prototypes.inserter',\n"
+            "}, prototypes\n"
+        )
+        subprocess.check_call([sys.executable, "-c", script])
 
 # fmt: on
@@ -0,0 +1,392 @@
+# test_env.py
+# -*- encoding: utf-8 -*-
+
+from draftsman import env
+from draftsman.classes.prototype_database import PrototypeDatabase
+
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import zipfile
+
+if sys.version_info >= (3, 3):  # pragma: no coverage
+    import unittest
+else:  # pragma: no coverage
+    import unittest2 as unittest
+
+
+class EnvFingerprintTesting(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.factorio_data = os.path.join(self.directory, "factorio-data")
+        os.makedirs(os.path.join(self.factorio_data, "base"))
+        with open(os.path.join(self.factorio_data, "base", "data.lua"), "w") as f:
+            f.write("require('prototypes')\n")
+
+        self.mods = os.path.join(self.directory, "factorio-mods")
+        os.makedirs(os.path.join(self.mods, "folder-mod"))
+        with open(os.path.join(self.mods, "folder-mod", "info.json"), "w") as f:
+            f.write('{"name": "folder-mod"}')
+        with zipfile.ZipFile(os.path.join(self.mods, "zip-mod_1.0.0.zip"), "w") as f:
+            f.writestr("zip-mod_1.0.0/info.json", '{"name": "zip-mod"}')
+        with open(os.path.join(self.mods, "mod-settings.dat"), "wb") as f:
+            f.write(b"\x01\x00\x00\x00")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def fingerprints(self, no_mods=False):
+        return env.get_input_fingerprints(self.factorio_data, self.mods, no_mods)
+
+    def test_fingerprint_file(self):
+        filepath = os.path.join(self.mods, "mod-settings.dat")
+        self.assertEqual(
+            env.fingerprint_file(filepath),
+            hashlib.sha256(b"\x01\x00\x00\x00").hexdigest(),
+        )
+
+    def test_fingerprint_folder(self):
+        folder = os.path.join(self.mods, "folder-mod")
+        before = env.fingerprint_folder(folder)
+
+        # Independent of the folder's location
+        moved = os.path.join(self.directory, "moved")
+        shutil.copytree(folder, moved)
+        self.assertEqual(env.fingerprint_folder(moved), before)
+
+        # Changing contents changes the fingerprint
+        with open(os.path.join(moved, "info.json"), "w") as f:
+            f.write('{"name": "folder-mod", "version": "1.0.0"}')
+        self.assertNotEqual(env.fingerprint_folder(moved), before)
+
+        # So does renaming a file
+        shutil.rmtree(moved)
+        shutil.copytree(folder, moved)
+        os.rename(os.path.join(moved, "info.json"), os.path.join(moved, "data.json"))
+        self.assertNotEqual(env.fingerprint_folder(moved), before)
+
+    def test_get_input_fingerprints(self):
+        fingerprints = self.fingerprints()
+        self.assertEqual(
+            list(fingerprints),
+            ["lua", "no_mods", "factorio-data", "compatibility", "mods"],
+        )
+        self.assertEqual(
+            list(fingerprints["mods"]),
+            ["folder-mod", "mod-settings.dat", "zip-mod_1.0.0.zip"],
+        )
+        self.assertEqual(fingerprints, self.fingerprints())
+
+        # Changing the settings only changes the settings fingerprint
+        with open(os.path.join(self.mods, "mod-settings.dat"), "wb") as f:
+            f.write(b"\x02\x00\x00\x00")
+        self.assertEqual(
+            env.get_changed(fingerprints, self.fingerprints()),
+            ["mods/mod-settings.dat"],
+        )
+
+        # Adding, removing and changing mods
+        os.remove(os.path.join(self.mods, "zip-mod_1.0.0.zip"))
+        with zipfile.ZipFile(os.path.join(self.mods, "zip-mod_1.1.0.zip"), "w") as f:
+            f.writestr("zip-mod_1.1.0/info.json", '{"name": "zip-mod"}')
+        with open(os.path.join(self.mods, "folder-mod", "data.lua"), "w") as f:
+            f.write("")
+        self.assertEqual(
+            env.get_changed(fingerprints, self.fingerprints(no_mods=True)),
+            [
+                "mods/folder-mod",
+                "mods/mod-settings.dat",
+                "mods/zip-mod_1.0.0.zip",
+                "mods/zip-mod_1.1.0.zip",
+                "no_mods",
+            ],
+        )
+
+        # Mods can't be mistaken for the other inputs
+        fingerprints = self.fingerprints()
+        os.makedirs(os.path.join(self.mods, "lua"))
+        self.assertEqual(fingerprints["lua"], self.fingerprints()["lua"])
+        self.assertEqual(
+            env.get_changed(fingerprints, self.fingerprints()), ["mods/lua"]
+        )
+
+    def test_get_output_fingerprints(self):
+        data_location = os.path.join(self.directory, "data")
+        os.makedirs(data_location)
+        fingerprints = env.get_output_fingerprints(data_location)
+        self.assertIn("env.py", fingerprints)
+        self.assertIn("prototype_database.py", fingerprints)
+        for filename in env.extracted_files:
+            self.assertIs(fingerprints[filename], None)
+
+        with open(os.path.join(data_location, "mods.pkl"), "wb") as f:
+            f.write(b"")
+        self.assertEqual(
+            env.get_changed(fingerprints, env.get_output_fingerprints(data_location)),
+            ["mods.pkl"],
+        )
+
+    def test_get_cache_location(self):
+        first = os.path.join(self.directory, "first")
+        second = os.path.join(self.directory, "second")
+        self.assertEqual(env.get_cache_location(first), env.get_cache_location(first))
+        self.assertNotEqual(
+            env.get_cache_location(first), env.get_cache_location(second)
+        )
+        self.assertEqual(
+            os.path.dirname(env.get_cache_location(first)),
+            os.path.join(os.path.dirname(env.__file__), "env-cache"),
+        )
+
+    def test_read_cache(self):
+        cache_location = os.path.join(self.directory, "env-cache")
+        self.assertIs(env.read_cache(cache_location), None)
+
+        os.makedirs(cache_location)
+        cache = {"inputs": dict(self.fingerprints()), "outputs": {}}
+        with open(os.path.join(cache_location, "fingerprints.json"), "w") as f:
+            json.dump(cache, f)
+        # No snapshot
+        self.assertIs(env.read_cache(cache_location), None)
+
+        with open(os.path.join(cache_location, "data-raw.pkl"), "wb") as f:
+            f.write(b"")
+        self.assertEqual(env.read_cache(cache_location), cache)
+        self.assertEqual(env.read_cache(cache_location)["inputs"], self.fingerprints())
+
+        # Corrupt fingerprints
+        with open(os.path.join(cache_location, "fingerprints.json"), "w") as f:
+            f.write("{")
+        self.assertIs(env.read_cache(cache_location), None)
+
+
+class EnvExtractTesting(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_extract_tiles(self):
+        # Extraction only needs data.raw, not a Lua runtime
+        data_raw = {
+            "tile": {
+                "stone-path": {"name": "stone-path", "order": "b"},
+                "concrete": {"name": "concrete", "order": "a"},
+                "water": {"name": "water"},
+            }
+        }
+        env.extract_tiles(data_raw, self.directory, False)
+        tiles = PrototypeDatabase(os.path.join(self.directory, "tiles.db"))
+        self.assertEqual(list(tiles), ["concrete", "stone-path", "water"])
+        self.assertEqual(tiles["water"], {"name": "water"})
+
+    def test_run_extractors(self):
+        data_raw = {
+            "tile": {"concrete": {"name": "concrete", "order": "a"}},
+            "programmable-speaker": {
+                "programmable-speaker": {
+                    "name": "programmable-speaker",
+                    "instruments": [
+                        {"name": "alarms", "notes": [{"name": "alarm-1"}]},
+                    ],
+                }
+            },
+        }
+        snapshot_path = os.path.join(self.directory, "data-raw.pkl")
+        with open(snapshot_path, "wb") as f:
+            pickle.dump(data_raw, f, 2)
+
+        functions = [env.extract_tiles, env.extract_instruments]
+        for processes in (1, 2):
+            data_location = os.path.join(self.directory, str(processes))
+            os.makedirs(data_location)
+            timings = env.run_extractors(
+                functions, snapshot_path, None, data_location, processes=processes
+            )
+            self.assertEqual(
+                [name for name, _ in timings], ["extract_tiles", "extract_instruments"]
+            )
+
+            tiles = PrototypeDatabase(os.path.join(data_location, "tiles.db"))
+            self.assertEqual(list(tiles), ["concrete"])
+            with open(os.path.join(data_location, "instruments.pkl"), "rb") as f:
+                raw, index, names = pickle.load(f)
+            self.assertEqual(index["programmable-speaker"]["alarms"]["alarm-1"], 0)
+            self.assertEqual(names["programmable-speaker"][0][0], "alarm-1")
+
+
+class LuaTableConverterTesting(unittest.TestCase):
+    def setUp(self):
+        self.lua = env.lupa.LuaRuntime(unpack_returned_tuples=True)
+
+    def test_convert(self):
+        table = self.lua.execute("""
+            return {
+                name = "test",
+                size = 1.5,
+                flags = {"placeable-neutral", "player-creation"},
+                sparse = {[1] = "a", [3] = "c"},
+                mixed = {1, 2, z = 3},
+                nested = {a = {b = {c = {}}}},
+            }
+            """)
+        converter = env.LuaTableConverter(self.lua)
+        result = converter.convert(table)
+        self.assertEqual(result, env.convert_table_to_dict(table))
+        self.assertEqual(
+            result,
+            {
+                "name": "test",
+                "size": 1.5,
+                "flags": ["placeable-neutral", "player-creation"],
+                "sparse": ["a", "c"],
+                "mixed": {1: 1, 2: 2, "z": 3},
+                "nested": {"a": {"b": {"c": []}}},
+            },
+        )
+        # Converted tables are remembered
+        self.assertIs(converter.convert(table), result)
+
+    def test_convert_shared(self):
+        table = self.lua.execute("""
+            local shared = {filename = "sprite.png"}
+            local t = {a = {sprite = shared}, b = {sprite = shared}}
+            t.self = t
+            return t
+            """)
+        result = env.LuaTableConverter(self.lua).convert(table)
+        self.assertEqual(result["a"], {"sprite": {"filename": "sprite.png"}})
+        self.assertIs(result["a"]["sprite"], result["b"]["sprite"])
+        self.assertIs(result["self"], result)
+
+    def test_convert_deep(self):
+        table = self.lua.execute("""
+            local root = {}
+            local t = root
+            for i = 1, 5000 do
+                t.next = {}
+                t = t.next
+            end
+            return root
+            """)
+        result = env.LuaTableConverter(self.lua).convert(table)
+        depth = 0
+        while result:
+            result = result["next"]
+            depth += 1
+        self.assertEqual(depth, 5000)
+
+    def test_convert_large(self):
+        converter = env.LuaTableConverter(self.lua)
+        size = converter.max_unpacked
+        table = self.lua.execute(
+            "local t = {{}} for i = 1, {} do t[i] = {{i}} end return t".format(size)
+        )
+        self.assertEqual(converter.convert(table), [[i] for i in range(1, size + 1)])
+
+        table = self.lua.execute(
+            "local t = {} for i = 1, 10 do t['k' .. i] = i end return t"
+        )
+        self.assertEqual(
+            converter.convert(table), {"k" + str(i): i for i in range(1, 11)}
+        )
+
+    def test_convert_lazy(self):
+        table = self.lua.execute("""
+            return {
+                item = {["iron-plate"] = {name = "iron-plate"}},
+                recipe = {["iron-plate"] = {name = "iron-plate"}},
+                ["utility-constants"] = 10,
+            }
+            """)
+        converter = env.LuaTableConverter(self.lua)
+        lazy = converter.convert_lazy(table)
+        self.assertEqual(sorted(lazy), ["item", "recipe", "utility-constants"])
+        self.assertEqual(len(lazy), 3)
+        self.assertEqual(lazy._values, {})
+
+        self.assertEqual(lazy["item"], {"iron-plate": {"name": "iron-plate"}})
+        self.assertEqual(list(lazy._values), ["item"])
+        self.assertIs(lazy["item"], lazy["item"])
+        self.assertEqual(lazy["utility-constants"], 10)
+        self.assertIn("recipe", lazy)
+        self.assertNotIn("tile", lazy)
+        with self.assertRaises(KeyError):
+            lazy["tile"]
+
+
+class ModArchiveTesting(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.filepath = os.path.join(self.directory, "test-mod_1.0.0.zip")
+        with zipfile.ZipFile(self.filepath, "w") as f:
+            f.writestr("test-mod_1.0.0/", "")
+            f.writestr("test-mod_1.0.0/info.json", '{"name": "test-mod"}')
+            f.writestr("test-mod_1.0.0/data.lua", "\ufeffrequire('prototypes.entity')")
+            f.writestr("test-mod_1.0.0/prototypes/entity.lua", "return {}")
+        self.archive = env.ModArchive(self.filepath)
+
+    def tearDown(self):
+        self.archive.archive.close()
+        shutil.rmtree(self.directory)
+
+    def test_read(self):
+        self.assertIn("test-mod_1.0.0/data.lua", self.archive)
+        self.assertIn("test-mod_1.0.0\\prototypes\\entity.lua", self.archive)
+        self.assertIn("test-mod_1.0.0/./prototypes/../data.lua", self.archive)
+        self.assertNotIn("test-mod_1.0.0/settings.lua", self.archive)
+        # Folders aren't files
+        self.assertNotIn("test-mod_1.0.0", self.archive)
+        self.assertIn("test-mod_1.0.0/", self.archive.namelist())
+
+        # Byte-order marks are stripped
+        contents = self.archive.read("test-mod_1.0.0/data.lua")
+        self.assertEqual(contents, "require('prototypes.entity')")
+        # And cached
+        self.assertIs(self.archive.read("test-mod_1.0.0\\data.lua"), contents)
+
+        with self.assertRaises(KeyError):
+            self.archive.read("test-mod_1.0.0/settings.lua")
+
+    def test_python_require(self):
+        mod = env.Mod(
+            name="test-mod",
+            internal_folder="test-mod_1.0.0",
+            version="1.0.0",
+            archive=True,
+            location="./factorio-mods/test-mod_1.0.0",
+            info=None,
+            files=self.archive,
+            data={},
+        )
+        package_path = "./core/lualib/?.lua;./factorio-mods/test-mod_1.0.0/?.lua"
+
+        result = env.python_require(mod, None, "prototypes/entity", package_path)
+        self.assertEqual(result, ("return {}", "/prototypes"))
+        self.assertEqual(
+            self.archive.requires,
+            {
+                (
+                    "prototypes/entity",
+                    package_path,
+                ): "test-mod_1.0.0/prototypes/entity.lua"
+            },
+        )
+        # Found the second time from the cache
+        result = env.python_require(mod, None, "prototypes/entity", package_path)
+        self.assertEqual(result, ("return {}", "/prototypes"))
+
+        result = env.python_require(mod, None, "missing", package_path)
+        self.assertEqual(
+            result, (None, "no file 'missing' found in 'test-mod' archive")
+        )
+        self.assertIs(self.archive.requires[("missing", package_path)], None)
+
+        mod.archive = False
+        result = env.python_require(mod, None, "prototypes/entity", package_path)
+        self.assertEqual(result[0], None)
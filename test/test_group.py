@@ -1014,6 +1014,80 @@ class GroupTesting(unittest.TestCase):
         with self.assertRaises(InvalidAssociationError):
             copy.deepcopy(group)
 
+    def test_clone(self):
+        group = Group("outer", position=(1, 1))
+        group.entities.append("wooden-chest")
+        group.entities.append("inserter", tile_position=(0, 1))
+        group.entities.append("small-electric-pole", tile_position=(1, 0))
+        group.entities.append("power-switch", tile_position=(3, 0))
+        group.add_circuit_connection("red", 0, 1)
+        group.add_power_connection(2, 3, side=1)
+        inner = Group("inner", position=(5, 0))
+        inner.entities.append("small-lamp", id="lamp")
+        group.entities.append(inner, copy=False)
+        group.add_circuit_connection("green", 0, ("inner", "lamp"))
+
+        blueprint = Blueprint()
+        blueprint.entities.append(group, copy=False)
+
+        group_clone = group.clone()
+
+        # Parents
+        self.assertIs(group_clone.parent, None)
+        self.assertIs(group_clone.entities[0].parent, group_clone)
+        self.assertIs(group_clone.entities["inner"].parent, group_clone)
+        self.assertIs(
+            group_clone.entities[("inner", "lamp")].parent,
+            group_clone.entities["inner"],
+        )
+        # Connections
+        self.assertIs(
+            group_clone.entities[0].connections["1"]["red"][0]["entity_id"](),
+            group_clone.entities[1],
+        )
+        self.assertIs(
+            group_clone.entities[3].connections["Cu0"][0]["entity_id"](),
+            group_clone.entities[2],
+        )
+        self.assertIs(
+            group_clone.entities[0].connections["1"]["green"][0]["entity_id"](),
+            group_clone.entities[("inner", "lamp")],
+        )
+        # Indexes
+        self.assertIsNot(group.entity_map, group_clone.entity_map)
+        self.assertIs(
+            group_clone.find_entity_at_position((1.5, 1.5)), group_clone.entities[0]
+        )
+        self.assertEqual(
+            group_clone.find_entities_filtered(name="small-lamp"),
+            [group_clone.entities[("inner", "lamp")]],
+        )
+        self.assertEqual(
+            group_clone.get_circuit_network(0, "green"),
+            [(group_clone.entities[0], 1), (group_clone.entities[("inner", 0)], 1)],
+        )
+        # Collision set is independent from the original
+        self.assertIsNot(group.collision_set, group_clone.collision_set)
+        self.assertEqual(
+            group.get_world_bounding_box(), group_clone.get_world_bounding_box()
+        )
+
+        # Clones can be added to blueprints like any other group
+        group_clone.id = "copy"
+        group_clone.position = (20, 20)
+        blueprint.entities.append(group_clone, copy=False)
+        self.assertEqual(len(blueprint.find_entities_filtered(name="small-lamp")), 2)
+        self.assertIs(
+            blueprint.entities[("copy", 1)].connections["1"]["red"][0]["entity_id"](),
+            blueprint.entities[("copy", 0)],
+        )
+
+        # Connections to entities outside of the group
+        blueprint.entities.append("steel-chest", tile_position=(-2, -2))
+        blueprint.add_circuit_connection("red", ("outer", 1), 2)
+        with self.assertRaises(InvalidAssociationError):
+            group.clone()
+
     def test_with_blueprint(self):
         blueprint = Blueprint()
         blueprint.entities.append("inserter")
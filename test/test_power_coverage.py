@@ -0,0 +1,169 @@
+# test_power_coverage.py
+# -*- encoding: utf-8 -*-
+
+from draftsman.classes.blueprint import Blueprint
+from draftsman.classes.group import Group
+from draftsman.classes.power_coverage import (
+    PowerCoverage,
+    get_tile_rect,
+    uses_electricity,
+)
+from draftsman.entity import new_entity
+from draftsman.error import InvalidAssociationError
+from draftsman.utils import AABB
+
+import pickle
+import sys
+
+if sys.version_info >= (3, 3):  # pragma: no coverage
+    import unittest
+else:  # pragma: no coverage
+    import unittest2 as unittest
+
+
+def make_blueprint():
+    blueprint = Blueprint()
+    # Supplies tiles -2 to 2
+    blueprint.entities.append("small-electric-pole", id="a")
+    blueprint.entities.append("inserter", tile_position=(2, 0))
+    blueprint.entities.append("inserter", tile_position=(3, 0))
+    blueprint.entities.append("wooden-chest", tile_position=(3, 1))
+    # Supplies tiles 4 to 8
+    blueprint.entities.append("small-electric-pole", id="b", tile_position=(6, 0))
+    # Supplies tiles 12 to 29
+    blueprint.entities.append("substation", id="c", tile_position=(20, 20))
+    # Occupies tiles 10 to 12
+    blueprint.entities.append("assembling-machine-1", tile_position=(10, 10))
+    blueprint.add_power_connection("a", "b")
+    return blueprint
+
+
+class PowerCoverageTesting(unittest.TestCase):
+    def test_constructor(self):
+        blueprint = make_blueprint()
+        coverage = PowerCoverage(blueprint.entities)
+        self.assertEqual(
+            coverage.poles,
+            [blueprint.entities["a"], blueprint.entities["b"], blueprint.entities["c"]],
+        )
+        self.assertEqual(
+            coverage.consumers,
+            [blueprint.entities[1], blueprint.entities[2], blueprint.entities[6]],
+        )
+
+        # Empty
+        coverage = PowerCoverage([])
+        self.assertEqual(coverage.poles, [])
+        self.assertEqual(coverage.chunks, {})
+        self.assertEqual(coverage.get_uncovered_entities(), [])
+
+    def test_is_covered(self):
+        blueprint = make_blueprint()
+        coverage = PowerCoverage(blueprint.entities)
+        self.assertTrue(coverage.is_covered(blueprint.entities[1]))
+        self.assertFalse(coverage.is_covered(blueprint.entities[2]))
+        self.assertTrue(coverage.is_covered(blueprint.entities[6]))
+
+        # Entities that were not analyzed
+        self.assertTrue(
+            coverage.is_covered(new_entity("inserter", tile_position=(4, 0)))
+        )
+        self.assertFalse(
+            coverage.is_covered(new_entity("inserter", tile_position=(-3, 0)))
+        )
+        self.assertTrue(
+            coverage.is_covered(new_entity("wooden-chest", tile_position=(-2, -2)))
+        )
+
+    def test_get_uncovered_entities(self):
+        blueprint = make_blueprint()
+        coverage = blueprint.get_power_coverage()
+        self.assertEqual(coverage.get_uncovered_entities(), [blueprint.entities[2]])
+
+        # Supply areas spanning multiple chunks (tiles 22 to 39)
+        blueprint = Blueprint()
+        blueprint.entities.append("substation", tile_position=(30, 30))
+        blueprint.entities.append("inserter", tile_position=(23, 23))
+        blueprint.entities.append("inserter", tile_position=(38, 38))
+        blueprint.entities.append("inserter", tile_position=(40, 38))
+        blueprint.entities.append("inserter", tile_position=(-40, -40))
+        coverage = blueprint.get_power_coverage()
+        self.assertEqual(
+            coverage.get_uncovered_entities(),
+            [blueprint.entities[3], blueprint.entities[4]],
+        )
+
+        # Entities inside of groups
+        group = Group("group", position=(10, 0))
+        group.entities.append("small-electric-pole")
+        group.entities.append("inserter", tile_position=(3, 0))
+        blueprint = make_blueprint()
+        blueprint.entities.append(group)
+        coverage = blueprint.get_power_coverage()
+        self.assertEqual(
+            coverage.get_uncovered_entities(),
+            [blueprint.entities[2], blueprint.entities[("group", 1)]],
+        )
+
+    def test_get_supplied_entities(self):
+        blueprint = make_blueprint()
+        coverage = blueprint.get_power_coverage()
+        self.assertEqual(
+            coverage.get_supplied_entities(blueprint.entities["a"]),
+            [blueprint.entities[1]],
+        )
+        self.assertEqual(coverage.get_supplied_entities(blueprint.entities["b"]), [])
+        self.assertEqual(
+            coverage.get_supplied_entities(blueprint.entities["c"]),
+            [blueprint.entities[6]],
+        )
+
+    def test_networks(self):
+        blueprint = make_blueprint()
+        blueprint.entities.append("small-electric-pole", id="d", tile_position=(0, 4))
+        blueprint.add_power_connection("c", "d")
+        coverage = blueprint.get_power_coverage()
+        self.assertEqual(
+            coverage.networks,
+            [
+                [blueprint.entities["a"], blueprint.entities["b"]],
+                [blueprint.entities["c"], blueprint.entities["d"]],
+            ],
+        )
+        self.assertEqual(coverage.get_network_id(blueprint.entities["b"]), 0)
+        self.assertEqual(coverage.get_network_id(blueprint.entities["d"]), 1)
+        self.assertEqual(
+            coverage.get_network(blueprint.entities["c"]),
+            [blueprint.entities["c"], blueprint.entities["d"]],
+        )
+        with self.assertRaises(InvalidAssociationError):
+            coverage.get_network_id(blueprint.entities[1])
+
+        # Connections to poles outside of the analyzed list are ignored
+        coverage = PowerCoverage(blueprint.entities[0:4])
+        self.assertEqual(coverage.networks, [[blueprint.entities["a"]]])
+
+    def test_pickle(self):
+        blueprint = make_blueprint()
+        coverage = PowerCoverage(blueprint.entities)
+        coverage = pickle.loads(pickle.dumps(coverage, 2))
+
+        # Handles refer to the unpickled entities
+        a, b, c = coverage.poles
+        self.assertEqual(coverage.get_network(a), [a, b])
+        self.assertEqual(coverage.get_network_id(c), 1)
+        self.assertTrue(coverage.is_covered(coverage.consumers[0]))
+        self.assertFalse(coverage.is_covered(coverage.consumers[1]))
+        self.assertEqual(coverage.get_uncovered_entities(), [coverage.consumers[1]])
+
+    def test_uses_electricity(self):
+        self.assertTrue(uses_electricity(new_entity("inserter")))
+        self.assertFalse(uses_electricity(new_entity("burner-inserter")))
+        self.assertFalse(uses_electricity(new_entity("wooden-chest")))
+        self.assertFalse(uses_electricity(new_entity("small-electric-pole")))
+
+    def test_get_tile_rect(self):
+        self.assertEqual(get_tile_rect(None), None)
+        self.assertEqual(get_tile_rect([[-2.0, -2.0], [3.0, 3.0]]), (-2, -2, 2, 2))
+        self.assertEqual(get_tile_rect(AABB(0.15, 0.15, 0.85, 0.85)), (0, 0, 0, 0))
+        self.assertEqual(get_tile_rect([[1.0, 1.0], [1.0, 1.0]]), (1, 1, 1, 1))
@@ -0,0 +1,285 @@
+# test_profile.py
+# -*- encoding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+from draftsman import data
+from draftsman.blueprintable import Blueprint, BlueprintBook
+from draftsman.classes.profile import DataProxy, Profile
+from draftsman.classes.prototype_database import PrototypeDatabase
+from draftsman.data import entities, signals
+from draftsman.entity import Container, new_entity
+from draftsman.error import InvalidEntityError, InvalidSignalError
+
+import copy
+import json
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import threading
+
+if sys.version_info >= (3, 3):  # pragma: no coverage
+    import unittest
+else:  # pragma: no coverage
+    import unittest2 as unittest
+
+
+def make_modded_data(directory):
+    # type: (str) -> None
+    """
+    Copies the default data into ``directory``, with an extra chest called
+    ``"modded-chest"`` and an extra virtual signal called ``"modded-signal"``.
+    """
+    default = data.default_profile.path
+    for filename in os.listdir(default):
+        if filename.endswith((".pkl", ".db")):
+            shutil.copy(os.path.join(default, filename), directory)
+
+    with open(os.path.join(default, "entities.pkl"), "rb") as inp:
+        entities_data = pickle.load(inp)
+    entities_data["containers"] = entities_data["containers"] + ["modded-chest"]
+    entities_data["flippable"]["modded-chest"] = False
+    with open(os.path.join(directory, "entities.pkl"), "wb") as out:
+        pickle.dump(entities_data, out, 2)
+    raw = {name: entities.raw[name] for name in entities.raw}
+    raw["modded-chest"] = dict(raw["wooden-chest"], name="modded-chest")
+    PrototypeDatabase.write(os.path.join(directory, "entities.db"), raw)
+
+    with open(os.path.join(default, "signals.pkl"), "rb") as inp:
+        signals_data = pickle.load(inp)
+    signals_data[1]["modded-signal"] = "virtual"
+    signals_data[4].append("modded-signal")
+    with open(os.path.join(directory, "signals.pkl"), "wb") as out:
+        pickle.dump(signals_data, out, 2)
+
+
+class ProfileTesting(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.mkdtemp()
+        make_modded_data(cls.directory)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.directory)
+
+    def setUp(self):
+        self.modded = Profile(self.directory)
+
+    def tearDown(self):
+        self.modded.unload()
+
+    def test_constructor(self):
+        self.assertIs(Profile(self.directory), self.modded)
+        self.assertIs(Profile(self.directory + os.sep), self.modded)
+        self.assertEqual(self.modded.path, os.path.realpath(self.directory))
+        self.assertIs(data.get_profile(), data.default_profile)
+
+        with self.assertRaises(ValueError):
+            Profile(os.path.join(self.directory, "incorrect"))
+
+    def test_lazy_loading(self):
+        self.assertNotIn("entities", vars(self.modded))
+        self.assertIn("modded-chest", self.modded.entities.raw)
+        self.assertIn("entities", vars(self.modded))
+        self.assertNotIn("signals", vars(self.modded))
+        self.assertIs(self.modded.entities, self.modded.entities)
+
+        with self.assertRaises(AttributeError):
+            self.modded.incorrect
+
+        raw = self.modded.entities.raw
+        self.modded.unload()
+        self.assertNotIn("entities", vars(self.modded))
+        self.assertIn("modded-chest", self.modded.entities.containers)
+        # The previous database is closed
+        self.assertTrue(raw._mmap.closed)
+
+    def test_cache(self):
+        cache = self.modded.cache("test")
+        self.assertEqual(cache, {})
+        self.assertIs(self.modded.cache("test"), cache)
+        self.assertIsNot(data.default_profile.cache("test"), cache)
+
+        self.modded.unload()
+        self.assertEqual(cache, {})
+
+    def test_to_profile(self):
+        self.assertIs(data.to_profile(self.modded), self.modded)
+        self.assertIs(data.to_profile(self.directory), self.modded)
+        with self.assertRaises(ValueError):
+            data.to_profile(None)
+
+    def test_set_profile(self):
+        try:
+            data.set_profile(self.directory)
+            self.assertIs(data.get_profile(), self.modded)
+            self.assertIn("modded-chest", entities.raw)
+        finally:
+            data.set_profile(data.default_profile)
+        self.assertNotIn("modded-chest", entities.raw)
+
+        with self.assertRaises(ValueError):
+            data.set_profile(10)
+        self.assertIs(data.get_profile(), data.default_profile)
+
+    def test_profile(self):
+        with data.profile(self.modded):
+            self.assertIs(data.get_profile(), self.modded)
+            self.assertIn("modded-chest", entities.containers)
+            self.assertEqual(signals.get_signal_type("modded-signal"), "virtual")
+            self.assertIsInstance(new_entity("modded-chest"), Container)
+        self.assertIs(data.get_profile(), data.default_profile)
+
+        # Data and caches are separate between profiles
+        self.assertNotIn("modded-chest", entities.containers)
+        with self.assertRaises(InvalidSignalError):
+            signals.get_signal_type("modded-signal")
+        with self.assertRaises(InvalidEntityError):
+            new_entity("modded-chest")
+
+        # Restored even if an error is raised
+        with self.assertRaises(InvalidEntityError):
+            with data.profile(self.modded):
+                new_entity("incorrect")
+        self.assertIs(data.get_profile(), data.default_profile)
+
+    def test_profile_threads(self):
+        entered = threading.Event()
+        done = threading.Event()
+        results = []
+
+        def use_modded():
+            with data.profile(self.modded):
+                entered.set()
+                done.wait(5)
+                results.append(data.get_profile())
+                results.append(Blueprint(profile=self.modded).profile)
+
+        thread = threading.Thread(target=use_modded)
+        thread.start()
+        try:
+            entered.wait(5)
+            # Other threads keep the process-wide profile
+            self.assertIs(data.get_profile(), data.default_profile)
+            blueprint = Blueprint()
+            with self.assertRaises(InvalidEntityError):
+                blueprint.entities.append("modded-chest")
+        finally:
+            done.set()
+            thread.join()
+        self.assertEqual(results, [self.modded, self.modded])
+
+        # The process-wide profile is shared, unless overridden
+        def use_default():
+            results.append(data.get_profile())
+
+        try:
+            data.set_profile(self.modded)
+            thread = threading.Thread(target=use_default)
+            thread.start()
+            thread.join()
+        finally:
+            data.set_profile(data.default_profile)
+        self.assertIs(results[-1], self.modded)
+
+    def test_module_names(self):
+        # The names are the values of the current profile themselves
+        self.assertIs(entities.containers, data.default_profile.entities.containers)
+        self.assertIs(type(entities.containers), list)
+        self.assertIsInstance(entities.raw, PrototypeDatabase)
+        self.assertEqual(json.loads(json.dumps(signals.raw)), signals.raw)
+        with data.profile(self.modded):
+            self.assertIs(entities.containers, self.modded.entities.containers)
+        with self.assertRaises(AttributeError):
+            entities.incorrect
+
+    def test_data_proxy(self):
+        containers = DataProxy("entities", "containers")
+        self.assertIsInstance(containers, list)
+        self.assertEqual(containers, data.default_profile.entities.containers)
+        self.assertNotEqual(containers, self.modded.entities.containers)
+        self.assertEqual(containers + ["modded-chest"], self.modded.entities.containers)
+        self.assertEqual(len(containers), len(list(containers)))
+        self.assertEqual(containers.index("wooden-chest"), 0)
+        # Only hashable if the value is
+        with self.assertRaises(TypeError):
+            hash(containers)
+        with data.profile(self.modded):
+            self.assertIn("modded-chest", containers)
+
+        # Copies and pickles are the same name, not a snapshot of its value
+        self.assertIs(copy.deepcopy(containers), containers)
+        unpickled = pickle.loads(pickle.dumps(containers, 2))
+        with data.profile(self.modded):
+            self.assertIn("modded-chest", unpickled)
+
+    def test_blueprint(self):
+        blueprint = Blueprint(profile=self.modded)
+        self.assertIs(blueprint.profile, self.modded)
+        blueprint.entities.append("modded-chest")
+        self.assertIs(blueprint.entities[0].profile, self.modded)
+        with data.profile(blueprint.profile):
+            self.assertIn("modded-chest", blueprint.entities[0].similar_entities)
+        string = blueprint.to_string()
+
+        # Loading
+        self.assertEqual(
+            Blueprint(string, profile=self.directory).to_dict(), blueprint.to_dict()
+        )
+        with self.assertRaises(InvalidEntityError):
+            Blueprint(string)
+        self.assertTrue(blueprint.validate().valid)
+
+        # Follows the process-wide profile when not set
+        blueprint.profile = None
+        self.assertIs(blueprint.profile, data.default_profile)
+        self.assertIs(blueprint.entities[0].profile, data.default_profile)
+        with self.assertRaises(InvalidEntityError):
+            blueprint.entities.append("modded-chest")
+        with self.assertRaises(ValueError):
+            blueprint.profile = 10
+
+    def test_blueprint_modify(self):
+        blueprint = Blueprint(profile=self.modded)
+        blueprint.entities.append("constant-combinator")
+        blueprint.entities.append("modded-chest", tile_position=(1, 0))
+        combinator, chest = blueprint.entities
+
+        # Modified outside of any `data.profile()` block
+        combinator.set_signal(0, "modded-signal")
+        self.assertEqual(
+            combinator.control_behavior["filters"][0]["signal"],
+            {"name": "modded-signal", "type": "virtual"},
+        )
+        chest.bar = 10
+        self.assertEqual(chest.bar, 10)
+        blueprint.icons = ["modded-signal"]
+        self.assertEqual(blueprint.icons[0]["signal"]["name"], "modded-signal")
+        blueprint.add_circuit_connection("red", 0, 1)
+
+        # Without a profile, the current profile is used
+        blueprint.profile = None
+        with self.assertRaises(TypeError):
+            combinator.set_signal(1, "modded-signal")
+        with data.profile(self.modded):
+            combinator.set_signal(1, "modded-signal")
+
+        # Entities that aren't in a blueprint use the current profile
+        combinator = blueprint.entities.pop(0)
+        with self.assertRaises(TypeError):
+            combinator.set_signal(0, "modded-signal")
+
+    def test_blueprint_book(self):
+        blueprint = Blueprint(profile=self.modded)
+        blueprint.entities.append("modded-chest")
+        book = BlueprintBook(profile=self.modded)
+        book.blueprints.append(blueprint)
+        string = book.to_string()
+
+        book = BlueprintBook(string, profile=self.modded)
+        self.assertEqual(book.blueprints[0].entities[0].name, "modded-chest")
+        with self.assertRaises(InvalidEntityError):
+            BlueprintBook(string)
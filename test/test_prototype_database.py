@@ -0,0 +1,101 @@
+# test_prototype_database.py
+# -*- encoding: utf-8 -*-
+
+from draftsman.classes.prototype_database import PrototypeDatabase
+from draftsman.data import entities, tiles
+
+from collections import OrderedDict
+import os
+import shutil
+import sys
+import tempfile
+
+if sys.version_info >= (3, 3):  # pragma: no coverage
+    import unittest
+else:  # pragma: no coverage
+    import unittest2 as unittest
+
+
+class PrototypeDatabaseTesting(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.filepath = os.path.join(self.directory, "test.db")
+        self.prototypes = OrderedDict()
+        self.prototypes["b"] = {"name": "b", "size": [1, 2]}
+        self.prototypes["a"] = {"name": "a", "flags": {"hidden": True}}
+        self.prototypes["c"] = {"name": "c"}
+        PrototypeDatabase.write(self.filepath, self.prototypes)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_read(self):
+        db = PrototypeDatabase(self.filepath)
+        self.assertEqual(len(db), 3)
+        self.assertEqual(list(db), ["b", "a", "c"])
+        self.assertIn("a", db)
+        self.assertNotIn("d", db)
+        self.assertEqual(db._decoded, {})
+
+        self.assertEqual(db["a"], {"name": "a", "flags": {"hidden": True}})
+        self.assertEqual(list(db._decoded), ["a"])
+        self.assertIs(db["a"], db["a"])
+        self.assertEqual(db.get("d", None), None)
+        with self.assertRaises(KeyError):
+            db["d"]
+
+        self.assertEqual(dict(db), dict(self.prototypes))
+
+    def test_modify(self):
+        db = PrototypeDatabase(self.filepath)
+        db["d"] = {"name": "d"}
+        db["a"] = {"name": "a"}
+        self.assertEqual(db["d"], {"name": "d"})
+        self.assertEqual(db["a"], {"name": "a"})
+        self.assertEqual(list(db), ["b", "a", "c", "d"])
+
+        del db["b"]
+        del db["d"]
+        self.assertEqual(list(db), ["a", "c"])
+        self.assertNotIn("b", db)
+        with self.assertRaises(KeyError):
+            del db["b"]
+
+        # The file is untouched
+        db = PrototypeDatabase(self.filepath)
+        self.assertEqual(dict(db), dict(self.prototypes))
+
+    def test_rewrite_while_open(self):
+        db = PrototypeDatabase(self.filepath)
+        self.assertEqual(db["b"], {"name": "b", "size": [1, 2]})
+        PrototypeDatabase.write(self.filepath, {"d": {"name": "d"}})
+        # The open database still reads the previous file
+        self.assertEqual(db["a"], {"name": "a", "flags": {"hidden": True}})
+        self.assertEqual(list(PrototypeDatabase(self.filepath)), ["d"])
+        self.assertEqual(os.listdir(self.directory), ["test.db"])
+
+    def test_close(self):
+        db = PrototypeDatabase(self.filepath)
+        self.assertEqual(db["b"], {"name": "b", "size": [1, 2]})
+        db.close()
+        self.assertEqual(db["b"], {"name": "b", "size": [1, 2]})
+        with self.assertRaises(ValueError):
+            db["a"]
+
+    def test_empty(self):
+        PrototypeDatabase.write(self.filepath, {})
+        db = PrototypeDatabase(self.filepath)
+        self.assertEqual(len(db), 0)
+        self.assertEqual(list(db), [])
+
+    def test_incorrect_file(self):
+        with open(self.filepath, "wb") as out:
+            out.write(b"not a database")
+        with self.assertRaises(ValueError):
+            PrototypeDatabase(self.filepath)
+
+    def test_data(self):
+        self.assertIsInstance(entities.raw, PrototypeDatabase)
+        self.assertIsInstance(tiles.raw, PrototypeDatabase)
+        self.assertEqual(entities.raw["wooden-chest"]["name"], "wooden-chest")
+        self.assertEqual(tiles.raw["landfill"]["name"], "landfill")
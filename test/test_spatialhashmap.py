@@ -2,6 +2,10 @@
 # -*- encoding: utf-8 -*-
 
 from draftsman.classes.blueprint import SpatialHashMap
+from draftsman.classes.spatial_hashmap import objects_collide
+from draftsman.classes.spatial_data_structure import SpatialDataStructure
+from draftsman.constants import Direction
+from draftsman.entity import new_entity
 from draftsman.tile import Tile
 from draftsman import utils
 
@@ -43,6 +47,18 @@ class SpatialHashMapTesting(unittest.TestCase):
         map.remove(Tile("landfill", (0, 0)))
         self.assertEqual(map.map, {})
 
+    def test_clone(self):
+        map = SpatialHashMap()
+        tiles = [Tile("refined-concrete", (0, 0)), Tile("landfill", (1, 1))]
+        for tile in tiles:
+            map.add(tile)
+        copies = [Tile("refined-concrete", (0, 0)), Tile("landfill", (1, 1))]
+        result = map.clone({id(tiles[0]): copies[0], id(tiles[1]): copies[1]})
+        self.assertIsInstance(result, SpatialHashMap)
+        self.assertEqual(result.map, {(0, 0): [copies[0], copies[1]]})
+        # The original is unchanged
+        self.assertIs(map.get_on_point((0.5, 0.5))[0], tiles[0])
+
     def test_get_all_entities(self):
         map = SpatialHashMap()
         tile_to_add = Tile("refined-concrete", (0, 0))
@@ -52,6 +68,56 @@ class SpatialHashMapTesting(unittest.TestCase):
 
         self.assertEqual(map.get_all_entities(), [tile_to_add, other_tile_to_add])
 
+    def test_get_overlapping_pairs(self):
+        map = SpatialHashMap()
+        self.assertEqual(map.get_overlapping_pairs(), [])
+        # Spans 4 cells, but only reported once
+        entities = [
+            new_entity("assembling-machine-1", tile_position=(6, 6)),
+            new_entity("wooden-chest", tile_position=(7, 7)),
+            new_entity("wooden-chest", tile_position=(0, 0)),
+            new_entity("wooden-chest", tile_position=(20, 0)),
+            new_entity("wooden-chest", tile_position=(0, 0)),
+        ]
+        for entity in entities:
+            map.add(entity)
+        self.assertEqual(
+            map.get_overlapping_pairs(),
+            [(entities[0], entities[1]), (entities[2], entities[4])],
+        )
+
+    def test_objects_collide(self):
+        chest = new_entity("wooden-chest")
+        self.assertTrue(objects_collide(chest, new_entity("wooden-chest")))
+        self.assertFalse(
+            objects_collide(chest, new_entity("wooden-chest", tile_position=(1, 0)))
+        )
+        # Different collision layers
+        self.assertFalse(
+            objects_collide(Tile("refined-concrete"), new_entity("wooden-chest"))
+        )
+        # Rails
+        rail = new_entity("straight-rail", tile_position=(0, 0))
+        self.assertTrue(
+            objects_collide(rail, new_entity("straight-rail", tile_position=(0, 0)))
+        )
+        self.assertFalse(
+            objects_collide(
+                rail,
+                new_entity(
+                    "straight-rail", tile_position=(0, 0), direction=Direction.EAST
+                ),
+            )
+        )
+        # Gates
+        self.assertTrue(objects_collide(rail, new_entity("gate", tile_position=(0, 0))))
+        self.assertFalse(
+            objects_collide(
+                new_entity("gate", tile_position=(0, 0), direction=Direction.EAST),
+                rail,
+            )
+        )
+
     def test_get_in_radius(self):
         map = SpatialHashMap()
         tile_to_add = Tile("refined-concrete", (0, 0))
@@ -100,3 +166,79 @@ class SpatialHashMapTesting(unittest.TestCase):
         self.assertEqual(results, [tile_to_add, another_tile_to_add, other_tile_to_add])
         results = map.get_in_area(utils.AABB(-100, -100, 100, 100), limit=1)
         self.assertEqual(results, [tile_to_add])
+
+    def test_get_in_areas(self):
+        map = SpatialHashMap()
+        tile_to_add = Tile("refined-concrete", (0, 0))
+        map.add(tile_to_add)
+        other_tile_to_add = Tile("landfill", (10, 0))
+        map.add(other_tile_to_add)
+        another_tile_to_add = Tile("refined-hazard-concrete-left", (7, 7))
+        map.add(another_tile_to_add)
+        areas = [
+            utils.AABB(0, 0, 4, 4),
+            utils.AABB(0, 0, 8, 8),
+            utils.AABB(-100, -100, 100, 100),
+            utils.AABB(20, 20, 30, 30),
+        ]
+        results = map.get_in_areas(areas)
+        self.assertEqual(
+            results,
+            [
+                [tile_to_add],
+                [tile_to_add, another_tile_to_add],
+                [tile_to_add, another_tile_to_add, other_tile_to_add],
+                [],
+            ],
+        )
+        results = map.get_in_areas(areas, limit=1)
+        self.assertEqual(results, [[tile_to_add], [tile_to_add], [tile_to_add], []])
+
+    def test_get_on_points(self):
+        map = SpatialHashMap()
+        tile_to_add = Tile("refined-concrete", (0, 0))
+        map.add(tile_to_add)
+        other_tile_to_add = Tile("landfill", (0, 0))
+        map.add(other_tile_to_add)
+        results = map.get_on_points([(0, 0), (100, 100), (0.5, 0.5)])
+        self.assertEqual(
+            results,
+            [[tile_to_add, other_tile_to_add], [], [tile_to_add, other_tile_to_add]],
+        )
+        results = map.get_on_points([(0, 0), (100, 100)], limit=1)
+        self.assertEqual(results, [[tile_to_add], []])
+
+    def test_get_nearest(self):
+        map = SpatialHashMap()
+        tiles = [
+            Tile("refined-concrete", (0, 0)),
+            Tile("landfill", (10, 0)),
+            Tile("refined-hazard-concrete-left", (7, 7)),
+            Tile("landfill", (-40, 3)),
+            Tile("landfill", (2, 1)),
+        ]
+        for tile in tiles:
+            map.add(tile)
+
+        self.assertEqual(map.get_nearest((0, 0)), [tiles[0]])
+        self.assertEqual(map.get_nearest((0, 0), k=2), [tiles[0], tiles[4]])
+        self.assertEqual(
+            map.get_nearest((0, 0), k=10),
+            [tiles[0], tiles[4], tiles[2], tiles[1], tiles[3]],
+        )
+        self.assertEqual(map.get_nearest((-100, -100)), [tiles[3]])
+        self.assertEqual(map.get_nearest((0, 0), k=0), [])
+        self.assertEqual(
+            map.get_nearest((0, 0), k=2, filter=lambda x: x.name == "landfill"),
+            [tiles[4], tiles[1]],
+        )
+        self.assertEqual(map.get_nearest((0, 0), filter=lambda x: False), [])
+        self.assertEqual(SpatialHashMap().get_nearest((0, 0)), [])
+
+        # Matches the brute force implementation
+        for point in [(0, 0), (5, 5), (-20, 1), (100, -3)]:
+            for k in range(1, 6):
+                self.assertEqual(
+                    map.get_nearest(point, k),
+                    SpatialDataStructure.get_nearest(map, point, k),
+                )
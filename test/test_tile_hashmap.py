@@ -0,0 +1,169 @@
+# test_tile_hashmap.py
+# -*- encoding: utf-8 -*-
+
+from draftsman.classes.tile_hashmap import TileHashMap
+from draftsman.tile import Tile
+from draftsman.warning import OverlappingObjectsWarning
+from draftsman import utils
+
+import sys
+
+if sys.version_info >= (3, 3):  # pragma: no coverage
+    import unittest
+else:  # pragma: no coverage
+    import unittest2 as unittest
+
+
+class TileHashMapTesting(unittest.TestCase):
+    def test_init(self):
+        map = TileHashMap()
+        self.assertEqual(map.map, {})
+
+    def test_add(self):
+        map = TileHashMap()
+        tile_to_add = Tile("refined-concrete", (0, 0))
+        map.add(tile_to_add)
+        self.assertEqual(map.map, {(0, 0): [tile_to_add]})
+        other_tile_to_add = Tile("landfill", (1, 1))
+        map.recursive_add(other_tile_to_add)
+        self.assertEqual(map.map, {(0, 0): [tile_to_add], (1, 1): [other_tile_to_add]})
+
+    def test_remove(self):
+        map = TileHashMap()
+        tile_to_add = Tile("refined-concrete", (0, 0))
+        map.add(tile_to_add)
+        other_tile_to_add = Tile("landfill", (1, 1))
+        map.add(other_tile_to_add)
+        map.remove(other_tile_to_add)
+        self.assertEqual(map.map, {(0, 0): [tile_to_add]})
+        map.recursive_remove(tile_to_add)
+        self.assertEqual(map.map, {})
+        map.remove(Tile("landfill", (0, 0)))
+        self.assertEqual(map.map, {})
+
+    def test_handle_overlapping(self):
+        map = TileHashMap()
+        tile_to_add = Tile("refined-concrete", (0, 0))
+        map.add(tile_to_add)
+
+        # Neighbours do not overlap
+        neighbour = Tile("refined-concrete", (1, 0))
+        self.assertIs(map.handle_overlapping(neighbour, False), neighbour)
+
+        # Same position
+        same = Tile("refined-concrete", (0, 0))
+        with self.assertWarns(OverlappingObjectsWarning):
+            self.assertIs(map.handle_overlapping(same, False), same)
+
+        # Merging
+        self.assertIs(map.handle_overlapping(same, True), None)
+
+        # Same position, different collision layers
+        landfill = Tile("landfill", (0, 0))
+        self.assertIs(map.handle_overlapping(landfill, True), landfill)
+
+    def test_clone(self):
+        map = TileHashMap()
+        tiles = [Tile("refined-concrete", (0, 0)), Tile("landfill", (1, 1))]
+        for tile in tiles:
+            map.add(tile)
+        copies = [Tile("refined-concrete", (0, 0)), Tile("landfill", (1, 1))]
+        result = map.clone({id(tiles[0]): copies[0], id(tiles[1]): copies[1]})
+        self.assertIsInstance(result, TileHashMap)
+        self.assertEqual(result.map, {(0, 0): [copies[0]], (1, 1): [copies[1]]})
+        # The original is unchanged
+        self.assertIs(map.get_on_point((0.5, 0.5))[0], tiles[0])
+
+    def test_get_all_entities(self):
+        map = TileHashMap()
+        tile_to_add = Tile("refined-concrete", (0, 0))
+        map.add(tile_to_add)
+        other_tile_to_add = Tile("landfill", (1, 1))
+        map.add(other_tile_to_add)
+
+        self.assertEqual(map.get_all_entities(), [tile_to_add, other_tile_to_add])
+
+    def test_get_overlapping_pairs(self):
+        map = TileHashMap()
+        self.assertEqual(map.get_overlapping_pairs(), [])
+        tiles = [
+            Tile("refined-concrete", (0, 0)),
+            Tile("refined-concrete", (1, 0)),
+            Tile("refined-concrete", (0, 0)),
+            Tile("refined-concrete", (0, 0)),
+        ]
+        for tile in tiles:
+            map.add(tile)
+        self.assertEqual(
+            map.get_overlapping_pairs(),
+            [(tiles[0], tiles[2]), (tiles[0], tiles[3]), (tiles[2], tiles[3])],
+        )
+
+    def test_get_in_radius(self):
+        map = TileHashMap()
+        tile_to_add = Tile("refined-concrete", (0, 0))
+        map.add(tile_to_add)
+        other_tile_to_add = Tile("landfill", (10, 0))
+        map.add(other_tile_to_add)
+        another_tile_to_add = Tile("refined-hazard-concrete-left", (7, 7))
+        map.add(another_tile_to_add)
+        results = map.get_in_radius(5, (0, 0))
+        self.assertEqual(results, [tile_to_add])
+        results = map.get_in_radius(10, (0, 0))
+        self.assertEqual(results, [tile_to_add, other_tile_to_add, another_tile_to_add])
+        results = map.get_in_radius(100, (0, 0))
+        self.assertEqual(results, [tile_to_add, other_tile_to_add, another_tile_to_add])
+        results = map.get_in_radius(100, (0, 0), limit=1)
+        self.assertEqual(results, [tile_to_add])
+        results = map.get_in_radius(-1, (0, 0))
+        self.assertEqual(results, [])
+
+    def test_get_on_point(self):
+        map = TileHashMap()
+        tile_to_add = Tile("refined-concrete", (0, 0))
+        map.add(tile_to_add)
+        results = map.get_on_point((0.5, 0.5))
+        self.assertEqual(results, [tile_to_add])
+        other_tile_to_add = Tile("landfill", (0, 0))
+        map.add(other_tile_to_add)
+        results = map.get_on_point((0.5, 0.5))
+        self.assertEqual(results, [tile_to_add, other_tile_to_add])
+        results = map.get_on_point((0.5, 0.5), limit=1)
+        self.assertEqual(results, [tile_to_add])
+        # Points on grid lines touch every adjacent tile
+        corner_tile = Tile("landfill", (1, 1))
+        map.add(corner_tile)
+        results = map.get_on_point((1, 1))
+        self.assertEqual(results, [tile_to_add, other_tile_to_add, corner_tile])
+        # Point not in map case
+        results = map.get_on_point((100, 100))
+        self.assertEqual(results, [])
+
+    def test_get_in_area(self):
+        map = TileHashMap()
+        tile_to_add = Tile("refined-concrete", (0, 0))
+        map.add(tile_to_add)
+        other_tile_to_add = Tile("landfill", (10, 0))
+        map.add(other_tile_to_add)
+        another_tile_to_add = Tile("refined-hazard-concrete-left", (7, 7))
+        map.add(another_tile_to_add)
+        results = map.get_in_area(utils.AABB(0, 0, 4, 4))
+        self.assertEqual(results, [tile_to_add])
+        # Touching the edge of a tile does not overlap it
+        results = map.get_in_area(utils.AABB(1, 1, 7, 7))
+        self.assertEqual(results, [])
+        results = map.get_in_area(utils.AABB(0.5, 0.5, 7.5, 7.5))
+        self.assertEqual(results, [tile_to_add, another_tile_to_add])
+        # Larger than the number of tiles
+        results = map.get_in_area(utils.AABB(-100, -100, 100, 100))
+        self.assertEqual(results, [tile_to_add, other_tile_to_add, another_tile_to_add])
+        results = map.get_in_area(utils.AABB(-100, -100, 100, 100), limit=1)
+        self.assertEqual(results, [tile_to_add])
+
+    def test_get_bounding_box(self):
+        map = TileHashMap()
+        self.assertEqual(map.get_bounding_box(), None)
+        map.add(Tile("refined-concrete", (0, 0)))
+        self.assertEqual(map.get_bounding_box(), utils.AABB(0, 0, 1, 1))
+        map.add(Tile("landfill", (10, -5)))
+        self.assertEqual(map.get_bounding_box(), utils.AABB(0, -5, 11, 1))
@@ -5,6 +5,7 @@ from __future__ import absolute_import, unicode_literals
 from draftsman.classes.blueprint import Blueprint
 from draftsman.classes.tile import Tile
 from draftsman.error import UnreasonablySizedBlueprintError
+from draftsman.utils import AABB
 from draftsman.warning import OverlappingObjectsWarning
 
 import sys
@@ -75,6 +76,13 @@ class TileListTesting(unittest.TestCase):
 
         self.assertEqual(blueprint.tiles[0].name, "refined-concrete")
         self.assertEqual(blueprint.tiles[1].name, "refined-concrete")
+        self.assertEqual(blueprint.area, AABB(0, 0, 2, 2))
+
+        # Area shrinks when read
+        blueprint.tiles[1] = Tile("landfill", position=(0, 1))
+        self.assertEqual(blueprint.area, AABB(0, 0, 1, 2))
+        self.assertEqual(blueprint.tile_width, 1)
+        self.assertEqual(blueprint.tile_height, 2)
 
     def test_delitem(self):
         blueprint = Blueprint()
@@ -86,8 +94,23 @@ class TileListTesting(unittest.TestCase):
         del blueprint.tiles[0]
 
         self.assertEqual(blueprint.tiles[0].name, "refined-concrete")
+        self.assertEqual(blueprint.area, AABB(1, 1, 2, 2))
+        self.assertEqual(blueprint.tile_width, 1)
+        self.assertEqual(blueprint.tile_height, 1)
 
         # Slice
         del blueprint.tiles[:]
 
         self.assertEqual(blueprint.tiles.data, [])
+        self.assertEqual(blueprint.area, None)
+        self.assertEqual(blueprint.tile_width, 0)
+        self.assertEqual(blueprint.tile_height, 0)
+
+        # Size is checked against the area without removed tiles
+        blueprint.tiles.append("landfill")
+        blueprint.tiles.append("landfill", position=(9990, 0))
+        del blueprint.tiles[1]
+        blueprint.tiles.append("landfill", position=(-5000, 0))
+        self.assertEqual(blueprint.area, AABB(-5000, 0, 1, 1))
+        with self.assertRaises(UnreasonablySizedBlueprintError):
+            blueprint.tiles.append("landfill", position=(5001, 0))
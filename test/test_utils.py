@@ -2,7 +2,8 @@
 # -*- encoding: utf-8 -*-
 
 from collections import OrderedDict
-from draftsman import utils
+from draftsman import signatures, utils
+from draftsman.classes.collisionset import CollisionSet
 from draftsman.classes.vector import Vector
 from draftsman.error import InvalidSignalError
 from draftsman.data import recipes, signals
@@ -116,8 +117,22 @@ class RectangleTesting(unittest.TestCase):
         pass
 
     def test_overlaps(self):
-        # TODO
-        pass
+        rect1 = utils.Rectangle((0, 0), 1, 1, 45)
+        rect2 = utils.Rectangle((1, 0), 1, 1, 45)
+        rect3 = utils.Rectangle((1.5, 0), 1, 1, 45)
+        self.assertTrue(rect1.overlaps(rect2))
+        self.assertFalse(rect1.overlaps(rect3))
+
+        # Changing the angle updates the cached points and normals
+        rect1.angle = 0
+        rect3.angle = 0
+        self.assertEqual(
+            rect1.get_points(), [[-0.5, -0.5], [0.5, -0.5], [0.5, 0.5], [-0.5, 0.5]]
+        )
+        self.assertTrue(rect1.overlaps(rect2))
+        self.assertFalse(rect1.overlaps(rect3))
+        rect3.position = [0.9, 0]
+        self.assertTrue(rect1.overlaps(rect3))
 
     def test_get_bounding_box(self):
         rect = utils.Rectangle((4, 4), 1, 1, 45)
@@ -220,6 +235,26 @@ class UtilsTesting(unittest.TestCase):
         with self.assertRaises(InvalidSignalError):
             signals.signal_dict("incorrect")
 
+        # Each call returns a new dict
+        signal = signals.signal_dict("signal-A")
+        signal["name"] = "modified"
+        self.assertEqual(
+            signals.signal_dict("signal-A"), {"name": "signal-A", "type": "virtual"}
+        )
+
+    def test_interned_signal_dict(self):
+        signal = signals.interned_signal_dict("water")
+        self.assertEqual(signal, {"name": "water", "type": "fluid"})
+        self.assertIs(signals.interned_signal_dict("water"), signal)
+        self.assertIsNot(signals.signal_dict("water"), signal)
+        with self.assertRaises(InvalidSignalError):
+            signals.interned_signal_dict("incorrect")
+
+        # Validated SignalIDs never share the interned dict
+        self.assertIsNot(signatures.SIGNAL_ID.validate("water"), signal)
+        self.assertIsNot(signatures.SIGNAL_ID_OR_NONE.validate("water"), signal)
+        self.assertIsNot(signatures.SIGNAL_ID_OR_CONSTANT.validate("water"), signal)
+
     # def test_dist(self):
     #     self.assertAlmostEqual(
     #         utils.dist([0, 0], [100, 0]),
@@ -354,3 +389,27 @@ class UtilsTesting(unittest.TestCase):
             result = test_function()
 
         self.assertEqual(result, "examples")
+
+    def test_clone_value(self):
+        # Primitives and associations are returned as-is
+        self.assertIs(utils.clone_value("string"), "string")
+        self.assertIs(utils.clone_value(None), None)
+
+        # Containers are copied recursively
+        value = {"a": [1, {"b": {2, 3}}], "c": Vector(1, 2), "d": OrderedDict()}
+        result = utils.clone_value(value)
+        self.assertEqual(result, value)
+        self.assertIsNot(result["a"], value["a"])
+        self.assertIsNot(result["a"][1]["b"], value["a"][1]["b"])
+        self.assertIsNot(result["c"], value["c"])
+        self.assertIs(type(result["d"]), OrderedDict)
+
+        # Draftsman objects are copied once per memo
+        collision_set = CollisionSet([utils.AABB(0, 0, 1, 1)])
+        memo = {}
+        first, second = utils.clone_value([collision_set, collision_set], memo)
+        self.assertIs(first, second)
+        self.assertIsNot(first, collision_set)
+        self.assertIsNot(first.shapes[0], collision_set.shapes[0])
+        self.assertEqual(first.shapes[0], collision_set.shapes[0])
+        self.assertIs(memo[id(collision_set)], first)
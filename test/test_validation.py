@@ -0,0 +1,318 @@
+# test_validation.py
+# -*- encoding: utf-8 -*-
+
+from draftsman import validation
+from draftsman.classes.blueprint import Blueprint
+from draftsman.classes.blueprintbook import BlueprintBook
+from draftsman.classes.deconstruction_planner import DeconstructionPlanner
+from draftsman.classes.group import Group
+from draftsman.classes.upgrade_planner import UpgradePlanner
+from draftsman.constants import ValidationLevel
+from draftsman.entity import new_entity
+from draftsman.error import DataFormatError, DraftsmanError, InvalidItemError
+from draftsman.warning import DraftsmanWarning, OverlappingObjectsWarning
+
+import copy
+import sys
+import threading
+import warnings
+
+if sys.version_info >= (3, 3):  # pragma: no coverage
+    import unittest
+else:  # pragma: no coverage
+    import unittest2 as unittest
+
+
+class ValidationTesting(unittest.TestCase):
+    def tearDown(self):
+        validation.set_level(ValidationLevel.STRICT)
+
+    def test_to_level(self):
+        self.assertIs(validation.to_level(ValidationLevel.NONE), ValidationLevel.NONE)
+        self.assertIs(validation.to_level("minimal"), ValidationLevel.MINIMAL)
+        self.assertIs(validation.to_level("STRICT"), ValidationLevel.STRICT)
+        self.assertIs(validation.to_level(0), ValidationLevel.NONE)
+
+        with self.assertRaises(ValueError):
+            validation.to_level("incorrect")
+        with self.assertRaises(ValueError):
+            validation.to_level(10)
+        with self.assertRaises(ValueError):
+            validation.to_level(True)
+        with self.assertRaises(ValueError):
+            validation.to_level(None)
+
+    def test_set_level(self):
+        self.assertIs(validation.get_level(), ValidationLevel.STRICT)
+        validation.set_level("none")
+        self.assertIs(validation.get_level(), ValidationLevel.NONE)
+        with self.assertRaises(ValueError):
+            validation.set_level("incorrect")
+        self.assertIs(validation.get_level(), ValidationLevel.NONE)
+
+    def test_level(self):
+        with validation.level("minimal"):
+            self.assertIs(validation.get_level(), ValidationLevel.MINIMAL)
+            with validation.level("none"):
+                self.assertIs(validation.get_level(), ValidationLevel.NONE)
+            self.assertIs(validation.get_level(), ValidationLevel.MINIMAL)
+        self.assertIs(validation.get_level(), ValidationLevel.STRICT)
+
+        # Restored on error
+        with self.assertRaises(DataFormatError):
+            with validation.level("none"):
+                raise DataFormatError("test")
+        self.assertIs(validation.get_level(), ValidationLevel.STRICT)
+
+    def test_level_threads(self):
+        entered = threading.Event()
+        done = threading.Event()
+        results = []
+
+        def use_none():
+            with validation.level("none"):
+                entered.set()
+                done.wait(5)
+                results.append(validation.get_level())
+
+        thread = threading.Thread(target=use_none)
+        thread.start()
+        try:
+            entered.wait(5)
+            # Other threads keep the process-wide level
+            self.assertIs(validation.get_level(), ValidationLevel.STRICT)
+            with self.assertRaises(DataFormatError):
+                new_entity("small-lamp", control_behavior={"incorrect": True})
+        finally:
+            done.set()
+            thread.join()
+        self.assertEqual(results, [ValidationLevel.NONE])
+
+    def test_entity_level(self):
+        entity = new_entity("wooden-chest")
+        self.assertIs(entity.validation_level, ValidationLevel.STRICT)
+        with validation.level("none"):
+            self.assertIs(entity.validation_level, ValidationLevel.NONE)
+
+        # Entities follow the level of the blueprint they're in
+        blueprint = Blueprint(validation_level="minimal")
+        blueprint.entities.append("wooden-chest")
+        group = Group("test")
+        group.entities.append("wooden-chest")
+        blueprint.entities.append(group)
+        self.assertIs(blueprint.entities[0].validation_level, ValidationLevel.MINIMAL)
+        self.assertIs(
+            blueprint.entities[("test", 0)].validation_level, ValidationLevel.MINIMAL
+        )
+
+        with self.assertRaises(AttributeError):
+            entity.validation_level = ValidationLevel.NONE
+
+    def test_blueprint_level(self):
+        blueprint = Blueprint()
+        self.assertIs(blueprint.validation_level, ValidationLevel.STRICT)
+        with validation.level("minimal"):
+            self.assertIs(blueprint.validation_level, ValidationLevel.MINIMAL)
+
+        blueprint.validation_level = "none"
+        self.assertIs(blueprint.validation_level, ValidationLevel.NONE)
+        self.assertIs(validation.get_level(), ValidationLevel.STRICT)
+        blueprint.validation_level = None
+        self.assertIs(blueprint.validation_level, ValidationLevel.STRICT)
+        with self.assertRaises(ValueError):
+            blueprint.validation_level = "incorrect"
+
+        # Not exported
+        self.assertNotIn("validation_level", blueprint.to_dict()["blueprint"])
+
+    def test_blueprintable_levels(self):
+        blueprint = {
+            "blueprint": {
+                "item": "blueprint",
+                "entities": [
+                    {
+                        "name": "small-lamp",
+                        "position": {"x": 0.5, "y": 0.5},
+                        "control_behavior": {"incorrect": True},
+                    }
+                ],
+            }
+        }
+        book = {"blueprint_book": {"item": "blueprint-book", "blueprints": [blueprint]}}
+        with self.assertRaises(DataFormatError):
+            BlueprintBook(copy.deepcopy(book))
+        book = BlueprintBook(book, validation_level="none")
+        self.assertIs(book.validation_level, ValidationLevel.NONE)
+        self.assertEqual(
+            book.blueprints[0].entities[0].control_behavior, {"incorrect": True}
+        )
+
+        planner = DeconstructionPlanner(validation_level="minimal")
+        self.assertIs(planner.validation_level, ValidationLevel.MINIMAL)
+        planner = UpgradePlanner(validation_level="none")
+        self.assertIs(planner.validation_level, ValidationLevel.NONE)
+        with self.assertRaises(ValueError):
+            UpgradePlanner(validation_level="incorrect")
+
+    def test_none(self):
+        control_behavior = {"circuit_condition": {"comparator": "incorrect"}}
+        with validation.level("none"):
+            with warnings.catch_warnings(record=True) as w:
+                warnings.simplefilter("always")
+                entity = new_entity("small-lamp", control_behavior=control_behavior)
+                entity = new_entity("wooden-chest", unused_keyword="whatever")
+                self.assertEqual(len(w), 0)
+            # Stored as given
+            entity = new_entity("small-lamp", control_behavior=control_behavior)
+            self.assertIs(entity.control_behavior, control_behavior)
+
+        with self.assertRaises(DataFormatError):
+            new_entity("small-lamp", control_behavior=control_behavior)
+
+        # Blueprint-wide
+        blueprint = Blueprint(validation_level="none")
+        icons = [{"index": 1, "signal": {"name": "wooden-chest", "type": "item"}}]
+        blueprint.icons = icons
+        self.assertIs(blueprint.icons, icons)
+        blueprint.entities.append("small-lamp", control_behavior=control_behavior)
+        self.assertIs(blueprint.entities[0].control_behavior, control_behavior)
+
+        # Convenience setters store their arguments as given too
+        signal = {"name": "signal-A", "type": "virtual"}
+        with validation.level("none"):
+            entity = new_entity("constant-combinator")
+            entity.set_signal(0, signal, 100)
+            self.assertEqual(
+                entity.signals, [{"index": 1, "signal": signal, "count": 100}]
+            )
+            self.assertIs(entity.signals[0]["signal"], signal)
+
+            # But signal names and comparators are still converted to the
+            # format they're exported in
+            entity.set_signal(1, "signal-B", 100)
+            self.assertEqual(
+                entity.signals[1]["signal"], {"name": "signal-B", "type": "virtual"}
+            )
+            self.assertEqual(
+                entity.to_dict()["control_behavior"]["filters"][1]["signal"],
+                {"name": "signal-B", "type": "virtual"},
+            )
+
+            entity = new_entity("decider-combinator")
+            entity.first_operand = "not-a-signal"
+            self.assertEqual(entity.first_operand, "not-a-signal")
+            entity.set_decider_conditions("signal-A", ">=", "signal-B", "signal-C")
+            self.assertEqual(entity.first_operand, signal)
+            self.assertEqual(entity.operation, "≥")
+            self.assertEqual(
+                entity.second_operand, {"name": "signal-B", "type": "virtual"}
+            )
+            self.assertEqual(
+                entity.output_signal, {"name": "signal-C", "type": "virtual"}
+            )
+            entity.set_decider_conditions("not-a-signal", "incorrect", signal)
+            self.assertEqual(entity.operation, "incorrect")
+            self.assertIs(entity.second_operand, signal)
+
+            entity = new_entity("arithmetic-combinator")
+            entity.output_signal = "not-a-signal"
+            self.assertEqual(entity.output_signal, "not-a-signal")
+            entity.set_arithmetic_conditions(signal, "incorrect", 1, signal)
+            self.assertEqual(entity.operation, "INCORRECT")
+            entity.set_arithmetic_conditions("signal-A", "xor", "signal-A")
+            self.assertEqual(entity.first_operand, signal)
+            self.assertEqual(entity.operation, "XOR")
+            self.assertEqual(entity.second_operand, signal)
+
+            entity = new_entity("small-lamp")
+            entity.set_circuit_condition(signal, "incorrect", 10)
+            self.assertEqual(
+                entity.control_behavior["circuit_condition"]["comparator"],
+                "incorrect",
+            )
+            entity.set_circuit_condition("signal-A", "!=", "signal-B")
+            self.assertEqual(
+                entity.control_behavior["circuit_condition"],
+                {
+                    "first_signal": signal,
+                    "comparator": "≠",
+                    "second_signal": {"name": "signal-B", "type": "virtual"},
+                },
+            )
+
+        with self.assertRaises(TypeError):
+            new_entity("decider-combinator").first_operand = "not-a-signal"
+        with self.assertRaises(TypeError):
+            new_entity("constant-combinator").set_signal(0, "not-a-signal")
+
+    def test_minimal(self):
+        with validation.level("minimal"):
+            # Formats are still checked
+            with self.assertRaises(DataFormatError):
+                new_entity("small-lamp", control_behavior={"incorrect": True})
+            with self.assertRaises(TypeError):
+                new_entity("wooden-chest").set_item_request("iron-plate", "10")
+
+            with warnings.catch_warnings(record=True) as w:
+                warnings.simplefilter("always")
+                # Unused keywords
+                new_entity("wooden-chest", unused_keyword="whatever")
+                # Range warnings
+                new_entity("programmable-speaker").volume = 10.0
+                # Overlapping entities
+                blueprint = Blueprint()
+                blueprint.entities.append("wooden-chest")
+                blueprint.entities.append("wooden-chest")
+                # Wire distance
+                blueprint.entities.append("small-electric-pole", tile_position=(1, 0))
+                blueprint.entities.append("small-electric-pole", tile_position=(100, 0))
+                blueprint.add_power_connection(2, 3)
+                self.assertEqual(len(w), 0)
+
+            # Data lookups are skipped
+            chest = new_entity("wooden-chest")
+            chest.set_item_request("unknown-item", 10)
+            self.assertEqual(chest.items, {"unknown-item": 10})
+            combinator = new_entity("decider-combinator")
+            combinator.second_operand = "signal-everything"
+            self.assertEqual(
+                combinator.second_operand,
+                {"name": "signal-everything", "type": "virtual"},
+            )
+
+        with self.assertRaises(InvalidItemError):
+            new_entity("wooden-chest").set_item_request("unknown-item", 10)
+        with self.assertRaises(DraftsmanError):
+            new_entity("decider-combinator").second_operand = "signal-everything"
+        with self.assertWarns(DraftsmanWarning):
+            new_entity("wooden-chest", unused_keyword="whatever")
+
+    def test_strict(self):
+        blueprint = Blueprint(validation_level="strict")
+        with validation.level("none"):
+            blueprint.entities.append("wooden-chest")
+            with self.assertWarns(OverlappingObjectsWarning):
+                blueprint.entities.append("wooden-chest")
+
+    def test_import(self):
+        blueprint = Blueprint()
+        blueprint.entities.append("wooden-chest", items={"iron-plate": 10})
+        blueprint.entities.append(
+            "small-lamp",
+            tile_position=(1, 0),
+            control_behavior={
+                "circuit_condition": {
+                    "first_signal": "signal-A",
+                    "comparator": ">",
+                    "constant": 10,
+                }
+            },
+        )
+        expected = blueprint.to_dict()
+        blueprint_string = blueprint.to_string()
+
+        for level in ("none", "minimal", "strict"):
+            blueprint = Blueprint(blueprint_string, validation_level=level)
+            self.assertEqual(blueprint.to_dict(), expected)
+            self.assertIs(blueprint.validation_level, validation.to_level(level))
+            self.assertIs(validation.get_level(), ValidationLevel.STRICT)
@@ -0,0 +1,119 @@
+# test_validation_report.py
+# -*- encoding: utf-8 -*-
+
+from draftsman.classes.validation_report import ValidationIssue, ValidationReport
+from draftsman.entity import new_entity
+from draftsman import signatures
+from draftsman.error import DataFormatError, DraftsmanError, InvalidItemError
+from draftsman.warning import (
+    DraftsmanWarning,
+    ItemCapacityWarning,
+    OverlappingObjectsWarning,
+)
+
+import sys
+
+if sys.version_info >= (3, 3):  # pragma: no coverage
+    import unittest
+else:  # pragma: no coverage
+    import unittest2 as unittest
+
+
+class ValidationIssueTesting(unittest.TestCase):
+    def test_constructor(self):
+        entity = new_entity("wooden-chest")
+        issue = ValidationIssue(InvalidItemError, "'unknown'", [entity])
+        self.assertIs(issue.category, InvalidItemError)
+        self.assertEqual(issue.message, "'unknown'")
+        self.assertEqual(issue.objects, (entity,))
+
+    def test_is_error(self):
+        self.assertTrue(ValidationIssue(DataFormatError, "").is_error)
+        self.assertTrue(ValidationIssue(TypeError, "").is_error)
+        self.assertFalse(ValidationIssue(ItemCapacityWarning, "").is_error)
+
+
+class ValidationReportTesting(unittest.TestCase):
+    def make_report(self):
+        report = ValidationReport()
+        report.add(ItemCapacityWarning, "capacity")
+        report.add(DataFormatError, "format")
+        report.add(OverlappingObjectsWarning, "overlap")
+        report.add(InvalidItemError, "item")
+        return report
+
+    def test_add(self):
+        report = self.make_report()
+        self.assertEqual([issue.message for issue in report.errors], ["format", "item"])
+        self.assertEqual(
+            [issue.message for issue in report.warnings], ["capacity", "overlap"]
+        )
+        self.assertEqual(len(report), 4)
+        self.assertEqual(
+            [issue.message for issue in report],
+            ["format", "item", "capacity", "overlap"],
+        )
+
+    def test_check_format(self):
+        report = ValidationReport()
+        entity = new_entity("small-lamp")
+        value = {"r": 1.0, "g": 0.0, "b": 0.0}
+        self.assertEqual(
+            report.check_format("color", value, signatures.COLOR, (entity,)), value
+        )
+        self.assertEqual(len(report), 0)
+
+        # Shorthand
+        value = [{"index": 1, "name": "iron-plate"}, "copper-plate"]
+        self.assertEqual(
+            report.check_format("filters", value, signatures.FILTERS),
+            [{"index": 1, "name": "iron-plate"}, {"index": 2, "name": "copper-plate"}],
+        )
+        self.assertEqual(value[1], "copper-plate")
+
+        # Incorrect
+        self.assertIs(
+            report.check_format("color", {"r": "wrong"}, signatures.COLOR, (entity,)),
+            None,
+        )
+        self.assertEqual(
+            [issue.category for issue in report.errors],
+            [DataFormatError, DataFormatError],
+        )
+        self.assertIn("'filters'", report.errors[0].message)
+        self.assertIn("'color'", report.errors[1].message)
+        self.assertEqual(report.errors[1].objects, (entity,))
+
+    def test_valid(self):
+        report = ValidationReport()
+        self.assertTrue(report.valid)
+        report.add(ItemCapacityWarning, "capacity")
+        self.assertTrue(report.valid)
+        report.add(DataFormatError, "format")
+        self.assertFalse(report.valid)
+
+    def test_get_issues(self):
+        report = self.make_report()
+        self.assertEqual(
+            [issue.message for issue in report.get_issues(InvalidItemError)],
+            ["item"],
+        )
+        self.assertEqual(
+            [issue.message for issue in report.get_issues(DraftsmanError)],
+            ["format", "item"],
+        )
+        self.assertEqual(
+            [issue.message for issue in report.get_issues(DraftsmanWarning)],
+            ["capacity", "overlap"],
+        )
+
+    def test_reissue(self):
+        report = self.make_report()
+        with self.assertWarns(ItemCapacityWarning):
+            with self.assertRaises(DataFormatError):
+                report.reissue()
+
+        report = ValidationReport()
+        report.add(OverlappingObjectsWarning, "overlap")
+        with self.assertWarns(OverlappingObjectsWarning):
+            report.reissue()